@@ -0,0 +1,44 @@
+"""
+Shared helpers for the benchmark scripts in this directory.
+
+Benchmarks are plain scripts (not collected by pytest).  Run them from the
+repository root, e.g.::
+
+    python benchmarks/bench_startup.py
+"""
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+# Widgets are built without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+_app = None
+
+
+def get_qapp():
+    """Return the running QApplication, creating (and keeping alive) one if needed."""
+    global _app
+    from PyQt6.QtWidgets import QApplication
+    if QApplication.instance() is None:
+        _app = QApplication(sys.argv[:1])
+    return QApplication.instance()
+
+
+def time_ms(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Median wall-clock time of *fn* over *repeat* runs, in milliseconds."""
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
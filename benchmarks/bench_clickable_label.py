@@ -0,0 +1,161 @@
+"""
+ClickableLabel paint cost for a 1280×720 camera frame.
+
+    drag repaint   — overlay-only repaint (corner drag): the scaled frame
+                     comes from the cache vs. rescaling on every paint.
+    new frame      — set_frame() + paint with smooth vs fast scaling.
+    overlay        — drag repaint with --areas inactive areas: inactive areas
+                     redrawn every paint vs taken from the overlay cache.
+    coalescing     — frames pushed at --fps for one second; how many were
+                     actually scaled and painted.
+    ndarray ingest — a BGR uint8 array: QImage copy + QPixmap.fromImage +
+                     set_frame vs set_frame_array (zero-copy, and with
+                     downscale-on-ingest).  "ingest" is the producer-side
+                     cost paid for every frame, coalesced or not; "+ paint"
+                     adds the repaint of that frame.
+
+Usage::
+
+    python benchmarks/bench_clickable_label.py [--repeat 50] [--fps 120]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import get_qapp, time_ms  # noqa: E402
+
+import numpy as np  # noqa: E402
+from PyQt6.QtGui import QColor, QImage, QPixmap  # noqa: E402
+
+from src.utils_widgets.clickable_label import ClickableLabel  # noqa: E402
+
+SIZE = (1280, 720)
+
+
+def make_label(fast: bool) -> ClickableLabel:
+    label = ClickableLabel(fast_transform=fast)
+    label.resize(960, 540)
+    label.set_area_corners("brightness_area", [(0.3, 0.4), (0.7, 0.4), (0.7, 0.6), (0.3, 0.6)])
+    label.set_active_area("brightness_area")
+    label.show()
+    get_qapp().processEvents()   # map the window so repaint() paints
+    return label
+
+
+def make_frames(count: int):
+    frames = []
+    for i in range(count):
+        pixmap = QPixmap(*SIZE)
+        pixmap.fill(QColor(20 * i % 255, 80, 120))
+        frames.append(pixmap)
+    return frames
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--fps", type=float, default=120.0)
+    parser.add_argument("--areas", type=int, default=6)
+    args = parser.parse_args(argv)
+
+    app = get_qapp()
+    frames = make_frames(8)
+
+    label = make_label(fast=False)
+    label.set_frame(frames[0])
+    label.repaint()
+
+    def uncached():
+        label._scaled_key = None
+        label.repaint()
+
+    cached_ms   = time_ms(lambda: [label.repaint() for _ in range(args.repeat)], 3) / args.repeat
+    uncached_ms = time_ms(lambda: [uncached() for _ in range(args.repeat)], 3) / args.repeat
+
+    crowded = make_label(fast=True)
+    crowded.set_frame(frames[0])
+    for n in range(args.areas):
+        x = (n % 3) * 0.3 + 0.05
+        y = (n // 3) * 0.3 + 0.05
+        crowded.set_area_corners(f"area_{n}", [(x, y), (x + 0.2, y), (x + 0.2, y + 0.2), (x, y + 0.2)])
+    crowded.set_active_area("brightness_area")
+    crowded.repaint()
+
+    def overlay_rebuilt():
+        crowded._overlay_key = None
+        crowded.repaint()
+
+    overlay_cached_ms  = time_ms(lambda: [crowded.repaint() for _ in range(args.repeat)], 3) / args.repeat
+    overlay_rebuilt_ms = time_ms(lambda: [overlay_rebuilt() for _ in range(args.repeat)], 3) / args.repeat
+
+    counter = iter(range(10 ** 9))
+
+    def new_frame(lbl):
+        lbl._last_paint = 0.0          # bypass coalescing: paint every frame
+        lbl.set_frame(frames[next(counter) % len(frames)])
+        lbl.repaint()
+
+    smooth_ms = time_ms(lambda: [new_frame(label) for _ in range(args.repeat)], 3) / args.repeat
+    fast_label = make_label(fast=True)
+    fast_ms = time_ms(lambda: [new_frame(fast_label) for _ in range(args.repeat)], 3) / args.repeat
+
+    live = make_label(fast=True)
+    start = time.perf_counter()
+    period = 1.0 / args.fps
+    i = 0
+    while time.perf_counter() - start < 1.0:
+        live.set_frame(frames[i % len(frames)])
+        i += 1
+        deadline = start + i * period
+        while time.perf_counter() < deadline:
+            app.processEvents()
+    app.processEvents()
+    received, painted = live.frame_stats()
+
+    arrays = [np.full((SIZE[1], SIZE[0], 3), 30 * i, np.uint8) for i in range(8)]
+
+    def via_pixmap(lbl, paint=True):
+        array = arrays[next(counter) % len(arrays)]
+        image = QImage(array.data, SIZE[0], SIZE[1], array.strides[0], QImage.Format.Format_BGR888)
+        lbl._last_paint = 0.0
+        lbl.set_frame(QPixmap.fromImage(image.copy()))
+        if paint:
+            lbl.repaint()
+
+    def via_array(lbl, downscale=False, paint=True):
+        lbl._last_paint = 0.0
+        lbl.set_frame_array(arrays[next(counter) % len(arrays)], "bgr", downscale=downscale)
+        if paint:
+            lbl.repaint()
+
+    def per_frame(fn):
+        return time_ms(lambda: [fn() for _ in range(args.repeat)], 3) / args.repeat
+
+    ingest = {
+        "ndarray via QImage copy + QPixmap": (per_frame(lambda: via_pixmap(fast_label, paint=False)),
+                                              per_frame(lambda: via_pixmap(fast_label))),
+        "ndarray via set_frame_array":       (per_frame(lambda: via_array(fast_label, paint=False)),
+                                              per_frame(lambda: via_array(fast_label))),
+        "ndarray, downscale on ingest":      (per_frame(lambda: via_array(fast_label, True, paint=False)),
+                                              per_frame(lambda: via_array(fast_label, True))),
+    }
+
+    print(f"frame={SIZE[0]}x{SIZE[1]}  label=960x540  repeat={args.repeat}")
+    print(f"  drag repaint, rescale every paint : {uncached_ms:7.2f} ms")
+    print(f"  drag repaint, cached scaled frame : {cached_ms:7.2f} ms")
+    print(f"  new frame, smooth scaling         : {smooth_ms:7.2f} ms")
+    print(f"  new frame, fast scaling           : {fast_ms:7.2f} ms")
+    print(f"  {f'drag repaint, {args.areas} areas redrawn':34}: {overlay_rebuilt_ms:7.2f} ms")
+    print(f"  {f'drag repaint, {args.areas} areas from overlay':34}: {overlay_cached_ms:7.2f} ms")
+    for name, (ingest_ms, total_ms) in ingest.items():
+        print(f"  {name:34}: {ingest_ms:7.2f} ms ingest, {total_ms:7.2f} ms + paint (fast scaling)")
+    print(f"  coalescing at {args.fps:.0f} fps: {received} frames pushed, {painted} painted")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Settings history: recording saves and rebuilding old versions.
+
+Uses the flat camera settings dict and a log of --versions saves that each
+change a few keys.
+
+    record          — one save appended (delta line + fsync, snapshot every N)
+    state_at latest — newest version: nearest snapshot + at most N deltas
+    state_at oldest — version 1: baseline snapshot + one delta
+    reload          — SettingsHistory(path) parsing the whole log
+
+Usage::
+
+    python benchmarks/bench_history.py [--versions 2000] [--snapshot-every 20] [--repeat 20]
+"""
+import argparse
+import itertools
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import time_ms  # noqa: E402
+
+from src.plugins.camera_settings.camera_settings_data import CameraSettingsData  # noqa: E402
+from src.plugins.camera_settings.mapper import CameraSettingsMapper  # noqa: E402
+from src.settings.settings_history import SettingsHistory  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--versions", type=int, default=2000)
+    parser.add_argument("--snapshot-every", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "history.jsonl"
+        history = SettingsHistory(path, args.snapshot_every)
+        state = CameraSettingsMapper.to_flat_dict(CameraSettingsData())
+        keys = [k for k, v in state.items() if isinstance(v, int) and not isinstance(v, bool)]
+        counter = itertools.count(1)
+
+        def record():
+            nonlocal state
+            i = next(counter)
+            after = {**state, keys[i % len(keys)]: i, keys[(i * 7) % len(keys)]: -i}
+            history.record("CameraSettings", state, after)
+            state = after
+
+        for _ in range(args.versions):
+            record()
+        size_kb = path.stat().st_size / 1024
+
+        rows = [
+            ("record",          record),
+            ("state_at latest", lambda: history.state_at(history.latest_version())),
+            ("state_at oldest", lambda: history.state_at(1)),
+            ("reload",          lambda: SettingsHistory(path, args.snapshot_every)),
+        ]
+        print(f"log={size_kb:.0f} KiB  versions={args.versions}  "
+              f"snapshot_every={args.snapshot_every}  repeat={args.repeat}")
+        for name, fn in rows:
+            fn()
+            print(f"  {name:<16} {time_ms(fn, args.repeat):9.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
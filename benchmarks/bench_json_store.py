@@ -0,0 +1,62 @@
+"""
+JSON settings file service: cached loads and skipped writes.
+
+Uses JsonRobotSettingsService on a config whose movement groups hold
+thousands of trajectory points (the largest file the HMI writes).
+
+    load cached     — load_config() while the file is unchanged (no read, no parse)
+    load cold       — a fresh service each time: read + json.loads + from_dict
+    save unchanged  — same content as on disk: serialise + hash, write skipped
+    save changed    — serialise + hash + temp file + fsync + rename
+
+Usage::
+
+    python benchmarks/bench_json_store.py [--points 5000] [--groups 20] [--repeat 20]
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import time_ms  # noqa: E402
+from bench_mappers import build_config  # noqa: E402
+
+from src.plugins.robot_settings.json_settings_service import JsonRobotSettingsService  # noqa: E402
+from src.plugins.robot_settings.mapper import RobotSettingsMapper  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--groups", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp) / "robot_config.json"
+        calib_path = Path(tmp) / "robot_calibration.json"
+        service = JsonRobotSettingsService(config_path, calib_path)
+        config = build_config(args.points, args.groups)
+        service.save_config(config)
+        size_kb = config_path.stat().st_size / 1024
+
+        ips = iter(f"10.0.{i // 256}.{i % 256}" for i in range(1_000_000))
+        rows = [
+            ("load cached",    lambda: service.load_config()),
+            ("load cold",      lambda: JsonRobotSettingsService(config_path, calib_path).load_config()),
+            ("save unchanged", lambda: service._config.save(config)),
+            ("save changed",   lambda: service.save_config(
+                RobotSettingsMapper.from_flat_dict({"robot_ip": next(ips)}, config))),
+        ]
+        print(f"file={size_kb:.0f} KiB  points={args.points}  groups={args.groups}  repeat={args.repeat}")
+        for name, fn in rows:
+            fn()
+            print(f"  {name:<16} {time_ms(fn, args.repeat):9.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Mapper throughput: generated (compile_mapper) vs hand-written vs reflective.
+
+Uses the camera table (33 fields) — the largest mapper.
+
+    generated   — current CameraSettingsMapper, compiled from its field table.
+    handwritten — the former hand-written mapper (reproduced below): one
+                  flat.get(key, default) plus a cast per field.
+    reflective  — a naive table-driven mapper that loops over the table
+                  with getattr()/setattr() on every call; what the engine
+                  avoids by generating code once.
+
+Usage::
+
+    python benchmarks/bench_mapper_engine.py [--calls 20000]
+"""
+import argparse
+import sys
+import time
+from copy import copy
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import _common  # noqa: E402,F401  (puts the repo root on sys.path)
+
+from src.plugins.camera_settings import mapper as camera_mapper  # noqa: E402
+from src.plugins.camera_settings.camera_settings_data import CameraSettingsData  # noqa: E402
+
+_FIELDS = camera_mapper._FIELDS
+
+
+# ── former hand-written mapper ────────────────────────────────────────────────
+
+def handwritten_to_flat(data):
+    return {
+        "index": data.index, "width": data.width, "height": data.height,
+        "skip_frames": data.skip_frames, "capture_position_offset": data.capture_position_offset,
+        "contour_detection": data.contour_detection, "draw_contours": data.draw_contours,
+        "threshold": data.threshold, "threshold_pickup_area": data.threshold_pickup_area,
+        "epsilon": data.epsilon, "min_contour_area": data.min_contour_area,
+        "max_contour_area": data.max_contour_area, "gaussian_blur": data.gaussian_blur,
+        "blur_kernel_size": data.blur_kernel_size, "threshold_type": data.threshold_type,
+        "dilate_enabled": data.dilate_enabled, "dilate_kernel_size": data.dilate_kernel_size,
+        "dilate_iterations": data.dilate_iterations, "erode_enabled": data.erode_enabled,
+        "erode_kernel_size": data.erode_kernel_size, "erode_iterations": data.erode_iterations,
+        "chessboard_width": data.chessboard_width, "chessboard_height": data.chessboard_height,
+        "square_size_mm": data.square_size_mm, "calibration_skip_frames": data.calibration_skip_frames,
+        "brightness_auto": data.brightness_auto, "brightness_kp": data.brightness_kp,
+        "brightness_ki": data.brightness_ki, "brightness_kd": data.brightness_kd,
+        "target_brightness": data.target_brightness, "aruco_enabled": data.aruco_enabled,
+        "aruco_dictionary": data.aruco_dictionary, "aruco_flip_image": data.aruco_flip_image,
+    }
+
+
+def handwritten_from_flat(flat, base):
+    d = copy(base)
+    g = flat.get
+    d.index = int(g("index", d.index))
+    d.width = int(g("width", d.width))
+    d.height = int(g("height", d.height))
+    d.skip_frames = int(g("skip_frames", d.skip_frames))
+    d.capture_position_offset = int(g("capture_position_offset", d.capture_position_offset))
+    d.contour_detection = bool(g("contour_detection", d.contour_detection))
+    d.draw_contours = bool(g("draw_contours", d.draw_contours))
+    d.threshold = int(g("threshold", d.threshold))
+    d.threshold_pickup_area = int(g("threshold_pickup_area", d.threshold_pickup_area))
+    d.epsilon = float(g("epsilon", d.epsilon))
+    d.min_contour_area = float(g("min_contour_area", d.min_contour_area))
+    d.max_contour_area = float(g("max_contour_area", d.max_contour_area))
+    d.gaussian_blur = bool(g("gaussian_blur", d.gaussian_blur))
+    d.blur_kernel_size = int(g("blur_kernel_size", d.blur_kernel_size))
+    d.threshold_type = str(g("threshold_type", d.threshold_type))
+    d.dilate_enabled = bool(g("dilate_enabled", d.dilate_enabled))
+    d.dilate_kernel_size = int(g("dilate_kernel_size", d.dilate_kernel_size))
+    d.dilate_iterations = int(g("dilate_iterations", d.dilate_iterations))
+    d.erode_enabled = bool(g("erode_enabled", d.erode_enabled))
+    d.erode_kernel_size = int(g("erode_kernel_size", d.erode_kernel_size))
+    d.erode_iterations = int(g("erode_iterations", d.erode_iterations))
+    d.chessboard_width = int(g("chessboard_width", d.chessboard_width))
+    d.chessboard_height = int(g("chessboard_height", d.chessboard_height))
+    d.square_size_mm = float(g("square_size_mm", d.square_size_mm))
+    d.calibration_skip_frames = int(g("calibration_skip_frames", d.calibration_skip_frames))
+    d.brightness_auto = bool(g("brightness_auto", d.brightness_auto))
+    d.brightness_kp = float(g("brightness_kp", d.brightness_kp))
+    d.brightness_ki = float(g("brightness_ki", d.brightness_ki))
+    d.brightness_kd = float(g("brightness_kd", d.brightness_kd))
+    d.target_brightness = float(g("target_brightness", d.target_brightness))
+    d.aruco_enabled = bool(g("aruco_enabled", d.aruco_enabled))
+    d.aruco_dictionary = str(g("aruco_dictionary", d.aruco_dictionary))
+    d.aruco_flip_image = bool(g("aruco_flip_image", d.aruco_flip_image))
+    return d
+
+
+# ── naive reflective mapper ───────────────────────────────────────────────────
+
+def reflective_to_flat(data):
+    return {f.key: getattr(data, f.attr or f.key) for f in _FIELDS}
+
+
+def reflective_from_flat(flat, base):
+    d = copy(base)
+    for f in _FIELDS:
+        if f.key in flat:
+            value = flat[f.key]
+            setattr(d, f.attr or f.key, f.type(value) if f.type else value)
+    return d
+
+
+def _per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    mapper = camera_mapper._MAPPER
+    base   = CameraSettingsData()
+    full   = mapper.to_flat_dict(base)
+    delta  = {"threshold": 120}
+
+    cases = (
+        ("to_flat_dict",            mapper.to_flat_dict,  handwritten_to_flat,  reflective_to_flat, (base,)),
+        ("from_flat_dict (full)",   mapper.from_flat_dict, handwritten_from_flat, reflective_from_flat, (full, base)),
+        ("from_flat_dict (1 key)",  mapper.from_flat_dict, handwritten_from_flat, reflective_from_flat, (delta, base)),
+    )
+    print(f"fields={len(_FIELDS)}  calls={args.calls}   (µs per call)")
+    print(f"  {'':<24} {'generated':>10} {'handwritten':>12} {'reflective':>11}")
+    for name, gen, hand, refl, call_args in cases:
+        g = _per_call_us(lambda: gen(*call_args),  args.calls)
+        h = _per_call_us(lambda: hand(*call_args), args.calls)
+        r = _per_call_us(lambda: refl(*call_args), args.calls)
+        print(f"  {name:<24} {g:10.2f} {h:12.2f} {r:11.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+Mapper save cost: structural-sharing from_flat_dict() vs the former deepcopy.
+
+Builds a RobotConfig whose movement groups hold thousands of trajectory
+points and applies a flat dict onto it, as RobotSettingsModel.save() does.
+
+    shared    — current code: shallow copies, untouched sub-objects shared.
+    deepcopy  — the former behaviour, reproduced as deepcopy(base) followed
+                by the same field assignments.
+
+Each is measured with a one-key delta (what a typical Save sends now) and
+with the full flat dict.
+
+Usage::
+
+    python benchmarks/bench_mappers.py [--points 5000] [--groups 20] [--repeat 20]
+"""
+import argparse
+import sys
+from copy import deepcopy
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import time_ms  # noqa: E402
+
+from src.external_dependencies.robotConfig.MovementGroup import MovementGroup  # noqa: E402
+from src.external_dependencies.robotConfig.robotConfigModel import get_default_config  # noqa: E402
+from src.external_dependencies.robotConfig.robot_calibration_settings import RobotCalibrationSettings  # noqa: E402
+from src.plugins.camera_settings.camera_settings_data import CameraSettingsData  # noqa: E402
+from src.plugins.camera_settings.mapper import CameraSettingsMapper  # noqa: E402
+from src.plugins.glue_settings.glue_settings_data import GlueSettings  # noqa: E402
+from src.plugins.glue_settings.mapper import GlueSettingsMapper  # noqa: E402
+from src.plugins.robot_settings.mapper import RobotCalibrationMapper, RobotSettingsMapper  # noqa: E402
+
+
+def build_config(points: int, groups: int):
+    """Default config plus *groups* trajectory groups sharing *points* points."""
+    config = get_default_config()
+    per_group = max(1, points // groups)
+    for g in range(groups):
+        config.movement_groups[f"TRAJECTORY {g}"] = MovementGroup(
+            velocity=50, acceleration=50,
+            points=[f"[{g}.5, {i}.25, 300.0, 180, 0, 90]" for i in range(per_group)],
+        )
+    return config
+
+
+def _row(name: str, shared: float, legacy: float) -> None:
+    print(f"  {name:<28} shared {shared:9.3f} ms   deepcopy {legacy:9.3f} ms   "
+          f"{legacy / shared:8.1f}x")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--groups", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    config = build_config(args.points, args.groups)
+    full   = RobotSettingsMapper.to_flat_dict(config)
+    delta  = {"safety_x_min": full["safety_x_min"] - 1}
+
+    print(f"points={args.points}  groups={args.groups}  repeat={args.repeat}")
+    for name, flat in (("robot config, 1-key delta", delta), ("robot config, full flat", full)):
+        _row(name,
+             time_ms(lambda: RobotSettingsMapper.from_flat_dict(flat, config), args.repeat),
+             time_ms(lambda: RobotSettingsMapper.from_flat_dict(flat, deepcopy(config)), args.repeat))
+
+    others = (
+        ("robot calibration", RobotCalibrationMapper, RobotCalibrationSettings()),
+        ("camera",            CameraSettingsMapper,   CameraSettingsData()),
+        ("glue",              GlueSettingsMapper,     GlueSettings()),
+    )
+    for name, mapper, base in others:
+        flat = mapper.to_flat_dict(base)
+        _row(f"{name}, full flat",
+             time_ms(lambda: mapper.from_flat_dict(flat, base), args.repeat),
+             time_ms(lambda: mapper.from_flat_dict(flat, deepcopy(base)), args.repeat))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Trajectory read cost: cached numeric buffer vs re-parsing the point strings.
+
+    strings — the former MovementGroup.parse_points(): strip/split/float on
+              every call (reproduced below).
+    cached  — MovementGroup.points_array(): parsed once, then the same
+              read-only N×6 float64 array on every call.
+
+Usage::
+
+    python benchmarks/bench_movement_points.py [--points 5000] [--reads 200]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import time_ms  # noqa: E402
+
+from src.external_dependencies.robotConfig.MovementGroup import MovementGroup  # noqa: E402
+
+
+def parse_points_strings(points):
+    parsed_points = []
+    for point in points:
+        try:
+            point_str = point.strip("[]")
+            parsed_points.append([float(x.strip()) for x in point_str.split(",")])
+        except (ValueError, AttributeError):
+            continue
+    return parsed_points
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    points = [f"[{i}.125, -{i}.5, 300, 180, 0, 90]" for i in range(args.points)]
+
+    def strings():
+        for _ in range(args.reads):
+            parse_points_strings(points)
+
+    def cached():
+        group = MovementGroup(points=points)
+        for _ in range(args.reads):
+            group.points_array()
+
+    def first_parse():
+        MovementGroup(points=points).points_array()
+
+    s = time_ms(strings, args.repeat)
+    c = time_ms(cached, args.repeat)
+    print(f"points={args.points}  reads={args.reads}  repeat={args.repeat}")
+    print(f"  re-parse strings every read : {s:9.2f} ms")
+    print(f"  cached N×6 buffer           : {c:9.2f} ms   (first parse {time_ms(first_parse, args.repeat):.2f} ms)")
+    print(f"  speed-up                    : {s / c:9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
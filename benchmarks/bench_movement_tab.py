@@ -0,0 +1,82 @@
+"""
+MovementGroupsTab build cost: eager editors vs collapsed-header mode.
+
+Loads a config with ~200 movement groups (the defaults plus SLOT n
+PICKUP/DROPOFF pairs with a few points each) and renders the tab once.
+
+    eager      — MovementGroupsTab(): one full MovementGroupWidget per group.
+    collapsed  — MovementGroupsTab(collapsible=True): header buttons only;
+                 an editor is built when its group is expanded.
+
+Usage::
+
+    python benchmarks/bench_movement_tab.py [--groups 200] [--repeat 3]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import get_qapp, time_ms  # noqa: E402
+
+from PyQt6.QtWidgets import QScrollArea, QWidget  # noqa: E402
+
+from src.external_dependencies.robotConfig.MovementGroup import MovementGroup  # noqa: E402
+from src.external_dependencies.robotConfig.robotConfigModel import get_default_config  # noqa: E402
+from src.plugins.robot_settings.view.movement_groups_tab import MovementGroupsTab  # noqa: E402
+
+
+def build_groups(count: int):
+    groups = dict(get_default_config().movement_groups)
+    slot = 0
+    while len(groups) < count:
+        for kind in ("PICKUP", "DROPOFF"):
+            groups[f"SLOT {slot} {kind}"] = MovementGroup(
+                velocity=50, acceleration=50,
+                points=[f"[-{slot}.5, -224.46, {z}, 180, 0, 90]" for z in (300, 181.11, 300)],
+            )
+        slot += 1
+    return groups
+
+
+def build(groups, collapsible: bool):
+    tab = MovementGroupsTab(collapsible=collapsible)
+    tab.load(groups)
+    scroll = QScrollArea()
+    scroll.setWidgetResizable(True)
+    scroll.setWidget(tab)
+    scroll.resize(1280, 1024)
+    scroll.grab()
+    return scroll, tab
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--groups", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    get_qapp()
+    groups = build_groups(args.groups)
+    build(build_groups(12), collapsible=False)   # warm-up
+
+    eager = time_ms(lambda: build(groups, collapsible=False), args.repeat)
+    lazy  = time_ms(lambda: build(groups, collapsible=True),  args.repeat)
+    eager_scroll, eager_tab = build(groups, collapsible=False)
+    eager_widgets = len(eager_tab.findChildren(QWidget))
+    scroll, tab = build(groups, collapsible=True)
+    lazy_widgets = len(tab.findChildren(QWidget))
+    expand = time_ms(lambda: (tab.expand("NOZZLE CLEAN"), tab.expand("NOZZLE CLEAN", False)), args.repeat)
+
+    print(f"groups={len(groups)}  repeat={args.repeat}")
+    print(f"  eager editors      : {eager:9.1f} ms   {eager_widgets:6d} widgets")
+    print(f"  collapsed headers  : {lazy:9.1f} ms   {lazy_widgets:6d} widgets")
+    print(f"  speed-up           : {eager / lazy:9.1f}x")
+    print(f"  expand+collapse one group: {expand:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Points list cost: PointsListModel + QListView vs one QListWidgetItem per point.
+
+Measures filling the list, rendering it once, and collecting the values
+back (what MovementGroupWidget.get_values() does on every Save).
+
+    model  — current code: numeric N×6 buffer, rows formatted only when
+             the view paints them.
+    widget — the former QListWidget with one item per point string.
+
+Usage::
+
+    python benchmarks/bench_points_list.py [--points 20000] [--repeat 3]
+"""
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import get_qapp, time_ms  # noqa: E402
+
+from PyQt6.QtWidgets import QListView, QListWidget, QListWidgetItem  # noqa: E402
+
+from src.external_dependencies.robotConfig.MovementGroup import MovementGroup  # noqa: E402
+from src.plugins.robot_settings.view.points_list_model import PointsListModel  # noqa: E402
+
+
+def fill_widget(points):
+    view = QListWidget()
+    view.setFixedHeight(140)
+    for pt in points:
+        view.addItem(QListWidgetItem(pt))
+    view.grab()
+    return view, [view.item(i).text() for i in range(view.count())]
+
+
+def fill_model(array):
+    model = PointsListModel()
+    view = QListView()
+    view.setModel(model)
+    view.setUniformItemSizes(True)
+    view.setFixedHeight(140)
+    model.set_points_array(array)
+    view.grab()
+    return view, model.points_array()
+
+
+def _peak_kb(fn) -> float:
+    tracemalloc.start()
+    keep = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del keep
+    return peak / 1024.0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    get_qapp()
+    group = MovementGroup(points=[f"[{i}.125, -{i}.5, 300, 180, 0, 90]" for i in range(args.points)])
+    points, array = group.points, group.points_array()
+
+    w = time_ms(lambda: fill_widget(points), args.repeat)
+    m = time_ms(lambda: fill_model(array), args.repeat)
+    print(f"points={args.points}  repeat={args.repeat}")
+    print(f"  QListWidget items  : {w:9.1f} ms   peak py alloc {_peak_kb(lambda: fill_widget(points)):9.0f} KiB")
+    print(f"  PointsListModel    : {m:9.1f} ms   peak py alloc {_peak_kb(lambda: fill_model(array)):9.0f} KiB")
+    print(f"  speed-up           : {w / m:9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
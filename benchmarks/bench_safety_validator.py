@@ -0,0 +1,64 @@
+"""
+Safety-limit validation: batched NumPy check vs a per-point Python loop.
+
+Validates a RobotConfig whose movement groups hold thousands of points
+against its SafetyLimits, as RobotSettingsModel.save() does on every save.
+
+    batched — find_violations(): one stacked N×6 comparison over the
+              groups' cached point buffers.
+    loop    — the straightforward per-point, per-axis loop over the parsed
+              point lists (reproduced below).
+
+Usage::
+
+    python benchmarks/bench_safety_validator.py [--points 5000] [--groups 20]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import time_ms  # noqa: E402
+
+from bench_mappers import build_config  # noqa: E402
+from src.plugins.robot_settings.safety_validator import AXES, find_violations  # noqa: E402
+
+
+def loop_violations(groups, limits):
+    found = []
+    for name, group in groups.items():
+        for i, point in enumerate(group.parse_points()):
+            for axis, value in zip(AXES, point):
+                lo, hi = getattr(limits, f"{axis}_min"), getattr(limits, f"{axis}_max")
+                if axis.startswith("r"):
+                    value = lo + (value - lo) % 360.0
+                if value < lo or value > hi:
+                    found.append((name, i, axis))
+    return found
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=5000)
+    parser.add_argument("--groups", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    config = build_config(args.points, args.groups)
+    groups, limits = config.movement_groups, config.safety_limits
+    batched = find_violations(groups, limits)
+    assert [(v.group, v.point, v.axis) for v in batched] == loop_violations(groups, limits)
+
+    b = time_ms(lambda: find_violations(groups, limits), args.repeat)
+    lp = time_ms(lambda: loop_violations(groups, limits), args.repeat)
+    print(f"points={args.points}  groups={args.groups}  violations={len(batched)}")
+    print(f"  batched numpy     : {b:9.2f} ms")
+    print(f"  per-point loop    : {lp:9.2f} ms")
+    print(f"  speed-up          : {lp / b:9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
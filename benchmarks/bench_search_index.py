@@ -0,0 +1,70 @@
+"""
+SearchIndex query latency over the real settings schemas.
+
+Indexes every field of the robot, glue and camera views, the movement
+group definitions and the category ids (as SettingsNavigationWidget does),
+optionally padded with synthetic "SLOT n PICKUP/DROPOFF" groups, then
+times typical prefix and fuzzy queries.
+
+Usage::
+
+    python benchmarks/bench_search_index.py [--slots 100] [--repeat 2000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import get_qapp  # noqa: E402
+
+from src.plugins.camera_settings.view.camera_tab import camera_tab_factory  # noqa: E402
+from src.plugins.glue_settings.view.glue_tab import glue_tab_factory  # noqa: E402
+from src.plugins.robot_settings.view.robot_tab import robot_tab_factory  # noqa: E402
+from src.settings.settings_search import (  # noqa: E402
+    KIND_CATEGORY, KIND_MOVEMENT_GROUP, SearchEntry, SearchIndex,
+)
+
+QUERIES = ["slot 4 drop", "erode", "erdit", "tcp x", "safty", "robot", "zzz"]
+
+
+def build_index(slots: int) -> SearchIndex:
+    index = SearchIndex()
+    for category, factory in (("robot", robot_tab_factory),
+                              ("glue", glue_tab_factory),
+                              ("camera", camera_tab_factory)):
+        index.add(SearchEntry(category, KIND_CATEGORY, category))
+        index.add_entries(factory()[0].search_entries(category))
+    for n in range(slots):
+        for kind in ("PICKUP", "DROPOFF"):
+            index.add(SearchEntry("robot", KIND_MOVEMENT_GROUP, f"SLOT {n} {kind}"))
+    return index
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slots", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    get_qapp()
+    start = time.perf_counter()
+    index = build_index(args.slots)
+    build_ms = (time.perf_counter() - start) * 1000.0
+    index.search("warm-up")
+
+    print(f"entries={len(index)}  (views + index built in {build_ms:.1f} ms)  repeat={args.repeat}")
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            hits = index.search(query, limit=10)
+        us = (time.perf_counter() - start) / args.repeat * 1e6
+        top = hits[0].entry.key if hits else "-"
+        print(f"  {query!r:14} {us:8.1f} µs   {len(hits):2d} hits   top={top}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
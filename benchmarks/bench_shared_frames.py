@@ -0,0 +1,116 @@
+"""
+Shared-memory frame ring: throughput and latency between two processes.
+
+A producer process (run_producer_stub) publishes 1280×720 BGR frames at
+--fps; this process polls the ring every --poll-ms, as SharedFrameSource
+does on its GUI timer, and takes only the newest frame.
+
+Reports frames consumed / dropped as stale, latency from the producer's
+publish timestamp to the end of the consumer's copy, and the raw
+in-process write and read (copy) cost per frame.
+
+Usage::
+
+    python benchmarks/bench_shared_frames.py [--fps 60] [--poll-ms 16] [--seconds 3]
+"""
+import argparse
+import multiprocessing as mp
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import time_ms  # noqa: E402
+
+import numpy as np  # noqa: E402
+
+from src.plugins.camera_settings.shared_frames import (  # noqa: E402
+    SharedFrameReader, SharedFrameWriter, run_producer_stub,
+)
+
+WIDTH, HEIGHT = 1280, 720
+
+
+def raw_costs(repeat: int):
+    frame = np.random.randint(0, 255, (HEIGHT, WIDTH, 3), np.uint8)
+    with SharedFrameWriter("bench_raw_ring", WIDTH, HEIGHT) as writer:
+        with SharedFrameReader("bench_raw_ring") as reader:
+            out = np.empty(reader.shape, np.uint8)
+
+            def repeated(fn):
+                def run():
+                    for _ in range(repeat):
+                        fn()
+                return time_ms(run, 3) / repeat
+
+            write_ms = repeated(lambda: writer.write(frame))
+            read_ms = repeated(lambda: reader.read_latest())
+            read_out_ms = repeated(lambda: reader.read_latest(out=out))
+    return write_ms, read_ms, read_out_ms
+
+
+def consume(name: str, seconds: float, poll_ms: float):
+    deadline = time.perf_counter() + 5.0
+    reader = None
+    while reader is None:
+        try:
+            reader = SharedFrameReader(name)
+        except (FileNotFoundError, ValueError):
+            if time.perf_counter() > deadline:
+                raise
+            time.sleep(0.01)
+
+    latencies, consumed, dropped, last = [], 0, 0, 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        frame = reader.read_latest(last)
+        if frame is not None:
+            latencies.append(frame.age_ms())
+            consumed += 1
+            dropped += frame.dropped
+            last = frame.seq
+        time.sleep(poll_ms / 1000.0)
+    reader.close()
+    return consumed, dropped, last, latencies
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fps", type=float, default=60.0)
+    parser.add_argument("--poll-ms", type=float, default=16.0)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    write_ms, read_ms, read_out_ms = raw_costs(args.repeat)
+
+    name = "bench_frame_ring"
+    producer = mp.get_context("spawn").Process(
+        target=run_producer_stub, args=(name, WIDTH, HEIGHT, args.fps, args.seconds + 1.0),
+    )
+    producer.start()
+    try:
+        consumed, dropped, published, latencies = consume(name, args.seconds, args.poll_ms)
+    finally:
+        producer.join()
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+    print(f"frame={WIDTH}x{HEIGHT}x3  producer={args.fps:g} fps  poll={args.poll_ms:g} ms  "
+          f"seconds={args.seconds:g}")
+    print(f"  raw write (copy into ring)  : {write_ms:6.2f} ms/frame")
+    print(f"  raw read  (copy out, newest): {read_ms:6.2f} ms/frame")
+    print(f"  raw read  into out= buffer  : {read_out_ms:6.2f} ms/frame")
+    print(f"  consumed {consumed} of {published} published "
+          f"({consumed / args.seconds:.1f} fps), {dropped} dropped as stale")
+    if latencies:
+        print(f"  latency publish → copied    : median {statistics.median(latencies):5.2f} ms, "
+              f"p95 {p95:5.2f} ms, max {latencies[-1]:5.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Startup profiling harness for the plugin entry points.
+
+Measures, for each entry point (run_robot_tab.py, run_camera_tab.py,
+run_glue_tab.py, run_showcase.py), using offscreen Qt:
+
+    import        — importing the entry module (and the plugin it pulls in)
+    model         — BaseSettingsPlugin._create_model()
+    view          — BaseSettingsPlugin._create_view()
+    controller    — BaseSettingsPlugin._create_controller()
+    load          — first plugin.load()
+    first_paint   — rendering the 1280×1024 main window once
+
+Each phase reports wall-clock time (ms) and net traced allocations (KiB).
+Every sample runs in a fresh interpreter so import time is not hidden by
+the module cache; the median over --repeat runs is reported.
+
+Usage::
+
+    python benchmarks/bench_startup.py                       # print JSON
+    python benchmarks/bench_startup.py --save-baseline       # store baseline
+    python benchmarks/bench_startup.py --threshold 0.15      # compare, exit 1 on regression
+"""
+import argparse
+import importlib
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import REPO_ROOT, get_qapp  # noqa: E402
+
+DEFAULT_BASELINE  = Path(__file__).resolve().parent / "baselines" / "startup.json"
+DEFAULT_THRESHOLD = 0.20   # 20 % slower than baseline counts as a regression
+MIN_REGRESSION_MS = 5.0    # ...and at least this much slower — sub-ms phases are mostly noise
+
+ENTRY_POINTS = ["robot", "camera", "glue", "showcase"]
+
+PHASES = ["import", "model", "view", "controller", "load", "first_paint"]
+
+
+# ── single run (child process) ────────────────────────────────────────────────
+
+class _PhaseRecorder:
+    def __init__(self):
+        self.results: Dict[str, Dict[str, float]] = {}
+
+    def measure(self, phase: str, fn: Callable[[], object]):
+        before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result = fn()
+        elapsed = (time.perf_counter() - start) * 1000.0
+        after = tracemalloc.get_traced_memory()[0]
+        self.results[phase] = {
+            "wall_ms":  round(elapsed, 3),
+            "alloc_kb": round((after - before) / 1024.0, 1),
+        }
+        return result
+
+
+def _timed_plugin_class(plugin_cls, rec: _PhaseRecorder):
+    """Subclass *plugin_cls* so each factory step of __init__ is measured."""
+
+    class Timed(plugin_cls):
+        def _create_model(self, service):
+            return rec.measure("model", lambda: super(Timed, self)._create_model(service))
+
+        def _create_view(self):
+            return rec.measure("view", lambda: super(Timed, self)._create_view())
+
+        def _create_controller(self, model, view):
+            return rec.measure("controller", lambda: super(Timed, self)._create_controller(model, view))
+
+    Timed.__name__ = plugin_cls.__name__
+    return Timed
+
+
+def _paint(widget) -> None:
+    from PyQt6.QtWidgets import QMainWindow
+    win = QMainWindow()
+    win.resize(1280, 1024)
+    win.setCentralWidget(widget)
+    win.grab()   # synchronous render of the whole tree
+
+
+def _run_plugin(rec: _PhaseRecorder, module_name: str, plugin_import: str,
+                plugin_name: str, service_name: str) -> None:
+    module = rec.measure("import", lambda: importlib.import_module(module_name))
+    plugin_cls = getattr(importlib.import_module(plugin_import), plugin_name)
+    service = getattr(module, service_name)()
+
+    plugin = _timed_plugin_class(plugin_cls, rec)(service)
+    rec.measure("load", plugin.load)
+    rec.measure("first_paint", lambda: _paint(plugin.widget))
+
+
+def _run_showcase(rec: _PhaseRecorder) -> None:
+    rec.measure("import", lambda: importlib.import_module("run_showcase"))
+    from src.settings.settings_view.build_showcase import build_showcase
+    widget = rec.measure("view", build_showcase)
+    rec.measure("first_paint", lambda: _paint(widget))
+
+
+def run_once(entry: str) -> Dict[str, Dict[str, float]]:
+    app = get_qapp()   # noqa: F841 — QApplication must exist before any widget
+    rec = _PhaseRecorder()
+    tracemalloc.start()
+    try:
+        if entry == "robot":
+            _run_plugin(rec, "run_robot_tab", "src.plugins.robot_settings",
+                        "RobotSettingsPlugin", "MockRobotSettingsService")
+        elif entry == "camera":
+            _run_plugin(rec, "run_camera_tab", "src.plugins.camera_settings",
+                        "CameraSettingsPlugin", "MockCameraSettingsService")
+        elif entry == "glue":
+            _run_plugin(rec, "run_glue_tab", "src.plugins.glue_settings",
+                        "GlueSettingsPlugin", "MockGlueSettingsService")
+        elif entry == "showcase":
+            _run_showcase(rec)
+        else:
+            raise ValueError(f"Unknown entry point: {entry!r}. Known: {ENTRY_POINTS}")
+    finally:
+        tracemalloc.stop()
+    return rec.results
+
+
+# ── aggregation (parent process) ──────────────────────────────────────────────
+
+def _run_in_subprocess(entry: str) -> Dict[str, Dict[str, float]]:
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", entry],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    # Entry modules may print; the JSON payload is the last line
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def collect(entries: List[str], repeat: int) -> Dict[str, Dict[str, Dict[str, float]]]:
+    results = {}
+    for entry in entries:
+        runs = [_run_in_subprocess(entry) for _ in range(repeat)]
+        phases = {}
+        for phase in PHASES:
+            samples = [r[phase] for r in runs if phase in r]
+            if samples:
+                phases[phase] = {
+                    "wall_ms":  round(statistics.median(s["wall_ms"]  for s in samples), 3),
+                    "alloc_kb": round(statistics.median(s["alloc_kb"] for s in samples), 1),
+                }
+        phases["total"] = {
+            "wall_ms":  round(sum(p["wall_ms"]  for p in phases.values()), 3),
+            "alloc_kb": round(sum(p["alloc_kb"] for p in phases.values()), 1),
+        }
+        results[entry] = phases
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """Return a message for every phase whose wall_ms exceeds baseline × (1 + threshold)
+    by more than MIN_REGRESSION_MS."""
+    regressions = []
+    for entry, phases in current.items():
+        for phase, metrics in phases.items():
+            base = baseline.get(entry, {}).get(phase)
+            if not base or base["wall_ms"] <= 0:
+                continue
+            ratio = metrics["wall_ms"] / base["wall_ms"]
+            if ratio > 1.0 + threshold and metrics["wall_ms"] - base["wall_ms"] > MIN_REGRESSION_MS:
+                regressions.append(
+                    f"{entry}.{phase}: {metrics['wall_ms']:.1f} ms vs "
+                    f"baseline {base['wall_ms']:.1f} ms (+{(ratio - 1.0) * 100:.0f} %)"
+                )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("entries", nargs="*", default=ENTRY_POINTS,
+                        help=f"entry points to measure (default: all of {ENTRY_POINTS})")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh-process runs per entry (median)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown before a phase counts as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="write results to --baseline")
+    parser.add_argument("--output", type=Path, help="also write results JSON to this file")
+    parser.add_argument("--child", metavar="ENTRY", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_once(args.child)))
+        return 0
+
+    results = collect(args.entries, args.repeat)
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(text + "\n")
+        print(f"[bench] Baseline saved to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"[bench] No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    for msg in regressions:
+        print(f"[bench] REGRESSION {msg}")
+    if not regressions:
+        print(f"[bench] No regressions (threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Widget-construction cost: per-widget setStyleSheet() vs the shared stylesheet.
+
+Builds a grid of labelled TouchSpinBoxes (the GenericSettingGroup cell
+layout) and renders it once so that Qt parses and polishes every sheet.
+
+    shared  — current code: one SETTINGS_VIEW_STYLE on the container,
+              widgets only carry object names / dynamic properties.
+    legacy  — the same widgets with the per-instance stylesheets the code
+              used to set (reproduced below) applied on top.
+
+Usage::
+
+    python benchmarks/bench_styles.py [--fields 200] [--repeat 5]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _common import get_qapp, time_ms  # noqa: E402
+
+from PyQt6.QtWidgets import QGridLayout, QLabel, QVBoxLayout, QWidget  # noqa: E402
+
+from src.settings.settings_view.styles import (  # noqa: E402
+    BG_COLOR, BORDER, LABEL_STYLE, OBJ_SETTING_CELL, OBJ_SETTING_LABEL,
+    PRIMARY, PRIMARY_DARK, SETTINGS_VIEW_STYLE,
+)
+from src.utils_widgets.touch_spinbox import TouchSpinBox  # noqa: E402
+
+
+# ── legacy per-instance sheets (as previously set in TouchSpinBox.__init__) ───
+
+_LEGACY_FRAME = f"""
+    QFrame {{ background-color: white; border: 1px solid {BORDER}; border-radius: 10px; }}
+"""
+_LEGACY_BTN = f"""
+    QPushButton {{
+        background: white; border: 1px solid {BORDER}; border-radius: 8px;
+        font-size: 20pt; font-weight: bold; color: {PRIMARY};
+    }}
+    QPushButton:hover {{ border: 1px solid {PRIMARY}; background-color: rgba(122,90,248,0.05); }}
+    QPushButton:pressed {{ background-color: rgba(122,90,248,0.15); }}
+    QPushButton:disabled {{ background-color: {BORDER}; border: 1px solid {BORDER}; color: #aaaaaa; }}
+"""
+_LEGACY_PILL_SELECTED = f"""
+    QPushButton {{ background-color: {PRIMARY}; color: white; border: none;
+                   border-radius: 8px; padding: 0 12px; }}
+"""
+_LEGACY_PILL = f"""
+    QPushButton {{ background-color: transparent; color: {PRIMARY_DARK};
+                   border: 1px solid {BORDER}; border-radius: 8px; padding: 0 12px; }}
+    QPushButton:hover {{ background-color: rgba(122,90,248,0.08); border: 1px solid {PRIMARY}; }}
+"""
+
+
+def _apply_legacy(cell: QWidget, label: QLabel, spin: TouchSpinBox) -> None:
+    cell.setStyleSheet("background: transparent;")
+    label.setStyleSheet(LABEL_STYLE)
+    spin.setStyleSheet(_LEGACY_FRAME)
+    for btn in (spin.minus_btn, spin.plus_btn):
+        btn.setStyleSheet(_LEGACY_BTN)
+    spin.value_label.setStyleSheet(f"color: {PRIMARY_DARK}; background: transparent; border: none;")
+    for step, btn in spin._step_btns.items():
+        btn.setStyleSheet(_LEGACY_PILL_SELECTED if step == spin._step else _LEGACY_PILL)
+
+
+def build(fields: int, legacy: bool) -> QWidget:
+    root = QWidget()
+    root.setStyleSheet(f"background: {BG_COLOR};" if legacy else SETTINGS_VIEW_STYLE)
+    grid = QGridLayout()
+    for i in range(fields):
+        cell = QWidget()
+        cell.setObjectName(OBJ_SETTING_CELL)
+        layout = QVBoxLayout(cell)
+        label = QLabel(f"Field {i}")
+        label.setObjectName(OBJ_SETTING_LABEL)
+        spin = TouchSpinBox(0, 1000, initial=i, step=1, decimals=0, step_options=[1, 5, 10])
+        layout.addWidget(label)
+        layout.addWidget(spin)
+        if legacy:
+            _apply_legacy(cell, label, spin)
+        grid.addWidget(cell, i // 2, i % 2)
+    root.setLayout(grid)
+    root.resize(1280, 1024)
+    root.grab()   # force polish + paint of every widget
+    return root
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fields", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    get_qapp()
+    build(10, legacy=False)   # warm-up (font database, style plugin)
+
+    legacy = time_ms(lambda: build(args.fields, legacy=True),  args.repeat)
+    shared = time_ms(lambda: build(args.fields, legacy=False), args.repeat)
+
+    print(f"fields={args.fields}  repeat={args.repeat}")
+    print(f"  legacy per-widget sheets : {legacy:8.1f} ms")
+    print(f"  shared registry sheet    : {shared:8.1f} ms")
+    print(f"  speed-up                 : {legacy / shared:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
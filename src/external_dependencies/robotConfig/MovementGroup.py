@@ -1,10 +1,56 @@
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict
 
+import numpy as np
+
+POSE_SIZE = 6  # x, y, z, rx, ry, rz
+
+
+def _parse_pose(text: str) -> Optional[List[float]]:
+    """Parse "[x, y, z, rx, ry, rz]" into floats; None if malformed."""
+    try:
+        return [float(x.strip()) for x in text.strip("[]").split(",")]
+    except (ValueError, AttributeError):
+        return None
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def format_pose(values) -> str:
+    """Inverse of the string format: [-98.555, -224.46, 300, 180, 0, 90]."""
+    return "[" + ", ".join(_format_value(float(v)) for v in values) + "]"
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def _finite(array: np.ndarray) -> np.ndarray:
+    if not np.isfinite(array).all():
+        raise ValueError("Pose values must be finite numbers")
+    return array
+
 
 @dataclass
 class MovementGroup:
-    """Data class representing a movement group configuration"""
+    """Data class representing a movement group configuration
+
+    position / points keep the string format used in the config file, but
+    the parsed values live in cached float64 buffers (position_array(),
+    points_array() — an N×6 array) that are parsed once and dropped when
+    the strings are reassigned.  Numeric edits (set_position_array,
+    set_point, set_points_array) update the buffer directly; the strings
+    are re-formatted lazily, the next time they are read (e.g. to_dict()).
+
+    Row i of points_array() is always points[i]: a point that does not parse
+    to six numbers is a row of NaN, and set_point() leaves its string as is.
+
+    Mutating the points list in place is not tracked beyond its length —
+    call invalidate() afterwards, or assign a new list.
+    """
     velocity: int = 0
     acceleration: int = 0
     position: Optional[str] = None
@@ -35,28 +81,115 @@ class MovementGroup:
             result["points"] = self.points
         return result
 
+    # ── string fields (properties installed below the class) ──────────────
+
+    def _get_position(self) -> Optional[str]:
+        if self._position_stale:
+            self._position = None if self._position_array is None else format_pose(self._position_array)
+            self._position_stale = False
+        return self._position
+
+    def _set_position(self, value: Optional[str]) -> None:
+        self._position = value
+        self._position_stale = False
+        self._position_array = None
+        self._position_parsed = False
+
+    def _get_points(self) -> List[str]:
+        if self._points_stale:
+            self._points = [format_pose(row) for row in self._points_array]
+            self._points_len = len(self._points)
+            self._points_stale = False
+        return self._points
+
+    def _set_points(self, value: List[str]) -> None:
+        self._points = value
+        self._points_stale = False
+        self._points_array = None
+        self._points_len = None
+        self._parsed_points_source = None      # points_array() that _parsed_points belongs to
+
+    # ── numeric buffers ───────────────────────────────────────────────────
+
+    def position_array(self) -> Optional[np.ndarray]:
+        """Position as a read-only float64 array (cached); None if unset or malformed."""
+        if not self._position_parsed:
+            values = _parse_pose(self._position) if self._position else None
+            self._position_array = None if values is None else _read_only(np.array(values, dtype=np.float64))
+            self._position_parsed = True
+        return self._position_array
+
+    def points_array(self) -> np.ndarray:
+        """Trajectory points as a read-only N×6 float64 array (cached).
+
+        Points that do not parse to exactly six numbers are NaN rows.
+        """
+        if self._points_array is None or (not self._points_stale and self._points_len != len(self._points)):
+            array = np.full((len(self._points), POSE_SIZE), np.nan)
+            for row, values in enumerate(map(_parse_pose, self._points)):
+                if values is not None and len(values) == POSE_SIZE:
+                    array[row] = values
+            self._points_array = _read_only(array)
+            self._points_len = len(self._points)
+        return self._points_array
+
+    def set_position_array(self, values) -> None:
+        """Set the position from numbers; the string is formatted when next read."""
+        self._position_array = _read_only(np.array(values, dtype=np.float64).reshape(POSE_SIZE))
+        self._position_parsed = True
+        self._position_stale = True
+
+    def set_points_array(self, values) -> None:
+        """Replace all points from an N×6 array-like; strings are formatted when next read.
+
+        Raises ValueError for NaN / infinite values (e.g. the malformed rows of
+        points_array()), which have no string form.
+        """
+        array = _finite(np.array(values, dtype=np.float64).reshape(-1, POSE_SIZE))
+        self._points_array = _read_only(array)
+        self._points_stale = True
+
+    def set_point(self, index: int, values) -> None:
+        """Replace points[index] from six numbers; every other point string is kept."""
+        pose = _finite(np.array(values, dtype=np.float64).reshape(POSE_SIZE))
+        array = self.points_array().copy()
+        points = list(self.points)
+        array[index] = pose
+        points[index] = format_pose(pose)
+        self._points = points
+        self._points_stale = False
+        self._points_array = _read_only(array)
+        self._points_len = len(points)
+
+    def invalidate(self) -> None:
+        """Drop the numeric caches after editing the points list in place."""
+        self._set_points(self.points)
+        self._set_position(self.position)
+
+    # ── legacy list API ───────────────────────────────────────────────────
+
     def parse_position(self) -> Optional[List[float]]:
         """Parse position string into list of floats"""
-        if not self.position:
-            return None
-
-        try:
-            # Remove brackets and split by comma
-            position_str = self.position.strip("[]")
-            values = [float(x.strip()) for x in position_str.split(",")]
-            return values
-        except (ValueError, AttributeError):
-            return None
+        array = self.position_array()
+        return None if array is None else array.tolist()
 
     def parse_points(self) -> List[List[float]]:
-        """Parse all trajectory points into lists of floats"""
-        parsed_points = []
-        for point in self.points:
-            try:
-                # Remove brackets and split by comma
-                point_str = point.strip("[]")
-                values = [float(x.strip()) for x in point_str.split(",")]
-                parsed_points.append(values)
-            except (ValueError, AttributeError):
-                continue
-        return parsed_points
\ No newline at end of file
+        """Parse all trajectory points into lists of floats
+
+        Served from points_array().  Only while some point is not six numbers
+        are the strings parsed — once per change of the points — so short
+        points are still returned and unparsable ones skipped.
+        """
+        array = self.points_array()
+        if not np.isnan(array).any():
+            return array.tolist()
+        if self._parsed_points_source is not array:
+            self._parsed_points = [values for values in map(_parse_pose, self.points) if values is not None]
+            self._parsed_points_source = array
+        return [list(values) for values in self._parsed_points]
+
+
+# Backed by the numeric buffers; installed after @dataclass so __init__,
+# __eq__ and __repr__ go through them.
+MovementGroup.position = property(MovementGroup._get_position, MovementGroup._set_position)
+MovementGroup.points   = property(MovementGroup._get_points,   MovementGroup._set_points)
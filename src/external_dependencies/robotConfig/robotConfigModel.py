@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from src.external_dependencies.robotConfig.GlobalMotionSettings import GlobalMotionSettings
 from src.external_dependencies.robotConfig.MovementGroup import MovementGroup
 from src.external_dependencies.robotConfig.OffsetDirectionMap import OffsetDirectionMap
@@ -284,6 +286,11 @@ class RobotConfig:
         return config.points if config else []
     
     # Helper methods for parsed positions (returns lists of floats ready for robot)
+
+    def getPointsArray(self, group_name: str) -> np.ndarray:
+        """Get a movement group's trajectory points as a cached, read-only N×6 float array"""
+        config = self.movement_groups.get(group_name)
+        return config.points_array() if config else np.empty((0, 6))
     
     def getLoginPositionParsed(self) -> Optional[List[float]]:
         """Get LOGIN_POS position as parsed list of floats"""
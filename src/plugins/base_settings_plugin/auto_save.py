@@ -0,0 +1,62 @@
+"""
+AutoSaver — debounced auto-save for settings controllers.
+
+Every notify() restarts an idle timer; the save callback runs once the
+edits have been quiet for delay_ms, so a burst of TouchSpinBox taps turns
+into a single write.  During continuous editing max_delay_ms caps how
+long a change may stay unsaved.  The callback saves the view's whole
+delta, so every key changed during the burst lands in that one write.
+
+Usage::
+
+    saver = AutoSaver(controller.save_pending, delay_ms=1000, parent=view)
+    view.value_changed_signal.connect(lambda *_: saver.notify())
+    view.tab_deactivated.connect(saver.flush)
+"""
+import time
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+_DEFAULT_MAX_DELAY_FACTOR = 5
+
+
+class AutoSaver(QObject):
+    def __init__(self, save: Callable[[], None], delay_ms: int = 1000,
+                 max_delay_ms: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        self._save = save
+        self._delay_ms = delay_ms
+        self._max_delay_s = (max_delay_ms if max_delay_ms is not None
+                             else delay_ms * _DEFAULT_MAX_DELAY_FACTOR) / 1000
+        self._first_change: Optional[float] = None     # perf_counter() of the oldest unsaved change
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+    def notify(self) -> None:
+        """A setting changed — (re)start the idle timer."""
+        now = time.perf_counter()
+        if self._first_change is None:
+            self._first_change = now
+        remaining = self._first_change + self._max_delay_s - now
+        if remaining <= 0:
+            self.flush()
+            return
+        self._timer.start(min(self._delay_ms, int(remaining * 1000)))
+
+    def flush(self) -> None:
+        """Save now if changes are pending."""
+        if self._first_change is None:
+            return
+        self.cancel()
+        self._save()
+
+    def cancel(self) -> None:
+        """Drop the pending save (e.g. because the user pressed Save)."""
+        self._timer.stop()
+        self._first_change = None
+
+    def is_pending(self) -> bool:
+        return self._first_change is not None
@@ -1,6 +1,10 @@
 from typing import Generic, TypeVar, Optional, Tuple
 from PyQt6.QtWidgets import QWidget
 
+from src.plugins.base_settings_plugin.service_worker import ServiceWorker
+from src.settings.settings_history import SettingsHistory, SettingsHistoryView
+from src.settings.settings_view.settings_view import SettingsView
+
 # Type variables
 TService = TypeVar("TService")
 TModel = TypeVar("TModel")
@@ -25,20 +29,48 @@ class BaseSettingsPlugin(Generic[TService, TModel, TController, TView]):
 
             def _create_controller(self, model: MyModel, view: QWidget) -> MyController:
                 return MyController(model, view)
+
+    Async mode (``async_io=True``):
+        Service calls made by load() and Save run on a ServiceWorker instead of
+        the GUI thread; models receive it as ``worker=self.worker``.  Connect to
+        plugin.worker's started / progress / finished / failed signals (op is
+        "load" or "save") to follow them.  Save is disabled while a save is in
+        flight and overlapping saves coalesce to the newest.
+
+    Auto-save (``auto_save_ms=N``):
+        Controllers save the edited fields by themselves once edits have been
+        quiet for N ms (an AutoSaver, passed as ``auto_save_ms=self.auto_save_ms``),
+        and flush pending edits when the navigation leaves the view.
+
+    History (``history=SettingsHistory(path)``):
+        Models record every save into the history (passed as
+        ``history=self.history``) and a "History" tab lists the versions.
+        Restoring one sets and saves only the keys that differ from the
+        current settings.  Use one history file per plugin.
     """
 
-    def __init__(self, service: TService):
+    def __init__(self, service: TService, async_io: bool = False,
+                 auto_save_ms: Optional[int] = None, history: Optional[SettingsHistory] = None):
         """
         Initialize the plugin with dependency injection.
 
         Args:
             service: The service that handles data persistence
+            async_io: Run service calls on a background worker
+            auto_save_ms: Save edits this long after the last change (None: Save button only)
+            history: Record saves here and show them in a History tab
         """
         self._service = service
+        self._worker: Optional[ServiceWorker] = ServiceWorker() if async_io else None
+        self._auto_save_ms = auto_save_ms
+        self._history = history
+        self._history_view: Optional[SettingsHistoryView] = None
         self._model: TModel = self._create_model(service)
         self._view: TView = self._create_view()
         self._controller: TController = self._create_controller(self._model, self._view)
         self._widget: QWidget = self._extract_main_widget(self._view)
+        if history is not None:
+            self._add_history_tab(history)
 
     # ── Abstract Methods ─────────────────────────────────────────────────────────
 
@@ -59,15 +91,45 @@ class BaseSettingsPlugin(Generic[TService, TModel, TController, TView]):
             return view_result[0]
         return view_result
 
+    def _add_history_tab(self, history: SettingsHistory) -> None:
+        widget = self._widget
+        settings_view = widget if isinstance(widget, SettingsView) else getattr(widget, "settings_view", None)
+        if settings_view is None:
+            print(f"[{self.__class__.__name__}] No SettingsView to add the History tab to")
+            return
+        self._history_view = SettingsHistoryView(history)
+        self._history_view.restore_requested.connect(self.restore)
+        settings_view.add_raw_tab("History", self._history_view)
+
     # ── Public API ───────────────────────────────────────────────────────────────
 
+    @property
+    def worker(self) -> Optional[ServiceWorker]:
+        """Background worker for service calls; None unless created with async_io=True."""
+        return self._worker
+
+    @property
+    def auto_save_ms(self) -> Optional[int]:
+        return self._auto_save_ms
+
+    @property
+    def history(self) -> Optional[SettingsHistory]:
+        return self._history
+
+    @property
+    def history_view(self) -> Optional[SettingsHistoryView]:
+        return self._history_view
+
     @property
     def widget(self) -> TView:
         """Returns the main QWidget for this settings plugin."""
         return self._widget
 
     def load(self) -> None:
-        """Load data from model/service into the UI via controller."""
+        """Load data from model/service into the UI via controller.
+
+        In async mode this returns at once; the UI is filled when the service replies.
+        """
         if hasattr(self._controller, "load"):
             self._controller.load()
 
@@ -76,4 +138,11 @@ class BaseSettingsPlugin(Generic[TService, TModel, TController, TView]):
         if hasattr(self._controller, "save"):
             self._controller.save()
         else:
-            print(f"[{self.__class__.__name__}] Save not implemented; may auto-save on change")
\ No newline at end of file
+            print(f"[{self.__class__.__name__}] Save not implemented; may auto-save on change")
+
+    def restore(self, version: int) -> None:
+        """Restore the settings saved as version of the history."""
+        if self._history is None or not hasattr(self._controller, "restore"):
+            print(f"[{self.__class__.__name__}] Restore not available")
+            return
+        self._controller.restore(self._history.state_at(version))
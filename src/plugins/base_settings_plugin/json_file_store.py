@@ -0,0 +1,113 @@
+"""
+JsonFileStore — one settings object persisted as a JSON file, crash-safe.
+
+Writes go to a temporary file in the same directory, are fsync'ed and then
+renamed over the target, so a crash or power cut leaves either the old or
+the new file — never a truncated one.  A save whose serialised content is
+byte-identical to what is on disk (compared by SHA-256) is skipped.
+
+load() caches the parsed object together with the file's mtime and size;
+while neither changes, repeated loads return the cached object without
+reading or parsing the file.  Callers share that object and must not
+mutate it — the mappers' from_flat_dict() already returns copies.
+
+Usage::
+
+    store = JsonFileStore("camera.json", CameraSettingsMapper.from_json,
+                          CameraSettingsMapper.to_json, CameraSettingsData)
+    settings = store.load()        # default() while the file does not exist
+    store.save(settings)           # False when nothing changed
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Generic, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class JsonFileStore(Generic[T]):
+    def __init__(self, path: Union[str, Path], parse: Callable[[dict], T],
+                 serialise: Callable[[T], dict], default: Callable[[], T]):
+        self._path = Path(path)
+        self._parse = parse
+        self._serialise = serialise
+        self._default = default
+        self._cached: Optional[T] = None
+        self._stat_key: Optional[Tuple[int, int]] = None   # (mtime_ns, size) of the cached content
+        self._digest: Optional[str] = None                 # SHA-256 of the file content on disk
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self) -> T:
+        """The stored object; re-read only when the file changed on disk."""
+        stat_key = self._stat()
+        if stat_key is None:
+            self._cached, self._stat_key, self._digest = None, None, None
+            return self._default()
+        if stat_key != self._stat_key or self._cached is None:
+            data = self._path.read_bytes()
+            self._cached = self._parse(json.loads(data))
+            self._digest = hashlib.sha256(data).hexdigest()
+            self._stat_key = stat_key
+        return self._cached
+
+    def save(self, obj: T) -> bool:
+        """Write obj atomically.  Returns False (nothing written) if the file already holds it."""
+        data = json.dumps(self._serialise(obj), indent=2).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == self._digest and self._stat() == self._stat_key:
+            self._cached = obj
+            return False
+        self._write_atomic(data)
+        self._cached, self._digest, self._stat_key = obj, digest, self._stat()
+        return True
+
+    # ── Private ────────────────────────────────────────────────────────────────
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self._path.stat()
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _write_atomic(self, data: bytes) -> None:
+        directory = self._path.parent
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{self._path.name}.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                os.chmod(tmp, self._mode())      # mkstemp creates 0600; keep the file's own mode
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self._path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        self._fsync_dir(directory)
+
+    def _mode(self) -> int:
+        try:
+            return self._path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            return 0o644
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        # Makes the rename itself durable; directories cannot be opened on Windows
+        if os.name != "posix":
+            return
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -0,0 +1,53 @@
+"""
+PendingSaves — the state a model has submitted for saving but not yet written.
+
+A ServiceWorker coalesces saves: a save parked behind a running one is
+replaced by the next, and its callbacks never run.  Building each save on
+the last *written* settings would then lose the replaced save's changes,
+so models build on the latest *submitted* state instead, and every job
+carries all keys submitted since the last successful write.
+
+Usage::
+
+    base = self._pending.base(self._settings)
+    updated = Mapper.from_flat_dict(flat, base)
+    delta = self._pending.submit(updated, flat)     # flat + still unwritten keys
+    # write(updated, delta) ... then on the GUI thread:
+    self._pending.done(updated, delta)   # or self._pending.failed(updated)
+"""
+from typing import Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PendingSaves(Generic[T]):
+    def __init__(self):
+        self._state: Optional[T] = None     # newest submitted, not yet written
+        self._delta: dict = {}              # keys submitted since the last write → value
+
+    def base(self, saved: T) -> T:
+        """What the next save should build on: the newest submitted state, else saved."""
+        return self._state if self._state is not None else saved
+
+    def submit(self, state: T, delta: dict) -> dict:
+        """Record a new save of state; returns delta merged with the keys still unwritten."""
+        self._state = state
+        self._delta.update(delta)
+        return dict(self._delta)
+
+    def done(self, state: T, delta: dict) -> None:
+        """The save of state with delta was written."""
+        for key, value in delta.items():
+            if key in self._delta and self._delta[key] is value:    # not re-submitted since
+                del self._delta[key]
+        if self._state is state:
+            self._state = None
+
+    def failed(self, state: T) -> None:
+        """The save of state failed; if nothing newer is queued, forget what was submitted."""
+        if self._state is state:
+            self._state = None
+            self._delta.clear()
+
+    def is_empty(self) -> bool:
+        return self._state is None
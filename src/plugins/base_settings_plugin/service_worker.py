@@ -0,0 +1,142 @@
+"""
+ServiceWorker — runs blocking service calls off the GUI thread.
+
+Jobs run on a private QThreadPool (one thread by default, so calls into a
+service never overlap and run in submission order); their results come
+back through queued signals, so on_done / on_error callbacks and every
+signal below are delivered on the GUI thread.
+
+Coalescing: a job submitted with coalesce=True while another job of the
+same op is in flight is parked instead of queued; a later submission
+replaces the parked one, so after a burst of saves only the newest is
+written.  The replaced job's callbacks are never called.
+
+Usage::
+
+    worker = ServiceWorker()
+    worker.failed.connect(lambda op, exc: print(f"{op} failed: {exc}"))
+    worker.submit("save", lambda: service.save_settings(settings),
+                  on_done=lambda _: view.clear_dirty(), coalesce=True)
+
+call_service() runs the same job inline when there is no worker, which
+lets models keep one code path for both modes.
+"""
+import itertools
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PyQt6.QtCore import QCoreApplication, QDeadlineTimer, QObject, QThreadPool, pyqtSignal
+
+OnDone  = Optional[Callable[[Any], None]]
+OnError = Optional[Callable[[Exception], None]]
+
+
+class ServiceWorker(QObject):
+    """
+    Signals:
+        started(str op):                     a job began running
+        progress(str op, int percent):       reported by the job via report_progress()
+        finished(str op, object result):     the job returned
+        failed(str op, object exception):    the job raised
+    """
+
+    started  = pyqtSignal(str)
+    progress = pyqtSignal(str, int)
+    finished = pyqtSignal(str, object)
+    failed   = pyqtSignal(str, object)
+
+    _job_done = pyqtSignal(int, bool, object)   # job id, ok, result or exception (worker thread → GUI)
+
+    def __init__(self, max_threads: int = 1, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._ids = itertools.count(1)
+        self._jobs:    Dict[int, Tuple[str, OnDone, OnError]] = {}          # in flight
+        self._parked:  Dict[str, Tuple[Callable[[], Any], OnDone, OnError]] = {}   # op → newest coalesced job
+        self._job_done.connect(self._on_job_done)
+
+    # ── Public API ─────────────────────────────────────────────────────────────
+
+    def submit(self, op: str, fn: Callable[[], Any], on_done: OnDone = None,
+               on_error: OnError = None, coalesce: bool = False) -> None:
+        """Run fn() in the background; on_done(result) or on_error(exc) follows on the GUI thread."""
+        if coalesce and self._in_flight(op):
+            self._parked[op] = (fn, on_done, on_error)
+            return
+        self._start(op, fn, on_done, on_error)
+
+    def report_progress(self, op: str, percent: int) -> None:
+        """Emit progress for op — safe to call from inside a running job."""
+        self.progress.emit(op, percent)
+
+    def is_busy(self, op: Optional[str] = None) -> bool:
+        """True while a job (of op, if given) is running, queued or parked."""
+        if op is None:
+            return bool(self._jobs or self._parked)
+        return self._in_flight(op) or op in self._parked
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        """Block until every job has finished and its callbacks ran.  False on timeout."""
+        deadline = QDeadlineTimer(timeout_ms)
+        while self.is_busy():
+            if deadline.hasExpired():
+                return False
+            self._pool.waitForDone(10)
+            QCoreApplication.processEvents()
+        return True
+
+    # ── Private ────────────────────────────────────────────────────────────────
+
+    def _in_flight(self, op: str) -> bool:
+        return any(job_op == op for job_op, _, _ in self._jobs.values())
+
+    def _start(self, op: str, fn: Callable[[], Any], on_done: OnDone, on_error: OnError) -> None:
+        job_id = next(self._ids)
+        self._jobs[job_id] = (op, on_done, on_error)
+        self._pool.start(lambda: self._run(job_id, op, fn))
+
+    def _run(self, job_id: int, op: str, fn: Callable[[], Any]) -> None:
+        # Worker thread: never touch widgets here, only hand the outcome over
+        self.started.emit(op)
+        try:
+            result = fn()
+        except Exception as e:
+            self._job_done.emit(job_id, False, e)
+        else:
+            self._job_done.emit(job_id, True, result)
+
+    def _on_job_done(self, job_id: int, ok: bool, payload) -> None:
+        op, on_done, on_error = self._jobs.pop(job_id)
+        # Start the parked job first so callbacks already see it as in flight
+        parked = self._parked.pop(op, None)
+        if parked is not None:
+            self._start(op, *parked)
+        if ok:
+            self.finished.emit(op, payload)
+            if on_done is not None:
+                on_done(payload)
+        else:
+            self.failed.emit(op, payload)
+            if on_error is not None:
+                on_error(payload)
+
+
+def call_service(worker: Optional[ServiceWorker], op: str, fn: Callable[[], Any],
+                 on_done: OnDone = None, on_error: OnError = None, coalesce: bool = False) -> None:
+    """Run fn() through worker, or right away when worker is None.
+
+    Inline, on_done(result) is called before this returns and an exception
+    is passed to on_error — or propagates when there is none.
+    """
+    if worker is not None:
+        worker.submit(op, fn, on_done, on_error, coalesce)
+        return
+    try:
+        result = fn()
+    except Exception as e:
+        if on_error is None:
+            raise
+        on_error(e)
+        return
+    if on_done is not None:
+        on_done(result)
@@ -13,6 +13,17 @@ class ICameraSettingsService(Protocol):
     Unified service interface for camera settings.
 
     Combines both settings persistence and camera actions.
+
+    Optional:
+        save_settings_delta(settings, delta) — when implemented, called instead
+        of save_settings() with the updated settings plus the flat dict of the
+        fields that changed, so the backend can write only those.
+
+        capture_image_with_progress / calibrate_camera_with_progress /
+        calibrate_robot_with_progress(progress, is_cancelled) — when
+        implemented, called instead of the plain action (on a worker thread)
+        with progress(percent, message="") to report and is_cancelled() to
+        poll; return early or raise ActionCancelled once it is True.
     """
 
     # Settings persistence
@@ -4,12 +4,14 @@ from PyQt6.QtWidgets import QWidget
 from src.settings.settings_view import SettingsView
 from src.utils_widgets.clickable_label import ClickableLabel
 
+from src.plugins.camera_settings.camera_action_runner import CameraActionRunner
 from src.plugins.camera_settings.controller import CameraSettingsController
 from src.plugins.camera_settings.model import CameraSettingsModel
 from src.plugins.camera_settings.ICameraSettingsService import ICameraSettingsService
 from src.plugins.camera_settings.view.camera_tab import camera_tab_factory
 from src.plugins.camera_settings.view.camera_settings_view import CameraSettingsView
 from src.plugins.base_settings_plugin.base_settings_plugin import BaseSettingsPlugin
+from src.settings.settings_history import SettingsHistory
 
 
 class CameraSettingsPlugin(
@@ -29,12 +31,13 @@ class CameraSettingsPlugin(
         window.setCentralWidget(plugin.widget)
     """
 
-    def __init__(self, service: ICameraSettingsService):
+    def __init__(self, service: ICameraSettingsService, async_io: bool = False,
+                 auto_save_ms: Optional[int] = None, history: Optional[SettingsHistory] = None):
 
-        super().__init__(service)
+        super().__init__(service, async_io, auto_save_ms, history)
 
     def _create_model(self, service: ICameraSettingsService) -> CameraSettingsModel:
-        return CameraSettingsModel(service)
+        return CameraSettingsModel(service, worker=self._worker, history=self._history)
 
     def _create_view(self) -> CameraSettingsView:
         view, settings_view = camera_tab_factory()
@@ -42,16 +45,20 @@ class CameraSettingsPlugin(
         return view
 
     def _create_controller(self, model: CameraSettingsModel, view: CameraSettingsView) -> CameraSettingsController:
-        return CameraSettingsController(model, view)
+        return CameraSettingsController(model, view, auto_save_ms=self._auto_save_ms)
 
     # ── Private helpers ────────────────────────────────────────────
     def _connect_actions(self, view: CameraSettingsView) -> None:
+        # Capture and calibration can take tens of seconds — run them off the GUI thread
         ctrl = view.controls
-        svc = self._service
-        ctrl.raw_mode_toggled.connect(svc.set_raw_mode)
-        ctrl.capture_requested.connect(svc.capture_image)
-        ctrl.calibrate_camera_requested.connect(svc.calibrate_camera)
-        ctrl.calibrate_robot_requested.connect(svc.calibrate_robot)
+        ctrl.raw_mode_toggled.connect(self._service.set_raw_mode)
+        self._action_runner = CameraActionRunner(self._service, parent=view)
+        self._action_runner.bind(ctrl)
+
+    @property
+    def action_runner(self) -> CameraActionRunner:
+        """Runs capture / calibration; connect to its action_* signals for results."""
+        return self._action_runner
 
     # Optional: convenience to access preview label
     @property
@@ -0,0 +1,132 @@
+"""
+CameraActionRunner — runs capture and calibration off the GUI thread.
+
+Calibrations take tens of seconds, so the service calls behind the camera
+controls run on a ServiceWorker.  At most one calibration (camera or
+robot) runs at a time and each action runs at most once at a time;
+run() refuses anything else.
+
+Services can opt into progress and early stopping by implementing
+``<action>_with_progress(progress, is_cancelled)`` next to the plain method
+(e.g. calibrate_camera_with_progress): progress(percent, message) may be
+called from the worker thread, and is_cancelled() turns True after
+cancel().  Plain methods cannot be interrupted — a cancelled action
+finishes in the background and its result is discarded.
+
+Usage::
+
+    runner = CameraActionRunner(service)
+    runner.bind(view.controls)          # buttons, progress, cancel, results
+    runner.run(ACTION_CALIBRATE_CAMERA)
+"""
+import threading
+from typing import Dict
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from src.plugins.base_settings_plugin.service_worker import ServiceWorker
+from src.plugins.camera_settings.ICameraSettingsService import ICameraSettingsService
+from src.plugins.camera_settings.view.camera_actions import (
+    ACTION_CALIBRATE_CAMERA, ACTION_CALIBRATE_ROBOT, ACTION_CAPTURE, CALIBRATION_ACTIONS,
+)
+
+_SERVICE_METHODS = {
+    ACTION_CAPTURE:          "capture_image",
+    ACTION_CALIBRATE_CAMERA: "calibrate_camera",
+    ACTION_CALIBRATE_ROBOT:  "calibrate_robot",
+}
+
+
+class ActionCancelled(Exception):
+    """May be raised by a *_with_progress service method once is_cancelled() is True."""
+
+
+class CameraActionRunner(QObject):
+    """
+    Signals:
+        action_started(str action)
+        action_progress(str action, int percent, str message)
+        action_finished(str action, object result)   — service return value
+        action_failed(str action, str error)
+        action_cancelled(str action)                  — emitted when the call has returned
+    """
+
+    action_started   = pyqtSignal(str)
+    action_progress  = pyqtSignal(str, int, str)
+    action_finished  = pyqtSignal(str, object)
+    action_failed    = pyqtSignal(str, str)
+    action_cancelled = pyqtSignal(str)
+
+    def __init__(self, service: ICameraSettingsService, parent=None):
+        super().__init__(parent)
+        self._service = service
+        self._worker = ServiceWorker(max_threads=len(_SERVICE_METHODS), parent=self)
+        self._running: Dict[str, threading.Event] = {}   # action → its cancel flag
+
+    # ── Public API ─────────────────────────────────────────────────────────────
+
+    def run(self, action: str) -> bool:
+        """Start action in the background.  False if it (or another calibration) is running."""
+        if action not in _SERVICE_METHODS:
+            raise ValueError(f"Unknown camera action {action!r}")
+        if action in self._running:
+            print(f"[CameraActionRunner] '{action}' is already running")
+            return False
+        if action in CALIBRATION_ACTIONS and any(a in self._running for a in CALIBRATION_ACTIONS):
+            print(f"[CameraActionRunner] '{action}' refused: a calibration is already running")
+            return False
+        cancel = threading.Event()
+        self._running[action] = cancel
+        self._worker.submit(action, lambda: self._call(action, cancel),
+                            on_done=lambda result: self._on_done(action, result),
+                            on_error=lambda error: self._on_error(action, error))
+        self.action_started.emit(action)
+        return True
+
+    def cancel(self, action: str = "") -> None:
+        """Ask action — or every running action when empty — to stop."""
+        for name, flag in self._running.items():
+            if not action or name == action:
+                flag.set()
+
+    def is_running(self, action: str = "") -> bool:
+        return action in self._running if action else bool(self._running)
+
+    def wait_for_done(self, timeout_ms: int = -1) -> bool:
+        return self._worker.wait_for_done(timeout_ms)
+
+    def bind(self, controls) -> None:
+        """Wire a CameraControlsWidget: its buttons start actions, its strip shows progress."""
+        controls.capture_requested.connect(lambda: self.run(ACTION_CAPTURE))
+        controls.calibrate_camera_requested.connect(lambda: self.run(ACTION_CALIBRATE_CAMERA))
+        controls.calibrate_robot_requested.connect(lambda: self.run(ACTION_CALIBRATE_ROBOT))
+        controls.cancel_requested.connect(self.cancel)
+        self.action_started.connect(controls.set_action_running)
+        self.action_progress.connect(controls.set_action_progress)
+        self.action_finished.connect(lambda action, _: controls.set_action_result(action, "done"))
+        self.action_failed.connect(lambda action, error: controls.set_action_result(action, f"failed: {error}"))
+        self.action_cancelled.connect(lambda action: controls.set_action_result(action, "cancelled"))
+
+    # ── Private ────────────────────────────────────────────────────────────────
+
+    def _call(self, action: str, cancel: threading.Event):
+        # Worker thread
+        method = _SERVICE_METHODS[action]
+        with_progress = getattr(self._service, f"{method}_with_progress", None)
+        if with_progress is None:
+            return getattr(self._service, method)()
+        return with_progress(lambda percent, message="": self.action_progress.emit(action, int(percent), message),
+                             cancel.is_set)
+
+    def _on_done(self, action: str, result) -> None:
+        if self._running.pop(action).is_set():
+            self.action_cancelled.emit(action)
+        else:
+            self.action_finished.emit(action, result)
+
+    def _on_error(self, action: str, error: Exception) -> None:
+        if self._running.pop(action).is_set() or isinstance(error, ActionCancelled):
+            self.action_cancelled.emit(action)
+            return
+        print(f"[CameraActionRunner] '{action}' failed: {error}")
+        self.action_failed.emit(action, str(error))
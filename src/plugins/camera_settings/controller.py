@@ -1,26 +1,85 @@
+from typing import Optional
+
+from src.plugins.base_settings_plugin.auto_save import AutoSaver
 from src.plugins.camera_settings.model import CameraSettingsModel
 from src.plugins.camera_settings.mapper import CameraSettingsMapper
 from src.plugins.camera_settings.view.camera_settings_view import CameraSettingsView
 
 
 class CameraSettingsController:
-    def __init__(self, model: CameraSettingsModel, view: CameraSettingsView):
+    def __init__(self, model: CameraSettingsModel, view: CameraSettingsView,
+                 auto_save_ms: Optional[int] = None):
         self._model = model
         self._view = view
+        self._auto_saver: Optional[AutoSaver] = None
 
         # Connect settings persistence signals
         self._view.save_requested.connect(self._on_save)
-
+        if auto_save_ms:
+            self._auto_saver = AutoSaver(self._save_delta, auto_save_ms, parent=view)
+            self._view.value_changed_signal.connect(lambda *_: self._auto_saver.notify())
+            self._view.settings_view.tab_deactivated.connect(self.flush)
 
     def load(self) -> None:
-        settings = self._model.load()
+        self._model.load(on_done=self._on_loaded, on_error=self._on_load_failed)
+
+    def _on_loaded(self, settings) -> None:
         # Access the internal settings_view to set values
         self._view.settings_view.set_values(CameraSettingsMapper.to_flat_dict(settings))
+        self._view.settings_view.set_error("")
+
+    def _on_load_failed(self, error: Exception) -> None:
+        print(f"[controller] Camera settings not loaded: {error}")
+        self._view.settings_view.set_error(f"Not loaded: {error}")
+
+    def flush(self) -> None:
+        """Write edits waiting for auto-save now."""
+        if self._auto_saver is not None:
+            self._auto_saver.flush()
+
+    def restore(self, flat: dict) -> None:
+        """Bring the settings back to flat (e.g. a SettingsHistory version).
+
+        Only the keys whose value differs from the saved settings are pushed
+        into the view and saved.
+        """
+        current = self._model.to_flat_dict()
+        changed = {k: v for k, v in flat.items() if k in current and current[k] != v}
+        if not changed:
+            print(f"[controller] Camera settings already match the restored version")
+            return
+        self._view.settings_view.set_values(changed)
+        self._view.settings_view.mark_dirty(changed)          # until the save confirms them
+        self._save_delta(changed)
 
     def _on_save(self, flat: dict) -> None:
-        # Convert flat dict to CameraSettingsData using mapper
-        # Use current model settings as base
-        current_settings = self._model._settings
-        settings = CameraSettingsMapper.from_flat_dict(flat, current_settings)
-        self._model.save(settings)
+        if self._auto_saver is not None:
+            self._auto_saver.cancel()
+        self._save_delta()
+
+    def _save_delta(self, delta: Optional[dict] = None) -> None:
+        # Apply only the fields the user edited (or delta) onto the current model settings
+        settings_view = self._view.settings_view
+        delta = settings_view.get_delta() if delta is None else delta
+        if not delta:
+            print(f"[controller] No camera settings changed")
+            return
+        settings = CameraSettingsMapper.from_flat_dict(delta, self._model.latest_settings())
+        self._model.save(settings, delta,
+                         on_done=lambda _: self._on_saved(delta),
+                         on_error=self._on_save_failed)
+        settings_view.set_saving(self._model.is_saving())
+
+    def _on_saved(self, delta: dict) -> None:
+        settings_view = self._view.settings_view
+        # A save replaced while parked never reports back; this one wrote its keys too
+        settings_view.clear_dirty({**delta, **self._model.to_flat_dict()})
+        settings_view.set_saving(self._model.is_saving())
+        settings_view.set_error("")
         print(f"[controller] Camera settings saved successfully")
+
+    def _on_save_failed(self, error: Exception) -> None:
+        settings_view = self._view.settings_view
+        settings_view.set_saving(self._model.is_saving())
+        settings_view.set_error(f"Not saved: {error}")
+        print(f"[controller] Camera settings not saved: {error}")
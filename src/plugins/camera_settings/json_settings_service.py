@@ -0,0 +1,55 @@
+"""
+Reference file-backed ICameraSettingsService.
+
+Settings live in one JSON file in the repository's nested format
+(CameraSettingsMapper.to_json / from_json), written atomically by a
+JsonFileStore: unchanged saves are skipped and repeated loads are served
+from the cached object.  Camera actions are forwarded to an optional
+actions object — the file service itself cannot talk to a camera.
+
+Usage::
+
+    service = JsonCameraSettingsService("config/camera_settings.json", actions=camera)
+    plugin = CameraSettingsPlugin(service)
+"""
+from pathlib import Path
+from typing import Optional, Union
+
+from src.plugins.base_settings_plugin.json_file_store import JsonFileStore
+from src.plugins.camera_settings.camera_actions_service import ICameraActionsService
+from src.plugins.camera_settings.camera_settings_data import CameraSettingsData
+from src.plugins.camera_settings.mapper import CameraSettingsMapper
+
+
+class JsonCameraSettingsService:
+    def __init__(self, path: Union[str, Path], actions: Optional[ICameraActionsService] = None):
+        self._store = JsonFileStore(path, CameraSettingsMapper.from_json,
+                                    CameraSettingsMapper.to_json, CameraSettingsData)
+        self._actions = actions
+
+    # Settings persistence
+    def load_settings(self) -> CameraSettingsData:
+        return self._store.load()
+
+    def save_settings(self, settings: CameraSettingsData) -> None:
+        if not self._store.save(settings):
+            print(f"[JsonCameraSettingsService] {self._store.path.name} unchanged, not written")
+
+    # Camera actions
+    def set_raw_mode(self, enabled: bool) -> None:
+        self._forward("set_raw_mode", enabled)
+
+    def capture_image(self):
+        return self._forward("capture_image")
+
+    def calibrate_camera(self):
+        return self._forward("calibrate_camera")
+
+    def calibrate_robot(self):
+        return self._forward("calibrate_robot")
+
+    def _forward(self, action: str, *args):
+        if self._actions is None:
+            print(f"[JsonCameraSettingsService] No camera actions service; {action} ignored")
+            return None
+        return getattr(self._actions, action)(*args)
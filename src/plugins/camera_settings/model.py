@@ -1,18 +1,90 @@
-from typing import Optional
+from typing import Callable, Optional
 
+from src.plugins.base_settings_plugin.pending_saves import PendingSaves
+from src.plugins.base_settings_plugin.service_worker import ServiceWorker, call_service
 from src.plugins.camera_settings.camera_settings_data import CameraSettingsData
 from src.plugins.camera_settings.ICameraSettingsService import ICameraSettingsService
+from src.plugins.camera_settings.mapper import CameraSettingsMapper
+from src.settings.settings_history import HistoryRecorder, SettingsHistory
 
 
 class CameraSettingsModel:
-    def __init__(self, service: ICameraSettingsService):
+    """
+    With a ServiceWorker the service calls run in the background: load() and
+    save() return at once and on_done / on_error follow on the GUI thread.
+    Without one they run inline, as before.
+
+    With a SettingsHistory every save is recorded there (changed keys only).
+    """
+
+    def __init__(self, service: ICameraSettingsService, worker: Optional[ServiceWorker] = None,
+                 history: Optional[SettingsHistory] = None):
         self._service = service
+        self._worker = worker
+        self._recorder = (HistoryRecorder(history, "CameraSettings", CameraSettingsMapper.to_flat_dict)
+                          if history is not None else None)
         self._settings: Optional[CameraSettingsData] = None
+        self._pending: PendingSaves[CameraSettingsData] = PendingSaves()
+
+    def load(self, on_done: Optional[Callable[[CameraSettingsData], None]] = None,
+             on_error: Optional[Callable[[Exception], None]] = None) -> Optional[CameraSettingsData]:
+        """Returns the settings when running inline, None in the background."""
+        def loaded(settings: CameraSettingsData) -> None:
+            self._settings = settings
+            if on_done is not None:
+                on_done(settings)
+
+        call_service(self._worker, "load", self._read, loaded, on_error)
+        return self._settings if self._worker is None else None
+
+    def save(self, settings: CameraSettingsData, delta: Optional[dict] = None,
+             on_done: Optional[Callable[[CameraSettingsData], None]] = None,
+             on_error: Optional[Callable[[Exception], None]] = None) -> None:
+        """Persist settings; with a delta, backends that support it write only the changed fields.
+
+        Build settings on latest_settings().  In the background, overlapping
+        saves coalesce: only the newest is written, carrying the earlier
+        saves' delta keys as well.
+        """
+        merged = self._pending.submit(settings, delta or {})
+        delta = merged if delta is not None else None
+
+        def write() -> None:
+            if delta is not None and hasattr(self._service, "save_settings_delta"):
+                self._service.save_settings_delta(settings, delta)
+            else:
+                self._service.save_settings(settings)
+            if self._recorder is not None:
+                self._recorder.saved(settings, delta)
+
+        def saved(_) -> None:
+            self._pending.done(settings, merged)
+            self._settings = settings
+            if on_done is not None:
+                on_done(settings)
+
+        def failed(error: Exception) -> None:
+            self._pending.failed(settings)
+            if on_error is not None:
+                on_error(error)
+            elif self._worker is None:
+                raise error                 # inline without on_error: propagate as before
+
+        call_service(self._worker, "save", write, saved, failed, coalesce=True)
+
+    def latest_settings(self) -> Optional[CameraSettingsData]:
+        """The newest settings submitted for saving, else the last loaded or saved ones."""
+        return self._pending.base(self._settings)
+
+    def is_saving(self) -> bool:
+        return self._worker is not None and self._worker.is_busy("save")
 
-    def load(self) -> CameraSettingsData:
-        self._settings = self._service.load_settings()
-        return self._settings
+    def to_flat_dict(self) -> dict:
+        """The last loaded or saved settings as a flat dict ({} before the first load)."""
+        return CameraSettingsMapper.to_flat_dict(self._settings) if self._settings is not None else {}
 
-    def save(self, settings: CameraSettingsData) -> None:
-        self._service.save_settings(settings)
-        self._settings = settings
+    def _read(self) -> CameraSettingsData:
+        settings = self._service.load_settings()
+        if self._recorder is not None:
+            self._recorder.loaded(settings)
+        return settings
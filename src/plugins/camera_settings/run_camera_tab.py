@@ -1,3 +1,5 @@
+import argparse
+import multiprocessing as mp
 import sys
 from pathlib import Path
 
@@ -9,6 +11,8 @@ from PyQt6.QtWidgets import QApplication, QMainWindow
 from src.plugins.camera_settings import CameraSettingsPlugin, ICameraSettingsService
 from src.plugins.camera_settings.camera_settings_data import CameraSettingsData
 from src.plugins.camera_settings.mapper import CameraSettingsMapper
+from src.plugins.camera_settings.shared_frames import run_producer_stub
+from src.plugins.camera_settings.view.shared_frame_source import SharedFrameSource
 
 # ── Sample data matching the exact JSON structure ──────────────────────────────
 
@@ -62,15 +66,31 @@ class FakeCameraSettingsService(ICameraSettingsService):
 # ── Runner ─────────────────────────────────────────────────────────────────────
 
 def main():
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Camera settings tab")
+    parser.add_argument("--shm", metavar="NAME",
+                        help="show live frames from the shared-memory frame ring NAME")
+    parser.add_argument("--stub", action="store_true",
+                        help="with --shm: also start the local test-pattern producer")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
 
     plugin = CameraSettingsPlugin(service=FakeCameraSettingsService())
     plugin.load()
 
-    # White test frame so overlay drawing is visible
-    test_frame = QPixmap(1280, 720)
-    test_frame.fill(QColor("white"))
-    plugin.preview_label.set_frame(test_frame)
+    producer = None
+    if args.shm:
+        plugin.preview_label.set_fast_transform(True)
+        source = SharedFrameSource(args.shm, label=plugin.preview_label)
+        source.start()
+        if args.stub:
+            producer = mp.get_context("spawn").Process(target=run_producer_stub, args=(args.shm,), daemon=True)
+            producer.start()
+    else:
+        # White test frame so overlay drawing is visible
+        test_frame = QPixmap(1280, 720)
+        test_frame.fill(QColor("white"))
+        plugin.preview_label.set_frame(test_frame)
 
     win = QMainWindow()
     win.setWindowTitle("Camera Settings")
@@ -78,7 +98,10 @@ def main():
     win.setCentralWidget(plugin.widget)
     win.show()
 
-    sys.exit(app.exec())
+    code = app.exec()
+    if producer is not None:
+        producer.terminate()
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,265 @@
+"""
+Shared-memory frame ring between an external vision process and the HMI.
+
+The producer writes uint8 H×W×C frames into a fixed ring of slots in a
+multiprocessing.shared_memory block; the reader only ever takes the newest
+frame, so frames the HMI had no time for are dropped, never queued.  No
+pickling, sockets or Qt are involved — this module imports only NumPy.
+
+Layout (all integers little-endian uint64)::
+
+    header  [magic, slots, height, width, channels, latest_seq, instance, 0]
+    meta    slots × [seq, timestamp_ns]       seq 0 = slot being written
+    data    slots × height × width × channels uint8, 64-byte aligned
+
+Sequence numbers start at 1; frame n lives in slot (n - 1) % slots.  A
+writer marks a slot 0 before copying into it and stamps the sequence
+afterwards; the reader checks the stamp before and after its copy and
+discards the frame if the writer lapped it meanwhile (seqlock).
+
+Timestamps are time.monotonic_ns(), comparable across processes.  Each
+writer stamps a random instance id into the header and clears the magic
+when it closes, so a reader can tell that the ring it mapped was closed or
+replaced by a restarted producer under the same name.
+
+Usage::
+
+    # vision process
+    writer = SharedFrameWriter("camera0", width=1280, height=720)
+    writer.write(frame_bgr)
+
+    # HMI process
+    reader = SharedFrameReader("camera0")
+    frame = reader.read_latest(after_seq=last_seq)   # None if nothing new
+"""
+import os
+import sys
+import time
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+
+import numpy as np
+
+_MAGIC = 0x31474E49524D4143        # b"CAMRING1"
+_HEADER_WORDS = 8
+_MAGIC_W, _SLOTS_W, _HEIGHT_W, _WIDTH_W, _CHANNELS_W, _LATEST_W, _INSTANCE_W = range(7)
+_ALIGN = 64
+
+
+def _layout(slots: int, height: int, width: int, channels: int):
+    """(meta offset, data offset, total bytes)."""
+    meta_offset = _HEADER_WORDS * 8
+    data_offset = -(-(meta_offset + slots * 16) // _ALIGN) * _ALIGN
+    return meta_offset, data_offset, data_offset + slots * height * width * channels
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open an existing block without letting this process's resource tracker own it.
+
+    Before Python 3.13 attaching registers the block too, and the tracker
+    unlinks it when the attaching process exits — under the producer.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    seq: int
+    timestamp_ns: int       # time.monotonic_ns() when the producer finished writing
+    array: np.ndarray       # H×W×C uint8 (H×W for one channel)
+    dropped: int            # frames published since after_seq that were skipped
+
+    def age_ms(self) -> float:
+        return (time.monotonic_ns() - self.timestamp_ns) / 1e6
+
+
+class _SharedRing:
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self._shm = shm
+        self._header = np.ndarray((_HEADER_WORDS,), np.uint64, shm.buf)
+
+    def _map(self) -> None:
+        slots, height, width, channels = (int(self._header[w]) for w in
+                                          (_SLOTS_W, _HEIGHT_W, _WIDTH_W, _CHANNELS_W))
+        meta_offset, data_offset, _ = _layout(slots, height, width, channels)
+        self.slots = slots
+        self.shape = (height, width) if channels == 1 else (height, width, channels)
+        self._meta = np.ndarray((slots, 2), np.uint64, self._shm.buf, meta_offset)
+        self._data = np.ndarray((slots, *self.shape), np.uint8, self._shm.buf, data_offset)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def latest_seq(self) -> int:
+        return int(self._header[_LATEST_W])
+
+    def close(self) -> None:
+        # Views into shm.buf must go before the mapping can be closed
+        self._header = self._meta = self._data = None
+        self._shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class SharedFrameWriter(_SharedRing):
+    """Producer side — creates (and on close unlinks) the shared-memory block."""
+
+    def __init__(self, name: str, width: int, height: int, channels: int = 3, slots: int = 4):
+        if slots < 2:
+            raise ValueError("A frame ring needs at least 2 slots")
+        _, _, size = _layout(slots, height, width, channels)
+        super().__init__(shared_memory.SharedMemory(name=name, create=True, size=size))
+        self._header[:] = 0
+        self._header[_SLOTS_W], self._header[_HEIGHT_W] = slots, height
+        self._header[_WIDTH_W], self._header[_CHANNELS_W] = width, channels
+        self._map()
+        self._meta[:] = 0
+        self._header[_INSTANCE_W] = int.from_bytes(os.urandom(8), "little") | 1
+        self._header[_MAGIC_W] = _MAGIC      # readers may attach from here on
+        self._seq = 0
+
+    def write(self, frame: np.ndarray) -> int:
+        """Copy frame into the next slot and publish it.  Returns its sequence number."""
+        seq = self._seq + 1
+        slot = (seq - 1) % self.slots
+        self._meta[slot, 0] = 0                         # slot is being written
+        self._data[slot] = frame.reshape(self.shape)
+        self._meta[slot, 1] = time.monotonic_ns()
+        self._meta[slot, 0] = seq
+        self._header[_LATEST_W] = seq
+        self._seq = seq
+        return seq
+
+    def close(self) -> None:
+        shm = self._shm
+        self._header[_MAGIC_W] = 0           # tells attached readers the ring is gone
+        super().close()
+        shm.unlink()
+
+
+class SharedFrameReader(_SharedRing):
+    """Consumer side — attaches to a ring created by SharedFrameWriter.
+
+    Raises FileNotFoundError if no ring of that name exists (yet), and
+    ValueError if the block is not a frame ring.
+    """
+
+    _RETRIES = 3
+
+    def __init__(self, name: str):
+        super().__init__(_attach(name))
+        if int(self._header[_MAGIC_W]) != _MAGIC:
+            self.close()
+            raise ValueError(f"Shared memory {name!r} is not a frame ring")
+        self._map()
+
+    def read_latest(self, after_seq: int = 0, copy: bool = True,
+                    out: Optional[np.ndarray] = None) -> Optional[SharedFrame]:
+        """The newest frame if it is newer than after_seq, else None.
+
+        out (an array of the ring's shape) receives the copy instead of a
+        fresh allocation.  With copy=False the array is a view into the
+        ring; it stays intact only until the producer has written
+        slots - 1 further frames.
+        """
+        for _ in range(self._RETRIES):
+            seq = self.latest_seq()
+            if seq <= after_seq:
+                return None
+            slot = (seq - 1) % self.slots
+            if int(self._meta[slot, 0]) != seq:
+                continue                                # lapped before we started
+            timestamp = int(self._meta[slot, 1])
+            if not copy:
+                array = self._data[slot]
+            elif out is not None:
+                np.copyto(out, self._data[slot])
+                array = out
+            else:
+                array = self._data[slot].copy()
+            if int(self._meta[slot, 0]) != seq:
+                continue                                # overwritten while copying
+            dropped = seq - after_seq - 1 if after_seq else 0
+            return SharedFrame(seq, timestamp, array, dropped)
+        return None
+
+    def is_current(self) -> bool:
+        """False once the producer closed this ring or a new ring took over its name.
+
+        Opens the name again to compare instance ids, so call it only
+        occasionally — e.g. after the producer has been quiet for a while.
+        """
+        if int(self._header[_MAGIC_W]) != _MAGIC:
+            return False
+        try:
+            shm = _attach(self.name)
+        except FileNotFoundError:
+            return False
+        try:
+            header = np.ndarray((_HEADER_WORDS,), np.uint64, shm.buf)
+            same = int(header[_INSTANCE_W]) == int(self._header[_INSTANCE_W])
+            del header
+        finally:
+            shm.close()
+        return same
+
+
+def run_producer_stub(name: str, width: int = 1280, height: int = 720, fps: float = 30.0,
+                      duration: Optional[float] = None, slots: int = 4) -> int:
+    """Publish a moving test pattern at fps until duration (seconds) elapses or Ctrl+C.
+
+    Stands in for the vision process during development.  Returns the
+    number of frames written.
+    """
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    base = np.stack([np.broadcast_to(x, (height, width)),
+                     np.broadcast_to(y, (height, width)),
+                     np.full((height, width), 96, np.float32)], axis=-1).astype(np.uint8)
+    bar = max(width // 16, 1)
+    period = 1.0 / fps
+    writer = SharedFrameWriter(name, width, height, 3, slots)
+    start = time.perf_counter()
+    seq = 0
+    try:
+        while duration is None or time.perf_counter() - start < duration:
+            frame = base.copy()
+            pos = (seq * 8) % width
+            frame[:, pos:pos + bar] = 255
+            seq = writer.write(frame)
+            delay = start + seq * period - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        writer.close()
+    return seq
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Publish test frames into a shared-memory ring")
+    parser.add_argument("--name", default="camera_preview")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--duration", type=float, default=None)
+    args = parser.parse_args()
+    print(f"[producer] {args.name}: {args.width}x{args.height} @ {args.fps:g} fps (Ctrl+C to stop)")
+    written = run_producer_stub(args.name, args.width, args.height, args.fps, args.duration)
+    print(f"[producer] {written} frames written")
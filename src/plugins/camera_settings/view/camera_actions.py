@@ -0,0 +1,12 @@
+"""
+Names of the long-running camera actions.
+
+CameraControlsWidget has one button per action and CameraActionRunner maps
+each to a service call; both import the names from here.
+"""
+ACTION_CAPTURE           = "capture"
+ACTION_CALIBRATE_CAMERA  = "calibrate_camera"
+ACTION_CALIBRATE_ROBOT   = "calibrate_robot"
+
+# At most one of these runs at a time
+CALIBRATION_ACTIONS = (ACTION_CALIBRATE_CAMERA, ACTION_CALIBRATE_ROBOT)
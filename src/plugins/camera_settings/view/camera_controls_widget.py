@@ -12,11 +12,21 @@ calibrate_camera_requested()        — Calibrate Camera pressed
 calibrate_robot_requested()         — Calibrate Robot pressed
 active_area_changed(str)            — user selected an area to edit ("working_area" /
                                       "brightness_area" / "" for none)
+cancel_requested()                  — Cancel pressed while an action is running
+
+Long-running actions are reported back through set_action_running(),
+set_action_progress() and set_action_result() — CameraActionRunner.bind()
+wires all of this.  While a calibration runs both calibrate buttons are
+disabled; a running action's own button is disabled until it ends.
 """
 from PyQt6.QtCore import pyqtSignal
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QGroupBox
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QGroupBox, QProgressBar
+)
+
+from src.plugins.camera_settings.view.camera_actions import (
+    ACTION_CALIBRATE_CAMERA, ACTION_CALIBRATE_ROBOT, ACTION_CAPTURE, CALIBRATION_ACTIONS,
 )
 
 from src.utils_widgets.SwitchButton import QToggle
@@ -25,6 +35,25 @@ from src.utils_widgets.MaterialButton import MaterialButton
 
 _LABEL_DARK = "color: #AAAACC; font-size: 10pt; background: transparent;"
 
+_ACTION_TITLES = {
+    ACTION_CAPTURE:          "Capture Image",
+    ACTION_CALIBRATE_CAMERA: "Calibrate Camera",
+    ACTION_CALIBRATE_ROBOT:  "Calibrate Robot",
+}
+
+_PROGRESS_STYLE = """
+QProgressBar {
+    background: #26263E;
+    border: none;
+    border-radius: 4px;
+    max-height: 8px;
+}
+QProgressBar::chunk {
+    background: #6750A4;
+    border-radius: 4px;
+}
+"""
+
 _GROUP_STYLE = """
 QGroupBox {
     background: transparent;
@@ -86,11 +115,14 @@ class CameraControlsWidget(QWidget):
     calibrate_camera_requested = pyqtSignal()
     calibrate_robot_requested  = pyqtSignal()
     active_area_changed        = pyqtSignal(str)   # "" = no area selected
+    cancel_requested           = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setStyleSheet("background: #1A1A2E;")
         self._area_btns: dict[str, QPushButton] = {}
+        self._action_btns: dict[str, QPushButton] = {}
+        self._running_actions: set[str] = set()
         self._build_ui()
 
     # ── Build ──────────────────────────────────────────────────────────────────
@@ -101,9 +133,12 @@ class CameraControlsWidget(QWidget):
         layout.setSpacing(8)
 
         layout.addWidget(self._build_raw_mode_row())
-        layout.addWidget(self._action_btn("Capture Image",    self.capture_requested))
-        layout.addWidget(self._action_btn("Calibrate Camera", self.calibrate_camera_requested))
-        layout.addWidget(self._action_btn("Calibrate Robot",  self.calibrate_robot_requested))
+        for action, signal in ((ACTION_CAPTURE,          self.capture_requested),
+                               (ACTION_CALIBRATE_CAMERA, self.calibrate_camera_requested),
+                               (ACTION_CALIBRATE_ROBOT,  self.calibrate_robot_requested)):
+            self._action_btns[action] = self._action_btn(_ACTION_TITLES[action], signal)
+            layout.addWidget(self._action_btns[action])
+        layout.addWidget(self._build_action_status())
         layout.addWidget(self._build_divider())
         layout.addWidget(self._build_area_row())
 
@@ -129,6 +164,33 @@ class CameraControlsWidget(QWidget):
         hl.addWidget(self._raw_toggle)
         return row
 
+    def _build_action_status(self) -> QWidget:
+        container = QWidget()
+        container.setStyleSheet("background: transparent;")
+        vl = QVBoxLayout(container)
+        vl.setContentsMargins(0, 0, 0, 0)
+        vl.setSpacing(4)
+
+        row = QHBoxLayout()
+        self._action_status = QLabel("")
+        self._action_status.setStyleSheet(_LABEL_DARK)
+        self._action_status.setWordWrap(True)
+        self._cancel_btn = MaterialButton("Cancel", color="#B3261E", font_size=10)
+        self._cancel_btn.setMinimumHeight(28)
+        self._cancel_btn.clicked.connect(self.cancel_requested)
+        self._cancel_btn.hide()
+        row.addWidget(self._action_status, 1)
+        row.addWidget(self._cancel_btn)
+
+        self._action_progress = QProgressBar()
+        self._action_progress.setStyleSheet(_PROGRESS_STYLE)
+        self._action_progress.setTextVisible(False)
+        self._action_progress.hide()
+
+        vl.addLayout(row)
+        vl.addWidget(self._action_progress)
+        return container
+
     def _build_divider(self) -> QWidget:
         line = QWidget()
         line.setFixedHeight(1)
@@ -202,6 +264,36 @@ class CameraControlsWidget(QWidget):
             btn.setChecked(n == name)
             btn.blockSignals(False)
 
+    def set_action_running(self, action: str) -> None:
+        """An action started: disable its button (both calibrate buttons for a calibration)."""
+        self._running_actions.add(action)
+        self._action_status.setText(f"{_ACTION_TITLES[action]}…")
+        self._action_progress.setRange(0, 0)        # busy until the first progress report
+        self._action_progress.show()
+        self._cancel_btn.show()
+        self._update_action_buttons()
+
+    def set_action_progress(self, action: str, percent: int, message: str = "") -> None:
+        self._action_progress.setRange(0, 100)
+        self._action_progress.setValue(percent)
+        text = f"{_ACTION_TITLES[action]}: {percent}%"
+        self._action_status.setText(f"{text} — {message}" if message else text)
+
+    def set_action_result(self, action: str, result: str) -> None:
+        """An action ended; result is shown next to its title (e.g. "done", "failed: …")."""
+        self._running_actions.discard(action)
+        self._action_status.setText(f"{_ACTION_TITLES[action]}: {result}")
+        if not self._running_actions:
+            self._action_progress.hide()
+            self._cancel_btn.hide()
+        self._update_action_buttons()
+
+    def _update_action_buttons(self) -> None:
+        calibrating = any(a in self._running_actions for a in CALIBRATION_ACTIONS)
+        for action, btn in self._action_btns.items():
+            btn.setEnabled(action not in self._running_actions
+                           and not (calibrating and action in CALIBRATION_ACTIONS))
+
     # ── Factory helper ─────────────────────────────────────────────────────────
 
     @staticmethod
@@ -27,6 +27,8 @@ class CameraSettingsView(QWidget):
     Signals (re-emitted from internal widgets):
         # From ClickableLabel
         corner_updated(str, int, float, float) — area_name, corner_index, x_norm, y_norm
+                                                 (during drags, per the label's emit policy)
+        corner_committed(str, int, float, float) — same, once the corner is released
         empty_clicked(str, float, float) — area_name, x_norm, y_norm
 
         # From CameraControlsWidget
@@ -52,6 +54,7 @@ class CameraSettingsView(QWidget):
 
     # Signals from ClickableLabel
     corner_updated = pyqtSignal(str, int, float, float)  # area_name, index, xn, yn
+    corner_committed = pyqtSignal(str, int, float, float)  # area_name, index, xn, yn
     empty_clicked = pyqtSignal(str, float, float)  # area_name, xn, yn
 
     # Signals from CameraControlsWidget
@@ -64,6 +67,7 @@ class CameraSettingsView(QWidget):
     # Signals from SettingsView
     value_changed_signal = pyqtSignal(str, object, str)  # key, value, component_name
     save_requested = pyqtSignal(dict)
+    search_entries_changed = pyqtSignal()
 
     def __init__(self, settings_view: SettingsView, parent=None):
         super().__init__(parent)
@@ -106,6 +110,7 @@ class CameraSettingsView(QWidget):
         # ClickableLabel signals
         if self._preview_label:
             self._preview_label.corner_updated.connect(self.corner_updated.emit)
+            self._preview_label.corner_committed.connect(self.corner_committed.emit)
             self._preview_label.empty_clicked.connect(self.empty_clicked.emit)
 
         # CameraControlsWidget signals
@@ -118,6 +123,7 @@ class CameraSettingsView(QWidget):
         # SettingsView signals
         self._settings_view.value_changed_signal.connect(self.value_changed_signal.emit)
         self._settings_view.save_requested.connect(self.save_requested.emit)
+        self._settings_view.search_entries_changed.connect(self.search_entries_changed.emit)
 
     # ── Internal slots ─────────────────────────────────────────────────────────
 
@@ -150,3 +156,14 @@ class CameraSettingsView(QWidget):
     def settings_view(self) -> SettingsView:
         """Inner SettingsView — used by the persistence controller."""
         return self._settings_view
+
+    def search_entries(self, category: str):
+        """Search entries of the inner SettingsView (see SettingsNavigationWidget)."""
+        return self._settings_view.search_entries(category)
+
+    def reveal(self, key: str) -> bool:
+        return self._settings_view.reveal(key)
+
+    def on_tab_deactivate(self) -> None:
+        """Forwarded to the inner SettingsView (see SettingsNavigationWidget)."""
+        self._settings_view.on_tab_deactivate()
@@ -23,6 +23,7 @@ def camera_tab_factory(parent=None) -> Tuple[CameraSettingsView, SettingsView]:
         component_name="CameraSettings",
         mapper=CameraSettingsMapper.to_flat_dict,
         parent=parent,
+        lazy=True,
     )
     settings_view.add_tab("Core",        [CORE_GROUP])
     settings_view.add_tab("Detection",   [CONTOUR_GROUP, PREPROCESSING_GROUP])
@@ -0,0 +1,122 @@
+"""
+SharedFrameSource — feeds a ClickableLabel from a shared-memory frame ring.
+
+Polls a SharedFrameReader on a GUI-thread timer (one poll per screen refresh
+by default) and pushes only the newest frame via set_frame_array(); frames
+published between two polls are counted as dropped, never queued.  Until
+the producer has created the ring the source keeps retrying to attach.
+When no frame arrives for a while it checks whether the ring was closed or
+replaced by a restarted producer and only then re-attaches; a producer
+that merely pauses keeps its ring and the last frame stays on screen.
+
+Usage::
+
+    source = SharedFrameSource("camera_preview", label=view.preview_label)
+    source.start()
+
+    # or for a widget installed with CameraSettingsView.set_preview_widget():
+    label = ClickableLabel(fast_transform=True)
+    view.set_preview_widget(label)
+    SharedFrameSource("camera_preview", label=label).start()
+"""
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from src.plugins.camera_settings.shared_frames import SharedFrame, SharedFrameReader
+from src.utils_widgets.clickable_label import ClickableLabel
+
+_DEFAULT_INTERVAL_MS = 16
+_RECHECK_AFTER_S     = 2.0    # no new frame for this long → check the ring was replaced
+
+
+class SharedFrameSource(QObject):
+    """
+    Signals:
+        frame_received(SharedFrame): a new frame was taken from the ring
+        attached(str):               the ring was found (ring name)
+
+    Frames are copied out of the ring into two buffers used in turn, so a
+    frame's array is overwritten two frames later — copy it to keep it.
+    """
+
+    frame_received = pyqtSignal(object)   # SharedFrame
+    attached       = pyqtSignal(str)
+
+    def __init__(self, name: str, label: Optional[ClickableLabel] = None, format: str = "bgr",
+                 interval_ms: Optional[int] = None, parent=None):
+        super().__init__(parent if parent is not None else label)
+        self._name = name
+        self._label = label
+        self._format = format
+        self._reader: Optional[SharedFrameReader] = None
+        self._buffers: List[np.ndarray] = []
+        self._last_seq = 0
+        self._received = 0
+        self._dropped = 0
+        self._last_age_ms = 0.0
+        self._next_check = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._poll)
+        if interval_ms is None and label is not None and label.screen() is not None:
+            rate = label.screen().refreshRate()
+            interval_ms = int(1000 / rate) if rate > 0 else None
+        self._timer.setInterval(interval_ms or _DEFAULT_INTERVAL_MS)
+
+    # ── Public API ─────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def stop(self) -> None:
+        """Stop polling and detach from the ring."""
+        self._timer.stop()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def is_attached(self) -> bool:
+        return self._reader is not None
+
+    def stats(self) -> Tuple[int, int, float]:
+        """(frames received, frames dropped as stale, age of the last frame in ms)."""
+        return self._received, self._dropped, self._last_age_ms
+
+    # ── Private ────────────────────────────────────────────────────────────────
+
+    def _poll(self) -> None:
+        if self._reader is None and not self._attach():
+            return
+        frame = self._reader.read_latest(self._last_seq, out=self._buffers[self._received % 2])
+        if frame is None:
+            now = time.monotonic()
+            if now >= self._next_check:
+                self._next_check = now + _RECHECK_AFTER_S
+                if not self._reader.is_current():
+                    self._reader.close()    # a restarted producer creates a new block
+                    self._reader = None
+            return
+        self._last_seq = frame.seq
+        self._next_check = time.monotonic() + _RECHECK_AFTER_S
+        self._received += 1
+        self._dropped += frame.dropped
+        self._last_age_ms = frame.age_ms()
+        if self._label is not None:
+            self._label.set_frame_array(frame.array, self._format)
+        self.frame_received.emit(frame)
+
+    def _attach(self) -> bool:
+        try:
+            self._reader = SharedFrameReader(self._name)
+        except (FileNotFoundError, ValueError):
+            return False                # producer not up yet — retry on the next tick
+        self._last_seq = 0
+        self._next_check = time.monotonic() + _RECHECK_AFTER_S
+        if not self._buffers or self._buffers[0].shape != self._reader.shape:
+            self._buffers = [np.empty(self._reader.shape, np.uint8) for _ in range(2)]
+        print(f"[SharedFrameSource] Attached to '{self._name}' {self._reader.shape}")
+        self.attached.emit(self._name)
+        return True
@@ -5,7 +5,13 @@ from src.plugins.glue_settings.glue_type import GlueType
 
 
 class GlueSettingsService(Protocol):
-    """Unified service interface for glue settings and glue types."""
+    """Unified service interface for glue settings and glue types.
+
+    Optional:
+        save_settings_delta(settings, delta) — when implemented, called instead
+        of save_settings() with the updated settings plus the flat dict of the
+        fields that changed.
+    """
 
     def load_settings(self) -> GlueSettings: ...
     def save_settings(self, settings: GlueSettings) -> None: ...
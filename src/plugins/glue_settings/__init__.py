@@ -1,3 +1,5 @@
+from typing import Optional
+
 from PyQt6.QtWidgets import QWidget
 
 from src.plugins.glue_settings.controller import GlueSettingsController
@@ -5,17 +7,20 @@ from src.plugins.glue_settings.model import GlueSettingsModel
 from src.plugins.glue_settings.IGlueSettingsService import GlueSettingsService
 from src.plugins.glue_settings.view.glue_tab import glue_tab_factory
 from src.plugins.base_settings_plugin.base_settings_plugin import BaseSettingsPlugin
+from src.plugins.base_settings_plugin.service_worker import call_service
+from src.settings.settings_history import SettingsHistory
 from src.settings.settings_view import SettingsView
 
 
 class GlueSettingsPlugin(BaseSettingsPlugin[GlueSettingsService, GlueSettingsModel, GlueSettingsController, QWidget]):
 
-    def __init__(self, service: GlueSettingsService):
+    def __init__(self, service: GlueSettingsService, async_io: bool = False,
+                 auto_save_ms: Optional[int] = None, history: Optional[SettingsHistory] = None):
         self._glue_type_tab = None
-        super().__init__(service)
+        super().__init__(service, async_io, auto_save_ms, history)
 
     def _create_model(self, service: GlueSettingsService) -> GlueSettingsModel:
-        return GlueSettingsModel(service)
+        return GlueSettingsModel(service, worker=self._worker, history=self._history)
 
     def _create_view(self) -> QWidget:
         view_result = glue_tab_factory()
@@ -28,7 +33,7 @@ class GlueSettingsPlugin(BaseSettingsPlugin[GlueSettingsService, GlueSettingsMod
         return view_result
 
     def _create_controller(self, model: GlueSettingsModel, view: SettingsView) -> GlueSettingsController:
-        return GlueSettingsController(model, view)
+        return GlueSettingsController(model, view, auto_save_ms=self._auto_save_ms)
 
     def _connect_glue_type_signals(self):
         self._glue_type_tab.add_requested.connect(self._on_add_glue_type)
@@ -36,32 +41,28 @@ class GlueSettingsPlugin(BaseSettingsPlugin[GlueSettingsService, GlueSettingsMod
         self._glue_type_tab.remove_requested.connect(self._on_remove_glue_type)
 
     def _on_add_glue_type(self, name: str, description: str):
-        try:
-            self._service.add_glue_type(name, description)
-            self._reload_glue_types()
-        except Exception as e:
-            print(f"[GlueSettingsPlugin] Error adding glue type: {e}")
+        self._change_glue_types(lambda: self._service.add_glue_type(name, description), "adding glue type")
 
     def _on_update_glue_type(self, id_: str, name: str, description: str):
-        try:
-            self._service.update_glue_type(id_, name, description)
-            self._reload_glue_types()
-        except Exception as e:
-            print(f"[GlueSettingsPlugin] Error updating glue type: {e}")
+        self._change_glue_types(lambda: self._service.update_glue_type(id_, name, description), "updating glue type")
 
     def _on_remove_glue_type(self, id_: str):
-        try:
-            self._service.remove_glue_type(id_)
-            self._reload_glue_types()
-        except Exception as e:
-            print(f"[GlueSettingsPlugin] Error removing glue type: {e}")
+        self._change_glue_types(lambda: self._service.remove_glue_type(id_), "removing glue type")
 
     def _reload_glue_types(self):
-        try:
-            glue_types = self._service.load_glue_types()
-            self._glue_type_tab.load_types(glue_types)
-        except Exception as e:
-            print(f"[GlueSettingsPlugin] Error reloading glue types: {e}")
+        self._change_glue_types(None, "reloading glue types")
+
+    def _change_glue_types(self, change, action: str):
+        """Apply change (if any) and reload the list — on the worker in async mode."""
+        def run():
+            if change is not None:
+                change()
+            return self._service.load_glue_types()
+
+        def failed(e: Exception):
+            print(f"[GlueSettingsPlugin] Error {action}: {e}")
+
+        call_service(self._worker, "glue_types", run, self._glue_type_tab.load_types, failed)
 
     def load(self) -> None:
         super().load()
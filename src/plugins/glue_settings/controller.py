@@ -1,25 +1,80 @@
+from typing import Optional
+
+from src.plugins.base_settings_plugin.auto_save import AutoSaver
 from src.plugins.glue_settings.model import GlueSettingsModel
 from src.settings.settings_view.settings_view import SettingsView
 from src.plugins.glue_settings.mapper import GlueSettingsMapper
 
 
 class GlueSettingsController:
-    def __init__(self, model: GlueSettingsModel, view: SettingsView):
+    def __init__(self, model: GlueSettingsModel, view: SettingsView, auto_save_ms: Optional[int] = None):
         self._model = model
         self._view = view
+        self._auto_saver = AutoSaver(self._save_delta, auto_save_ms, parent=view) if auto_save_ms else None
         self._view.value_changed_signal.connect(self._on_value_changed)
         self._view.save_requested.connect(self._on_save_requested)
+        self._view.tab_deactivated.connect(self.flush)
 
     def load(self) -> None:
-        settings = self._model.load()
+        self._model.load(on_done=self._on_loaded, on_error=self._on_load_failed)
+
+    def _on_loaded(self, settings) -> None:
         flat = GlueSettingsMapper.to_flat_dict(settings)
         self._view.set_values(flat)
+        self._view.set_error("")
+
+    def _on_load_failed(self, error: Exception) -> None:
+        print(f"[controller] Settings not loaded: {error}")
+        self._view.set_error(f"Not loaded: {error}")
+
+    def flush(self) -> None:
+        """Write edits waiting for auto-save now."""
+        if self._auto_saver is not None:
+            self._auto_saver.flush()
+
+    def restore(self, flat: dict) -> None:
+        """Bring the settings back to flat (e.g. a SettingsHistory version).
+
+        Only the keys whose value differs from the saved settings are pushed
+        into the view and saved.
+        """
+        current = self._model.to_flat_dict()
+        changed = {k: v for k, v in flat.items() if k in current and current[k] != v}
+        if not changed:
+            print(f"[controller] Settings already match the restored version")
+            return
+        self._view.set_values(changed)
+        self._view.mark_dirty(changed)          # until the save confirms them
+        self._save_delta(changed)
 
     def _on_value_changed(self, key: str, value, component: str) -> None:
-        # Individual field changed - optionally auto-save or just mark as dirty
-        pass
+        # Individual field changed - auto-save after the burst, or wait for Save
+        if self._auto_saver is not None:
+            self._auto_saver.notify()
 
     def _on_save_requested(self, values: dict) -> None:
-        # Save button clicked - save all values
-        self._model.save(values)
+        # Save button clicked - a pending auto-save is covered by this write
+        if self._auto_saver is not None:
+            self._auto_saver.cancel()
+        self._save_delta()
+
+    def _save_delta(self, delta: Optional[dict] = None) -> None:
+        # Save only the fields the user edited (or delta)
+        delta = self._view.get_delta() if delta is None else delta
+        if not delta:
+            print(f"[controller] No settings changed")
+            return
+        self._model.save(delta, on_done=lambda _: self._on_saved(delta), on_error=self._on_save_failed)
+        self._view.set_saving(self._model.is_saving())
+
+    def _on_saved(self, delta: dict) -> None:
+        # A save replaced while parked never reports back; this one wrote its keys too
+        self._view.clear_dirty({**delta, **self._model.to_flat_dict()})
+        self._view.set_saving(self._model.is_saving())
+        self._view.set_error("")
         print(f"[controller] Settings saved successfully")
+
+    def _on_save_failed(self, error: Exception) -> None:
+        self._view.set_saving(self._model.is_saving())
+        self._view.set_error(f"Not saved: {error}")
+        print(f"[controller] Settings not saved: {error}")
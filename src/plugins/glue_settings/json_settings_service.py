@@ -0,0 +1,76 @@
+"""
+Reference file-backed GlueSettingsService.
+
+Glue settings and the glue type list live in two JSON files, each written
+atomically by a JsonFileStore: unchanged saves are skipped and repeated
+loads are served from the cached object.
+
+Usage::
+
+    service = JsonGlueSettingsService("config/glue_settings.json",
+                                      "config/glue_types.json")
+    plugin = GlueSettingsPlugin(service)
+"""
+import uuid
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import List, Union
+
+from src.plugins.base_settings_plugin.json_file_store import JsonFileStore
+from src.plugins.glue_settings.glue_settings_data import GlueSettings
+from src.plugins.glue_settings.glue_type import GlueType
+from src.plugins.glue_settings.mapper import GlueSettingsMapper
+
+
+def _parse_settings(data: dict) -> GlueSettings:
+    return GlueSettingsMapper.from_flat_dict(data, GlueSettings())
+
+
+def _parse_types(data: dict) -> List[GlueType]:
+    return [GlueType(**item) for item in data.get("glue_types", [])]
+
+
+def _serialise_types(types: List[GlueType]) -> dict:
+    return {"glue_types": [asdict(t) for t in types]}
+
+
+class JsonGlueSettingsService:
+    def __init__(self, settings_path: Union[str, Path], glue_types_path: Union[str, Path]):
+        self._settings = JsonFileStore(settings_path, _parse_settings,
+                                       GlueSettingsMapper.to_flat_dict, GlueSettings)
+        self._types = JsonFileStore(glue_types_path, _parse_types, _serialise_types, list)
+
+    def load_settings(self) -> GlueSettings:
+        return self._settings.load()
+
+    def save_settings(self, settings: GlueSettings) -> None:
+        if not self._settings.save(settings):
+            print(f"[JsonGlueSettingsService] {self._settings.path.name} unchanged, not written")
+
+    # The cached list is shared with earlier callers — always build a new one
+    def load_glue_types(self) -> List[GlueType]:
+        return list(self._types.load())
+
+    def add_glue_type(self, name: str, description: str) -> GlueType:
+        glue_type = GlueType(id=uuid.uuid4().hex, name=name, description=description)
+        self._types.save([*self._types.load(), glue_type])
+        return glue_type
+
+    def update_glue_type(self, id_: str, name: str, description: str) -> GlueType:
+        types = self._types.load()
+        index = self._index_of(types, id_)
+        updated = replace(types[index], name=name, description=description)
+        self._types.save([*types[:index], updated, *types[index + 1:]])
+        return updated
+
+    def remove_glue_type(self, id_: str) -> None:
+        types = self._types.load()
+        index = self._index_of(types, id_)
+        self._types.save([*types[:index], *types[index + 1:]])
+
+    @staticmethod
+    def _index_of(types: List[GlueType], id_: str) -> int:
+        for i, glue_type in enumerate(types):
+            if glue_type.id == id_:
+                return i
+        raise KeyError(f"Unknown glue type id: {id_!r}")
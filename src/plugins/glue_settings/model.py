@@ -1,22 +1,87 @@
-from typing import Optional
+from typing import Callable, Optional
 
+from src.plugins.base_settings_plugin.pending_saves import PendingSaves
+from src.plugins.base_settings_plugin.service_worker import ServiceWorker, call_service
 from src.plugins.glue_settings.glue_settings_data import GlueSettings
 from src.plugins.glue_settings.IGlueSettingsService import GlueSettingsService
 from src.plugins.glue_settings.mapper import GlueSettingsMapper
+from src.settings.settings_history import HistoryRecorder, SettingsHistory
 
 
 class GlueSettingsModel:
-    def __init__(self, service: GlueSettingsService):
+    """
+    With a ServiceWorker the service calls run in the background: load() and
+    save() return at once and on_done / on_error follow on the GUI thread.
+    Without one they run inline, as before.
+
+    With a SettingsHistory every save is recorded there (changed keys only).
+    """
+
+    def __init__(self, service: GlueSettingsService, worker: Optional[ServiceWorker] = None,
+                 history: Optional[SettingsHistory] = None):
         self._service = service
+        self._worker = worker
+        self._recorder = (HistoryRecorder(history, "GlueSettings", GlueSettingsMapper.to_flat_dict)
+                          if history is not None else None)
         self._settings: Optional[GlueSettings] = None
+        self._pending: PendingSaves[GlueSettings] = PendingSaves()
+
+    def load(self, on_done: Optional[Callable[[GlueSettings], None]] = None,
+             on_error: Optional[Callable[[Exception], None]] = None) -> Optional[GlueSettings]:
+        """Returns the settings when running inline, None in the background."""
+        def loaded(settings: GlueSettings) -> None:
+            self._settings = settings
+            if on_done is not None:
+                on_done(settings)
 
-    def load(self) -> GlueSettings:
-        self._settings = self._service.load_settings()
-        return self._settings
+        call_service(self._worker, "load", self._read, loaded, on_error)
+        return self._settings if self._worker is None else None
 
-    def save(self, flat: dict) -> None:
-        # Use current settings as base, or create default if not loaded yet
-        base = self._settings if self._settings is not None else GlueSettings()
+    def save(self, flat: dict, on_done: Optional[Callable[[GlueSettings], None]] = None,
+             on_error: Optional[Callable[[Exception], None]] = None) -> None:
+        """Apply flat (full or delta) onto the current settings and persist.
+
+        Backends implementing save_settings_delta() receive flat as the delta.
+        In the background, overlapping saves coalesce: only the newest is
+        written, and it builds on the earlier ones and carries their keys.
+        """
+        # Build on the newest submitted settings, or create default if not loaded yet
+        base = self._pending.base(self._settings if self._settings is not None else GlueSettings())
         updated = GlueSettingsMapper.from_flat_dict(flat, base)
-        self._service.save_settings(updated)
-        self._settings = updated
+        delta = self._pending.submit(updated, flat)
+
+        def write() -> None:
+            if hasattr(self._service, "save_settings_delta"):
+                self._service.save_settings_delta(updated, delta)
+            else:
+                self._service.save_settings(updated)
+            if self._recorder is not None:
+                self._recorder.saved(updated, delta)
+
+        def saved(_) -> None:
+            self._pending.done(updated, delta)
+            self._settings = updated
+            if on_done is not None:
+                on_done(updated)
+
+        def failed(error: Exception) -> None:
+            self._pending.failed(updated)
+            if on_error is not None:
+                on_error(error)
+            elif self._worker is None:
+                raise error                 # inline without on_error: propagate as before
+
+        call_service(self._worker, "save", write, saved, failed, coalesce=True)
+
+    def is_saving(self) -> bool:
+        return self._worker is not None and self._worker.is_busy("save")
+
+    def to_flat_dict(self) -> dict:
+        """The last loaded or saved settings as a flat dict ({} before the first load)."""
+        return GlueSettingsMapper.to_flat_dict(self._settings) if self._settings is not None else {}
+
+    def _read(self) -> GlueSettings:
+        settings = self._service.load_settings()
+        if self._recorder is not None:
+            self._recorder.loaded(settings)
+        return settings
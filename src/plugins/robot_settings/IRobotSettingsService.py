@@ -2,6 +2,13 @@ from typing import Protocol
 
 
 class RobotSettingsService(Protocol):
+    """
+    Optional:
+        save_config_delta(config, delta) / save_calibration_delta(calibration, delta)
+        — when implemented, called instead of save_config() / save_calibration()
+        with the updated object plus the flat dict of the fields that changed
+        (movement group edits appear under the "movement_groups" key).
+    """
 
     def load_config(self):
         ...
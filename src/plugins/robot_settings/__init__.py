@@ -29,7 +29,7 @@ class RobotSettingsPlugin(BaseSettingsPlugin[
 
     def _create_model(self, service: RobotSettingsService) -> RobotSettingsModel:
         """Create and return the model instance."""
-        return RobotSettingsModel(service)
+        return RobotSettingsModel(service, worker=self._worker, history=self._history)
 
     def _create_view(self) -> Tuple[SettingsView, MovementGroupsTab]:
         """Create and return the view instance (returns tuple)."""
@@ -39,4 +39,4 @@ class RobotSettingsPlugin(BaseSettingsPlugin[
         """Create and return the controller instance."""
         # view is a tuple (SettingsView, MovementGroupsTab)
         settings_view, movement_tab = view
-        return RobotSettingsController(model, settings_view, movement_tab)
+        return RobotSettingsController(model, settings_view, movement_tab, auto_save_ms=self._auto_save_ms)
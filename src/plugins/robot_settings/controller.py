@@ -1,4 +1,8 @@
+from typing import Optional
+
+from src.plugins.base_settings_plugin.auto_save import AutoSaver
 from src.plugins.robot_settings.model import RobotSettingsModel
+from src.plugins.robot_settings.safety_validator import SafetyLimitError
 from src.plugins.robot_settings.view.movement_groups_tab import MovementGroupsTab
 from src.settings.settings_view.settings_view import SettingsView
 
@@ -9,31 +13,103 @@ class RobotSettingsController:
         model: RobotSettingsModel,
         view: SettingsView,
         movement_tab: MovementGroupsTab,
+        auto_save_ms: Optional[int] = None,
     ):
         self._model        = model
         self._view         = view
         self._movement_tab = movement_tab
+        self._movement_dirty = False
+        self._movement_version = 0
+        self._auto_saver = AutoSaver(self._save_delta, auto_save_ms, parent=view) if auto_save_ms else None
 
         self._view.value_changed_signal.connect(self._on_field_changed)
         self._view.save_requested.connect(self._on_save_requested)
         self._movement_tab.values_changed.connect(self._on_movement_changed)
+        self._view.tab_deactivated.connect(self.flush)
 
     def load(self) -> None:
-        config, calibration = self._model.load()
+        self._model.load(on_done=self._on_loaded, on_error=self._on_load_failed)
+
+    def _on_loaded(self, result: tuple) -> None:
+        config, calibration = result
         self._view.load(config)
         self._movement_tab.load(config.movement_groups)
+        self._movement_dirty = False
+        self._view.set_error("")
+
+    def _on_load_failed(self, error: Exception) -> None:
+        print(f"[controller] Robot settings not loaded: {error}")
+        self._view.set_error(f"Not loaded: {error}")
+
+    def flush(self) -> None:
+        """Write edits waiting for auto-save now."""
+        if self._auto_saver is not None:
+            self._auto_saver.flush()
+
+    def restore(self, flat: dict) -> None:
+        """Bring the settings back to flat (e.g. a SettingsHistory version).
+
+        Only the keys whose value differs from the saved settings are pushed
+        into the view and saved.
+        """
+        current = self._model.to_flat_dict()
+        changed = {k: v for k, v in flat.items() if k in current and current[k] != v}
+        if not changed:
+            print(f"[controller] Robot settings already match the restored version")
+            return
+        self._view.set_values(changed)
+        self._view.mark_dirty(changed)          # until the save confirms them
+        self._save_delta(changed)
 
     def _on_field_changed(self, key: str, value, component: str) -> None:
         # Individual field changed
         print(f"[controller] Field changed: {key} = {value!r}")
+        if self._auto_saver is not None:
+            self._auto_saver.notify()
 
     def _on_save_requested(self, values: dict) -> None:
-        # Save button clicked - save all values
-        flat = self._view.get_values()
-        movement_groups = self._movement_tab.get_values()
-        self._model.save(flat, movement_groups)
+        # Save button clicked - a pending auto-save is covered by this write
+        if self._auto_saver is not None:
+            self._auto_saver.cancel()
+        self._save_delta()
+
+    def _save_delta(self, delta: Optional[dict] = None) -> None:
+        # Save only the fields the user edited (or delta)
+        delta = self._view.get_delta() if delta is None else delta
+        movement_groups = self._movement_tab.get_values() if self._movement_dirty else None
+        if not delta and movement_groups is None:
+            print(f"[controller] No robot settings changed")
+            return
+        movement_version = self._movement_version
+        try:
+            self._model.save(delta, movement_groups,
+                             on_done=lambda _: self._on_saved(delta, movement_version),
+                             on_error=self._on_save_failed)
+        except SafetyLimitError as e:
+            # Refused before anything was written — tell the operator which points
+            print(f"[controller] Robot settings not saved: {e}")
+            self._view.set_error(f"Not saved: {e}")
+            return
+        self._view.set_saving(self._model.is_saving())
+
+    def _on_saved(self, delta: dict, movement_version: int) -> None:
+        # A save replaced while parked never reports back; this one wrote its keys too
+        self._view.clear_dirty({**delta, **self._model.to_flat_dict()})
+        if movement_version == self._movement_version:    # no group edits during the save
+            self._movement_dirty = False
+        self._view.set_saving(self._model.is_saving())
+        self._view.set_error("")
         print(f"[controller] Robot settings saved successfully")
 
+    def _on_save_failed(self, error: Exception) -> None:
+        self._view.set_saving(self._model.is_saving())
+        self._view.set_error(f"Not saved: {error}")
+        print(f"[controller] Robot settings not saved: {error}")
+
     def _on_movement_changed(self, key: str, value) -> None:
         # Movement group changed
+        self._movement_dirty = True
+        self._movement_version += 1
+        if self._auto_saver is not None:
+            self._auto_saver.notify()
         print(f"[controller] Movement changed: {key} = {value!r}")
@@ -0,0 +1,45 @@
+"""
+Reference file-backed RobotSettingsService.
+
+The config (RobotConfig.to_dict / from_dict) and the calibration settings
+live in two JSON files, each written atomically by a JsonFileStore:
+unchanged saves are skipped and repeated loads are served from the cached
+object.  A missing config file loads as get_default_config().
+
+Usage::
+
+    service = JsonRobotSettingsService("config/robot_config.json",
+                                       "config/robot_calibration.json")
+    plugin = RobotSettingsPlugin(service)
+"""
+from pathlib import Path
+from typing import Union
+
+from src.external_dependencies.robotConfig.robotConfigModel import RobotConfig, get_default_config
+from src.external_dependencies.robotConfig.robot_calibration_settings import RobotCalibrationSettings
+from src.plugins.base_settings_plugin.json_file_store import JsonFileStore
+
+
+class JsonRobotSettingsService:
+    def __init__(self, config_path: Union[str, Path], calibration_path: Union[str, Path]):
+        self._config = JsonFileStore(config_path, RobotConfig.from_dict,
+                                     RobotConfig.to_dict, get_default_config)
+        self._calibration = JsonFileStore(calibration_path, RobotCalibrationSettings.from_dict,
+                                          RobotCalibrationSettings.to_dict, RobotCalibrationSettings)
+
+    def load_config(self) -> RobotConfig:
+        return self._config.load()
+
+    def save_config(self, config: RobotConfig) -> None:
+        self._save(self._config, config)
+
+    def load_calibration(self) -> RobotCalibrationSettings:
+        return self._calibration.load()
+
+    def save_calibration(self, calibration: RobotCalibrationSettings) -> None:
+        self._save(self._calibration, calibration)
+
+    @staticmethod
+    def _save(store: JsonFileStore, obj) -> None:
+        if not store.save(obj):
+            print(f"[JsonRobotSettingsService] {store.path.name} unchanged, not written")
@@ -1,5 +1,65 @@
 from src.external_dependencies.robotConfig.robotConfigModel import RobotConfig
 from src.external_dependencies.robotConfig.robot_calibration_settings import RobotCalibrationSettings
+from src.settings.settings_mapper import MappedField, compile_mapper
+
+
+def _str_to_bool(value) -> bool:
+    # Offset direction combos hold "True" / "False"
+    return value == "True"
+
+
+_CONFIG_FIELDS = (
+    # Robot info
+    MappedField("robot_ip"),
+    MappedField("robot_tool",   type=int),
+    MappedField("robot_user",   type=int),
+    MappedField("tcp_x_offset", type=float),
+    MappedField("tcp_y_offset", type=float),
+    # Global motion settings
+    MappedField("global_velocity",     "global_motion_settings.global_velocity",     int),
+    MappedField("global_acceleration", "global_motion_settings.global_acceleration", int),
+    MappedField("emergency_decel",     "global_motion_settings.emergency_decel",     int),
+    MappedField("max_jog_step",        "global_motion_settings.max_jog_step",        int),
+    # TCP step settings
+    MappedField("tcp_x_step_distance", type=float),
+    MappedField("tcp_x_step_offset",   type=float),
+    MappedField("tcp_y_step_distance", type=float),
+    MappedField("tcp_y_step_offset",   type=float),
+    # Offset direction map
+    MappedField("offset_pos_x", "offset_direction_map.pos_x", _str_to_bool, export=str),
+    MappedField("offset_neg_x", "offset_direction_map.neg_x", _str_to_bool, export=str),
+    MappedField("offset_pos_y", "offset_direction_map.pos_y", _str_to_bool, export=str),
+    MappedField("offset_neg_y", "offset_direction_map.neg_y", _str_to_bool, export=str),
+    # Safety limits
+    MappedField("safety_x_min",  "safety_limits.x_min",  int),
+    MappedField("safety_x_max",  "safety_limits.x_max",  int),
+    MappedField("safety_y_min",  "safety_limits.y_min",  int),
+    MappedField("safety_y_max",  "safety_limits.y_max",  int),
+    MappedField("safety_z_min",  "safety_limits.z_min",  int),
+    MappedField("safety_z_max",  "safety_limits.z_max",  int),
+    MappedField("safety_rx_min", "safety_limits.rx_min", int),
+    MappedField("safety_rx_max", "safety_limits.rx_max", int),
+    MappedField("safety_ry_min", "safety_limits.ry_min", int),
+    MappedField("safety_ry_max", "safety_limits.ry_max", int),
+    MappedField("safety_rz_min", "safety_limits.rz_min", int),
+    MappedField("safety_rz_max", "safety_limits.rz_max", int),
+)
+
+_CALIBRATION_FIELDS = (
+    # Adaptive movement
+    MappedField("calib_min_step_mm",        "min_step_mm",        float),
+    MappedField("calib_max_step_mm",        "max_step_mm",        float),
+    MappedField("calib_target_error_mm",    "target_error_mm",    float),
+    MappedField("calib_max_error_ref",      "max_error_ref",      float),
+    MappedField("calib_k",                  "k",                  float),
+    MappedField("calib_derivative_scaling", "derivative_scaling", float),
+    # Marker detection
+    MappedField("calib_z_target",     "z_target", int),
+    MappedField("calib_required_ids", "required_ids"),
+)
+
+_CONFIG_MAPPER      = compile_mapper(_CONFIG_FIELDS,      name="RobotConfig")
+_CALIBRATION_MAPPER = compile_mapper(_CALIBRATION_FIELDS, name="RobotCalibration")
 
 
 class RobotSettingsMapper:
@@ -10,87 +70,18 @@ class RobotSettingsMapper:
 
     @staticmethod
     def to_flat_dict(config: RobotConfig) -> dict:
-        return {
-            # Robot info
-            "robot_ip":    config.robot_ip,
-            "robot_tool":  config.robot_tool,
-            "robot_user":  config.robot_user,
-            "tcp_x_offset": config.tcp_x_offset,
-            "tcp_y_offset": config.tcp_y_offset,
-            # Global motion settings
-            "global_velocity":     config.global_motion_settings.global_velocity,
-            "global_acceleration": config.global_motion_settings.global_acceleration,
-            "emergency_decel":     config.global_motion_settings.emergency_decel,
-            "max_jog_step":        config.global_motion_settings.max_jog_step,
-            # TCP step settings
-            "tcp_x_step_distance": config.tcp_x_step_distance,
-            "tcp_x_step_offset":   config.tcp_x_step_offset,
-            "tcp_y_step_distance": config.tcp_y_step_distance,
-            "tcp_y_step_offset":   config.tcp_y_step_offset,
-            # Offset direction map
-            "offset_pos_x": str(config.offset_direction_map.pos_x),
-            "offset_neg_x": str(config.offset_direction_map.neg_x),
-            "offset_pos_y": str(config.offset_direction_map.pos_y),
-            "offset_neg_y": str(config.offset_direction_map.neg_y),
-            # Safety limits
-            "safety_x_min":  config.safety_limits.x_min,
-            "safety_x_max":  config.safety_limits.x_max,
-            "safety_y_min":  config.safety_limits.y_min,
-            "safety_y_max":  config.safety_limits.y_max,
-            "safety_z_min":  config.safety_limits.z_min,
-            "safety_z_max":  config.safety_limits.z_max,
-            "safety_rx_min": config.safety_limits.rx_min,
-            "safety_rx_max": config.safety_limits.rx_max,
-            "safety_ry_min": config.safety_limits.ry_min,
-            "safety_ry_max": config.safety_limits.ry_max,
-            "safety_rz_min": config.safety_limits.rz_min,
-            "safety_rz_max": config.safety_limits.rz_max,
-        }
-
+        return _CONFIG_MAPPER.to_flat_dict(config)
 
     @staticmethod
     def from_flat_dict(flat: dict, base: RobotConfig) -> RobotConfig:
-        """Reverse of to_flat_dict — applies flat dict values onto a copy of base."""
-        from copy import deepcopy
-        c = deepcopy(base)
-
-        c.robot_ip   = flat.get("robot_ip",   c.robot_ip)
-        c.robot_tool = int(flat.get("robot_tool", c.robot_tool))
-        c.robot_user = int(flat.get("robot_user", c.robot_user))
-        c.tcp_x_offset = float(flat.get("tcp_x_offset", c.tcp_x_offset))
-        c.tcp_y_offset = float(flat.get("tcp_y_offset", c.tcp_y_offset))
-
-        c.tcp_x_step_distance = float(flat.get("tcp_x_step_distance", c.tcp_x_step_distance))
-        c.tcp_x_step_offset   = float(flat.get("tcp_x_step_offset",   c.tcp_x_step_offset))
-        c.tcp_y_step_distance = float(flat.get("tcp_y_step_distance", c.tcp_y_step_distance))
-        c.tcp_y_step_offset   = float(flat.get("tcp_y_step_offset",   c.tcp_y_step_offset))
-
-        c.offset_direction_map.pos_x = flat.get("offset_pos_x", str(c.offset_direction_map.pos_x)) == "True"
-        c.offset_direction_map.neg_x = flat.get("offset_neg_x", str(c.offset_direction_map.neg_x)) == "True"
-        c.offset_direction_map.pos_y = flat.get("offset_pos_y", str(c.offset_direction_map.pos_y)) == "True"
-        c.offset_direction_map.neg_y = flat.get("offset_neg_y", str(c.offset_direction_map.neg_y)) == "True"
-
-        gm = c.global_motion_settings
-        gm.global_velocity     = int(flat.get("global_velocity",     gm.global_velocity))
-        gm.global_acceleration = int(flat.get("global_acceleration", gm.global_acceleration))
-        gm.emergency_decel     = int(flat.get("emergency_decel",     gm.emergency_decel))
-        gm.max_jog_step        = int(flat.get("max_jog_step",        gm.max_jog_step))
-
-        sl = c.safety_limits
-        sl.x_min  = int(flat.get("safety_x_min",  sl.x_min))
-        sl.x_max  = int(flat.get("safety_x_max",  sl.x_max))
-        sl.y_min  = int(flat.get("safety_y_min",  sl.y_min))
-        sl.y_max  = int(flat.get("safety_y_max",  sl.y_max))
-        sl.z_min  = int(flat.get("safety_z_min",  sl.z_min))
-        sl.z_max  = int(flat.get("safety_z_max",  sl.z_max))
-        sl.rx_min = int(flat.get("safety_rx_min", sl.rx_min))
-        sl.rx_max = int(flat.get("safety_rx_max", sl.rx_max))
-        sl.ry_min = int(flat.get("safety_ry_min", sl.ry_min))
-        sl.ry_max = int(flat.get("safety_ry_max", sl.ry_max))
-        sl.rz_min = int(flat.get("safety_rz_min", sl.rz_min))
-        sl.rz_max = int(flat.get("safety_rz_max", sl.rz_max))
-
-        return c
+        """Reverse of to_flat_dict — applies flat dict values (full or delta) onto a copy of base.
+
+        Structural sharing: the config itself is copied shallowly and a nested
+        object (offset map, global motion, safety limits) is copied only when
+        flat touches one of its keys.  movement_groups and untouched nested
+        objects are shared with base, so treat both as read-only.
+        """
+        return _CONFIG_MAPPER.from_flat_dict(flat, base)
 
 
 class RobotCalibrationMapper:
@@ -98,31 +89,9 @@ class RobotCalibrationMapper:
 
     @staticmethod
     def to_flat_dict(settings: RobotCalibrationSettings) -> dict:
-        return {
-            # Adaptive movement
-            "calib_min_step_mm":        settings.min_step_mm,
-            "calib_max_step_mm":        settings.max_step_mm,
-            "calib_target_error_mm":    settings.target_error_mm,
-            "calib_max_error_ref":      settings.max_error_ref,
-            "calib_k":                  settings.k,
-            "calib_derivative_scaling": settings.derivative_scaling,
-            # Marker detection
-            "calib_z_target":     settings.z_target,
-            "calib_required_ids": settings.required_ids,
-        }
+        return _CALIBRATION_MAPPER.to_flat_dict(settings)
 
     @staticmethod
     def from_flat_dict(flat: dict, base: RobotCalibrationSettings) -> RobotCalibrationSettings:
-        from copy import deepcopy
-        s = deepcopy(base)
-
-        s.min_step_mm        = float(flat.get("calib_min_step_mm",        s.min_step_mm))
-        s.max_step_mm        = float(flat.get("calib_max_step_mm",        s.max_step_mm))
-        s.target_error_mm    = float(flat.get("calib_target_error_mm",    s.target_error_mm))
-        s.max_error_ref      = float(flat.get("calib_max_error_ref",      s.max_error_ref))
-        s.k                  = float(flat.get("calib_k",                  s.k))
-        s.derivative_scaling = float(flat.get("calib_derivative_scaling", s.derivative_scaling))
-        s.z_target           = int(flat.get("calib_z_target",             s.z_target))
-        s.required_ids       = flat.get("calib_required_ids",             s.required_ids)
-
-        return s
+        """Merge flat dict (full or delta) into a shallow copy of base (required_ids is shared unless set)."""
+        return _CALIBRATION_MAPPER.from_flat_dict(flat, base)
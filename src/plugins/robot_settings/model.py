@@ -1,29 +1,139 @@
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 from src.external_dependencies.robotConfig.MovementGroup import MovementGroup
 from src.external_dependencies.robotConfig.robotConfigModel import RobotConfig, get_default_config
 from src.external_dependencies.robotConfig.robot_calibration_settings import RobotCalibrationSettings
+from src.plugins.base_settings_plugin.pending_saves import PendingSaves
+from src.plugins.base_settings_plugin.service_worker import ServiceWorker, call_service
 from src.plugins.robot_settings.IRobotSettingsService import RobotSettingsService
 from src.plugins.robot_settings.mapper import RobotCalibrationMapper, RobotSettingsMapper
+from src.plugins.robot_settings.safety_validator import validate_movement_groups
+from src.settings.settings_history import HistoryRecorder, SettingsHistory
+
+_CALIBRATION_PREFIX = "calib_"
 
 
 class RobotSettingsModel:
-    def __init__(self, service: RobotSettingsService):
+    """
+    With a ServiceWorker the service calls run in the background: load() and
+    save() return at once and on_done / on_error follow on the GUI thread,
+    with progress reported between the config and the calibration call.
+    Without one they run inline, as before.
+
+    With a SettingsHistory every save of config or calibration keys is
+    recorded there.  Movement groups are not flat values and are not recorded.
+    """
+
+    def __init__(self, service: RobotSettingsService, worker: Optional[ServiceWorker] = None,
+                 history: Optional[SettingsHistory] = None):
         self._service = service
+        self._worker = worker
+        self._recorder = (HistoryRecorder(history, "RobotSettings", _to_flat_dict)
+                          if history is not None else None)
         self._config: Optional[RobotConfig] = None
         self._calibration: Optional[RobotCalibrationSettings] = None
+        self._pending: PendingSaves[tuple] = PendingSaves()     # (config, calibration)
+
+    def load(self, on_done: Optional[Callable[[tuple], None]] = None,
+             on_error: Optional[Callable[[Exception], None]] = None
+             ) -> Optional[tuple[RobotConfig, RobotCalibrationSettings]]:
+        """Returns (config, calibration) when running inline, None in the background."""
+        def read() -> tuple[RobotConfig, RobotCalibrationSettings]:
+            config = self._service.load_config()
+            self._report_progress("load", 50)
+            calibration = self._service.load_calibration()
+            if self._recorder is not None:
+                self._recorder.loaded((config, calibration))
+            return config, calibration
+
+        def loaded(result: tuple) -> None:
+            self._config, self._calibration = result
+            if on_done is not None:
+                on_done(result)
+
+        call_service(self._worker, "load", read, loaded, on_error)
+        return (self._config, self._calibration) if self._worker is None else None
+
+    def save(self, flat: dict, movement_groups: Optional[Dict[str, MovementGroup]] = None,
+             on_done: Optional[Callable[[tuple], None]] = None,
+             on_error: Optional[Callable[[Exception], None]] = None) -> None:
+        """Apply flat (full or delta) and persist only what it touches.
+
+        The config is written when flat has config keys or movement_groups is
+        given (None keeps the current groups); the calibration is written when
+        flat has "calib_*" keys.  Backends implementing save_config_delta() /
+        save_calibration_delta() receive the matching part of flat as the delta.
+
+        Raises SafetyLimitError — before anything is written — when a
+        trajectory point of the updated config lies outside its SafetyLimits.
+        Validation always runs inline; only the service calls go to the
+        worker, where overlapping saves coalesce to the newest.  Each save
+        builds on the newest submitted config and calibration and carries
+        the keys of earlier saves that are not written yet.
+        """
+        config_delta = {k: v for k, v in flat.items() if not k.startswith(_CALIBRATION_PREFIX)}
+        calib_delta  = {k: v for k, v in flat.items() if k.startswith(_CALIBRATION_PREFIX)}
+        config, calibration = self._pending.base((self._config, self._calibration))
+
+        if config_delta or movement_groups is not None:
+            config = RobotSettingsMapper.from_flat_dict(config_delta, config)
+            if movement_groups is not None:
+                config.movement_groups = movement_groups
+                config_delta["movement_groups"] = movement_groups
+            validate_movement_groups(config.movement_groups, config.safety_limits)
+        if calib_delta:
+            calibration = RobotCalibrationMapper.from_flat_dict(calib_delta, calibration)
+
+        state = (config, calibration)
+        delta = self._pending.submit(state, {**config_delta, **calib_delta})
+        config_delta = {k: v for k, v in delta.items() if not k.startswith(_CALIBRATION_PREFIX)}
+        calib_delta  = {k: v for k, v in delta.items() if k.startswith(_CALIBRATION_PREFIX)}
+
+        def write() -> None:
+            if config_delta:
+                if hasattr(self._service, "save_config_delta"):
+                    self._service.save_config_delta(config, config_delta)
+                else:
+                    self._service.save_config(config)
+                if calib_delta:
+                    self._report_progress("save", 50)
+            if calib_delta:
+                if hasattr(self._service, "save_calibration_delta"):
+                    self._service.save_calibration_delta(calibration, calib_delta)
+                else:
+                    self._service.save_calibration(calibration)
+            if self._recorder is not None:
+                self._recorder.saved(state, [k for k in delta if k != "movement_groups"])
+
+        def saved(_) -> None:
+            self._pending.done(state, delta)
+            self._config, self._calibration = state
+            if on_done is not None:
+                on_done(state)
+
+        def failed(error: Exception) -> None:
+            self._pending.failed(state)
+            if on_error is not None:
+                on_error(error)
+            elif self._worker is None:
+                raise error                 # inline without on_error: propagate as before
+
+        call_service(self._worker, "save", write, saved, failed, coalesce=True)
+
+    def is_saving(self) -> bool:
+        return self._worker is not None and self._worker.is_busy("save")
+
+    def to_flat_dict(self) -> dict:
+        """Config and calibration as one flat dict ({} before the first load)."""
+        if self._config is None or self._calibration is None:
+            return {}
+        return _to_flat_dict((self._config, self._calibration))
 
-    def load(self) -> tuple[RobotConfig, RobotCalibrationSettings]:
-        self._config = self._service.load_config()
-        self._calibration = self._service.load_calibration()
-        return self._config, self._calibration
+    def _report_progress(self, op: str, percent: int) -> None:
+        if self._worker is not None:
+            self._worker.report_progress(op, percent)
 
-    def save(self, flat: dict, movement_groups: Dict[str, MovementGroup]) -> None:
-        updated = RobotSettingsMapper.from_flat_dict(flat, self._config)
-        updated.movement_groups = movement_groups
-        self._service.save_config(updated)
-        self._config = updated
 
-        updated_calib = RobotCalibrationMapper.from_flat_dict(flat, self._calibration)
-        self._service.save_calibration(updated_calib)
-        self._calibration = updated_calib
+def _to_flat_dict(settings: tuple) -> dict:
+    config, calibration = settings
+    return {**RobotSettingsMapper.to_flat_dict(config), **RobotCalibrationMapper.to_flat_dict(calibration)}
@@ -0,0 +1,111 @@
+"""
+Safety-limit validation of movement group trajectories.
+
+Every trajectory point of every movement group is checked against the
+config's SafetyLimits in one batched NumPy comparison: the groups' cached
+N×6 point buffers are stacked into a single array and compared with the
+per-axis min/max vectors.
+
+Rotation axes are compared modulo 360°, so -180 satisfies [170, 190].
+A violation's point is the row in group.points as shown in the editor.
+The check fails closed: a point that is not six numbers (a NaN row of
+points_array()) is one violation with an empty axis, and a NaN or
+infinite value is a violation of its axis.
+"""
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from src.external_dependencies.robotConfig.MovementGroup import MovementGroup
+from src.external_dependencies.robotConfig.SafetyLimits import SafetyLimits
+
+AXES = ("x", "y", "z", "rx", "ry", "rz")
+_ROTATION_AXES = slice(3, 6)
+
+
+@dataclass(frozen=True)
+class SafetyViolation:
+    group: str
+    point: int        # row in group.points (0-based; str() shows it 1-based)
+    axis: str         # one of AXES; "" when the point is not six numbers
+    value: float
+    limit_min: float
+    limit_max: float
+
+    def __str__(self) -> str:
+        where = f"{self.group} point {self.point + 1}"
+        if not self.axis:
+            return f"{where}: not six numbers"
+        if not np.isfinite(self.value):
+            return f"{where}: {self.axis}={self.value:g} is not a finite number"
+        return f"{where}: {self.axis}={self.value:g} outside [{self.limit_min:g}, {self.limit_max:g}]"
+
+
+class SafetyLimitError(ValueError):
+    """Raised when trajectory points lie outside the safety limits."""
+
+    def __init__(self, violations: List[SafetyViolation]):
+        self.violations = violations
+        super().__init__(
+            f"{len(violations)} trajectory value(s) outside the safety limits: "
+            + "; ".join(str(v) for v in violations[:5])
+            + (" …" if len(violations) > 5 else "")
+        )
+
+
+def limit_vectors(limits: SafetyLimits):
+    """(mins, maxs) as float arrays in AXES order."""
+    mins = np.array([getattr(limits, f"{a}_min") for a in AXES], dtype=np.float64)
+    maxs = np.array([getattr(limits, f"{a}_max") for a in AXES], dtype=np.float64)
+    return mins, maxs
+
+
+def find_violations(groups: Dict[str, MovementGroup], limits: SafetyLimits) -> List[SafetyViolation]:
+    """Every (group, point, axis) whose value lies outside limits or is not finite,
+    in group/point/axis order; a malformed point is reported once."""
+    # points_array() keeps one row per point string, so row indices are the UI rows
+    names  = [name for name, group in groups.items() if len(group.points_array())]
+    if not names:
+        return []
+    arrays  = [groups[name].points_array() for name in names]
+    points  = np.concatenate(arrays)
+    offsets = np.cumsum([0] + [len(a) for a in arrays])
+
+    mins, maxs = limit_vectors(limits)
+    checked = points.copy()
+    with np.errstate(invalid="ignore"):     # inf folds to NaN; both are caught below
+        # Fold angles into [min, min + 360) before comparing
+        checked[:, _ROTATION_AXES] = mins[_ROTATION_AXES] + np.mod(
+            checked[:, _ROTATION_AXES] - mins[_ROTATION_AXES], 360.0
+        )
+    # NaN compares False both ways — check finiteness explicitly so bad points never pass
+    invalid = ~np.isfinite(points)
+    bad = invalid | (checked < mins) | (checked > maxs)
+    malformed = invalid.all(axis=1)
+    bad[malformed] = False
+    bad[malformed, 0] = True                # one violation per malformed point
+    rows, cols = np.nonzero(bad)
+    if not len(rows):
+        return []
+
+    group_idx = np.searchsorted(offsets, rows, side="right") - 1
+    return [
+        SafetyViolation(
+            group=names[g],
+            point=int(r - offsets[g]),
+            axis="" if malformed[r] else AXES[c],
+            value=float(points[r, c]),
+            limit_min=float(mins[c]),
+            limit_max=float(maxs[c]),
+        )
+        for r, c, g in zip(rows.tolist(), cols.tolist(), group_idx.tolist())
+    ]
+
+
+def validate_movement_groups(groups: Dict[str, MovementGroup], limits: SafetyLimits) -> None:
+    """Raise SafetyLimitError listing every out-of-bounds point value."""
+    violations = find_violations(groups, limits)
+    if violations:
+        raise SafetyLimitError(violations)
+
@@ -1,18 +1,21 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Union
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QItemSelection, QItemSelectionModel, Qt, pyqtSignal
 from PyQt6.QtWidgets import (
-    QDialog, QGridLayout, QHBoxLayout, QLabel, QLineEdit,
-    QListWidget, QListWidgetItem, QPushButton, QSizePolicy,
+    QAbstractItemView, QDialog, QGridLayout, QHBoxLayout, QLabel, QLineEdit,
+    QListView, QPushButton, QScrollArea, QSizePolicy,
     QVBoxLayout, QWidget, QGroupBox,
 )
 
 from src.external_dependencies.robotConfig.MovementGroup import MovementGroup
+from src.plugins.robot_settings.view.points_list_model import PointsListModel
+from src.settings.settings_search.search_index import KIND_MOVEMENT_GROUP, SearchEntry
 from src.settings.settings_view.styles import (
-    ACTION_BTN_STYLE, BG_COLOR, BORDER, GHOST_BTN_STYLE,
-    GROUP_STYLE, LABEL_STYLE, PRIMARY_DARK, PRIMARY_LIGHT,
+    OBJ_ACTION_BUTTON, OBJ_ERROR_LABEL, OBJ_GHOST_BUTTON, OBJ_HEADER_BUTTON,
+    OBJ_SETTING_CELL, OBJ_SETTING_GROUP, OBJ_SETTING_LABEL, OBJ_SETTING_LIST,
+    OBJ_SETTING_READOUT, SETTINGS_VIEW_STYLE,
 )
 from src.utils_widgets.touch_spinbox import TouchSpinBox
 
@@ -57,38 +60,6 @@ MOVEMENT_GROUP_DEFINITIONS: Dict[str, MovementGroupDef] = {
 }
 
 
-_ACTION_BTN_STYLE = ACTION_BTN_STYLE
-_GHOST_BTN_STYLE  = GHOST_BTN_STYLE
-
-# ── Styles ────────────────────────────────────────────────────────────────────
-
-_LIST_STYLE = f"""
-QListWidget {{
-    background: white;
-    border: 2px solid {BORDER};
-    border-radius: 8px;
-    padding: 4px;
-    font-size: 11pt;
-}}
-QListWidget::item:selected {{
-    background: {PRIMARY_LIGHT};
-    color: {PRIMARY_DARK};
-}}
-"""
-
-_POSITION_STYLE = f"""
-QLineEdit {{
-    background: white;
-    color: #333333;
-    border: 2px solid {BORDER};
-    border-radius: 8px;
-    padding: 8px 16px;
-    font-size: 11pt;
-    min-height: 44px;
-}}
-"""
-
-
 # ── Position editor dialog ────────────────────────────────────────────────────
 
 class PositionEditorDialog(QDialog):
@@ -97,6 +68,9 @@ class PositionEditorDialog(QDialog):
 
     Layout: two columns — X / Y / Z on the left, RX / RY / RZ on the right.
     Each coordinate gets a TouchSpinBox with appropriate range and step pills.
+
+    A position_str that is not six numbers is not replaced by zeros: the
+    dialog says so and OK stays disabled until a coordinate is set.
     """
 
     # (label, min, max, decimals, suffix, step, step_options)
@@ -114,9 +88,14 @@ class PositionEditorDialog(QDialog):
         self.setWindowTitle(title)
         self.setModal(True)
         self.setMinimumWidth(720)
-        self.setStyleSheet(f"background: {BG_COLOR};")
+        if parent is None:      # otherwise the owner's sheet already applies
+            self.setStyleSheet(SETTINGS_VIEW_STYLE)
 
-        values = self._parse(position_str)
+        try:
+            values = self._parse(position_str) if position_str.strip() else [0.0] * 6
+            invalid = False
+        except ValueError:
+            values, invalid = [0.0] * 6, True
         self._spinboxes: List[TouchSpinBox] = []
 
         root = QVBoxLayout(self)
@@ -125,7 +104,7 @@ class PositionEditorDialog(QDialog):
 
         # ── 2-column coordinate grid ──────────────────────────────────────
         grid_widget = QWidget()
-        grid_widget.setStyleSheet("background: transparent;")
+        grid_widget.setObjectName(OBJ_SETTING_CELL)
         grid = QGridLayout(grid_widget)
         grid.setHorizontalSpacing(24)
         grid.setVerticalSpacing(12)
@@ -137,13 +116,13 @@ class PositionEditorDialog(QDialog):
             row = i % 3
 
             cell = QWidget()
-            cell.setStyleSheet("background: transparent;")
+            cell.setObjectName(OBJ_SETTING_CELL)
             cell_layout = QVBoxLayout(cell)
             cell_layout.setContentsMargins(0, 0, 0, 0)
             cell_layout.setSpacing(4)
 
             lbl = QLabel(lbl_text)
-            lbl.setStyleSheet(LABEL_STYLE)
+            lbl.setObjectName(OBJ_SETTING_LABEL)
             cell_layout.addWidget(lbl)
 
             spin = TouchSpinBox(
@@ -157,41 +136,57 @@ class PositionEditorDialog(QDialog):
 
         root.addWidget(grid_widget)
 
+        self._error_label = QLabel(
+            f"{position_str!r} is not a valid position — set the coordinates before OK."
+        )
+        self._error_label.setObjectName(OBJ_ERROR_LABEL)
+        self._error_label.setWordWrap(True)
+        self._error_label.setVisible(invalid)
+        root.addWidget(self._error_label)
+
         # ── Cancel / OK buttons ───────────────────────────────────────────
         btn_row = QWidget()
-        btn_row.setStyleSheet("background: transparent;")
+        btn_row.setObjectName(OBJ_SETTING_CELL)
         btn_layout = QHBoxLayout(btn_row)
         btn_layout.setContentsMargins(0, 0, 0, 0)
         btn_layout.setSpacing(12)
         btn_layout.addStretch()
 
         cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet(_GHOST_BTN_STYLE)
+        cancel_btn.setObjectName(OBJ_GHOST_BUTTON)
         cancel_btn.setMinimumWidth(120)
         cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         cancel_btn.clicked.connect(self.reject)
         btn_layout.addWidget(cancel_btn)
 
         ok_btn = QPushButton("OK")
-        ok_btn.setStyleSheet(_ACTION_BTN_STYLE)
+        ok_btn.setObjectName(OBJ_ACTION_BUTTON)
         ok_btn.setMinimumWidth(120)
         ok_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         ok_btn.clicked.connect(self.accept)
         btn_layout.addWidget(ok_btn)
+        self._ok_btn = ok_btn
 
         root.addWidget(btn_row)
 
+        if invalid:
+            ok_btn.setEnabled(False)
+            for spin in self._spinboxes:
+                spin.valueChanged.connect(self._on_coordinate_set)
+
     # ── Helpers ───────────────────────────────────────────────────────────
 
     @staticmethod
     def _parse(position_str: str) -> List[float]:
-        try:
-            values = [float(x.strip()) for x in position_str.strip("[] ").split(",")]
-            if len(values) == 6:
-                return values
-        except (ValueError, AttributeError):
-            pass
-        return [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+        """"[x, y, z, rx, ry, rz]" → six floats.  Raises ValueError otherwise."""
+        values = [float(x.strip()) for x in position_str.strip("[] ").split(",")]
+        if len(values) != 6:
+            raise ValueError(f"expected 6 values, got {len(values)}")
+        return values
+
+    def _on_coordinate_set(self) -> None:
+        self._error_label.setVisible(False)
+        self._ok_btn.setEnabled(True)
 
     def get_position_str(self) -> str:
         return "[" + ", ".join(f"{s.value():.3f}" for s in self._spinboxes) + "]"
@@ -226,14 +221,15 @@ class MovementGroupWidget(QGroupBox):
         super().__init__(definition.name, parent)
         self._def  = definition
         self._name = definition.name
-        self.setStyleSheet(GROUP_STYLE)
+        self.setObjectName(OBJ_SETTING_GROUP)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
 
         self._velocity_spin:     Optional[TouchSpinBox] = None
         self._acceleration_spin: Optional[TouchSpinBox] = None
         self._iterations_spin:   Optional[TouchSpinBox] = None
         self._position_display:  Optional[QLineEdit]    = None
-        self._points_list:       Optional[QListWidget]  = None
+        self._points_view:       Optional[QListView]    = None
+        self._points_model:      Optional[PointsListModel] = None
 
         self._build_ui()
 
@@ -258,7 +254,7 @@ class MovementGroupWidget(QGroupBox):
 
     def _build_vel_acc_row(self) -> QWidget:
         row = QWidget()
-        row.setStyleSheet("background: transparent;")
+        row.setObjectName(OBJ_SETTING_CELL)
         layout = QHBoxLayout(row)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(16)
@@ -289,7 +285,7 @@ class MovementGroupWidget(QGroupBox):
 
     def _build_iterations_row(self) -> QWidget:
         row = QWidget()
-        row.setStyleSheet("background: transparent;")
+        row.setObjectName(OBJ_SETTING_CELL)
         layout = QHBoxLayout(row)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(16)
@@ -310,29 +306,29 @@ class MovementGroupWidget(QGroupBox):
 
     def _build_single_position_section(self) -> QWidget:
         section = QWidget()
-        section.setStyleSheet("background: transparent;")
+        section.setObjectName(OBJ_SETTING_CELL)
         layout = QVBoxLayout(section)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
 
         lbl = QLabel("Position")
-        lbl.setStyleSheet(LABEL_STYLE)
+        lbl.setObjectName(OBJ_SETTING_LABEL)
         layout.addWidget(lbl)
 
         row = QWidget()
-        row.setStyleSheet("background: transparent;")
+        row.setObjectName(OBJ_SETTING_CELL)
         row_layout = QHBoxLayout(row)
         row_layout.setContentsMargins(0, 0, 0, 0)
         row_layout.setSpacing(8)
 
         self._position_display = QLineEdit()
         self._position_display.setReadOnly(True)
-        self._position_display.setStyleSheet(_POSITION_STYLE)
+        self._position_display.setObjectName(OBJ_SETTING_READOUT)
         self._position_display.setPlaceholderText("No position set")
         row_layout.addWidget(self._position_display, stretch=1)
 
         edit_btn = QPushButton("Edit")
-        edit_btn.setStyleSheet(_GHOST_BTN_STYLE)
+        edit_btn.setObjectName(OBJ_GHOST_BUTTON)
         edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         edit_btn.clicked.connect(self._on_edit_single_position)
         row_layout.addWidget(edit_btn)
@@ -342,7 +338,7 @@ class MovementGroupWidget(QGroupBox):
             ("Move To",     self.move_to_requested),
         ]:
             btn = QPushButton(label)
-            btn.setStyleSheet(_ACTION_BTN_STYLE)
+            btn.setObjectName(OBJ_ACTION_BUTTON)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.clicked.connect(lambda _, s=signal: s.emit(self._name))
             row_layout.addWidget(btn)
@@ -352,34 +348,39 @@ class MovementGroupWidget(QGroupBox):
 
     def _build_multi_position_section(self) -> QWidget:
         section = QWidget()
-        section.setStyleSheet("background: transparent;")
+        section.setObjectName(OBJ_SETTING_CELL)
         layout = QVBoxLayout(section)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
 
         lbl = QLabel("Points")
-        lbl.setStyleSheet(LABEL_STYLE)
+        lbl.setObjectName(OBJ_SETTING_LABEL)
         layout.addWidget(lbl)
 
-        self._points_list = QListWidget()
-        self._points_list.setFixedHeight(140)
-        self._points_list.setStyleSheet(_LIST_STYLE)
-        layout.addWidget(self._points_list)
+        # Model/view: rows are formatted from the numeric buffer only when visible
+        self._points_model = PointsListModel(self)
+        self._points_view = QListView()
+        self._points_view.setModel(self._points_model)
+        self._points_view.setUniformItemSizes(True)
+        self._points_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self._points_view.setFixedHeight(140)
+        self._points_view.setObjectName(OBJ_SETTING_LIST)
+        layout.addWidget(self._points_view)
 
         btn_row = QWidget()
-        btn_row.setStyleSheet("background: transparent;")
+        btn_row.setObjectName(OBJ_SETTING_CELL)
         btn_layout = QHBoxLayout(btn_row)
         btn_layout.setContentsMargins(0, 0, 0, 0)
         btn_layout.setSpacing(8)
 
         add_btn = QPushButton("Add")
-        add_btn.setStyleSheet(_GHOST_BTN_STYLE)
+        add_btn.setObjectName(OBJ_GHOST_BUTTON)
         add_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         add_btn.clicked.connect(self._on_add_point)
         btn_layout.addWidget(add_btn)
 
         edit_btn = QPushButton("Edit")
-        edit_btn.setStyleSheet(_GHOST_BTN_STYLE)
+        edit_btn.setObjectName(OBJ_GHOST_BUTTON)
         edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         edit_btn.clicked.connect(self._on_edit_selected_point)
         btn_layout.addWidget(edit_btn)
@@ -390,14 +391,14 @@ class MovementGroupWidget(QGroupBox):
             ("Set Current", lambda: self.set_current_requested.emit(self._name)),
         ]:
             btn = QPushButton(label)
-            btn.setStyleSheet(_ACTION_BTN_STYLE)
+            btn.setObjectName(OBJ_ACTION_BUTTON)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.clicked.connect(slot)
             btn_layout.addWidget(btn)
 
         if self._def.has_trajectory_execution:
             exec_btn = QPushButton("Execute")
-            exec_btn.setStyleSheet(_ACTION_BTN_STYLE)
+            exec_btn.setObjectName(OBJ_ACTION_BUTTON)
             exec_btn.setCursor(Qt.CursorShape.PointingHandCursor)
             exec_btn.clicked.connect(lambda: self.execute_trajectory_requested.emit(self._name))
             btn_layout.addWidget(exec_btn)
@@ -432,74 +433,97 @@ class MovementGroupWidget(QGroupBox):
         )
 
     def _on_edit_selected_point(self):
-        row = self._points_list.currentRow()
+        row = self._points_view.currentIndex().row()
         if row < 0:
             return
-        current = self._points_list.item(row).text()
+        current = self._points_model.point_string(row)
         self._open_editor(
             f"Edit Point {row} — {self._name}",
             current,
             lambda pos: self._update_point(row, pos),
         )
 
-    def _append_point(self, pos: str):
-        item = QListWidgetItem(pos)
-        self._points_list.addItem(item)
-        self._points_list.setCurrentItem(item)
+    def _append_point(self, pos: str) -> bool:
+        values = self._parse_point(pos)
+        if values is None:
+            return False
+        self._points_model.append_points([values], [pos])
+        self._points_view.setCurrentIndex(self._points_model.index(self._points_model.rowCount() - 1))
         self.points_changed.emit(self._name, self._collect_points())
+        return True
 
-    def _update_point(self, row: int, pos: str):
-        self._points_list.item(row).setText(pos)
+    def _update_point(self, row: int, pos: str) -> bool:
+        values = self._parse_point(pos)
+        if values is None:
+            return False
+        self._points_model.set_point(row, values, pos)
         self.points_changed.emit(self._name, self._collect_points())
+        return True
+
+    def _parse_point(self, pos: str) -> Optional[List[float]]:
+        # An unreadable point must never become a move to [0, 0, 0, 0, 0, 0]
+        try:
+            return PositionEditorDialog._parse(pos)
+        except (ValueError, AttributeError) as e:
+            print(f"[MovementGroupWidget] {self._name}: point {pos!r} rejected: {e}")
+            return None
 
     # ── Internal helpers ──────────────────────────────────────────────────
 
     @staticmethod
     def _labeled_cell(label_text: str) -> QWidget:
         cell = QWidget()
-        cell.setStyleSheet("background: transparent;")
+        cell.setObjectName(OBJ_SETTING_CELL)
         layout = QVBoxLayout(cell)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(6)
         lbl = QLabel(label_text)
-        lbl.setStyleSheet(LABEL_STYLE)
+        lbl.setObjectName(OBJ_SETTING_LABEL)
         layout.addWidget(lbl)
         return cell
 
     def _on_remove_point(self):
-        row = self._points_list.currentRow()
-        if row >= 0:
-            self._points_list.takeItem(row)
+        rows = [index.row() for index in self._points_view.selectionModel().selectedRows()]
+        if not rows and self._points_view.currentIndex().isValid():
+            rows = [self._points_view.currentIndex().row()]
+        if rows:
+            self._points_model.remove_points(rows)
             self.points_changed.emit(self._name, self._collect_points())
 
     def _collect_points(self) -> List[str]:
-        return [self._points_list.item(i).text() for i in range(self._points_list.count())]
+        return self._points_model.point_strings()
 
     # ── Public API ────────────────────────────────────────────────────────
 
-    def load(self, group: MovementGroup) -> None:
-        """Populate all widgets from model — no signals emitted."""
+    def load(self, group: MovementGroup) -> bool:
+        """Patch the widgets to show group — no signals emitted.
+
+        Only values that differ from what is shown are touched; the points
+        model is patched row by row from the group's numeric buffer and
+        keeps each point's string as it is in the config.
+        Returns True if anything changed.
+        """
+        changed = False
         for spin, val in [
             (self._velocity_spin,     float(group.velocity)),
             (self._acceleration_spin, float(group.acceleration)),
+            (self._iterations_spin,   float(group.iterations)),
         ]:
-            if spin:
+            if spin and spin.value() != val:
                 spin.blockSignals(True)
                 spin.setValue(val)
                 spin.blockSignals(False)
+                changed = True
 
-        if self._iterations_spin:
-            self._iterations_spin.blockSignals(True)
-            self._iterations_spin.setValue(float(group.iterations))
-            self._iterations_spin.blockSignals(False)
-
-        if self._position_display and group.position is not None:
-            self._position_display.setText(group.position)
+        if self._position_display:
+            position = group.position or ""
+            if self._position_display.text() != position:
+                self._position_display.setText(position)
+                changed = True
 
-        if self._points_list is not None:
-            self._points_list.clear()
-            for pt in group.points:
-                self._points_list.addItem(QListWidgetItem(pt))
+        if self._points_model is not None:
+            changed |= self._points_model.patch(group.points_array(), group.points)
+        return changed
 
     def get_values(self) -> MovementGroup:
         return MovementGroup(
@@ -507,7 +531,7 @@ class MovementGroupWidget(QGroupBox):
             acceleration = int(self._acceleration_spin.value()) if self._acceleration_spin else 0,
             iterations   = int(self._iterations_spin.value())   if self._iterations_spin   else 1,
             position     = self._position_display.text() or None if self._position_display else None,
-            points       = self._collect_points()               if self._points_list       else [],
+            points       = self._collect_points()               if self._points_model      else [],
         )
 
     def set_position(self, position_str: str) -> None:
@@ -516,13 +540,92 @@ class MovementGroupWidget(QGroupBox):
             self._position_display.setText(position_str)
             self.position_changed.emit(self._name, position_str)
 
-    def add_point(self, point_str: str) -> None:
-        """Called by controller after handling set_current_requested on a multi-pos group."""
-        if self._points_list:
-            item = QListWidgetItem(point_str)
-            self._points_list.addItem(item)
-            self._points_list.setCurrentItem(item)
-            self.points_changed.emit(self._name, self._collect_points())
+    def add_point(self, point_str: str) -> bool:
+        """Called by controller after handling set_current_requested on a multi-pos group.
+
+        Returns False (nothing added) if point_str is not six numbers.
+        """
+        return self._points_model is not None and self._append_point(point_str)
+
+    def select_points(self, first: int, last: int) -> None:
+        """Select the inclusive row range first..last (e.g. for a bulk Remove)."""
+        if self._points_model is None:
+            return
+        selection = QItemSelection(self._points_model.index(first), self._points_model.index(last))
+        self._points_view.selectionModel().select(
+            selection, QItemSelectionModel.SelectionFlag.ClearAndSelect
+        )
+
+
+# ── CollapsibleMovementGroup ──────────────────────────────────────────────────
+
+class CollapsibleMovementGroup(QWidget):
+    """
+    Header button plus a MovementGroupWidget that exists only while expanded.
+
+    While collapsed the latest MovementGroup is kept as data; expanding
+    builds the editor and loads it, collapsing reads the editor's values
+    back and releases the widget.
+    """
+
+    _ARROW = {False: "▸", True: "▾"}
+
+    def __init__(self, definition: MovementGroupDef, group: MovementGroup,
+                 connect: Callable[[MovementGroupWidget], None], parent=None):
+        super().__init__(parent)
+        self._def     = definition
+        self._group   = group
+        self._connect = connect
+        self._widget: Optional[MovementGroupWidget] = None
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.setSpacing(8)
+
+        self._header = QPushButton()
+        self._header.setCheckable(True)
+        self._header.setObjectName(OBJ_HEADER_BUTTON)
+        self._header.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._header.toggled.connect(self.set_expanded)
+        self._layout.addWidget(self._header)
+        self._update_header()
+
+    @property
+    def widget(self) -> Optional[MovementGroupWidget]:
+        return self._widget
+
+    def is_expanded(self) -> bool:
+        return self._widget is not None
+
+    def set_expanded(self, expanded: bool) -> None:
+        if expanded and self._widget is None:
+            self._widget = MovementGroupWidget(self._def)
+            self._connect(self._widget)
+            self._widget.load(self._group)
+            self._layout.addWidget(self._widget)
+        elif not expanded and self._widget is not None:
+            self._group = self._widget.get_values()
+            self._layout.removeWidget(self._widget)
+            self._widget.deleteLater()
+            self._widget = None
+        self._header.blockSignals(True)
+        self._header.setChecked(expanded)
+        self._header.blockSignals(False)
+        self._update_header()
+
+    def load(self, group: MovementGroup) -> bool:
+        if self._widget is not None:
+            self._group = group
+            return self._widget.load(group)
+        changed = group != self._group
+        self._group = group
+        return changed
+
+    def get_values(self) -> MovementGroup:
+        return self._widget.get_values() if self._widget is not None else self._group
+
+    def _update_header(self) -> None:
+        self._header.setText(f"{self._ARROW[self.is_expanded()]}  {self._def.name}")
 
 
 # ── MovementGroupsTab ─────────────────────────────────────────────────────────
@@ -538,44 +641,116 @@ class MovementGroupsTab(QWidget):
         # Wire actions to controller externally:
         tab.set_current_requested.connect(controller.handle_set_current)
         tab.execute_trajectory_requested.connect(controller.handle_execute)
+
+    Collapsed-header mode (``collapsible=True``):
+        each group is shown as a header; its editor is built when the header
+        is expanded and released again on collapse.  get_widget() only
+        returns an editor that exists (None while collapsed); call
+        expand(name), which returns the editor, to call set_position() /
+        add_point() on a collapsed group.
+
+    search_entries_changed fires when load() adds or removes groups, so a
+    search index holding search_entries() can be refreshed.
+
+    The widgets only carry object names: they are styled by the SettingsView
+    the tab is added to, or by install_app_stylesheet() when used on its own.
     """
 
     values_changed               = pyqtSignal(str, object)  # "GROUP_NAME.field", value
+    search_entries_changed       = pyqtSignal()
     set_current_requested        = pyqtSignal(str)           # group_name
     move_to_requested            = pyqtSignal(str)           # group_name
     execute_trajectory_requested = pyqtSignal(str)           # group_name
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, collapsible: bool = False):
         super().__init__(parent)
-        self.setStyleSheet(f"background: {BG_COLOR};")
-        self._widgets: Dict[str, MovementGroupWidget] = {}
+        self._collapsible = collapsible
+        # name → editor, or its collapsible holder in collapsed-header mode
+        self._widgets: Dict[str, Union[MovementGroupWidget, CollapsibleMovementGroup]] = {}
 
         self._layout = QVBoxLayout(self)
         self._layout.setContentsMargins(16, 16, 16, 16)
         self._layout.setSpacing(16)
         self._layout.addStretch()
 
-    def load(self, groups: Dict[str, MovementGroup]) -> None:
+    def load(self, groups: Dict[str, MovementGroup]) -> List[str]:
         """
         First call: creates one widget per group.
-        Subsequent calls: updates values in existing widgets.
+        Subsequent calls: patches only the values that differ in existing
+        widgets, and removes the widgets of groups that disappeared.
         Groups not in MOVEMENT_GROUP_DEFINITIONS fall back to type inference.
+
+        Returns the names of the groups whose widget was created, changed or removed.
         """
+        updated: List[str] = []
+        names_before = list(self._widgets)
+        for name in [n for n in self._widgets if n not in groups]:
+            widget = self._widgets.pop(name)
+            self._layout.removeWidget(widget)
+            widget.deleteLater()
+            updated.append(name)
+
         for name, group in groups.items():
             if name not in self._widgets:
                 defn = MOVEMENT_GROUP_DEFINITIONS.get(name) or self._infer_def(name, group)
-                widget = MovementGroupWidget(defn)
-                self._connect_widget(widget)
+                if self._collapsible:
+                    widget = CollapsibleMovementGroup(defn, group, self._connect_widget)
+                else:
+                    widget = MovementGroupWidget(defn)
+                    self._connect_widget(widget)
+                    widget.load(group)
                 self._widgets[name] = widget
                 self._layout.insertWidget(self._layout.count() - 1, widget)
-
-            self._widgets[name].load(group)
+                updated.append(name)
+            elif self._widgets[name].load(group):
+                updated.append(name)
+        if list(self._widgets) != names_before:
+            self.search_entries_changed.emit()
+        return updated
 
     def get_values(self) -> Dict[str, MovementGroup]:
         return {name: w.get_values() for name, w in self._widgets.items()}
 
     def get_widget(self, group_name: str) -> Optional[MovementGroupWidget]:
-        return self._widgets.get(group_name)
+        """The group's editor; None for unknown groups and, in collapsed-header mode, collapsed ones."""
+        widget = self._widgets.get(group_name)
+        if isinstance(widget, CollapsibleMovementGroup):
+            return widget.widget
+        return widget
+
+    def expand(self, group_name: str, expanded: bool = True) -> Optional[MovementGroupWidget]:
+        """Expand (or collapse) a group in collapsed-header mode; returns its editor if built."""
+        widget = self._widgets.get(group_name)
+        if isinstance(widget, CollapsibleMovementGroup):
+            widget.set_expanded(expanded)
+            return widget.widget
+        return widget
+
+    def is_expanded(self, group_name: str) -> bool:
+        """True if the group's editor exists (always, outside collapsed-header mode)."""
+        widget = self._widgets.get(group_name)
+        if isinstance(widget, CollapsibleMovementGroup):
+            return widget.is_expanded()
+        return widget is not None
+
+    def search_entries(self, category: str) -> List[SearchEntry]:
+        """One SearchEntry per known group: MOVEMENT_GROUP_DEFINITIONS plus any loaded extras."""
+        names = dict.fromkeys([*MOVEMENT_GROUP_DEFINITIONS, *self._widgets])
+        return [SearchEntry(category, KIND_MOVEMENT_GROUP, name, context="Movement Groups")
+                for name in names]
+
+    def reveal(self, group_name: str) -> bool:
+        """Expand a loaded group and scroll the enclosing scroll area to it."""
+        widget = self._widgets.get(group_name)
+        if widget is None:
+            return False
+        self.expand(group_name)
+        parent = self.parentWidget()
+        while parent is not None and not isinstance(parent, QScrollArea):
+            parent = parent.parentWidget()
+        if parent is not None:
+            parent.ensureWidgetVisible(widget)
+        return True
 
     # ── Private ───────────────────────────────────────────────────────────
 
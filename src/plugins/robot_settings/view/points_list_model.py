@@ -0,0 +1,156 @@
+"""
+PointsListModel — QAbstractListModel over an N×6 float64 trajectory buffer.
+
+The model owns a numeric array (the same layout as
+MovementGroup.points_array()); display strings are formatted only for
+the rows a view asks for, so a QListView with uniform item sizes touches
+just the visible rows regardless of trajectory length.
+
+Each row may also carry its original text (e.g. the config string or what
+the position editor returned).  That text is shown and returned by
+point_strings() verbatim, so unedited points are saved exactly as they
+were read — malformed ones (NaN rows) included.
+"""
+from difflib import SequenceMatcher
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from src.external_dependencies.robotConfig.MovementGroup import POSE_SIZE, format_pose
+
+
+def _as_rows(values) -> np.ndarray:
+    return np.array(values, dtype=np.float64).reshape(-1, POSE_SIZE)
+
+
+def _as_texts(texts, count: int) -> List[Optional[str]]:
+    if texts is None:
+        return [None] * count
+    texts = list(texts)
+    if len(texts) != count:
+        raise ValueError(f"Expected {count} point texts, got {len(texts)}")
+    return texts
+
+
+class PointsListModel(QAbstractListModel):
+    """
+    One row per trajectory point; DisplayRole is the "[x, y, z, rx, ry, rz]" string.
+
+    Bulk edits (insert_points, remove_points, set_points_array, patch)
+    emit one begin/end pair per contiguous block, not one per row.  Every
+    edit takes optional texts, one per row; rows without one are formatted
+    from their numbers.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._points = np.empty((0, POSE_SIZE), dtype=np.float64)
+        self._texts: List[Optional[str]] = []     # original text per row, None → format_pose
+
+    # ── QAbstractListModel ────────────────────────────────────────────────
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._points)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._points):
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self.point_string(index.row())
+        return None
+
+    # ── Bulk API ──────────────────────────────────────────────────────────
+
+    def points_array(self) -> np.ndarray:
+        """A read-only view of the buffer."""
+        view = self._points.view()
+        view.flags.writeable = False
+        return view
+
+    def point(self, row: int) -> np.ndarray:
+        return self.points_array()[row]
+
+    def point_string(self, row: int) -> str:
+        text = self._texts[row]
+        return format_pose(self._points[row]) if text is None else text
+
+    def point_strings(self) -> List[str]:
+        return [self.point_string(row) for row in range(len(self._points))]
+
+    def set_points_array(self, values, texts: Optional[Sequence[str]] = None) -> None:
+        rows = _as_rows(values)
+        self.beginResetModel()
+        self._points = rows.copy()
+        self._texts = _as_texts(texts, len(rows))
+        self.endResetModel()
+
+    def insert_points(self, row: int, values, texts: Optional[Sequence[str]] = None) -> None:
+        rows = _as_rows(values)
+        if not len(rows):
+            return
+        texts = _as_texts(texts, len(rows))
+        self.beginInsertRows(QModelIndex(), row, row + len(rows) - 1)
+        self._points = np.insert(self._points, row, rows, axis=0)
+        self._texts[row:row] = texts
+        self.endInsertRows()
+
+    def append_points(self, values, texts: Optional[Sequence[str]] = None) -> None:
+        self.insert_points(len(self._points), values, texts)
+
+    def set_point(self, row: int, values, text: Optional[str] = None) -> None:
+        self.set_points_at(row, [values], None if text is None else [text])
+
+    def set_points_at(self, row: int, values, texts: Optional[Sequence[str]] = None) -> None:
+        """Overwrite len(values) consecutive rows starting at row."""
+        rows = _as_rows(values)
+        if not len(rows):
+            return
+        self._points[row:row + len(rows)] = rows
+        self._texts[row:row + len(rows)] = _as_texts(texts, len(rows))
+        self.dataChanged.emit(self.index(row), self.index(row + len(rows) - 1))
+
+    def remove_points(self, rows: Iterable[int]) -> None:
+        """Remove the given rows (any order), one removal per contiguous block."""
+        for first, last in reversed(self._blocks(rows)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self._points = np.delete(self._points, np.s_[first:last + 1], axis=0)
+            del self._texts[first:last + 1]
+            self.endRemoveRows()
+
+    def patch(self, values, texts: Optional[Sequence[str]] = None) -> bool:
+        """Make the rows equal to values (and texts), touching only the rows that differ.
+
+        Returns True if anything changed.
+        """
+        new = _as_rows(values)
+        new_texts = _as_texts(texts, len(new))
+        if new_texts == self._texts and np.array_equal(self._points, new, equal_nan=True):
+            return False
+        old_keys = [(row.tobytes(), text) for row, text in zip(self._points, self._texts)]
+        new_keys = [(row.tobytes(), text) for row, text in zip(new, new_texts)]
+        matcher = SequenceMatcher(None, old_keys, new_keys, autojunk=False)
+        # Walk backwards so earlier row indices stay valid while patching
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                continue
+            common = min(i2 - i1, j2 - j1)
+            self.set_points_at(i1, new[j1:j1 + common], new_texts[j1:j1 + common])
+            if i2 - i1 > common:
+                self.remove_points(range(i1 + common, i2))
+            if j2 - j1 > common:
+                self.insert_points(i1 + common, new[j1 + common:j2], new_texts[j1 + common:j2])
+        return True
+
+    # ── Helpers ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _blocks(rows: Iterable[int]) -> List[Sequence[int]]:
+        """Sorted unique rows → [(first, last), ...] contiguous ranges."""
+        blocks: List[List[int]] = []
+        for row in sorted(set(rows)):
+            if blocks and row == blocks[-1][1] + 1:
+                blocks[-1][1] = row
+            else:
+                blocks.append([row, row])
+        return blocks
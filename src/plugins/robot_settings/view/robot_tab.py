@@ -24,7 +24,7 @@ def robot_tab_factory(parent=None) -> Tuple[SettingsView, MovementGroupsTab]:
       - connect movement_tab.set_current_requested / execute_trajectory_requested
         to the robot controller
     """
-    movement_tab = MovementGroupsTab()
+    movement_tab = MovementGroupsTab(collapsible=True)
 
     view = SettingsView(
         component_name="RobotSettings",
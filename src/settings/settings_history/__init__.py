@@ -0,0 +1,4 @@
+from src.settings.settings_history.settings_history import (
+    HistoryChange, HistoryRecorder, HistoryVersion, SettingsHistory,
+)
+from src.settings.settings_history.history_view import SettingsHistoryView
@@ -0,0 +1,229 @@
+"""
+Pure UI tab for browsing a SettingsHistory and picking a version to restore.
+
+The upper table lists the saved versions, newest first, ending with a
+"Baseline" row for the settings before the first recorded change; the
+lower one shows the key / old / new values of the selected version (the
+stored values for the baseline).  Restoring only emits a signal — the
+plugin applies the version through its controller.
+
+Signals:
+    restore_requested(version)
+"""
+from __future__ import annotations
+
+import time
+from typing import List
+
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWidgets import (
+    QGroupBox, QHBoxLayout, QHeaderView, QMessageBox, QPushButton,
+    QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget,
+)
+
+from src.settings.settings_history.settings_history import HistoryVersion, SettingsHistory
+from src.settings.settings_view.styles import (
+    ACTION_BTN_STYLE, BG_COLOR, BORDER, GHOST_BTN_STYLE, GROUP_STYLE,
+)
+
+_MAX_KEYS_SHOWN = 3
+_BASELINE_VERSION = 0
+
+_TABLE_STYLE = f"""
+QTableWidget {{
+    background: white;
+    border: none;
+    font-size: 11pt;
+    color: #333333;
+    gridline-color: {BORDER};
+}}
+QTableWidget::item {{ padding: 8px 12px; }}
+QTableWidget::item:selected {{
+    background: rgba(144, 91, 169, 0.12);
+    color: #333333;
+}}
+QHeaderView::section {{
+    background: {BG_COLOR};
+    color: #555555;
+    font-size: 10pt;
+    font-weight: bold;
+    border: none;
+    border-bottom: 2px solid {BORDER};
+    padding: 8px 12px;
+}}
+"""
+
+
+def _detach(history: SettingsHistory, listener) -> None:
+    try:
+        history.remove_listener(listener)
+    except AttributeError:
+        pass    # interpreter exit: the history was torn down before Qt deleted the view
+
+
+def _summary(version: HistoryVersion) -> str:
+    keys = [c.key for c in version.changes]
+    shown = ", ".join(keys[:_MAX_KEYS_SHOWN])
+    more = len(keys) - _MAX_KEYS_SHOWN
+    return f"{shown} (+{more})" if more > 0 else shown
+
+
+class SettingsHistoryView(QWidget):
+    """
+    History tab: versions table, changes of the selected version, Restore.
+
+    The view re-reads the history when shown and whenever a version is
+    recorded (the listener may fire on a worker thread; the refresh is
+    queued to the GUI thread).  The listener is removed when the view is
+    destroyed.
+    """
+
+    restore_requested = pyqtSignal(int)   # version
+    _history_changed  = pyqtSignal()
+
+    def __init__(self, history: SettingsHistory, parent=None):
+        super().__init__(parent)
+        self._history = history
+        self._versions: List[HistoryVersion] = []    # newest first, as shown; baseline last
+        self._build_ui()
+        self._history_changed.connect(self.refresh)
+        # Neither closure holds self, so the view can be collected while the history lives on
+        changed = self._history_changed
+        listener = lambda _: changed.emit()
+        history.add_listener(listener)
+        self.destroyed.connect(lambda: _detach(history, listener))
+        self.refresh()
+
+    # ── Build ──────────────────────────────────────────────────────────────────
+
+    def _build_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 16, 16, 16)
+        layout.setSpacing(16)
+
+        versions_group = QGroupBox("Saved Versions")
+        versions_group.setStyleSheet(GROUP_STYLE)
+        inner = QVBoxLayout(versions_group)
+        inner.setContentsMargins(12, 16, 12, 12)
+        self._versions_table = self._table(["Version", "Saved", "Component", "Changed"])
+        self._versions_table.setMinimumHeight(240)
+        self._versions_table.itemSelectionChanged.connect(self._on_selection_changed)
+        inner.addWidget(self._versions_table)
+
+        changes_group = QGroupBox("Changes")
+        changes_group.setStyleSheet(GROUP_STYLE)
+        inner = QVBoxLayout(changes_group)
+        inner.setContentsMargins(12, 16, 12, 12)
+        inner.setSpacing(12)
+        self._changes_table = self._table(["Key", "Old", "New"])
+        inner.addWidget(self._changes_table)
+
+        btn_row = QWidget()
+        btn_row.setStyleSheet("background: transparent;")
+        row = QHBoxLayout(btn_row)
+        row.setContentsMargins(0, 0, 0, 0)
+        self._btn_refresh = QPushButton("Refresh")
+        self._btn_refresh.setStyleSheet(GHOST_BTN_STYLE)
+        self._btn_refresh.clicked.connect(self.refresh)
+        self._btn_restore = QPushButton("Restore This Version")
+        self._btn_restore.setStyleSheet(ACTION_BTN_STYLE)
+        self._btn_restore.setEnabled(False)
+        self._btn_restore.clicked.connect(self._on_restore)
+        row.addWidget(self._btn_refresh)
+        row.addStretch()
+        row.addWidget(self._btn_restore)
+        inner.addWidget(btn_row)
+
+        layout.addWidget(versions_group)
+        layout.addWidget(changes_group)
+
+    @staticmethod
+    def _table(headers: List[str]) -> QTableWidget:
+        table = QTableWidget()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setStyleSheet(_TABLE_STYLE)
+        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.verticalHeader().setVisible(False)
+        header = table.horizontalHeader()
+        for column in range(len(headers) - 1):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(len(headers) - 1, QHeaderView.ResizeMode.Stretch)
+        return table
+
+    # ── Public API ─────────────────────────────────────────────────────────────
+
+    def refresh(self) -> None:
+        """Re-read the versions, keeping the selection where possible."""
+        selected = self.selected_version()
+        self._versions = list(reversed(self._history.versions()))
+        if self._versions and self._history.has_baseline():
+            first = self._versions[-1]
+            self._versions.append(HistoryVersion(_BASELINE_VERSION, first.timestamp, first.component, ()))
+        table = self._versions_table
+        table.setRowCount(len(self._versions))
+        for row, version in enumerate(self._versions):
+            if version.version == _BASELINE_VERSION:
+                cells = ("Baseline", "before version 1", version.component, "Settings before the first change")
+            else:
+                saved = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(version.timestamp))
+                cells = (str(version.version), saved, version.component, _summary(version))
+            for column, text in enumerate(cells):
+                table.setItem(row, column, QTableWidgetItem(text))
+        rows = [r for r, v in enumerate(self._versions) if v.version == selected]
+        if rows:
+            table.selectRow(rows[0])
+        else:
+            table.clearSelection()
+            self._show_changes(None)
+
+    def selected_version(self) -> int | None:
+        rows = self._versions_table.selectionModel().selectedRows()
+        return self._versions[rows[0].row()].version if rows else None
+
+    def select_version(self, version: int) -> None:
+        for row, recorded in enumerate(self._versions):
+            if recorded.version == version:
+                self._versions_table.selectRow(row)
+                return
+
+    # ── Private ────────────────────────────────────────────────────────────────
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.refresh()
+
+    def _on_selection_changed(self) -> None:
+        rows = self._versions_table.selectionModel().selectedRows()
+        self._show_changes(self._versions[rows[0].row()] if rows else None)
+
+    def _show_changes(self, version: HistoryVersion | None) -> None:
+        if version is None:
+            rows = []
+        elif version.version == _BASELINE_VERSION:
+            rows = [(key, "", repr(value)) for key, value in self._history.state_at(_BASELINE_VERSION).items()]
+        else:
+            rows = [(c.key, repr(c.old), repr(c.new)) for c in version.changes]
+        self._changes_table.setRowCount(len(rows))
+        for row, cells in enumerate(rows):
+            for column, value in enumerate(cells):
+                self._changes_table.setItem(row, column, QTableWidgetItem(value))
+        self._btn_restore.setEnabled(version is not None)
+
+    def _on_restore(self) -> None:
+        version = self.selected_version()
+        if version is None:
+            return
+        what = ("the settings from before the first recorded change" if version == _BASELINE_VERSION
+                else f"the settings saved as version {version}")
+        reply = QMessageBox.question(
+            self, "Restore Settings",
+            f"Restore {what}?\n"
+            "Only the values that differ from the current ones are changed.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No,
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.restore_requested.emit(version)
@@ -0,0 +1,212 @@
+"""
+Append-only history of saved settings, for auditing and rolling back.
+
+Every save appends one JSON line holding the changed keys with their old
+and new values.  Every ``snapshot_every`` versions a full snapshot of the
+flat settings dict is appended as well (plus one for the baseline before
+the first change), so state_at() replays at most ``snapshot_every`` deltas
+whatever the length of the log.
+
+Log lines::
+
+    {"v": 0, "t": 1718000000.0, "c": "CameraSettings", "s": {...}}              snapshot
+    {"v": 7, "t": 1718000042.5, "c": "CameraSettings", "d": [["threshold", 150, 120]]}
+
+Values are the flat-dict values the mappers produce, so they must be JSON
+serialisable.  A line cut short by a crash is ignored on the next load.
+record() may be called from a worker thread; listeners are called on that
+thread.
+
+Models use a HistoryRecorder, which remembers the last loaded or saved
+state so each save is recorded against what was actually persisted.
+"""
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+_DEFAULT_SNAPSHOT_EVERY = 20
+
+
+@dataclass(frozen=True)
+class HistoryChange:
+    key: str
+    old: Any
+    new: Any
+
+
+@dataclass(frozen=True)
+class HistoryVersion:
+    version: int
+    timestamp: float             # time.time()
+    component: str
+    changes: Tuple[HistoryChange, ...]
+
+
+class SettingsHistory:
+    def __init__(self, path: Union[str, Path], snapshot_every: int = _DEFAULT_SNAPSHOT_EVERY):
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be at least 1")
+        self._path = Path(path)
+        self._snapshot_every = snapshot_every
+        self._lock = threading.Lock()
+        self._versions: List[HistoryVersion] = []       # version n at index n - 1
+        self._snapshots: Dict[int, dict] = {}           # version → full flat state after it
+        self._listeners: List[Callable[[HistoryVersion], None]] = []
+        self._torn_tail = False                         # last line was cut short by a crash
+        self._load()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    # ── Public API ─────────────────────────────────────────────────────────────
+
+    def record(self, component: str, before: dict, after: dict,
+               keys: Optional[Iterable[str]] = None) -> Optional[int]:
+        """Append the keys (default: all of after) whose value changed from before to after.
+
+        before and after are the full flat dicts around the save.  Returns the
+        new version, or None when nothing changed.
+        """
+        keys = after.keys() if keys is None else keys
+        changes = tuple(HistoryChange(k, before.get(k), after[k])
+                        for k in keys if k in after and before.get(k) != after[k])
+        if not changes:
+            return None
+        with self._lock:
+            now = time.time()
+            version = HistoryVersion(len(self._versions) + 1, now, component, changes)
+            snapshots: Dict[int, dict] = {}
+            lines = []
+            if not self._versions and 0 not in self._snapshots:       # baseline
+                snapshots[0] = dict(before)
+                lines.append({"v": 0, "t": now, "c": component, "s": snapshots[0]})
+            lines.append({"v": version.version, "t": now, "c": component,
+                          "d": [[c.key, c.old, c.new] for c in changes]})
+            if version.version % self._snapshot_every == 0:
+                snapshots[version.version] = self._state_after(version, before)
+                lines.append({"v": version.version, "t": now, "c": component,
+                              "s": snapshots[version.version]})
+            self._append(lines)
+            self._versions.append(version)
+            self._snapshots.update(snapshots)
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(version)
+            except Exception as e:       # the version is on disk — a listener must not undo that
+                print(f"[SettingsHistory] Listener failed: {e}")
+        return version.version
+
+    def versions(self) -> List[HistoryVersion]:
+        """Every recorded version, oldest first."""
+        with self._lock:
+            return list(self._versions)
+
+    def latest_version(self) -> int:
+        return len(self._versions)
+
+    def has_baseline(self) -> bool:
+        """True once the state before the first recorded change (version 0) is stored."""
+        with self._lock:
+            return 0 in self._snapshots
+
+    def state_at(self, version: int) -> dict:
+        """The flat settings dict as it was right after version was saved (0 = baseline)."""
+        with self._lock:
+            if not 0 <= version <= len(self._versions) or not self._snapshots:
+                raise KeyError(f"Unknown settings version: {version}")
+            base = max(v for v in self._snapshots if v <= version)
+            state = dict(self._snapshots[base])
+            for recorded in self._versions[base:version]:
+                for change in recorded.changes:
+                    state[change.key] = change.new
+            return state
+
+    def add_listener(self, callback: Callable[[HistoryVersion], None]) -> None:
+        """callback(version) after each record() — on the recording thread."""
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[HistoryVersion], None]) -> None:
+        """Stop calling callback; unknown callbacks are ignored."""
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    # ── Private ────────────────────────────────────────────────────────────────
+
+    def _state_after(self, version: HistoryVersion, before: dict) -> dict:
+        # The caller's before dict is the full state preceding this version
+        state = dict(before)
+        for change in version.changes:
+            state[change.key] = change.new
+        return state
+
+    def _append(self, lines: List[dict]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(line, separators=(",", ":")) + "\n" for line in lines)
+        if self._torn_tail:
+            data = "\n" + data              # never glue a record onto a torn line
+            self._torn_tail = False
+        with open(self._path, "a", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _load(self) -> None:
+        try:
+            text = self._path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return
+        self._torn_tail = bool(text) and not text.endswith("\n")
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"[SettingsHistory] Skipping damaged line in {self._path.name}")
+                continue
+            if "s" in entry:
+                self._snapshots[entry["v"]] = entry["s"]
+            else:
+                changes = tuple(HistoryChange(k, old, new) for k, old, new in entry["d"])
+                self._versions.append(HistoryVersion(entry["v"], entry["t"], entry["c"], changes))
+
+
+class HistoryRecorder:
+    """Records one model's saves into a SettingsHistory.
+
+    loaded(obj) / saved(obj, keys) take the model's own objects and flatten
+    them with to_flat.  Call both from the thread that talks to the service
+    (a model's worker, or inline) so they see the saves in order.
+    """
+
+    def __init__(self, history: SettingsHistory, component: str, to_flat: Callable[[Any], dict]):
+        self._history = history
+        self._component = component
+        self._to_flat = to_flat
+        self._persisted: Optional[dict] = None
+
+    @property
+    def history(self) -> SettingsHistory:
+        return self._history
+
+    def loaded(self, obj) -> None:
+        self._persisted = self._to_flat(obj)
+
+    def saved(self, obj, keys: Optional[Iterable[str]] = None) -> Optional[int]:
+        """Record obj as saved; only keys (default: all) are compared.  Returns the version."""
+        after = self._to_flat(obj)
+        before = self._persisted if self._persisted is not None else after
+        self._persisted = after
+        try:
+            return self._history.record(self._component, before, after, keys)
+        except (OSError, TypeError, ValueError) as e:    # the settings themselves were saved
+            print(f"[SettingsHistory] {self._component} save not recorded: {e}")
+            return None
@@ -0,0 +1 @@
+from src.settings.settings_mapper.mapper_engine import CompiledMapper, MappedField, compile_mapper
@@ -0,0 +1,193 @@
+"""
+Declarative mapper engine.
+
+A plugin describes its settings once, as a table of MappedField rows::
+
+    _FIELDS = (
+        MappedField("threshold",     type=int,  json="Threshold"),
+        MappedField("gaussian_blur", type=bool, json="Preprocessing/Gaussian blur"),
+        MappedField("global_velocity", attr="global_motion_settings.global_velocity", type=int),
+    )
+    _MAPPER = compile_mapper(_FIELDS, name="CameraSettings")
+
+compile_mapper() generates straight-line Python source for each direction
+and compiles it once (at import time of the plugin's mapper module), so a
+call costs one dict access and one cast per field — no loops over the
+table, no getattr()/setattr() reflection.
+
+from_flat_dict() keeps the structural-sharing contract of the hand-written
+mappers: the base is copied shallowly, a nested object is copied only when
+the flat dict touches one of its fields, and everything else is shared.
+"""
+from copy import copy
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+JSON_PATH_SEP = "/"
+
+
+@dataclass(frozen=True)
+class MappedField:
+    key: str                               # flat key used by SettingsView
+    attr: Optional[str] = None             # dotted attribute path on the model (defaults to key)
+    type: Optional[Callable] = None        # cast applied when reading a flat value (None = as-is)
+    json: Optional[str] = None             # "Name" or "Section/Name" in the nested JSON (None = not persisted)
+    export: Optional[Callable] = None      # conversion applied when writing the flat value
+
+    @property
+    def attr_path(self) -> List[str]:
+        return (self.attr or self.key).split(".")
+
+
+class CompiledMapper:
+    """The generated functions for one field table.
+
+    Attributes:
+        to_flat_dict(obj) -> dict
+        from_flat_dict(flat, base) -> obj
+        to_json(obj) -> dict              (only fields with a json path)
+        from_json(data, factory) -> obj   (missing keys keep factory()'s defaults)
+    """
+
+    def __init__(self, fields: Sequence[MappedField], name: str, namespace: Dict[str, Any], source: str):
+        self.fields = tuple(fields)
+        self.name = name
+        self.source = source
+        self.to_flat_dict:   Callable = namespace["to_flat_dict"]
+        self.from_flat_dict: Callable = namespace["from_flat_dict"]
+        self.to_json:        Callable = namespace["to_json"]
+        self.from_json:      Callable = namespace["from_json"]
+
+    @property
+    def keys(self) -> List[str]:
+        return [f.key for f in self.fields]
+
+
+def compile_mapper(fields: Sequence[MappedField], name: str = "mapper") -> CompiledMapper:
+    """Generate and compile the to/from functions for a field table."""
+    keys = [f.key for f in fields]
+    if len(set(keys)) != len(keys):
+        raise ValueError(f"{name}: duplicate flat keys in field table")
+    for f in fields:
+        if f.json is not None and f.json.count(JSON_PATH_SEP) > 1:
+            raise ValueError(f"{name}: JSON path {f.json!r} nests deeper than one section")
+
+    namespace: Dict[str, Any] = {"_copy": copy}
+    cast_names:   Dict[int, str] = {}
+    export_names: Dict[int, str] = {}
+    for i, f in enumerate(fields):
+        if f.type is not None:
+            cast_names[i] = f"_t{i}"
+            namespace[cast_names[i]] = f.type
+        if f.export is not None:
+            export_names[i] = f"_e{i}"
+            namespace[export_names[i]] = f.export
+
+    lines: List[str] = []
+    lines += _gen_to_flat_dict(fields, export_names)
+    lines += _gen_from_flat_dict(fields, cast_names)
+    lines += _gen_to_json(fields)
+    lines += _gen_from_json(fields)
+    source = "\n".join(lines) + "\n"
+
+    exec(compile(source, f"<mapper {name}>", "exec"), namespace)
+    return CompiledMapper(fields, name, namespace, source)
+
+
+# ── code generation ───────────────────────────────────────────────────────────
+
+def _gen_to_flat_dict(fields: Sequence[MappedField], export_names: Dict[int, str]) -> List[str]:
+    lines = ["def to_flat_dict(obj):", "    return {"]
+    for i, f in enumerate(fields):
+        expr = "obj." + ".".join(f.attr_path)
+        if i in export_names:
+            expr = f"{export_names[i]}({expr})"
+        lines.append(f"        {f.key!r}: {expr},")
+    lines += ["    }", ""]
+    return lines
+
+
+def _gen_from_flat_dict(fields: Sequence[MappedField], cast_names: Dict[int, str]) -> List[str]:
+    lines = ["def from_flat_dict(flat, base):", "    o = _copy(base)"]
+
+    def assign(indent: str, target: str, i: int, f: MappedField) -> None:
+        value = f"flat[{f.key!r}]"
+        if i in cast_names:
+            value = f"{cast_names[i]}({value})"
+        lines.append(f"{indent}if {f.key!r} in flat:")
+        lines.append(f"{indent}    {target}.{f.attr_path[-1]} = {value}")
+
+    # Top-level attributes first, then one copy-on-touch block per nested object
+    nested: Dict[str, List[int]] = {}
+    for i, f in enumerate(fields):
+        path = f.attr_path
+        if len(path) == 1:
+            assign("    ", "o", i, f)
+        else:
+            nested.setdefault(".".join(path[:-1]), []).append(i)
+
+    copied: set = set()
+    for n, (parent, indices) in enumerate(nested.items()):
+        touched = " or ".join(f"{fields[i].key!r} in flat" for i in indices)
+        lines.append(f"    if {touched}:")
+        # copy every object on the way down that this mapper has not copied yet
+        parts = parent.split(".")
+        for depth in range(1, len(parts) + 1):
+            prefix = ".".join(parts[:depth])
+            if prefix not in copied:
+                lines.append(f"        o.{prefix} = _copy(o.{prefix})")
+                copied.add(prefix)
+        lines.append(f"        n{n} = o.{parent}")
+        for i in indices:
+            assign("        ", f"n{n}", i, fields[i])
+    lines += ["    return o", ""]
+    return lines
+
+
+def _gen_to_json(fields: Sequence[MappedField]) -> List[str]:
+    # Nested sections are emitted in the order their first field appears
+    lines = ["def to_json(obj):", "    return {"]
+    sections: Dict[str, List[MappedField]] = {}
+    order: List[Any] = []
+    for f in fields:
+        if f.json is None:
+            continue
+        section, _, leaf = f.json.rpartition(JSON_PATH_SEP)
+        if not section:
+            order.append(f)
+        else:
+            if section not in sections:
+                sections[section] = []
+                order.append(section)
+            sections[section].append(f)
+
+    for item in order:
+        if isinstance(item, MappedField):
+            lines.append(f"        {item.json!r}: obj.{'.'.join(item.attr_path)},")
+            continue
+        lines.append(f"        {item!r}: {{")
+        for f in sections[item]:
+            leaf = f.json.rpartition(JSON_PATH_SEP)[2]
+            lines.append(f"            {leaf!r}: obj.{'.'.join(f.attr_path)},")
+        lines.append("        },")
+    lines += ["    }", ""]
+    return lines
+
+
+def _gen_from_json(fields: Sequence[MappedField]) -> List[str]:
+    lines = ["def from_json(data, factory):", "    o = factory()"]
+    section_vars: Dict[str, str] = {}
+    for f in fields:
+        if f.json is None:
+            continue
+        section, _, leaf = f.json.rpartition(JSON_PATH_SEP)
+        source = "data"
+        if section:
+            if section not in section_vars:
+                section_vars[section] = f"s{len(section_vars)}"
+                lines.append(f"    {section_vars[section]} = data.get({section!r}, {{}})")
+            source = section_vars[section]
+        lines.append(f"    if {leaf!r} in {source}:")
+        lines.append(f"        o.{'.'.join(f.attr_path)} = {source}[{leaf!r}]")
+    lines += ["    return o", ""]
+    return lines
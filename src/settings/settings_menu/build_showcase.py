@@ -35,7 +35,9 @@ def build_settings_menu_showcase():
 
     nav = SettingsNavigationWidget(
             categories=CUSTOM_CATEGORIES,
-            factory_map=factory_map
+            factory_map=factory_map,
+            deferred=True,
+            searchable=True,
         )
 
     return nav
\ No newline at end of file
@@ -1,9 +1,13 @@
+import time
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QFrame, QStackedWidget
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
 import qtawesome as qta
+from src.settings.settings_search.search_bar import SettingsSearchBar
+from src.settings.settings_search.search_index import KIND_CATEGORY, SearchEntry, SearchIndex
 from src.settings.settings_view.styles import PRIMARY, PRIMARY_LIGHT
 from .menu_icon import MenuIcon
 
@@ -131,21 +135,55 @@ class SettingsNavigationWidget(QWidget):
                     e.g., {"robot": lambda: RobotConfigUI(), "camera": create_camera_settings}
                     If provided, views are automatically created for all categories.
         parent: Parent widget
+        deferred: If True, the sidebar and welcome page are shown right away and
+                  the factories are called one per event-loop pass once the
+                  widget is first shown.  Clicking a category whose view is not
+                  built yet shows a loading page and builds that view next.
+                  A factory that raises is reported with view_failed and its
+                  category shows an error page instead of the view.
+        searchable: If True, a search field above the content area queries
+                  search_index and jumps to the picked entry.
+
+    Search:
+        search_index holds the category ids plus the entries of every built
+        view that has a search_entries(category_id) method; a view is
+        indexed when it is added and again whenever it emits
+        search_entries_changed (e.g. after its controller loaded movement
+        groups).  reveal(entry) switches to the entry's category and calls
+        the view's reveal(key).  reindex(category_id) refreshes a view
+        without that signal.
 
     Signals:
         tab_changing(str, str): Emitted before tab changes (old_tab_id, new_tab_id)
         tab_changed(str, str): Emitted after tab changes (old_tab_id, new_tab_id)
+        view_built(str, float): Emitted after a factory view is built (category_id, elapsed_ms)
+        view_failed(str, str): Emitted when a factory raised (category_id, error)
     """
 
     tab_changing = pyqtSignal(str, str)  # old_tab_id, new_tab_id
     tab_changed = pyqtSignal(str, str)   # old_tab_id, new_tab_id
+    view_built = pyqtSignal(str, float)  # category_id, elapsed_ms
+    view_failed = pyqtSignal(str, str)   # category_id, error
 
-    def __init__(self, categories, factory_map, parent=None):
+    def __init__(self, categories, factory_map, parent=None, deferred: bool = False,
+                 searchable: bool = False):
         super().__init__(parent)
         self.categories = categories
         self.factory_map = factory_map or {}
         self.settings_views = {}
+        self.build_timings = {}     # category_id → factory time in ms
+        self.build_errors = {}      # category_id → error of a factory that raised
         self.current_tab_id = None  # Track current tab
+        self._deferred = deferred
+        self._pending_factories = {}  # category_id → factory, in build order
+        self._requested_tab_id = None  # category clicked while its view was pending
+        self._prebuild_started = False
+        self._loading_index = None
+        self._error_index = None
+        self._requested_key = None     # entry key to reveal once its pending view is built
+        self._searchable = searchable
+        self.search_index = SearchIndex()
+        self.search_index.add_entries(SearchEntry(c.id, KIND_CATEGORY, c.id) for c in self.categories)
         self._init_ui()
         self._create_views_from_factory()
 
@@ -158,13 +196,23 @@ class SettingsNavigationWidget(QWidget):
         self.sidebar = SettingsMenu(categories=self.categories, compact=True)
         self.sidebar.setFixedWidth(100)
         self.sidebar.setStyleSheet("background-color: #f8f8f8; border-right: 1px solid #e0e0e0;")
-        self.sidebar.settings_selected.connect(self._show_settings)
+        self.sidebar.settings_selected.connect(self._on_sidebar_selected)
         main_layout.addWidget(self.sidebar)
 
         # Right content area
         self.content_stack = QStackedWidget()
         self.content_stack.setStyleSheet("background-color: white;")
-        main_layout.addWidget(self.content_stack, 1)
+        if self._searchable:
+            self.search_bar = SettingsSearchBar(self.search_index)
+            self.search_bar.entry_selected.connect(self.reveal)
+            content = QVBoxLayout()
+            content.setContentsMargins(0, 0, 0, 0)
+            content.setSpacing(0)
+            content.addWidget(self.search_bar)
+            content.addWidget(self.content_stack, 1)
+            main_layout.addLayout(content, 1)
+        else:
+            main_layout.addWidget(self.content_stack, 1)
 
         # Add welcome page as page 0
         welcome = self._create_welcome_page()
@@ -198,8 +246,35 @@ class SettingsNavigationWidget(QWidget):
         widget.setLayout(layout)
         return widget
 
+    def _create_loading_page(self):
+        """Create the page shown while a deferred view is being built"""
+        widget = QWidget()
+        layout = QVBoxLayout()
+
+        label = QLabel("Loading…")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setStyleSheet("color: #666; font-size: 16px;")
+        layout.addWidget(label)
+
+        widget.setLayout(layout)
+        return widget
+
+    def _create_error_page(self):
+        """Create the page shown for a category whose view could not be built"""
+        widget = QWidget()
+        layout = QVBoxLayout()
+
+        self._error_label = QLabel()
+        self._error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._error_label.setWordWrap(True)
+        self._error_label.setStyleSheet("color: #B3261E; font-size: 16px;")
+        layout.addWidget(self._error_label)
+
+        widget.setLayout(layout)
+        return widget
+
     def _create_views_from_factory(self):
-        """Automatically create views from factory_map"""
+        """Automatically create views from factory_map (or queue them in deferred mode)"""
         if not self.factory_map:
             return
 
@@ -209,22 +284,122 @@ class SettingsNavigationWidget(QWidget):
         for category in categories_to_use:
             category_id = category.id
             if category_id in self.factory_map:
-                factory = self.factory_map[category_id]
-                try:
-                    # Call factory to create widget
-                    widget = factory() if callable(factory) else factory
-                    self.add_settings_view(category_id, widget)
-                    print(f"[Navigation] Auto-created view for '{category_id}'")
-                except Exception as e:
-                    print(f"[Navigation] Error creating view for '{category_id}': {e}")
+                if self._deferred:
+                    self._pending_factories[category_id] = self.factory_map[category_id]
+                else:
+                    self._build_view(category_id, self.factory_map[category_id])
+
+    def _build_view(self, category_id: str, factory) -> bool:
+        """Call a factory, register its widget and record how long it took; False if it raised"""
+        start = time.perf_counter()
+        try:
+            # Call factory to create widget
+            widget = factory() if callable(factory) else factory
+            self.add_settings_view(category_id, widget)
+        except Exception as e:
+            print(f"[Navigation] Error creating view for '{category_id}': {e}")
+            self.build_errors[category_id] = str(e)
+            self.view_failed.emit(category_id, str(e))
+            return False
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        self.build_timings[category_id] = elapsed_ms
+        print(f"[Navigation] Auto-created view for '{category_id}' ({elapsed_ms:.1f} ms)")
+        self.view_built.emit(category_id, elapsed_ms)
+        return True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_factories and not self._prebuild_started:
+            self._prebuild_started = True
+            QTimer.singleShot(0, self._build_next_pending)
+
+    def _build_next_pending(self):
+        """Build one queued view, then yield back to the event loop"""
+        if not self._pending_factories:
+            return
+        category_id = next(iter(self._pending_factories))
+        built = self._build_view(category_id, self._pending_factories.pop(category_id))
+
+        if self._requested_tab_id == category_id:
+            # Leave the loading page either way — for the view or its error page
+            self._requested_tab_id = None
+            self._show_settings(category_id)
+            if built and self._requested_key is not None:
+                self._reveal_key(category_id, self._requested_key)
+            self._requested_key = None
+
+        if self._pending_factories:
+            QTimer.singleShot(0, self._build_next_pending)
+
+    def _show_loading(self, setting_id: str):
+        """Show the loading page and move *setting_id* to the front of the build queue"""
+        factory = self._pending_factories.pop(setting_id)
+        self._pending_factories = {setting_id: factory, **self._pending_factories}
+        self._requested_tab_id = setting_id
+
+        if self._loading_index is None:
+            self._loading_index = self.content_stack.addWidget(self._create_loading_page())
+        self.content_stack.setCurrentIndex(self._loading_index)
+
+        if not self._prebuild_started:
+            self._prebuild_started = True
+            QTimer.singleShot(0, self._build_next_pending)
 
     def add_settings_view(self, setting_id: str, widget: QWidget):
         """Add a settings view for a specific category"""
         index = self.content_stack.addWidget(widget)
         self.settings_views[setting_id] = index
+        self._index_view(setting_id, widget)
+        if hasattr(widget, "search_entries_changed"):
+            widget.search_entries_changed.connect(lambda: self.reindex(setting_id))
+
+    # ── Search ────────────────────────────────────────────────────────────
+
+    def search(self, query: str, limit: int = 20):
+        """Ranked SearchHits for query over everything indexed so far."""
+        return self.search_index.search(query, limit)
+
+    def reindex(self, category_id: str) -> None:
+        """Re-read the search entries of one built view."""
+        if category_id in self.settings_views:
+            self._index_view(category_id, self.content_stack.widget(self.settings_views[category_id]))
+
+    def reveal(self, entry: SearchEntry) -> None:
+        """Show entry's category and, for field / group entries, jump to the widget."""
+        self._requested_key = None if entry.kind == KIND_CATEGORY else entry.key
+        self.sidebar.set_active_item(entry.category)
+        self._show_settings(entry.category)
+        if self._requested_key is not None and entry.category in self.settings_views:
+            self._reveal_key(entry.category, self._requested_key)
+
+    def _reveal_key(self, category_id: str, key: str) -> None:
+        self._requested_key = None
+        widget = self.content_stack.widget(self.settings_views[category_id])
+        if not (hasattr(widget, "reveal") and widget.reveal(key)):
+            print(f"[Navigation] Cannot reveal '{key}' in '{category_id}'")
+
+    def _index_view(self, category_id: str, widget: QWidget) -> None:
+        self.search_index.remove_category(category_id)
+        self.search_index.add_entries(
+            SearchEntry(c.id, KIND_CATEGORY, c.id) for c in self.categories if c.id == category_id
+        )
+        if hasattr(widget, "search_entries"):
+            self.search_index.add_entries(widget.search_entries(category_id))
+
+    def _on_sidebar_selected(self, setting_id: str):
+        self._requested_key = None   # a click overrides a pending search jump
+        self._show_settings(setting_id)
 
     def _show_settings(self, setting_id: str):
         """Show the selected settings view"""
+        if setting_id in self._pending_factories:
+            self._show_loading(setting_id)
+            return
+
+        self._requested_tab_id = None
+        if setting_id in self.build_errors:
+            self._show_build_error(setting_id)
+            return
         if setting_id in self.settings_views:
             old_tab_id = self.current_tab_id
 
@@ -259,3 +434,12 @@ class SettingsNavigationWidget(QWidget):
             # Show welcome page
             self.content_stack.setCurrentIndex(0)
             self.current_tab_id = None
+
+    def _show_build_error(self, setting_id: str):
+        """Show the error page for a category whose factory raised"""
+        if self._error_index is None:
+            self._error_index = self.content_stack.addWidget(self._create_error_page())
+        self._error_label.setText(f"Could not load '{setting_id}' settings:\n{self.build_errors[setting_id]}")
+        self.content_stack.setCurrentIndex(self._error_index)
+        self.current_tab_id = None
+        print(f"[Navigation] View for {setting_id} failed to build")
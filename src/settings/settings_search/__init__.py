@@ -0,0 +1,3 @@
+from src.settings.settings_search.search_index import (
+    KIND_CATEGORY, KIND_FIELD, KIND_MOVEMENT_GROUP, SearchEntry, SearchHit, SearchIndex,
+)
@@ -0,0 +1,104 @@
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout, QWidget
+
+from src.settings.settings_search.search_index import KIND_CATEGORY, SearchEntry, SearchIndex
+from src.settings.settings_view.styles import BORDER, PRIMARY, PRIMARY_DARK, PRIMARY_LIGHT, TEXT_COLOR
+
+_SEARCH_BAR_STYLE = f"""
+QLineEdit {{
+    background: white;
+    border: 2px solid {BORDER};
+    border-radius: 8px;
+    padding: 8px 12px;
+    font-size: 12pt;
+    color: {TEXT_COLOR};
+}}
+QLineEdit:focus {{
+    border-color: {PRIMARY};
+}}
+QListWidget {{
+    background: white;
+    border: 2px solid {BORDER};
+    border-radius: 8px;
+    padding: 4px;
+    font-size: 11pt;
+}}
+QListWidget::item {{
+    padding: 6px;
+}}
+QListWidget::item:selected {{
+    background: {PRIMARY_LIGHT};
+    color: {PRIMARY_DARK};
+}}
+"""
+
+
+class SettingsSearchBar(QWidget):
+    """
+    Search field with a results list underneath, backed by a SearchIndex.
+
+    The list is hidden while the query is empty.  Clicking a result, or
+    pressing Enter (first result), emits entry_selected and clears the field.
+
+    Signals:
+        entry_selected(SearchEntry): the result the user picked
+    """
+
+    entry_selected = pyqtSignal(object)   # SearchEntry
+
+    def __init__(self, index: SearchIndex, max_results: int = 12, parent=None):
+        super().__init__(parent)
+        self._index = index
+        self._max_results = max_results
+        self.setStyleSheet(_SEARCH_BAR_STYLE)
+
+        self._edit = QLineEdit()
+        self._edit.setPlaceholderText("Search settings…")
+        self._edit.setClearButtonEnabled(True)
+        self._edit.textChanged.connect(self._update_results)
+        self._edit.returnPressed.connect(self._select_first)
+
+        self._results = QListWidget()
+        self._results.setMaximumHeight(240)
+        self._results.itemClicked.connect(self._on_item_clicked)
+        self._results.hide()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(16, 12, 16, 0)
+        layout.setSpacing(4)
+        layout.addWidget(self._edit)
+        layout.addWidget(self._results)
+
+    def set_query(self, text: str) -> None:
+        self._edit.setText(text)
+
+    def result_entries(self):
+        return [self._results.item(i).data(Qt.ItemDataRole.UserRole)
+                for i in range(self._results.count())]
+
+    # ── Private ───────────────────────────────────────────────────────────
+
+    def _update_results(self, text: str) -> None:
+        self._results.clear()
+        hits = self._index.search(text, limit=self._max_results)
+        for hit in hits:
+            item = QListWidgetItem(self._describe(hit.entry))
+            item.setData(Qt.ItemDataRole.UserRole, hit.entry)
+            self._results.addItem(item)
+        self._results.setVisible(bool(hits))
+
+    @staticmethod
+    def _describe(entry: SearchEntry) -> str:
+        if entry.kind == KIND_CATEGORY:
+            return entry.label or entry.key
+        where = f"{entry.category} › {entry.context}" if entry.context else entry.category
+        return f"{entry.label or entry.key}    ({where})"
+
+    def _select_first(self) -> None:
+        if self._results.count():
+            self._on_item_clicked(self._results.item(0))
+
+    def _on_item_clicked(self, item: QListWidgetItem) -> None:
+        entry = item.data(Qt.ItemDataRole.UserRole)
+        self._edit.clear()
+        self.entry_selected.emit(entry)
@@ -0,0 +1,138 @@
+"""
+In-memory search index over settings keys, labels, movement groups and
+navigation categories.
+
+Entries are added per category as views register, so a query never walks
+the widget tree.  Matching runs in two passes:
+
+    prefix  — the query is a prefix of the key, the label, or any
+              word-suffix of them ("4 drop" finds "SLOT 4 DROPOFF");
+              found with a bisect over a sorted term list.
+    fuzzy   — the query's characters appear in order ("erdit" finds
+              "erode_iterations"); one compiled regex scan over the
+              entries, ranked by how tight the match is.
+"""
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+KIND_CATEGORY       = "category"
+KIND_FIELD          = "field"
+KIND_MOVEMENT_GROUP = "movement_group"
+
+# Rank of a hit, best first
+_EXACT, _PREFIX, _WORD_PREFIX, _FUZZY = range(4)
+
+
+def normalise(text: str) -> str:
+    """Lower-case, with underscores and runs of whitespace folded to one space."""
+    return " ".join(text.replace("_", " ").lower().split())
+
+
+@dataclass(frozen=True)
+class SearchEntry:
+    category: str       # navigation category id the entry lives under
+    kind: str           # KIND_CATEGORY | KIND_FIELD | KIND_MOVEMENT_GROUP
+    key: str            # what reveal() is called with (field key, group name, category id)
+    label: str = ""     # display text, searched alongside key
+    context: str = ""   # e.g. tab / group title, shown next to the hit
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    entry: SearchEntry
+    rank: int           # 0 exact, 1 prefix, 2 word prefix, 3 fuzzy
+    score: int          # tie-break within a rank, lower is better
+
+
+class SearchIndex:
+    """
+    Usage:
+        index = SearchIndex()
+        index.add_entries([SearchEntry("camera", KIND_FIELD, "erode_iterations", "Erode Iterations")])
+        index.search("erode")      # → [SearchHit(...)]
+        index.remove_category("camera")
+    """
+
+    def __init__(self):
+        self._entries: List[Optional[SearchEntry]] = []   # id → entry (None once removed)
+        self._texts:   List[str] = []                     # id → normalised "key\nlabel"
+        self._ids:     Dict[SearchEntry, int] = {}
+        self._terms:   List[Tuple[str, int]] = []         # (term, id), sorted lazily
+        self._sorted = True
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # ── Building ──────────────────────────────────────────────────────────
+
+    def add(self, entry: SearchEntry) -> None:
+        if entry in self._ids:
+            return
+        entry_id = len(self._entries)
+        self._entries.append(entry)
+        self._ids[entry] = entry_id
+
+        texts = {normalise(entry.key), normalise(entry.label)} - {""}
+        self._texts.append("\n".join(sorted(texts)))
+        for text in texts:
+            words = text.split(" ")
+            self._terms.extend((" ".join(words[i:]), entry_id) for i in range(len(words)))
+        self._sorted = False
+
+    def add_entries(self, entries: Iterable[SearchEntry]) -> None:
+        for entry in entries:
+            self.add(entry)
+
+    def remove_category(self, category: str) -> None:
+        """Drop every entry registered under category (e.g. before re-indexing it)."""
+        removed = {i for entry, i in self._ids.items() if entry.category == category}
+        if not removed:
+            return
+        for entry_id in removed:
+            del self._ids[self._entries[entry_id]]
+            self._entries[entry_id] = None
+            self._texts[entry_id] = ""
+        self._terms = [term for term in self._terms if term[1] not in removed]
+
+    def entries(self, category: Optional[str] = None) -> List[SearchEntry]:
+        return [e for e in self._ids if category is None or e.category == category]
+
+    # ── Querying ──────────────────────────────────────────────────────────
+
+    def search(self, query: str, limit: int = 20, fuzzy: bool = True) -> List[SearchHit]:
+        """Best hits first: exact, then prefix, word prefix and (optionally) fuzzy matches."""
+        q = normalise(query)
+        if not q:
+            return []
+        if not self._sorted:
+            self._terms.sort()
+            self._sorted = True
+
+        best: Dict[int, Tuple[int, int]] = {}   # id → (rank, score)
+        i = bisect_left(self._terms, (q, -1))
+        while i < len(self._terms) and self._terms[i][0].startswith(q):
+            term, entry_id = self._terms[i]
+            text = self._texts[entry_id]
+            if term == q and term in text.split("\n"):
+                hit = (_EXACT, 0)
+            elif term in text.split("\n"):
+                hit = (_PREFIX, len(term))
+            else:
+                hit = (_WORD_PREFIX, len(term))
+            if hit < best.get(entry_id, (_FUZZY + 1, 0)):
+                best[entry_id] = hit
+            i += 1
+
+        if fuzzy and len(best) < limit:
+            pattern = re.compile(".*?".join(map(re.escape, q.replace(" ", ""))))
+            for entry_id, text in enumerate(self._texts):
+                if entry_id in best or not text:
+                    continue
+                match = pattern.search(text)
+                if match:
+                    best[entry_id] = (_FUZZY, match.end() - match.start())
+
+        ranked = sorted(best.items(), key=lambda item: (item[1], self._entries[item[0]].key))
+        return [SearchHit(self._entries[i], rank, score) for i, (rank, score) in ranked[:limit]]
@@ -1,3 +1,5 @@
+from typing import Any, Iterator, List, Tuple
+
 from PyQt6.QtWidgets import (
     QGroupBox, QGridLayout, QVBoxLayout, QWidget,
     QLabel, QSizePolicy
@@ -5,9 +7,11 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import pyqtSignal
 
 from src.settings.settings_view.schema import SettingGroup, SettingField
-from src.settings.settings_view.styles import GROUP_STYLE, LABEL_STYLE
+from src.settings.settings_view.styles import OBJ_SETTING_CELL, OBJ_SETTING_GROUP, OBJ_SETTING_LABEL
 from src.settings.settings_view.widget_factory import get_handler, WidgetHandler
 
+_MISSING = object()
+
 
 class GenericSettingGroup(QGroupBox):
     """
@@ -21,6 +25,12 @@ class GenericSettingGroup(QGroupBox):
 
     Fields whose handler has full_width=True always span both columns.
 
+    Styled by the shared sheet installed on SettingsView (object names only).
+
+    set_values() remembers the last value applied to each field and skips
+    fields whose incoming value is unchanged.  A user edit forgets the
+    remembered value, so the next set_values() re-applies it.
+
     Signals:
         value_changed(key: str, value: object)
     """
@@ -29,10 +39,11 @@ class GenericSettingGroup(QGroupBox):
 
     def __init__(self, group: SettingGroup, parent=None):
         super().__init__(group.title, parent)
-        self.setStyleSheet(GROUP_STYLE)
+        self.setObjectName(OBJ_SETTING_GROUP)
         self._group = group
         self._widgets:  dict[str, QWidget]        = {}
         self._handlers: dict[str, WidgetHandler]  = {}
+        self._applied:  dict[str, Any]            = {}   # key → last value set_values() applied
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         self._build_ui()
 
@@ -53,16 +64,16 @@ class GenericSettingGroup(QGroupBox):
             handler = get_handler(f.widget_type)
 
             cell = QWidget()
-            cell.setStyleSheet("background: transparent;")
+            cell.setObjectName(OBJ_SETTING_CELL)
             cell_layout = QVBoxLayout(cell)
             cell_layout.setContentsMargins(0, 0, 0, 0)
             cell_layout.setSpacing(6)
 
             label = QLabel(f.label)
-            label.setStyleSheet(LABEL_STYLE)
+            label.setObjectName(OBJ_SETTING_LABEL)
             cell_layout.addWidget(label)
 
-            emit = lambda val, k=f.key: self.value_changed.emit(k, val)
+            emit = lambda val, k=f.key: self._on_widget_changed(k, val)
             widget = handler.create(f, emit)
             cell_layout.addWidget(widget)
 
@@ -85,17 +96,37 @@ class GenericSettingGroup(QGroupBox):
         outer.addLayout(grid)
         self.setLayout(outer)
 
+    def _on_widget_changed(self, key: str, value) -> None:
+        # The widget no longer shows the last applied value
+        self._applied.pop(key, None)
+        self.value_changed.emit(key, value)
+
     # ── public API ────────────────────────────────────────────────────────────
 
-    def set_values(self, values: dict) -> None:
-        for key, widget in self._widgets.items():
-            if key not in values:
+    def set_values(self, values: dict) -> List[str]:
+        """Push values into the widgets (no signals emitted).
+
+        Returns the keys whose widget was actually updated; unknown keys and
+        values equal to the last applied one are skipped.
+        """
+        updated = []
+        for key, value in values.items():
+            widget = self._widgets.get(key)
+            if widget is None or self._applied.get(key, _MISSING) == value:
                 continue
             widget.blockSignals(True)
             try:
-                self._handlers[key].set_value(widget, values[key])
+                self._handlers[key].set_value(widget, value)
             finally:
                 widget.blockSignals(False)
+            self._applied[key] = value
+            updated.append(key)
+        return updated
+
+    def fields(self) -> Iterator[Tuple[str, QWidget, WidgetHandler]]:
+        """Yield (key, widget, handler) for every field of the group."""
+        for key, widget in self._widgets.items():
+            yield key, widget, self._handlers[key]
 
     def get_values(self) -> dict:
         return {
@@ -1,13 +1,21 @@
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from PyQt6.QtWidgets import (
-    QWidget, QTabWidget, QVBoxLayout, QScrollArea, QPushButton
+    QWidget, QTabWidget, QVBoxLayout, QScrollArea, QPushButton, QLabel
 )
 from PyQt6.QtCore import pyqtSignal, Qt
 
+from src.settings.settings_search.search_index import KIND_FIELD, SearchEntry
 from src.settings.settings_view.schema import SettingGroup
 from src.settings.settings_view.group_widget import GenericSettingGroup
-from src.settings.settings_view.styles import TAB_WIDGET_STYLE, SAVE_BUTTON_STYLE, BG_COLOR
+from src.settings.settings_view.styles import (
+    ERROR_LABEL_STYLE, SAVE_BUTTON_STYLE, SETTINGS_VIEW_STYLE, TAB_WIDGET_STYLE,
+)
+from src.settings.settings_view.widget_factory import WidgetHandler
+
+_MISSING = object()
+
+FieldEntry = Tuple[GenericSettingGroup, QWidget, WidgetHandler]
 
 
 class SettingsView(QWidget):
@@ -21,20 +29,63 @@ class SettingsView(QWidget):
         view.set_values(flat_dict)
         view.value_changed_signal.connect(handler)
         view.save_requested.connect(on_save)
+
+    Deferred mode (``lazy=True``):
+        add_tab() only stores the SettingGroup schemas; the group widgets are
+        built the first time the tab is shown.  set_values() caches values for
+        tabs that are not built yet and applies them on build; get_values()
+        returns the cached values for those tabs.
+
+    Single fields:
+        get_value(key) / set_value(key, value) go through a key index and
+        cost O(1).  Keys edited by the user since they were last pushed are
+        "dirty"; get_values(dirty_only=True) returns just those.
+
+    Background saves:
+        set_saving(True) disables the Save button until set_saving(False);
+        clear_dirty(saved_delta) then keeps edits made in the meantime.
+        mark_dirty(keys) flags values pushed by code (e.g. a restore) as
+        unsaved until such a clear_dirty() confirms them.
+        tab_deactivated fires when SettingsNavigationWidget leaves the view,
+        so auto-saving controllers can flush pending edits.
+        set_error(message) shows why a save was refused or failed above the
+        Save button; set_error("") hides it.
+
+    Search:
+        search_entries(category) lists every field of every tab (built or
+        not) for a SearchIndex; reveal(key) switches to the field's tab and
+        scrolls it into view.  Raw tabs whose widget has the same two
+        methods (e.g. MovementGroupsTab) are included, and their
+        search_entries_changed signal is re-emitted.
     """
 
     value_changed_signal = pyqtSignal(str, object, str)  # key, value, component_name
     save_requested = pyqtSignal(dict)                     # emits current values on Save
+    tab_deactivated = pyqtSignal()                        # the navigation switched away from this view
+    search_entries_changed = pyqtSignal()                 # a raw tab's search entries changed
 
-    def __init__(self, component_name: str = "SettingsView", mapper=None, parent: QWidget = None):
+    def __init__(self, component_name: str = "SettingsView", mapper=None, parent: QWidget = None,
+                 lazy: bool = False):
         super().__init__(parent)
-        self.setStyleSheet(f"background-color: {BG_COLOR};")
+        self.setStyleSheet(SETTINGS_VIEW_STYLE)
         self._component_name = component_name
         self._mapper = mapper
+        self._lazy = lazy
         self._groups: List[GenericSettingGroup] = []
+        self._key_index: Dict[str, FieldEntry] = {}   # field key → (group, widget, handler)
+        self._dirty: Set[str] = set()
+        self._tab_schemas: List[Tuple[str, List[SettingGroup]]] = []   # (tab title, schemas)
+        self._key_tabs:   Dict[str, QScrollArea] = {}                  # field key → its tab
+        self._raw_tabs:   List[Tuple[str, QScrollArea]] = []
+
+        # Deferred mode: scroll area → (schemas, footer) for tabs not built yet
+        self._pending_tabs:   Dict[QScrollArea, Tuple[List[SettingGroup], Optional[QWidget]]] = {}
+        self._pending_keys:   Set[str] = set()
+        self._pending_values: dict     = {}
 
         self._tabs = QTabWidget()
         self._tabs.setStyleSheet(TAB_WIDGET_STYLE)
+        self._tabs.currentChanged.connect(self._on_current_tab_changed)
 
         self._save_btn = QPushButton("Save")
         self._save_btn.setStyleSheet(SAVE_BUTTON_STYLE)
@@ -44,40 +95,88 @@ class SettingsView(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
+        self._error_label = QLabel()
+        self._error_label.setStyleSheet(ERROR_LABEL_STYLE)
+        self._error_label.setWordWrap(True)
+        self._error_label.hide()
+
         layout.addWidget(self._tabs)
+        layout.addWidget(self._error_label)
         layout.addWidget(self._save_btn)
 
     def add_tab(self, title: str, groups: List[SettingGroup], footer: QWidget = None) -> None:
         """Build a tab from a list of SettingGroup schemas and add it.
 
+        In deferred mode the widgets are built when the tab is first shown.
+
         Args:
             footer: Optional widget appended below the groups (e.g. an action button).
         """
         content = QWidget()
-        content.setStyleSheet(f"background: {BG_COLOR};")
         content_layout = QVBoxLayout(content)
         content_layout.setContentsMargins(16, 16, 16, 16)
         content_layout.setSpacing(16)
 
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        scroll.setWidget(content)
+
+        self._tab_schemas.append((title, groups))
+        self._key_tabs.update((f.key, scroll) for schema in groups for f in schema.fields)
+
+        if not self._lazy:
+            self._populate_tab(content_layout, groups, footer)
+            self._tabs.addTab(scroll, title)
+            return
+
+        self._pending_tabs[scroll] = (groups, footer)
+        self._pending_keys.update(f.key for schema in groups for f in schema.fields)
+        self._tabs.addTab(scroll, title)
+        if self._tabs.currentWidget() is scroll and scroll in self._pending_tabs:
+            self._materialise_tab(scroll)
+
+    def _populate_tab(self, content_layout: QVBoxLayout,
+                      groups: List[SettingGroup], footer: Optional[QWidget]) -> List[GenericSettingGroup]:
+        built = []
         for schema in groups:
             widget = GenericSettingGroup(schema)
-            widget.value_changed.connect(
-                lambda k, v: self.value_changed_signal.emit(k, v, self._component_name)
-            )
+            widget.value_changed.connect(self._on_field_changed)
             self._groups.append(widget)
+            self._key_index.update((key, (widget, w, handler)) for key, w, handler in widget.fields())
+            built.append(widget)
             content_layout.addWidget(widget)
 
         if footer is not None:
             content_layout.addWidget(footer)
 
         content_layout.addStretch()
+        return built
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-        scroll.setWidget(content)
+    def _on_field_changed(self, key: str, value) -> None:
+        self._dirty.add(key)
+        self.value_changed_signal.emit(key, value, self._component_name)
 
-        self._tabs.addTab(scroll, title)
+    def _materialise_tab(self, scroll: QScrollArea) -> None:
+        """Build the widgets of a deferred tab and apply any cached values."""
+        groups, footer = self._pending_tabs.pop(scroll)
+        keys = {f.key for schema in groups for f in schema.fields}
+        self._pending_keys -= keys
+
+        for widget in self._populate_tab(scroll.widget().layout(), groups, footer):
+            widget.set_values(self._pending_values)
+        for key in keys:
+            self._pending_values.pop(key, None)
+
+    def _on_current_tab_changed(self, index: int) -> None:
+        scroll = self._tabs.widget(index)
+        if scroll in self._pending_tabs:
+            self._materialise_tab(scroll)
+
+    def materialise_all(self) -> None:
+        """Build every deferred tab now (no-op in eager mode)."""
+        for scroll in list(self._pending_tabs):
+            self._materialise_tab(scroll)
 
     def add_raw_tab(self, title: str, widget: QWidget) -> None:
         """Add a tab containing an arbitrary widget (not schema-driven)."""
@@ -85,20 +184,139 @@ class SettingsView(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
         scroll.setWidget(widget)
+        self._raw_tabs.append((title, scroll))
         self._tabs.addTab(scroll, title)
+        if hasattr(widget, "search_entries_changed"):
+            widget.search_entries_changed.connect(self.search_entries_changed)
+
+    def search_entries(self, category: str) -> List[SearchEntry]:
+        """One SearchEntry per field (and per raw-tab entry), without building deferred tabs."""
+        entries = [
+            SearchEntry(category, KIND_FIELD, f.key, f.label, f"{title} › {schema.title}")
+            for title, groups in self._tab_schemas
+            for schema in groups
+            for f in schema.fields
+        ]
+        for _, scroll in self._raw_tabs:
+            if hasattr(scroll.widget(), "search_entries"):
+                entries.extend(scroll.widget().search_entries(category))
+        return entries
+
+    def reveal(self, key: str) -> bool:
+        """Show the tab holding key, scroll its widget into view and focus it.
+
+        Returns False if no tab knows the key.
+        """
+        scroll = self._key_tabs.get(key)
+        if scroll is not None:
+            self._tabs.setCurrentWidget(scroll)     # builds a deferred tab
+            _, widget, _ = self._key_index[key]
+            scroll.ensureWidgetVisible(widget)
+            widget.setFocus(Qt.FocusReason.OtherFocusReason)
+            return True
+        for _, scroll in self._raw_tabs:
+            inner = scroll.widget()
+            if hasattr(inner, "reveal") and inner.reveal(key):
+                self._tabs.setCurrentWidget(scroll)
+                return True
+        return False
 
-    def load(self, model) -> None:
+    def load(self, model) -> List[str]:
         """Convert model → flat dict via mapper, then push into widgets."""
         if self._mapper is None:
             raise RuntimeError("No mapper configured on this SettingsView.")
-        self.set_values(self._mapper(model))
+        return self.set_values(self._mapper(model))
 
-    def set_values(self, flat: dict) -> None:
-        for group in self._groups:
-            group.set_values(flat)
+    def set_values(self, flat: dict) -> List[str]:
+        """Push a flat dict into the widgets, touching only changed fields.
+
+        Returns the keys that were actually updated (including values cached
+        for deferred tabs).  Unknown keys are ignored.
+        """
+        per_group: Dict[GenericSettingGroup, dict] = {}
+        updated: List[str] = []
+        for key, value in flat.items():
+            entry = self._key_index.get(key)
+            if entry is not None:
+                per_group.setdefault(entry[0], {})[key] = value
+            elif key in self._pending_keys and self._pending_values.get(key, _MISSING) != value:
+                self._pending_values[key] = value
+                updated.append(key)
+
+        for group, values in per_group.items():
+            updated.extend(group.set_values(values))
+        self._dirty.difference_update(updated)
+        return updated
+
+    def get_value(self, key: str):
+        """Current value of a single field.  Raises KeyError for unknown or never-set keys."""
+        entry = self._key_index.get(key)
+        if entry is not None:
+            _, widget, handler = entry
+            return handler.get_value(widget)
+        if key in self._pending_values:
+            return self._pending_values[key]
+        raise KeyError(f"Unknown setting key: {key!r}")
+
+    def set_value(self, key: str, value) -> bool:
+        """Push a single value (no signals emitted).  Returns True if the field was updated."""
+        if key not in self._key_index and key not in self._pending_keys:
+            raise KeyError(f"Unknown setting key: {key!r}")
+        return bool(self.set_values({key: value}))
 
-    def get_values(self) -> dict:
-        result = {}
+    def dirty_keys(self) -> Set[str]:
+        """Keys edited by the user since they were last pushed or cleared."""
+        return set(self._dirty)
+
+    def mark_dirty(self, keys: Iterable[str]) -> None:
+        """Treat keys as edited — e.g. values pushed by a restore that is not saved yet."""
+        self._dirty.update(key for key in keys if key in self._key_index or key in self._pending_keys)
+
+    def get_delta(self) -> dict:
+        """Flat dict of the user-edited fields — mappers' from_flat_dict() applies it onto a base."""
+        return self.get_values(dirty_only=True)
+
+    def clear_dirty(self, saved: Optional[dict] = None) -> None:
+        """Forget pending edits; call after the delta has been persisted.
+
+        With ``saved`` (the delta that was written) only keys whose field
+        still holds the saved value are forgotten — edits made while a
+        background save was in flight stay dirty.
+        """
+        if saved is None:
+            self._dirty.clear()
+            return
+        self._dirty.difference_update(
+            key for key, value in saved.items()
+            if key in self._dirty and self.get_value(key) == value)
+
+    def on_tab_deactivate(self) -> None:
+        """Called by SettingsNavigationWidget when another category is shown."""
+        self.tab_deactivated.emit()
+
+    def set_saving(self, saving: bool) -> None:
+        """Disable the Save button while a save is in flight."""
+        self._save_btn.setEnabled(not saving)
+        self._save_btn.setText("Saving…" if saving else "Save")
+
+    def set_error(self, message: str) -> None:
+        """Show message above the Save button; an empty message hides it."""
+        self._error_label.setText(message)
+        self._error_label.setVisible(bool(message))
+
+    def error(self) -> str:
+        return self._error_label.text()
+
+    def get_values(self, dirty_only: bool = False) -> dict:
+        """Current values of all built fields, plus cached values of deferred tabs.
+
+        Fields of a deferred tab that were never set are omitted, so mappers
+        fall back to the model's own value for them.  With ``dirty_only`` only
+        the fields edited by the user are returned.
+        """
+        if dirty_only:
+            return {key: self.get_value(key) for key in self._dirty}
+        result = dict(self._pending_values)
         for group in self._groups:
             result.update(group.get_values())
         return result
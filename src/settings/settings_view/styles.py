@@ -4,6 +4,7 @@ PRIMARY_LIGHT = "rgba(122, 90, 248, 0.10)"
 BG_COLOR      = "#F8F9FA"
 BORDER        = "#E0E0E0"
 TEXT_COLOR    = "#1A1A2E"
+ERROR_COLOR   = "#B3261E"
 
 ###
 PRIMARY_HOVER = "#8B6FF9"       # lighter primary for hover
@@ -111,6 +112,14 @@ QLabel {{
 }}
 """
 
+ERROR_LABEL_STYLE = f"""
+QLabel {{
+    color: {ERROR_COLOR};
+    font-size: 11pt;
+    background: transparent;
+}}
+"""
+
 ACTION_BTN_STYLE = f"""
 QPushButton {{
     background-color: {PRIMARY};
@@ -140,3 +149,181 @@ QPushButton {{
 QPushButton:hover   {{ background-color: {PRIMARY_LIGHT}; }}
 QPushButton:pressed {{ background-color: {PRIMARY_LIGHT}; }}
 """
+
+# ── Shared stylesheet registry ────────────────────────────────────────────────
+#
+# Per-widget setStyleSheet() calls make Qt parse and polish one stylesheet per
+# instance.  The widgets below only set an object name (or a dynamic property)
+# and are styled by one sheet installed on an ancestor: SettingsView, the
+# editor dialogs, or the application via install_app_stylesheet().
+
+OBJ_TOUCH_SPINBOX       = "TouchSpinBox"
+OBJ_TOUCH_SPINBOX_ROW   = "TouchSpinBoxRow"
+OBJ_TOUCH_SPINBOX_STEP  = "TouchSpinBoxStep"
+OBJ_TOUCH_SPINBOX_VALUE = "TouchSpinBoxValue"
+OBJ_TOUCH_SPINBOX_PILL  = "TouchSpinBoxPill"
+OBJ_SETTING_GROUP       = "SettingGroup"
+OBJ_SETTING_CELL        = "SettingCell"
+OBJ_SETTING_LABEL       = "SettingLabel"
+OBJ_SETTING_COMBO       = "SettingCombo"
+OBJ_SETTING_LINE_EDIT   = "SettingLineEdit"
+OBJ_SETTING_READOUT     = "SettingReadout"      # read-only QLineEdit, e.g. a position
+OBJ_SETTING_LIST        = "SettingList"
+OBJ_ERROR_LABEL         = "ErrorLabel"
+OBJ_ACTION_BUTTON       = "ActionButton"
+OBJ_GHOST_BUTTON        = "GhostButton"
+OBJ_HEADER_BUTTON       = "HeaderButton"        # left-aligned ghost button
+
+PROP_SELECTED = "selected"   # bool dynamic property on step pills
+
+
+def _scoped(style: str, type_name: str, object_name: str) -> str:
+    """Restrict every *type_name* selector in *style* to one object name."""
+    return style.replace(type_name, f"{type_name}#{object_name}")
+
+
+TOUCH_SPINBOX_STYLE = f"""
+QFrame#{OBJ_TOUCH_SPINBOX} {{
+    background-color: white;
+    border: 1px solid {BORDER};
+    border-radius: 10px;
+}}
+QWidget#{OBJ_TOUCH_SPINBOX_ROW} {{ background: transparent; border: none; }}
+QLabel#{OBJ_TOUCH_SPINBOX_VALUE} {{
+    color: {PRIMARY_DARK};
+    background: transparent;
+    border: none;
+}}
+QPushButton#{OBJ_TOUCH_SPINBOX_STEP} {{
+    background: white;
+    border: 1px solid {BORDER};
+    border-radius: 8px;
+    font-size: 20pt;
+    font-weight: bold;
+    color: {PRIMARY};
+}}
+QPushButton#{OBJ_TOUCH_SPINBOX_STEP}:hover {{
+    border: 1px solid {PRIMARY};
+    background-color: rgba(122,90,248,0.05);
+}}
+QPushButton#{OBJ_TOUCH_SPINBOX_STEP}:pressed {{
+    background-color: rgba(122,90,248,0.15);
+}}
+QPushButton#{OBJ_TOUCH_SPINBOX_STEP}:disabled {{
+    background-color: {BORDER};
+    border: 1px solid {BORDER};
+    color: #aaaaaa;
+}}
+QPushButton#{OBJ_TOUCH_SPINBOX_PILL} {{
+    background-color: transparent;
+    color: {PRIMARY_DARK};
+    border: 1px solid {BORDER};
+    border-radius: 8px;
+    padding: 0 12px;
+}}
+QPushButton#{OBJ_TOUCH_SPINBOX_PILL}:hover {{
+    background-color: rgba(122,90,248,0.08);
+    border: 1px solid {PRIMARY};
+}}
+QPushButton#{OBJ_TOUCH_SPINBOX_PILL}[{PROP_SELECTED}="true"] {{
+    background-color: {PRIMARY};
+    color: white;
+    border: none;
+}}
+"""
+
+SETTING_INPUT_STYLE = f"""
+QComboBox#{OBJ_SETTING_COMBO} {{
+    background: white;
+    color: #333333;
+    border: 2px solid {BORDER};
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-size: 12pt;
+    min-height: 56px;
+}}
+QComboBox#{OBJ_SETTING_COMBO}:hover {{ border-color: {PRIMARY}; }}
+QComboBox#{OBJ_SETTING_COMBO}::drop-down {{ border: none; width: 40px; }}
+QComboBox#{OBJ_SETTING_COMBO} QAbstractItemView {{
+    background: white;
+    color: #333333;
+    selection-background-color: rgba(122, 90, 248, 0.12);
+    selection-color: {PRIMARY_DARK};
+    font-size: 11pt;
+    padding: 8px;
+}}
+QLineEdit#{OBJ_SETTING_LINE_EDIT} {{
+    background: white;
+    color: #333333;
+    border: 2px solid {BORDER};
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-size: 12pt;
+    min-height: 56px;
+}}
+QLineEdit#{OBJ_SETTING_LINE_EDIT}:focus {{ border-color: {PRIMARY}; }}
+QLineEdit#{OBJ_SETTING_READOUT} {{
+    background: white;
+    color: #333333;
+    border: 2px solid {BORDER};
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-size: 11pt;
+    min-height: 44px;
+}}
+QListView#{OBJ_SETTING_LIST} {{
+    background: white;
+    border: 2px solid {BORDER};
+    border-radius: 8px;
+    padding: 4px;
+    font-size: 11pt;
+}}
+QListView#{OBJ_SETTING_LIST}::item:selected {{
+    background: {PRIMARY_LIGHT};
+    color: {PRIMARY_DARK};
+}}
+QLabel#{OBJ_ERROR_LABEL} {{
+    color: {ERROR_COLOR};
+    font-size: 10pt;
+    background: transparent;
+}}
+"""
+
+SETTING_BUTTON_STYLE = (
+    _scoped(ACTION_BTN_STYLE, "QPushButton", OBJ_ACTION_BUTTON)
+    + _scoped(GHOST_BTN_STYLE, "QPushButton", OBJ_GHOST_BUTTON)
+    + _scoped(GHOST_BTN_STYLE, "QPushButton", OBJ_HEADER_BUTTON)
+    + f"QPushButton#{OBJ_HEADER_BUTTON} {{ text-align: left; }}\n"
+)
+
+# Cells are transparent, and so is everything inside them that has no rule
+# of its own.  Listed first so the object-name rules below win ties.
+SHARED_WIDGET_STYLE = (
+    f"QWidget#{OBJ_SETTING_CELL}, QWidget#{OBJ_SETTING_CELL} * {{ background: transparent; }}\n"
+    + _scoped(GROUP_STYLE, "QGroupBox", OBJ_SETTING_GROUP)
+    + _scoped(LABEL_STYLE, "QLabel", OBJ_SETTING_LABEL)
+    + TOUCH_SPINBOX_STYLE
+    + SETTING_INPUT_STYLE
+    + SETTING_BUTTON_STYLE
+)
+
+# Installed once per SettingsView / editor dialog.
+SETTINGS_VIEW_STYLE = f"* {{ background-color: {BG_COLOR}; }}\n" + SHARED_WIDGET_STYLE
+
+
+def install_app_stylesheet(app) -> None:
+    """Add SHARED_WIDGET_STYLE to the application stylesheet (idempotent).
+
+    Only needed for hosts that use TouchSpinBox & co. outside a SettingsView
+    or editor dialog; every rule is scoped by object name.
+    """
+    current = app.styleSheet()
+    if SHARED_WIDGET_STYLE not in current:
+        app.setStyleSheet(current + SHARED_WIDGET_STYLE)
+
+
+def repolish(widget) -> None:
+    """Re-apply the stylesheet after a dynamic property used in selectors changed."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
@@ -9,6 +9,9 @@ Each widget type is described by a WidgetHandler that knows:
 
 Adding a new widget type = add one WidgetHandler to _REGISTRY.
 Nothing else needs to change.
+
+Widgets are styled through object names by the shared sheet in styles.py
+(SETTING_INPUT_STYLE), not by per-instance setStyleSheet() calls.
 """
 from __future__ import annotations
 
@@ -21,48 +24,10 @@ from PyQt6.QtWidgets import QComboBox, QLineEdit, QWidget
 from src.utils_widgets.SwitchButton import QToggle
 from src.utils_widgets.int_list_widget import IntListWidget
 from src.settings.settings_view.schema import SettingField
-from src.settings.settings_view.styles import BORDER, PRIMARY, PRIMARY_DARK
+from src.settings.settings_view.styles import OBJ_SETTING_COMBO, OBJ_SETTING_LINE_EDIT
 from src.utils_widgets.touch_spinbox import TouchSpinBox
 
 
-# ── shared styles ─────────────────────────────────────────────────────────────
-
-_COMBO_STYLE = f"""
-QComboBox {{
-    background: white;
-    color: #333333;
-    border: 2px solid {BORDER};
-    border-radius: 8px;
-    padding: 8px 16px;
-    font-size: 12pt;
-    min-height: 56px;
-}}
-QComboBox:hover {{ border-color: {PRIMARY}; }}
-QComboBox::drop-down {{ border: none; width: 40px; }}
-QComboBox QAbstractItemView {{
-    background: white;
-    color: #333333;
-    selection-background-color: rgba(122, 90, 248, 0.12);
-    selection-color: {PRIMARY_DARK};
-    font-size: 11pt;
-    padding: 8px;
-}}
-"""
-
-_LINE_EDIT_STYLE = f"""
-QLineEdit {{
-    background: white;
-    color: #333333;
-    border: 2px solid {BORDER};
-    border-radius: 8px;
-    padding: 8px 16px;
-    font-size: 12pt;
-    min-height: 56px;
-}}
-QLineEdit:focus {{ border-color: {PRIMARY}; }}
-"""
-
-
 # ── WidgetHandler ─────────────────────────────────────────────────────────────
 
 @dataclass
@@ -101,7 +66,7 @@ def _make_spinbox(f: SettingField, emit: Callable) -> TouchSpinBox:
 
 def _make_combo(f: SettingField, emit: Callable) -> QComboBox:
     w = QComboBox()
-    w.setStyleSheet(_COMBO_STYLE)
+    w.setObjectName(OBJ_SETTING_COMBO)
     w.setFont(QFont("Arial", 12, QFont.Weight.Bold))
     for choice in (f.choices or []):
         w.addItem(str(choice))
@@ -115,7 +80,7 @@ def _make_combo(f: SettingField, emit: Callable) -> QComboBox:
 
 def _make_line_edit(f: SettingField, emit: Callable) -> QLineEdit:
     w = QLineEdit()
-    w.setStyleSheet(_LINE_EDIT_STYLE)
+    w.setObjectName(OBJ_SETTING_LINE_EDIT)
     if f.default is not None:
         w.setText(str(f.default))
     w.textChanged.connect(emit)
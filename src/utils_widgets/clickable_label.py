@@ -11,19 +11,52 @@ them back.
 Signals
 -------
 corner_updated(area_name, index, x_norm, y_norm)
-    A corner in *area_name* was moved (click-to-place or drag).
+    A corner in *area_name* was moved (click-to-place or drag).  How often
+    it fires during a drag depends on the emission policy:
+
+        EMIT_EVERY_MOVE    every mouse move (default)
+        EMIT_RATE_LIMITED  at most emit_rate_hz times per second; the last
+                           position of a burst is always delivered
+        EMIT_ON_RELEASE    once, when the button is released
+
+corner_committed(area_name, index, x_norm, y_norm)
+    A corner placed or dragged is final (mouse released) — whatever the policy.
 
 empty_clicked(area_name, x_norm, y_norm)
     The user clicked on an empty spot while *area_name* is active (no corner hit).
     Useful for appending a new corner: add the point and call set_area_corners().
+
+Rendering
+---------
+The scaled frame is cached, keyed on the frame's cacheKey(), the label size
+and the transform mode, so overlay-only repaints (corner drags, coordinate
+text) reuse it.  Frames pushed faster than the screen refresh are coalesced:
+set_frame() only stores the frame, and at most one repaint per refresh
+interval scales and paints the newest one.  ``fast_transform=True`` scales
+with Qt.FastTransformation — meant for live video.
+
+Inactive areas are drawn once into a transparent overlay pixmap, rebuilt
+only when corners, colours, the active area or the widget size change;
+each paint draws the frame, that overlay and the active area on top.
+
+NumPy frames
+------------
+set_frame_array(array, "bgr" | "rgb" | "gray") wraps a uint8 OpenCV-style
+array in a QImage without copying and paints it directly; the label keeps
+a reference to the array until the next frame replaces it, so the producer
+must not write into it meanwhile.  ``downscale=True`` shrinks frames larger
+than the label on ingest (one copy at label size, the array is released).
 """
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QRect
+import numpy as np
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QRect, QTimer
 from PyQt6.QtGui import (
-    QBrush, QColor, QMouseEvent, QPainter, QPen, QPixmap, QPolygonF,
+    QBrush, QColor, QImage, QMouseEvent, QPainter, QPen, QPixmap, QPolygonF,
 )
 from PyQt6.QtWidgets import QLabel, QSizePolicy
 
@@ -32,6 +65,14 @@ from PyQt6.QtWidgets import QLabel, QSizePolicy
 _HIT_THRESHOLD   = 0.05   # normalised radius to detect a corner under cursor
 _RADIUS_ACTIVE   = 9      # corner dot radius when area is active (editing)
 _RADIUS_INACTIVE = 7      # corner dot radius when area is inactive (view-only)
+_DEFAULT_REFRESH_HZ = 60.0  # used when the screen does not report a refresh rate
+_DEFAULT_EMIT_RATE_HZ = 20.0
+
+# corner_updated emission policies
+EMIT_EVERY_MOVE   = "every_move"
+EMIT_RATE_LIMITED = "rate_limited"
+EMIT_ON_RELEASE   = "on_release"
+_EMIT_POLICIES = (EMIT_EVERY_MOVE, EMIT_RATE_LIMITED, EMIT_ON_RELEASE)
 
 # Built-in colour palette for well-known area names
 _PALETTE: Dict[str, QColor] = {
@@ -41,6 +82,49 @@ _PALETTE: Dict[str, QColor] = {
 }
 _FALLBACK_COLOR = QColor(100, 180, 255)         # blue for unknown names
 
+# set_frame_array() formats → (QImage format, channels)
+_ARRAY_FORMATS: Dict[str, Tuple[QImage.Format, int]] = {
+    "bgr":  (QImage.Format.Format_BGR888,     3),
+    "rgb":  (QImage.Format.Format_RGB888,     3),
+    "gray": (QImage.Format.Format_Grayscale8, 1),
+}
+_NATIVE_FORMATS = (QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32_Premultiplied)
+
+
+class _AreaStyle(NamedTuple):
+    fill:   QBrush
+    border: QPen
+    halo:   QBrush
+    dot:    QBrush
+    number: QColor
+    radius: int
+
+
+_STYLES: Dict[Tuple[int, bool], _AreaStyle] = {}   # (rgba, active) → style
+
+
+def _area_style(color: QColor, active: bool) -> _AreaStyle:
+    """Brushes and pens for an area, built once per colour and state."""
+    key = (color.rgba(), active)
+    style = _STYLES.get(key)
+    if style is None:
+        fill = QColor(color)
+        fill.setAlpha(55 if active else 25)
+        border = QColor(color)
+        border.setAlpha(230 if active else 130)
+        halo = QColor(color).darker(160)
+        halo.setAlpha(180)
+        style = _STYLES[key] = _AreaStyle(
+            fill=QBrush(fill),
+            border=QPen(border, 2.0 if active else 1.2,
+                        Qt.PenStyle.SolidLine if active else Qt.PenStyle.DashLine),
+            halo=QBrush(halo),
+            dot=QBrush(color),
+            number=QColor(0, 0, 0) if color.lightness() > 128 else QColor(255, 255, 255),
+            radius=_RADIUS_ACTIVE if active else _RADIUS_INACTIVE,
+        )
+    return style
+
 
 class ClickableLabel(QLabel):
     """
@@ -63,16 +147,23 @@ class ClickableLabel(QLabel):
 
         # React to changes
         label.corner_updated.connect(on_corner)   # (area, idx, xn, yn)
+        label.corner_committed.connect(on_done)   # (area, idx, xn, yn) on release
         label.empty_clicked.connect(on_click)      # (area, xn, yn)
 
-        # Push live frames
+        # Throttle corner_updated during drags (or: EMIT_ON_RELEASE)
+        label.set_emit_policy(EMIT_RATE_LIMITED, rate_hz=10)
+
+        # Push live frames (cheap for live video: fast scaling, newest frame wins)
+        label = ClickableLabel(fast_transform=True)
         label.set_frame(pixmap)
     """
 
-    corner_updated = pyqtSignal(str, int, float, float)  # area, idx, x_norm, y_norm
-    empty_clicked  = pyqtSignal(str, float, float)        # area, x_norm, y_norm
+    corner_updated   = pyqtSignal(str, int, float, float)  # area, idx, x_norm, y_norm
+    corner_committed = pyqtSignal(str, int, float, float)  # area, idx, x_norm, y_norm
+    empty_clicked    = pyqtSignal(str, float, float)        # area, x_norm, y_norm
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, fast_transform: bool = False,
+                 emit_policy: str = EMIT_EVERY_MOVE, emit_rate_hz: float = _DEFAULT_EMIT_RATE_HZ):
         super().__init__(parent)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -80,13 +171,43 @@ class ClickableLabel(QLabel):
         self.setMouseTracking(True)
         # self.setStyleSheet("background: #12121F;")
 
-        self._frame:        QPixmap | None                        = None
+        self._frame:        QPixmap | QImage | None               = None
+        self._frame_array:  np.ndarray | None                     = None  # buffer behind a wrapped QImage
+        self._frame_size:   Tuple[int, int]                       = (0, 0)  # source (w, h) before downscale
         self._areas:        Dict[str, List[Tuple[float, float]]] = {}
         self._colors:       Dict[str, QColor]                    = {}
         self._active_area:  Optional[str]                        = None
         self._drag:         Tuple[str, int]                      = ("", -1)
         self._coord_text:   str                                  = ""
 
+        # Scaled-frame cache and frame coalescing
+        self._fast_transform = fast_transform
+        self._scaled:       QPixmap | QImage | None               = None
+        self._scaled_key:   tuple | None                          = None  # (cacheKey, w, h, fast)
+        self._last_paint:   float                                 = 0.0
+        self._painted_key:  int | None                            = None  # cacheKey of last painted frame
+        self._frames_received = 0
+        self._frames_painted  = 0
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self.update)
+
+        # corner_updated emission during drags
+        self._emit_policy   = EMIT_EVERY_MOVE
+        self._emit_interval = 1.0 / _DEFAULT_EMIT_RATE_HZ
+        self._last_emit     = 0.0
+        self._pending_emit: Tuple[str, int, float, float] | None = None   # throttled, not sent yet
+        self._uncommitted:  Tuple[str, int] | None = None                # corner to commit on release
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.timeout.connect(self._flush_corner_update)
+        self.set_emit_policy(emit_policy, emit_rate_hz)
+
+        # Inactive areas, pre-rendered; rebuilt when _overlay_version or geometry changes
+        self._overlay:         QPixmap | None = None
+        self._overlay_key:     tuple | None   = None
+        self._overlay_version: int            = 0
+
     # ── Area management ────────────────────────────────────────────────────────
 
     def add_area(self, name: str, color: str | QColor | None = None) -> None:
@@ -97,6 +218,7 @@ class ClickableLabel(QLabel):
             self._colors[name] = QColor(color) if isinstance(color, str) else color
         elif name not in self._colors:
             self._colors[name] = _PALETTE.get(name, _FALLBACK_COLOR)
+        self._overlay_version += 1
 
     def set_active_area(self, name: Optional[str]) -> None:
         """
@@ -106,6 +228,7 @@ class ClickableLabel(QLabel):
         if name and name not in self._areas:
             self.add_area(name)
         self._active_area = name
+        self._overlay_version += 1
         self.update()
 
     def set_area_corners(self, name: str, points: List[Tuple[float, float]]) -> None:
@@ -113,6 +236,7 @@ class ClickableLabel(QLabel):
         if name not in self._areas:
             self.add_area(name)
         self._areas[name] = list(points)
+        self._overlay_version += 1
         self.update()
 
     def get_area_corners(self, name: str) -> List[Tuple[float, float]]:
@@ -123,14 +247,112 @@ class ClickableLabel(QLabel):
         """Remove all corners for *name*."""
         if name in self._areas:
             self._areas[name] = []
+            self._overlay_version += 1
             self.update()
 
     # ── Frame update ───────────────────────────────────────────────────────────
 
     def set_frame(self, pixmap: QPixmap) -> None:
-        """Push a new camera frame.  Scaled to fit the label on paint."""
-        self._frame = pixmap
-        self.update()
+        """Push a new camera frame.  Scaled to fit the label on paint.
+
+        If the previous frame was painted less than one refresh interval
+        ago the repaint is deferred; frames pushed meanwhile replace this
+        one and are never scaled.
+        """
+        self._frame_array = None
+        self._push_frame(pixmap, pixmap.width(), pixmap.height())
+
+    def set_frame_array(self, array: np.ndarray, format: str = "bgr", downscale: bool = False) -> None:
+        """Push a uint8 H×W×3 ("bgr" / "rgb") or H×W ("gray") frame without copying it.
+
+        Rows may be padded (e.g. a ROI slice) as long as pixels within a row
+        are contiguous; anything else is copied once.  With ``downscale`` a
+        frame larger than the label is shrunk to the label size on ingest.
+        Pixel coordinates shown on click stay in source resolution.
+        """
+        if format not in _ARRAY_FORMATS:
+            raise ValueError(f"Unknown frame format {format!r}; expected one of {sorted(_ARRAY_FORMATS)}")
+        qformat, channels = _ARRAY_FORMATS[format]
+        if array.ndim == 3 and channels == 1 and array.shape[2] == 1:
+            array = array[:, :, 0]
+        expected_ndim = 2 if channels == 1 else 3
+        if (array.dtype != np.uint8 or array.ndim != expected_ndim
+                or (channels > 1 and array.shape[2] != channels)):
+            raise ValueError(f"Expected a uint8 {'H×W' if channels == 1 else 'H×W×3'} array "
+                             f"for {format!r}, got {array.dtype} {array.shape}")
+
+        row_contiguous = array.strides[1] == channels and (channels == 1 or array.strides[2] == 1)
+        if not row_contiguous or array.strides[0] < 0:
+            array = np.ascontiguousarray(array)
+        height, width = array.shape[:2]
+        # Points at the array's memory — the array must outlive the image
+        image = QImage(sip.voidptr(array.ctypes.data), width, height, array.strides[0], qformat)
+
+        if downscale and (width > self.width() or height > self.height()):
+            image = _scale_image(image, self.size(), self._transform_mode())
+            array = None    # the scaled image owns its pixels
+        self._frame_array = array
+        self._push_frame(image, width, height)
+
+    def _push_frame(self, frame: QPixmap | QImage, width: int, height: int) -> None:
+        self._frame = frame
+        self._frame_size = (width, height)
+        self._frames_received += 1
+        if self._frame_timer.isActive():
+            return
+        wait_ms = self._refresh_interval_ms() - (time.perf_counter() - self._last_paint) * 1000.0
+        if wait_ms > 0:
+            self._frame_timer.start(int(wait_ms) + 1)
+        else:
+            self.update()
+
+    def set_fast_transform(self, enabled: bool) -> None:
+        """Scale frames with Qt.FastTransformation (live video) instead of smooth scaling."""
+        if enabled != self._fast_transform:
+            self._fast_transform = enabled
+            self.update()
+
+    def frame_stats(self) -> Tuple[int, int]:
+        """(frames received by set_frame, frames painted) — the difference were coalesced."""
+        return self._frames_received, self._frames_painted
+
+    # ── Signal emission ────────────────────────────────────────────────────────
+
+    def set_emit_policy(self, policy: str, rate_hz: float | None = None) -> None:
+        """How corner_updated fires during drags: EMIT_EVERY_MOVE, EMIT_RATE_LIMITED or EMIT_ON_RELEASE."""
+        if policy not in _EMIT_POLICIES:
+            raise ValueError(f"Unknown emit policy {policy!r}; expected one of {_EMIT_POLICIES}")
+        if rate_hz is not None:
+            if rate_hz <= 0:
+                raise ValueError("rate_hz must be positive")
+            self._emit_interval = 1.0 / rate_hz
+        self._flush_corner_update()
+        self._emit_policy = policy
+
+    def emit_policy(self) -> str:
+        return self._emit_policy
+
+    def _drag_moved(self, area: str, idx: int, xn: float, yn: float) -> None:
+        self._uncommitted = (area, idx)
+        if self._emit_policy == EMIT_EVERY_MOVE:
+            self.corner_updated.emit(area, idx, xn, yn)
+            return
+        self._pending_emit = (area, idx, xn, yn)
+        if self._emit_policy == EMIT_ON_RELEASE or self._emit_timer.isActive():
+            return
+        wait = self._emit_interval - (time.perf_counter() - self._last_emit)
+        if wait > 0:
+            self._emit_timer.start(int(wait * 1000) + 1)
+        else:
+            self._flush_corner_update()
+
+    def _flush_corner_update(self) -> None:
+        """Send the throttled corner_updated, if any."""
+        self._emit_timer.stop()
+        if self._pending_emit is not None:
+            pending, self._pending_emit = self._pending_emit, None
+            self._last_emit = time.perf_counter()
+            self.corner_updated.emit(*pending)
 
     # ── Mouse events ───────────────────────────────────────────────────────────
 
@@ -159,6 +381,7 @@ class ClickableLabel(QLabel):
             if len(pts) < 4:
                 idx = len(pts)
                 pts.append((xn, yn))
+                self._uncommitted = (self._active_area, idx)
                 self.corner_updated.emit(self._active_area, idx, xn, yn)
                 self.update()
             else:
@@ -175,11 +398,18 @@ class ClickableLabel(QLabel):
             yn = max(0.0, min(1.0, yn))
             self._areas[area][idx] = (xn, yn)
             self._update_coord_text(xn, yn)
-            self.corner_updated.emit(area, idx, xn, yn)
+            self._drag_moved(area, idx, xn, yn)
             self.update()
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         self._drag = ("", -1)
+        self._flush_corner_update()
+        if self._uncommitted is not None:
+            area, idx = self._uncommitted
+            self._uncommitted = None
+            pts = self._areas.get(area, [])
+            if idx < len(pts):
+                self.corner_committed.emit(area, idx, *pts[idx])
 
     # ── Paint ──────────────────────────────────────────────────────────────────
 
@@ -190,29 +420,27 @@ class ClickableLabel(QLabel):
         # Background / frame
         rect = self.rect()
         if self._frame and not self._frame.isNull():
-            scaled = self._frame.scaled(
-                rect.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
+            scaled = self._scaled_frame()
+            self._last_paint = time.perf_counter()
+            if self._frame.cacheKey() != self._painted_key:
+                self._painted_key = self._frame.cacheKey()
+                self._frames_painted += 1
             ox = (rect.width()  - scaled.width())  // 2
             oy = (rect.height() - scaled.height()) // 2
-            painter.drawPixmap(ox, oy, scaled)
+            if isinstance(scaled, QImage):
+                painter.drawImage(ox, oy, scaled)
+            else:
+                painter.drawPixmap(ox, oy, scaled)
         else:
             painter.fillRect(rect, QColor("#12121F"))
 
-        # Draw inactive areas first, active area on top
-        order = [n for n in self._areas if n != self._active_area]
-        if self._active_area and self._active_area in self._areas:
-            order.append(self._active_area)
-
-        for name in order:
-            pts = self._areas[name]
-            if not pts:
-                continue
-            color  = self._colors.get(name, _FALLBACK_COLOR)
-            active = (name == self._active_area)
-            self._draw_area(painter, pts, color, active)
+        # Inactive areas from the overlay cache, active area live on top
+        overlay = self._overlay_pixmap()
+        if overlay is not None:
+            painter.drawPixmap(0, 0, overlay)
+        if self._active_area and self._areas.get(self._active_area):
+            color = self._colors.get(self._active_area, _FALLBACK_COLOR)
+            self._draw_area(painter, self._areas[self._active_area], color, True)
 
         # Coordinate overlay at top of image rect
         if self._coord_text:
@@ -238,27 +466,19 @@ class ClickableLabel(QLabel):
         color: QColor,
         active: bool,
     ) -> None:
+        style = _area_style(color, active)
         pixel_pts = [self._to_pixel(x, y) for x, y in pts]
 
         # Semi-transparent fill
         if len(pixel_pts) >= 3:
-            fill = QColor(color)
-            fill.setAlpha(55 if active else 25)
-            painter.setBrush(QBrush(fill))
+            painter.setBrush(style.fill)
             painter.setPen(Qt.PenStyle.NoPen)
             poly = QPolygonF([QPointF(px, py) for px, py in pixel_pts])
             painter.drawPolygon(poly)
 
         # Border lines
         if len(pixel_pts) >= 2:
-            border = QColor(color)
-            border.setAlpha(230 if active else 130)
-            pen = QPen(
-                border,
-                2.0 if active else 1.2,
-                Qt.PenStyle.SolidLine if active else Qt.PenStyle.DashLine,
-            )
-            painter.setPen(pen)
+            painter.setPen(style.border)
             painter.setBrush(Qt.BrushStyle.NoBrush)
             for i in range(len(pixel_pts)):
                 p1 = pixel_pts[i]
@@ -266,29 +486,72 @@ class ClickableLabel(QLabel):
                 painter.drawLine(int(p1[0]), int(p1[1]), int(p2[0]), int(p2[1]))
 
         # Corner dots + index numbers
-        r = _RADIUS_ACTIVE if active else _RADIUS_INACTIVE
+        r = style.radius
         for i, (px, py) in enumerate(pixel_pts):
             # Halo
-            halo = QColor(color).darker(160)
-            halo.setAlpha(180)
-            painter.setBrush(QBrush(halo))
+            painter.setBrush(style.halo)
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawEllipse(int(px) - r - 2, int(py) - r - 2, (r + 2) * 2, (r + 2) * 2)
             # Dot
-            painter.setBrush(QBrush(color))
+            painter.setBrush(style.dot)
             painter.drawEllipse(int(px) - r, int(py) - r, r * 2, r * 2)
             # Number
-            num_color = QColor(0, 0, 0) if color.lightness() > 128 else QColor(255, 255, 255)
-            painter.setPen(num_color)
+            painter.setPen(style.number)
             painter.drawText(int(px) - 4, int(py) + 5, str(i + 1))
 
+    def _overlay_pixmap(self) -> QPixmap | None:
+        """Transparent pixmap with every inactive area, rebuilt only when they or the geometry changed."""
+        r = self._image_rect()
+        dpr = self.devicePixelRatioF()
+        key = (self._overlay_version, r.x(), r.y(), r.width(), r.height(),
+               self.width(), self.height(), dpr)
+        if key == self._overlay_key:
+            return self._overlay
+
+        inactive = [n for n, pts in self._areas.items() if pts and n != self._active_area]
+        overlay = None
+        if inactive:
+            overlay = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            overlay.setDevicePixelRatio(dpr)
+            overlay.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(overlay)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setFont(self.font())
+            for name in inactive:
+                self._draw_area(painter, self._areas[name], self._colors.get(name, _FALLBACK_COLOR), False)
+            painter.end()
+        self._overlay, self._overlay_key = overlay, key
+        return overlay
+
+    def _scaled_frame(self) -> QPixmap | QImage:
+        """The current frame scaled to the label, rescaled only when frame, size or mode changed."""
+        key = (self._frame.cacheKey(), self.width(), self.height(), self._fast_transform)
+        if key != self._scaled_key:
+            if isinstance(self._frame, QImage):
+                self._scaled = _scale_image(self._frame, self.size(), self._transform_mode())
+            else:
+                self._scaled = self._frame.scaled(
+                    self.size(), Qt.AspectRatioMode.KeepAspectRatio, self._transform_mode(),
+                )
+            self._scaled_key = key
+        return self._scaled
+
     # ── Helpers ────────────────────────────────────────────────────────────────
 
+    def _transform_mode(self) -> Qt.TransformationMode:
+        return (Qt.TransformationMode.FastTransformation if self._fast_transform
+                else Qt.TransformationMode.SmoothTransformation)
+
+    def _refresh_interval_ms(self) -> float:
+        screen = self.screen()
+        rate = screen.refreshRate() if screen is not None else 0.0
+        return 1000.0 / (rate if rate > 0 else _DEFAULT_REFRESH_HZ)
+
     def _update_coord_text(self, xn: float, yn: float) -> None:
         """Store pixel coords (based on frame size) as a readable string for the overlay."""
         if self._frame and not self._frame.isNull():
-            px = int(xn * self._frame.width())
-            py = int(yn * self._frame.height())
+            px = int(xn * self._frame_size[0])
+            py = int(yn * self._frame_size[1])
         else:
             r = self._image_rect()
             px = int(xn * r.width())
@@ -300,7 +563,7 @@ class ClickableLabel(QLabel):
         if not self._frame or self._frame.isNull():
             return self.rect()
         lw, lh = self.width(), self.height()
-        fw, fh = self._frame.width(), self._frame.height()
+        fw, fh = self._frame_size
         scale  = min(lw / fw, lh / fh)
         sw, sh = int(fw * scale), int(fh * scale)
         return QRect((lw - sw) // 2, (lh - sh) // 2, sw, sh)
@@ -321,6 +584,22 @@ class ClickableLabel(QLabel):
         return r.x() + xn * r.width(), r.y() + yn * r.height()
 
 
+def _scale_image(image: QImage, size, mode: Qt.TransformationMode) -> QImage:
+    """
+    QImage.scaled() that ends in RGB32.  Qt scales and paints 24-bit and
+    grayscale images through slow generic paths, so convert first for fast
+    scaling (cheap conversion, then the fast path) and afterwards for smooth
+    scaling (convert the smaller result).
+    """
+    if image.format() in _NATIVE_FORMATS:
+        return image.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, mode)
+    if mode == Qt.TransformationMode.FastTransformation:
+        image = image.convertToFormat(QImage.Format.Format_RGB32)
+        return image.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, mode)
+    scaled = image.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, mode)
+    return scaled.convertToFormat(QImage.Format.Format_RGB32)
+
+
 def _nearest(pts: List[Tuple[float, float]], xn: float, yn: float) -> int:
     """Return index of the closest point within _HIT_THRESHOLD, else -1."""
     best_idx, best_d = -1, _HIT_THRESHOLD
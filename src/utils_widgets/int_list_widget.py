@@ -7,8 +7,8 @@ from PyQt6.QtWidgets import (
 )
 
 from src.settings.settings_view.styles import (
-    ACTION_BTN_STYLE, BG_COLOR, BORDER, GHOST_BTN_STYLE, LABEL_STYLE,
-    PRIMARY_DARK, PRIMARY_LIGHT,
+    ACTION_BTN_STYLE, BORDER, GHOST_BTN_STYLE, LABEL_STYLE,
+    PRIMARY_DARK, PRIMARY_LIGHT, SETTINGS_VIEW_STYLE,
 )
 from src.utils_widgets.touch_spinbox import TouchSpinBox
 
@@ -23,7 +23,7 @@ class _IntEditorDialog(QDialog):
         self.setWindowTitle(title)
         self.setModal(True)
         self.setMinimumWidth(360)
-        self.setStyleSheet(f"background: {BG_COLOR};")
+        self.setStyleSheet(SETTINGS_VIEW_STYLE)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
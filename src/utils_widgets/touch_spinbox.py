@@ -2,7 +2,10 @@ from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton, QFrame, Q
 from PyQt6.QtCore import pyqtSignal, Qt
 from PyQt6.QtGui import QFont
 
-from src.settings.settings_view.styles import PRIMARY, PRIMARY_DARK, BORDER
+from src.settings.settings_view.styles import (
+    OBJ_TOUCH_SPINBOX, OBJ_TOUCH_SPINBOX_PILL, OBJ_TOUCH_SPINBOX_ROW,
+    OBJ_TOUCH_SPINBOX_STEP, OBJ_TOUCH_SPINBOX_VALUE, PROP_SELECTED, repolish,
+)
 
 
 class TouchSpinBox(QFrame):
@@ -21,6 +24,9 @@ class TouchSpinBox(QFrame):
                    e.g. [0.01, 0.1, 1, 10]. When provided a compact row of
                    pills is shown below the stepper so the user can switch
                    precision without extra dialog clutter.
+
+    Styling comes from TOUCH_SPINBOX_STYLE in styles.py via object names; it
+    is installed by SettingsView, the editor dialogs, or install_app_stylesheet().
     """
 
     valueChanged = pyqtSignal(float)
@@ -38,13 +44,7 @@ class TouchSpinBox(QFrame):
 
         has_steps = bool(step_options) and len(step_options) > 1
         self.setFixedHeight(128 if has_steps else 72)
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: white;
-                border: 1px solid {BORDER};
-                border-radius: 10px;
-            }}
-        """)
+        self.setObjectName(OBJ_TOUCH_SPINBOX)
 
         outer = QVBoxLayout(self)
         outer.setContentsMargins(8, 8, 8, 8)
@@ -52,53 +52,28 @@ class TouchSpinBox(QFrame):
 
         # ── Stepper row ────────────────────────────────────────────────
         stepper_row = QWidget()
-        stepper_row.setStyleSheet("background: transparent; border: none;")
+        stepper_row.setObjectName(OBJ_TOUCH_SPINBOX_ROW)
         stepper_layout = QHBoxLayout(stepper_row)
         stepper_layout.setContentsMargins(0, 0, 0, 0)
         stepper_layout.setSpacing(8)
 
-        _btn_style = f"""
-            QPushButton {{
-                background: white;
-                border: 1px solid {BORDER};
-                border-radius: 8px;
-                font-size: 20pt;
-                font-weight: bold;
-                color: {PRIMARY};
-            }}
-            QPushButton:hover {{
-                border: 1px solid {PRIMARY};
-                background-color: rgba(122,90,248,0.05);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(122,90,248,0.15);
-            }}
-            QPushButton:disabled {{
-                background-color: {BORDER};
-                border: 1px solid {BORDER};
-                color: #aaaaaa;
-            }}
-        """
-
         self.minus_btn = QPushButton("−")
         self.minus_btn.setFixedSize(56, 56)
         self.minus_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.minus_btn.setStyleSheet(_btn_style)
+        self.minus_btn.setObjectName(OBJ_TOUCH_SPINBOX_STEP)
         self.minus_btn.clicked.connect(self._decrement)
         stepper_layout.addWidget(self.minus_btn)
 
         self.value_label = QLabel()
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.value_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        self.value_label.setStyleSheet(
-            f"color: {PRIMARY_DARK}; background: transparent; border: none;"
-        )
+        self.value_label.setObjectName(OBJ_TOUCH_SPINBOX_VALUE)
         stepper_layout.addWidget(self.value_label, stretch=1)
 
         self.plus_btn = QPushButton("+")
         self.plus_btn.setFixedSize(56, 56)
         self.plus_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.plus_btn.setStyleSheet(_btn_style)
+        self.plus_btn.setObjectName(OBJ_TOUCH_SPINBOX_STEP)
         self.plus_btn.clicked.connect(self._increment)
         stepper_layout.addWidget(self.plus_btn)
 
@@ -107,7 +82,7 @@ class TouchSpinBox(QFrame):
         # ── Step-size pill row (optional) ──────────────────────────────
         if has_steps:
             step_row = QWidget()
-            step_row.setStyleSheet("background: transparent; border: none;")
+            step_row.setObjectName(OBJ_TOUCH_SPINBOX_ROW)
             step_layout = QHBoxLayout(step_row)
             step_layout.setContentsMargins(0, 0, 0, 0)
             step_layout.setSpacing(6)
@@ -120,6 +95,7 @@ class TouchSpinBox(QFrame):
                 btn.setMinimumWidth(56)
                 btn.setFont(QFont("Arial", 11, QFont.Weight.Bold))
                 btn.setCursor(Qt.CursorShape.PointingHandCursor)
+                btn.setObjectName(OBJ_TOUCH_SPINBOX_PILL)
                 btn.clicked.connect(lambda _, sv=s: self._select_step(sv))
                 step_layout.addWidget(btn)
                 self._step_btns[s] = btn
@@ -142,30 +118,11 @@ class TouchSpinBox(QFrame):
         self._apply_step_styles()
 
     def _apply_step_styles(self):
-        selected = f"""
-            QPushButton {{
-                background-color: {PRIMARY};
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 0 12px;
-            }}
-        """
-        unselected = f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {PRIMARY_DARK};
-                border: 1px solid {BORDER};
-                border-radius: 8px;
-                padding: 0 12px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(122,90,248,0.08);
-                border: 1px solid {PRIMARY};
-            }}
-        """
         for s, btn in self._step_btns.items():
-            btn.setStyleSheet(selected if s == self._step else unselected)
+            selected = s == self._step
+            if btn.property(PROP_SELECTED) != selected:
+                btn.setProperty(PROP_SELECTED, selected)
+                repolish(btn)
 
     # ------------------------------------------------------------------
     def _refresh(self):
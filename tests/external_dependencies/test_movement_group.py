@@ -0,0 +1,145 @@
+"""Tests for src/external_dependencies/robotConfig/MovementGroup.py"""
+import numpy as np
+import pytest
+
+from src.external_dependencies.robotConfig import MovementGroup as movement_group_module
+from src.external_dependencies.robotConfig.MovementGroup import MovementGroup, format_pose
+
+P1 = "[1, 2, 3, 4, 5, 6]"
+P2 = "[7, 8, 9, 10, 11, 12]"
+
+
+class TestFormatPose:
+    def test_integers_without_decimals(self):
+        assert format_pose([1.0, -2.0, 300.0, 180.0, 0.0, 90.0]) == "[1, -2, 300, 180, 0, 90]"
+
+    def test_floats_round_trip(self):
+        values = [-98.555, -224.46, 0.1, 1e-7, 123456.789, -0.0]
+        text = format_pose(values)
+        assert MovementGroup(points=[text]).points_array()[0].tolist() == values
+
+
+class TestPosition:
+    def test_position_array_is_cached_and_read_only(self):
+        group = MovementGroup(position=P1)
+        array = group.position_array()
+        assert array.tolist() == [1, 2, 3, 4, 5, 6]
+        assert group.position_array() is array
+        with pytest.raises(ValueError):
+            array[0] = 0
+
+    def test_malformed_or_missing_position_is_none(self):
+        assert MovementGroup(position="[1, x]").position_array() is None
+        assert MovementGroup().position_array() is None
+        assert MovementGroup(position="[1, x]").parse_position() is None
+
+    def test_assigning_the_string_drops_the_cache(self):
+        group = MovementGroup(position=P1)
+        group.position_array()
+        group.position = P2
+        assert group.position_array()[0] == 7
+
+    def test_set_position_array_formats_lazily(self):
+        group = MovementGroup(position=P1)
+        group.set_position_array([0, 0, 0.5, 180, 0, 90])
+        assert group.position == "[0, 0, 0.5, 180, 0, 90]"
+        assert group.to_dict()["position"] == "[0, 0, 0.5, 180, 0, 90]"
+
+
+class TestPoints:
+    def test_points_array_is_cached(self):
+        group = MovementGroup(points=[P1, P2])
+        array = group.points_array()
+        assert array.shape == (2, 6)
+        assert group.points_array() is array
+
+    def test_empty_points(self):
+        assert MovementGroup().points_array().shape == (0, 6)
+
+    def test_malformed_points_are_nan_rows(self):
+        group = MovementGroup(points=[P1, "bad", "[1,2,3]", P2])
+        array = group.points_array()
+        assert array.shape == (4, 6)
+        assert np.isnan(array[1]).all() and np.isnan(array[2]).all()
+        assert array[3].tolist() == [7, 8, 9, 10, 11, 12]
+
+    def test_set_point_keeps_every_other_string(self):
+        group = MovementGroup(points=[P1, "bad", "[1,2,3]", P2])
+        group.set_point(3, np.zeros(6))
+        assert group.points == [P1, "bad", "[1,2,3]", "[0, 0, 0, 0, 0, 0]"]
+        assert group.points_array()[3].tolist() == [0] * 6
+        assert np.isnan(group.points_array()[1]).all()
+
+    def test_set_point_rejects_bad_values(self):
+        group = MovementGroup(points=[P1])
+        with pytest.raises(ValueError):
+            group.set_point(0, [1, 2, 3])
+        with pytest.raises(ValueError):
+            group.set_point(0, [np.nan] * 6)
+        assert group.points == [P1]
+
+    def test_set_points_array_formats_lazily(self):
+        group = MovementGroup(points=[P1])
+        group.set_points_array([[0, 0, 0, 0, 0, 0], [1.5, 0, 0, 0, 0, 0]])
+        assert group.points == ["[0, 0, 0, 0, 0, 0]", "[1.5, 0, 0, 0, 0, 0]"]
+
+    def test_set_points_array_rejects_nan_rows(self):
+        group = MovementGroup(points=[P1, "bad"])
+        with pytest.raises(ValueError):
+            group.set_points_array(group.points_array())
+        assert group.points == [P1, "bad"]
+
+    def test_assigning_the_list_drops_the_cache(self):
+        group = MovementGroup(points=[P1])
+        group.points_array()
+        group.points = [P2]
+        assert group.points_array()[0, 0] == 7
+
+    def test_appending_in_place_is_noticed(self):
+        group = MovementGroup(points=[P1])
+        group.points_array()
+        group.points.append(P2)
+        assert group.points_array().shape == (2, 6)
+
+    def test_invalidate_after_in_place_edit(self):
+        group = MovementGroup(points=[P1], position=P1)
+        group.points_array()
+        group.position_array()
+        group.points[0] = P2
+        group.invalidate()
+        assert group.points_array()[0, 0] == 7
+        assert group.position_array()[0] == 1
+
+    def test_parse_points_keeps_short_points(self):
+        group = MovementGroup(points=[P1, "bad", "[1,2,3]"])
+        assert group.parse_points() == [[1, 2, 3, 4, 5, 6], [1, 2, 3]]
+
+    @pytest.mark.parametrize("points", [[P1, P2], [P1, "bad", "[1,2,3]"]], ids=["valid", "malformed"])
+    def test_parse_points_parses_the_strings_once(self, points, monkeypatch):
+        group = MovementGroup(points=points)
+        first = group.parse_points()
+        calls = []
+        parse = movement_group_module._parse_pose
+        monkeypatch.setattr(movement_group_module, "_parse_pose", lambda text: calls.append(text) or parse(text))
+        assert group.parse_points() == first
+        assert calls == []
+
+    def test_parse_points_follows_edits(self):
+        group = MovementGroup(points=[P1, "[1,2,3]"])
+        group.parse_points()
+        group.points = [P2]
+        assert group.parse_points() == [[7, 8, 9, 10, 11, 12]]
+        group.set_point(0, [1, 1, 1, 1, 1, 1])
+        assert group.parse_points() == [[1, 1, 1, 1, 1, 1]]
+
+    def test_parse_points_returns_fresh_lists(self):
+        group = MovementGroup(points=[P1, "[1,2,3]"])
+        group.parse_points()[1].append(99)
+        assert group.parse_points()[1] == [1, 2, 3]
+
+    def test_equality_and_to_dict_use_the_strings(self):
+        a = MovementGroup(points=[P1])
+        b = MovementGroup(points=["[1,2,3,4,5,6]"])
+        b.set_points_array(b.points_array())
+        assert a == b
+        assert MovementGroup.from_dict(a.to_dict()) == a
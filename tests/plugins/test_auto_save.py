@@ -0,0 +1,157 @@
+"""Tests for src/plugins/base_settings_plugin/auto_save.py"""
+import pytest
+from PyQt6.QtTest import QTest
+
+from src.plugins.base_settings_plugin import auto_save
+from src.plugins.base_settings_plugin.auto_save import AutoSaver
+from src.plugins.glue_settings.controller import GlueSettingsController
+from src.settings.settings_view import SettingField, SettingGroup, SettingsView
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = FakeClock()
+    monkeypatch.setattr(auto_save.time, "perf_counter", c)
+    return c
+
+
+@pytest.fixture
+def saves():
+    return []
+
+
+@pytest.fixture
+def saver(qapp, saves):
+    return AutoSaver(lambda: saves.append(1), delay_ms=200, max_delay_ms=2000)
+
+
+class TestDebounce:
+    def test_burst_of_notifies_saves_once(self, saver, saves):
+        for _ in range(10):
+            saver.notify()
+            QTest.qWait(10)
+        assert saves == []
+        assert saver.is_pending()
+        QTest.qWait(400)
+        assert saves == [1]
+        assert not saver.is_pending()
+
+    def test_no_notify_no_save(self, saver, saves):
+        saver.flush()
+        QTest.qWait(300)
+        assert saves == []
+
+    def test_each_quiet_period_saves_again(self, saver, saves):
+        saver.notify()
+        QTest.qWait(400)
+        saver.notify()
+        QTest.qWait(400)
+        assert saves == [1, 1]
+
+
+class TestMaxDelay:
+    def test_timer_never_runs_past_the_cap(self, saver, clock):
+        saver.notify()
+        clock.now += 1.98
+        saver.notify()
+        assert saver._timer.remainingTime() <= 20
+
+    def test_change_after_the_cap_saves_at_once(self, saver, saves, clock):
+        saver.notify()
+        clock.now += 1.0
+        saver.notify()
+        assert saves == []
+        clock.now += 1.0
+        saver.notify()
+        assert saves == [1]
+        assert not saver._timer.isActive()
+
+    def test_cap_counts_from_the_first_unsaved_change(self, saver, saves, clock):
+        saver.notify()
+        clock.now += 1.9
+        saver.flush()
+        saver.notify()                      # new burst, new cap
+        clock.now += 1.0
+        saver.notify()
+        assert saves == [1]
+
+    def test_default_cap_is_a_multiple_of_the_delay(self, qapp, saves, clock):
+        saver = AutoSaver(lambda: saves.append(1), delay_ms=100)
+        saver.notify()
+        clock.now += 0.5
+        saver.notify()
+        assert saves == [1]
+
+
+class TestCancel:
+    def test_cancel_drops_the_pending_save(self, saver, saves):
+        saver.notify()
+        saver.cancel()
+        QTest.qWait(400)
+        assert saves == []
+        assert not saver.is_pending()
+
+
+class FakeModel:
+    def __init__(self):
+        self.saved = []
+
+    def save(self, flat, on_done=None, on_error=None):
+        self.saved.append(dict(flat))
+        if on_done is not None:
+            on_done(None)
+
+    def is_saving(self):
+        return False
+
+    def to_flat_dict(self):
+        return {k: v for flat in self.saved for k, v in flat.items()}
+
+
+@pytest.fixture
+def view(qapp):
+    v = SettingsView(component_name="Glue")
+    v.add_tab("Tab", [SettingGroup(title="G", fields=[
+        SettingField(key, key, "spinbox", default=0, min_val=0, max_val=100, step=1)
+        for key in ("speed", "accel")])])
+    return v
+
+
+@pytest.fixture
+def model():
+    return FakeModel()
+
+
+@pytest.fixture
+def controller(view, model):
+    return GlueSettingsController(model, view, auto_save_ms=5000)
+
+
+def _edit(view, key, value):
+    view.set_value(key, value)
+    view._on_field_changed(key, value)
+
+
+class TestControllerWiring:
+    def test_tab_deactivation_flushes_the_burst(self, controller, view, model):
+        _edit(view, "speed", 5)
+        _edit(view, "accel", 7)
+        assert model.saved == []
+        view.on_tab_deactivate()
+        assert model.saved == [{"speed": 5, "accel": 7}]
+
+    def test_save_button_cancels_the_pending_auto_save(self, controller, view, model):
+        _edit(view, "speed", 5)
+        view._save_btn.click()
+        assert model.saved == [{"speed": 5}]
+        assert not controller._auto_saver.is_pending()
+        view.on_tab_deactivate()
+        assert model.saved == [{"speed": 5}]
@@ -0,0 +1,152 @@
+"""Tests for src/plugins/camera_settings/camera_action_runner.py"""
+import threading
+
+import pytest
+
+from src.plugins.camera_settings.camera_action_runner import ActionCancelled, CameraActionRunner
+from src.plugins.camera_settings.view.camera_actions import (
+    ACTION_CALIBRATE_CAMERA, ACTION_CALIBRATE_ROBOT, ACTION_CAPTURE,
+)
+from src.plugins.camera_settings.view.camera_controls_widget import CameraControlsWidget
+
+
+class FakeCameraService:
+    """Each action blocks on its own Event, so tests decide when it returns."""
+
+    def __init__(self):
+        self.release = {action: threading.Event()
+                        for action in (ACTION_CAPTURE, ACTION_CALIBRATE_CAMERA, ACTION_CALIBRATE_ROBOT)}
+        self.robot_error = None
+
+    def capture_image(self):
+        self.release[ACTION_CAPTURE].wait(2)
+        return "image"
+
+    def calibrate_robot(self):
+        self.release[ACTION_CALIBRATE_ROBOT].wait(2)
+        if self.robot_error is not None:
+            raise self.robot_error
+        return "robot ok"
+
+    def calibrate_camera_with_progress(self, progress, is_cancelled):
+        progress(10, "first image")
+        self.release[ACTION_CALIBRATE_CAMERA].wait(2)
+        if is_cancelled():
+            raise ActionCancelled()
+        progress(100)
+        return {"rms": 0.2}
+
+
+@pytest.fixture
+def service():
+    s = FakeCameraService()
+    yield s
+    for event in s.release.values():
+        event.set()
+
+
+@pytest.fixture
+def runner(qapp, service):
+    r = CameraActionRunner(service)
+    r.log = []
+    for name in ("action_started", "action_progress", "action_finished", "action_failed", "action_cancelled"):
+        getattr(r, name).connect(lambda *args, name=name: r.log.append((name, *args)))
+    yield r
+    r.wait_for_done(2000)
+
+
+def _finish(runner, service, action):
+    service.release[action].set()
+    assert runner.wait_for_done(2000)
+
+
+class TestRun:
+    def test_result_is_delivered_and_busy_state_cleared(self, runner, service):
+        assert runner.run(ACTION_CAPTURE) is True
+        assert runner.is_running(ACTION_CAPTURE) and runner.is_running()
+        _finish(runner, service, ACTION_CAPTURE)
+        assert runner.log == [("action_started", ACTION_CAPTURE),
+                              ("action_finished", ACTION_CAPTURE, "image")]
+        assert not runner.is_running()
+
+    def test_progress_is_reported(self, runner, service):
+        runner.run(ACTION_CALIBRATE_CAMERA)
+        _finish(runner, service, ACTION_CALIBRATE_CAMERA)
+        assert ("action_progress", ACTION_CALIBRATE_CAMERA, 10, "first image") in runner.log
+        assert ("action_progress", ACTION_CALIBRATE_CAMERA, 100, "") in runner.log
+        assert runner.log[-1] == ("action_finished", ACTION_CALIBRATE_CAMERA, {"rms": 0.2})
+
+    def test_failure_is_reported(self, runner, service):
+        service.robot_error = RuntimeError("robot not homed")
+        runner.run(ACTION_CALIBRATE_ROBOT)
+        _finish(runner, service, ACTION_CALIBRATE_ROBOT)
+        assert runner.log[-1] == ("action_failed", ACTION_CALIBRATE_ROBOT, "robot not homed")
+        assert not runner.is_running()
+
+    def test_unknown_action_raises(self, runner):
+        with pytest.raises(ValueError):
+            runner.run("focus")
+
+
+class TestBusy:
+    def test_same_action_is_refused_while_running(self, runner, service):
+        assert runner.run(ACTION_CAPTURE)
+        assert runner.run(ACTION_CAPTURE) is False
+        _finish(runner, service, ACTION_CAPTURE)
+        assert runner.run(ACTION_CAPTURE) is True
+        _finish(runner, service, ACTION_CAPTURE)
+
+    def test_second_calibration_is_refused(self, runner, service):
+        assert runner.run(ACTION_CALIBRATE_CAMERA)
+        assert runner.run(ACTION_CALIBRATE_ROBOT) is False
+        assert runner.run(ACTION_CAPTURE) is True      # capture may run alongside
+        service.release[ACTION_CAPTURE].set()
+        _finish(runner, service, ACTION_CALIBRATE_CAMERA)
+        assert runner.run(ACTION_CALIBRATE_ROBOT) is True
+        _finish(runner, service, ACTION_CALIBRATE_ROBOT)
+
+
+class TestCancel:
+    def test_cooperative_action_stops(self, runner, service):
+        runner.run(ACTION_CALIBRATE_CAMERA)
+        runner.cancel(ACTION_CALIBRATE_CAMERA)
+        _finish(runner, service, ACTION_CALIBRATE_CAMERA)
+        assert runner.log[-1] == ("action_cancelled", ACTION_CALIBRATE_CAMERA)
+        assert not any(entry[0] == "action_finished" for entry in runner.log)
+
+    def test_plain_action_result_is_discarded(self, runner, service):
+        runner.run(ACTION_CAPTURE)
+        runner.cancel()
+        assert runner.is_running(ACTION_CAPTURE)       # still finishing in the background
+        _finish(runner, service, ACTION_CAPTURE)
+        assert runner.log[-1] == ("action_cancelled", ACTION_CAPTURE)
+        assert not any(entry[0] == "action_finished" for entry in runner.log)
+
+    def test_cancel_targets_one_action(self, runner, service):
+        runner.run(ACTION_CALIBRATE_CAMERA)
+        runner.run(ACTION_CAPTURE)
+        runner.cancel(ACTION_CAPTURE)
+        service.release[ACTION_CAPTURE].set()
+        _finish(runner, service, ACTION_CALIBRATE_CAMERA)
+        assert ("action_cancelled", ACTION_CAPTURE) in runner.log
+        assert ("action_finished", ACTION_CALIBRATE_CAMERA, {"rms": 0.2}) in runner.log
+
+
+class TestBind:
+    def test_buttons_start_actions_and_results_reach_the_controls(self, runner, service):
+        controls = CameraControlsWidget()
+        runner.bind(controls)
+        controls._action_btns[ACTION_CAPTURE].click()
+        assert runner.is_running(ACTION_CAPTURE)
+        assert not controls._action_btns[ACTION_CAPTURE].isEnabled()
+        _finish(runner, service, ACTION_CAPTURE)
+        assert controls._action_btns[ACTION_CAPTURE].isEnabled()
+        assert controls._action_status.text() == "Capture Image: done"
+
+    def test_cancel_button_cancels(self, runner, service):
+        controls = CameraControlsWidget()
+        runner.bind(controls)
+        runner.run(ACTION_CALIBRATE_ROBOT)
+        controls.cancel_requested.emit()
+        _finish(runner, service, ACTION_CALIBRATE_ROBOT)
+        assert controls._action_status.text() == "Calibrate Robot: cancelled"
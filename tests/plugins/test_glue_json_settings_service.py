@@ -0,0 +1,58 @@
+"""Tests for src/plugins/glue_settings/json_settings_service.py"""
+import json
+
+import pytest
+
+from src.plugins.glue_settings.glue_settings_data import GlueSettings
+from src.plugins.glue_settings.json_settings_service import JsonGlueSettingsService
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return tmp_path / "glue_settings.json", tmp_path / "glue_types.json"
+
+
+@pytest.fixture
+def service(paths):
+    return JsonGlueSettingsService(*paths)
+
+
+class TestSettings:
+    def test_defaults_without_file(self, service):
+        assert service.load_settings() == GlueSettings()
+
+    def test_round_trip(self, service, paths):
+        service.save_settings(GlueSettings(fan_speed=75.0))
+        assert JsonGlueSettingsService(*paths).load_settings().fan_speed == 75.0
+
+    def test_unchanged_save_is_reported(self, service, capsys):
+        service.save_settings(GlueSettings())
+        capsys.readouterr()
+        service.save_settings(GlueSettings())
+        assert "unchanged, not written" in capsys.readouterr().out
+
+
+class TestGlueTypes:
+    def test_add_update_remove(self, service, paths):
+        added = service.add_glue_type("Type A", "fast")
+        updated = service.update_glue_type(added.id, "Type B", "slow")
+        assert (updated.id, updated.name, updated.description) == (added.id, "Type B", "slow")
+        assert json.loads(paths[1].read_text())["glue_types"][0]["name"] == "Type B"
+        service.remove_glue_type(added.id)
+        assert service.load_glue_types() == []
+
+    def test_loaded_list_is_a_copy(self, service):
+        service.add_glue_type("Type A", "")
+        service.load_glue_types().clear()
+        assert len(service.load_glue_types()) == 1
+
+    @pytest.mark.parametrize("change", [
+        lambda s: s.update_glue_type("missing", "X", ""),
+        lambda s: s.remove_glue_type("missing"),
+    ], ids=["update", "remove"])
+    def test_unknown_id_raises_key_error(self, service, paths, change):
+        service.add_glue_type("Type A", "")
+        before = paths[1].read_text()
+        with pytest.raises(KeyError):
+            change(service)
+        assert paths[1].read_text() == before
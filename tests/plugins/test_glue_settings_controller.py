@@ -0,0 +1,133 @@
+"""Tests for src/plugins/glue_settings/controller.py"""
+import threading
+
+import pytest
+
+from src.plugins.base_settings_plugin.service_worker import ServiceWorker
+from src.plugins.glue_settings.controller import GlueSettingsController
+from src.plugins.glue_settings.glue_settings_data import GlueSettings
+from src.plugins.glue_settings.model import GlueSettingsModel
+from src.settings.settings_view import SettingField, SettingGroup, SettingsView
+
+
+class FakeModel:
+    def __init__(self):
+        self.error = None
+        self.saved = []
+
+    def save(self, flat, on_done=None, on_error=None):
+        if self.error is not None:
+            on_error(self.error)
+            return
+        self.saved.append(dict(flat))
+        on_done(None)
+
+    def is_saving(self):
+        return False
+
+    def to_flat_dict(self):
+        return {k: v for flat in self.saved for k, v in flat.items()}
+
+
+@pytest.fixture
+def view(qapp):
+    v = SettingsView(component_name="Glue")
+    v.add_tab("Tab", [SettingGroup(title="G", fields=[
+        SettingField("speed", "Speed", "spinbox", default=0, min_val=0, max_val=100, step=1)])])
+    return v
+
+
+@pytest.fixture
+def model():
+    return FakeModel()
+
+
+@pytest.fixture
+def controller(view, model):
+    return GlueSettingsController(model, view)
+
+
+def _edit(view, key, value):
+    view.set_value(key, value)
+    view._on_field_changed(key, value)
+
+
+class TestErrors:
+    def test_failed_save_is_shown_and_edits_stay_dirty(self, controller, view, model):
+        model.error = IOError("disk full")
+        _edit(view, "speed", 5)
+        view._save_btn.click()
+        assert view.error() == "Not saved: disk full"
+        assert view.dirty_keys() == {"speed"}
+
+    def test_successful_save_clears_the_error(self, controller, view, model):
+        model.error = IOError("disk full")
+        _edit(view, "speed", 5)
+        view._save_btn.click()
+        model.error = None
+        view._save_btn.click()
+        assert view.error() == ""
+        assert model.saved == [{"speed": 5}]
+
+    def test_failed_load_is_shown(self, controller, view):
+        controller._on_load_failed(IOError("file missing"))
+        assert view.error() == "Not loaded: file missing"
+
+
+class BlockingGlueService:
+    """The first save waits for release, so later saves park behind it."""
+
+    def __init__(self):
+        self.settings = GlueSettings()
+        self.release = threading.Event()
+        self.writes = 0
+
+    def load_settings(self):
+        return self.settings
+
+    def save_settings(self, settings):
+        if not self.writes:
+            self.release.wait(2)
+        self.writes += 1
+        self.settings = settings
+
+
+class TestRestore:
+    @pytest.fixture
+    def setup(self, qapp):
+        view = SettingsView(component_name="Glue")
+        view.add_tab("Tab", [SettingGroup(title="G", fields=[
+            SettingField(key, key, "double_spinbox", default=0.0, min_val=0, max_val=5000, step=1)
+            for key in ("spray_width", "fan_speed", "pump_speed")])])
+        worker = ServiceWorker()
+        service = BlockingGlueService()
+        controller = GlueSettingsController(GlueSettingsModel(service, worker=worker), view,
+                                            auto_save_ms=5000)
+        controller.load()
+        worker.wait_for_done(2000)
+        yield view, worker, service, controller
+        service.release.set()
+        worker.wait_for_done(2000)
+
+    def test_restored_keys_stay_dirty_until_saved(self, setup):
+        view, worker, service, controller = setup
+        controller.restore({"fan_speed": 15.0})
+        assert "fan_speed" in view.dirty_keys()
+        service.release.set()
+        worker.wait_for_done(2000)
+        assert view.dirty_keys() == set()
+        assert service.settings.fan_speed == 15.0
+
+    def test_restore_followed_by_edit_and_flush_survives(self, setup):
+        view, worker, service, controller = setup
+        _edit(view, "spray_width", 3.0)
+        controller.flush()                              # in flight
+        controller.restore({"fan_speed": 15.0})         # parked
+        _edit(view, "pump_speed", 900.0)
+        controller.flush()                              # replaces the parked restore
+        service.release.set()
+        assert worker.wait_for_done(2000)
+        assert (service.settings.spray_width, service.settings.fan_speed,
+                service.settings.pump_speed) == (3.0, 15.0, 900.0)
+        assert view.get_value("fan_speed") == 15.0
+        assert view.dirty_keys() == set()
@@ -0,0 +1,117 @@
+"""Tests for src/plugins/glue_settings/model.py"""
+import threading
+
+import pytest
+
+from src.plugins.base_settings_plugin.service_worker import ServiceWorker
+from src.plugins.glue_settings.glue_settings_data import GlueSettings
+from src.plugins.glue_settings.mapper import GlueSettingsMapper
+from src.plugins.glue_settings.model import GlueSettingsModel
+
+
+class BlockingGlueService:
+    """Stores what was written; the first save waits for release so later saves overlap it."""
+
+    def __init__(self):
+        self.settings = GlueSettings()
+        self.release = threading.Event()
+        self.writes = []
+
+    def load_settings(self):
+        return self.settings
+
+    def save_settings(self, settings):
+        if not self.writes:
+            self.release.wait(2)
+        self.writes.append(settings)
+        self.settings = settings
+
+
+class DeltaGlueService(BlockingGlueService):
+    def __init__(self):
+        super().__init__()
+        self.deltas = []
+
+    def save_settings_delta(self, settings, delta):
+        self.deltas.append(dict(delta))
+        self.save_settings(settings)
+
+
+@pytest.fixture
+def worker(qapp):
+    w = ServiceWorker()
+    yield w
+    w.wait_for_done(2000)
+
+
+def _model(service, worker):
+    model = GlueSettingsModel(service, worker=worker)
+    model.load()
+    worker.wait_for_done(2000)
+    return model
+
+
+class TestOverlappingSaves:
+    def test_replaced_parked_save_is_not_lost(self, worker):
+        service = BlockingGlueService()
+        model = _model(service, worker)
+        done = []
+        model.save({"spray_width": 1.0}, on_done=done.append)     # in flight
+        model.save({"fan_speed": 15.0}, on_done=done.append)      # parked, e.g. a restore
+        model.save({"pump_speed": 900.0}, on_done=done.append)    # replaces it
+        service.release.set()
+        assert worker.wait_for_done(2000)
+
+        on_disk = GlueSettingsMapper.to_flat_dict(service.settings)
+        assert (on_disk["spray_width"], on_disk["fan_speed"], on_disk["pump_speed"]) == (1.0, 15.0, 900.0)
+        assert len(service.writes) == 2
+        assert model.to_flat_dict() == on_disk
+
+    def test_delta_backend_receives_the_replaced_keys(self, worker):
+        service = DeltaGlueService()
+        model = _model(service, worker)
+        model.save({"spray_width": 1.0})
+        model.save({"fan_speed": 15.0})
+        model.save({"pump_speed": 900.0})
+        service.release.set()
+        worker.wait_for_done(2000)
+        assert service.deltas == [{"spray_width": 1.0},
+                                  {"spray_width": 1.0, "fan_speed": 15.0, "pump_speed": 900.0}]
+
+    def test_written_keys_are_not_carried_into_later_saves(self, worker):
+        service = DeltaGlueService()
+        service.release.set()
+        model = _model(service, worker)
+        model.save({"spray_width": 1.0})
+        worker.wait_for_done(2000)
+        model.save({"fan_speed": 15.0})
+        worker.wait_for_done(2000)
+        assert service.deltas[-1] == {"fan_speed": 15.0}
+
+    def test_failed_save_does_not_leak_into_the_next(self, qapp):
+        class FailingOnce(DeltaGlueService):
+            def save_settings_delta(self, settings, delta):
+                if not self.deltas:
+                    self.deltas.append("failed")
+                    raise IOError("disk full")
+                super().save_settings_delta(settings, delta)
+
+        service = FailingOnce()
+        service.release.set()
+        model = GlueSettingsModel(service)
+        model.load()
+        errors = []
+        model.save({"spray_width": 1.0}, on_error=errors.append)
+        model.save({"fan_speed": 15.0})
+        assert [str(e) for e in errors] == ["disk full"]
+        assert service.deltas[-1] == {"fan_speed": 15.0}
+        assert service.settings.spray_width == GlueSettings().spray_width
+
+    def test_inline_error_without_on_error_propagates(self):
+        class Failing(BlockingGlueService):
+            def save_settings(self, settings):
+                raise IOError("disk full")
+
+        model = GlueSettingsModel(Failing())
+        with pytest.raises(IOError):
+            model.save({"fan_speed": 15.0})
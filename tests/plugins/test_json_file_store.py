@@ -0,0 +1,126 @@
+"""Tests for src/plugins/base_settings_plugin/json_file_store.py"""
+import json
+import os
+import stat
+
+import pytest
+
+from src.plugins.base_settings_plugin import json_file_store
+from src.plugins.base_settings_plugin.json_file_store import JsonFileStore
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "settings.json"
+
+
+@pytest.fixture
+def store(path):
+    return JsonFileStore(path, dict, dict, lambda: {"default": True})
+
+
+def _tmp_files(path):
+    return [p.name for p in path.parent.iterdir() if p.name.endswith(".tmp")]
+
+
+class TestLoad:
+    def test_missing_file_returns_default(self, store, path):
+        assert store.load() == {"default": True}
+        assert not path.exists()
+
+    def test_reads_existing_file(self, store, path):
+        path.write_text(json.dumps({"a": 1}))
+        assert store.load() == {"a": 1}
+
+    def test_unchanged_file_is_served_from_cache(self, store, path, monkeypatch):
+        path.write_text(json.dumps({"a": 1}))
+        first = store.load()
+        monkeypatch.setattr(json_file_store.json, "loads", lambda _: pytest.fail("file re-parsed"))
+        assert store.load() is first
+
+    def test_external_edit_invalidates_the_cache(self, store, path):
+        path.write_text(json.dumps({"a": 1}))
+        store.load()
+        path.write_text(json.dumps({"a": 22}))
+        assert store.load() == {"a": 22}
+
+    def test_same_size_edit_is_seen_through_mtime(self, store, path):
+        path.write_text(json.dumps({"a": 1}))
+        store.load()
+        path.write_text(json.dumps({"a": 2}))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert store.load() == {"a": 2}
+
+    def test_deleted_file_falls_back_to_default(self, store, path):
+        path.write_text(json.dumps({"a": 1}))
+        store.load()
+        path.unlink()
+        assert store.load() == {"default": True}
+
+
+class TestSave:
+    def test_writes_and_creates_directories(self, tmp_path):
+        path = tmp_path / "config" / "nested" / "settings.json"
+        store = JsonFileStore(path, dict, dict, dict)
+        assert store.save({"a": 1}) is True
+        assert json.loads(path.read_text()) == {"a": 1}
+        assert _tmp_files(path) == []
+
+    def test_unchanged_save_writes_nothing(self, store, path, monkeypatch):
+        store.save({"a": 1})
+        monkeypatch.setattr(json_file_store.os, "replace", lambda *a: pytest.fail("file rewritten"))
+        assert store.save({"a": 1}) is False
+        assert _tmp_files(path) == []
+
+    def test_unchanged_after_load_writes_nothing(self, store, path):
+        path.write_text(json.dumps({"a": 1}, indent=2))
+        store.load()
+        assert store.save({"a": 1}) is False
+
+    def test_external_edit_forces_the_write(self, store, path):
+        store.save({"a": 1})
+        path.write_text(json.dumps({"a": 99}))
+        assert store.save({"a": 1}) is True
+        assert json.loads(path.read_text()) == {"a": 1}
+
+    def test_saved_object_is_what_load_returns(self, store):
+        obj = {"a": 1}
+        store.save(obj)
+        assert store.load() is obj
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_file_mode_is_preserved(self, store, path):
+        path.write_text("{}")
+        os.chmod(path, 0o640)
+        store.save({"a": 1})
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_new_file_is_not_private(self, store, path):
+        store.save({"a": 1})
+        assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    def test_failing_serialiser_leaves_file_and_no_tmp(self, path):
+        path.write_text(json.dumps({"a": 1}))
+
+        def serialise(obj):
+            raise ValueError("bad settings")
+
+        store = JsonFileStore(path, dict, serialise, dict)
+        with pytest.raises(ValueError):
+            store.save({"a": 2})
+        assert json.loads(path.read_text()) == {"a": 1}
+        assert _tmp_files(path) == []
+
+    def test_failed_write_removes_the_tmp_file(self, store, path, monkeypatch):
+        path.write_text(json.dumps({"a": 1}))
+
+        def fail_replace(src, dst):
+            raise OSError("rename failed")
+
+        monkeypatch.setattr(json_file_store.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            store.save({"a": 2})
+        assert json.loads(path.read_text()) == {"a": 1}
+        assert _tmp_files(path) == []
@@ -0,0 +1,226 @@
+"""Tests for src/plugins/robot_settings/view/movement_groups_tab.py"""
+import pytest
+from PyQt6.QtCore import QCoreApplication, QEvent
+from PyQt6.QtGui import QColor, QPalette
+from PyQt6.QtWidgets import QLabel, QLineEdit, QListView, QPushButton, QWidget
+
+from src.external_dependencies.robotConfig.MovementGroup import MovementGroup
+from src.plugins.robot_settings.view.movement_groups_tab import (
+    MOVEMENT_GROUP_DEFINITIONS, MovementGroupsTab, MovementGroupWidget, PositionEditorDialog,
+)
+from src.plugins.robot_settings.view.robot_tab import robot_tab_factory
+from src.settings.settings_view.styles import (
+    OBJ_ACTION_BUTTON, SETTINGS_VIEW_STYLE, SHARED_WIDGET_STYLE,
+)
+
+P1 = "[1.5, 2, 3, 4, 5, 6]"
+
+
+@pytest.fixture
+def widget(qapp):
+    return MovementGroupWidget(MOVEMENT_GROUP_DEFINITIONS["TOOL CHANGER"])
+
+
+class TestPositionEditorDialog:
+    def test_parse_rejects_malformed(self):
+        with pytest.raises(ValueError):
+            PositionEditorDialog._parse("[1, 2, 3]")
+        with pytest.raises(ValueError):
+            PositionEditorDialog._parse("bad")
+
+    def test_valid_position_can_be_accepted(self, qapp):
+        dlg = PositionEditorDialog("Edit", P1)
+        assert dlg._ok_btn.isEnabled()
+        assert dlg._error_label.isHidden()
+        assert dlg.get_position_str() == "[1.500, 2.000, 3.000, 4.000, 5.000, 6.000]"
+
+    def test_empty_position_starts_at_zero(self, qapp):
+        assert PositionEditorDialog("Add", "")._ok_btn.isEnabled()
+
+    def test_malformed_position_blocks_ok_until_edited(self, qapp):
+        dlg = PositionEditorDialog("Edit", "[1, 2, x]")
+        assert not dlg._ok_btn.isEnabled()
+        assert not dlg._error_label.isHidden()
+        dlg._spinboxes[0]._increment()      # a tap on +
+        assert dlg._ok_btn.isEnabled()
+
+
+class TestMovementGroupWidget:
+    def test_get_values_keeps_point_strings(self, widget):
+        group = MovementGroup(points=[P1, "bad", "[1,2,3]", "[7, 8, 9, 10, 11, 12]"])
+        widget.load(group)
+        assert widget.get_values().points == group.points
+
+    def test_add_point_rejects_invalid(self, widget):
+        widget.load(MovementGroup(points=[P1]))
+        emitted = []
+        widget.points_changed.connect(lambda *a: emitted.append(a))
+        assert widget.add_point("not a pose") is False
+        assert widget.get_values().points == [P1]
+        assert emitted == []
+
+    def test_add_point_stores_the_text(self, widget):
+        assert widget.add_point("[0.100, 0, 0, 0, 0, 0]") is True
+        assert widget.get_values().points == ["[0.100, 0, 0, 0, 0, 0]"]
+
+    def test_update_point_changes_only_that_row(self, widget):
+        widget.load(MovementGroup(points=[P1, "bad", "[7, 8, 9, 10, 11, 12]"]))
+        assert widget._update_point(2, "[0, 0, 0, 0, 0, 0]") is True
+        assert widget.get_values().points == [P1, "bad", "[0, 0, 0, 0, 0, 0]"]
+        assert widget._update_point(0, "garbage") is False
+        assert widget.get_values().points[0] == P1
+
+
+def _groups():
+    return {
+        "HOME_POS":     MovementGroup(velocity=10, position=P1),
+        "TOOL CHANGER": MovementGroup(velocity=20, points=[P1]),
+    }
+
+
+class TestCollapsibleMovementGroupsTab:
+    @pytest.fixture
+    def tab(self, qapp):
+        tab = MovementGroupsTab(collapsible=True)
+        tab.load(_groups())
+        return tab
+
+    def test_no_editors_until_needed(self, tab):
+        assert not tab.is_expanded("HOME_POS")
+        assert not tab.is_expanded("TOOL CHANGER")
+
+    def test_get_values_of_collapsed_groups(self, tab):
+        assert tab.get_values() == _groups()
+
+    def test_get_widget_does_not_expand(self, tab):
+        assert tab.get_widget("TOOL CHANGER") is None
+        assert not tab.is_expanded("TOOL CHANGER")
+        assert tab.get_widget("NOPE") is None
+
+    def test_expand_builds_the_editor(self, tab):
+        editor = tab.expand("TOOL CHANGER")
+        assert isinstance(editor, MovementGroupWidget)
+        assert tab.is_expanded("TOOL CHANGER")
+        assert editor.get_values() == _groups()["TOOL CHANGER"]
+        assert tab.get_widget("TOOL CHANGER") is editor
+        assert tab.expand("TOOL CHANGER") is editor
+
+    def test_controller_contract_on_collapsed_groups(self, tab):
+        changes = []
+        tab.values_changed.connect(lambda key, value: changes.append(key))
+        tab.expand("HOME_POS").set_position("[0, 0, 300, 180, 0, 0]")
+        assert tab.expand("TOOL CHANGER").add_point("[0, 0, 300, 180, 0, 0]")
+        assert changes == ["HOME_POS.position", "TOOL CHANGER.points"]
+        values = tab.get_values()
+        assert values["HOME_POS"].position == "[0, 0, 300, 180, 0, 0]"
+        assert values["TOOL CHANGER"].points == [P1, "[0, 0, 300, 180, 0, 0]"]
+
+    def test_collapse_keeps_edits(self, tab):
+        tab.expand("TOOL CHANGER").add_point("[0, 0, 300, 180, 0, 0]")
+        assert tab.expand("TOOL CHANGER", False) is None
+        assert not tab.is_expanded("TOOL CHANGER")
+        assert tab.get_values()["TOOL CHANGER"].points == [P1, "[0, 0, 300, 180, 0, 0]"]
+
+    def test_load_while_collapsed_reaches_the_editor(self, tab):
+        groups = _groups()
+        groups["TOOL CHANGER"] = MovementGroup(velocity=30, points=[P1, P1])
+        assert tab.load(groups) == ["TOOL CHANGER"]
+        assert not tab.is_expanded("TOOL CHANGER")
+        assert tab.expand("TOOL CHANGER").get_values() == groups["TOOL CHANGER"]
+
+    def test_eager_mode_always_has_editors(self, qapp):
+        tab = MovementGroupsTab()
+        tab.load(_groups())
+        assert tab.is_expanded("HOME_POS")
+        assert isinstance(tab.get_widget("HOME_POS"), MovementGroupWidget)
+
+
+class TestLoadPatching:
+    @pytest.fixture
+    def tab(self, qapp):
+        tab = MovementGroupsTab()
+        tab.load(_groups())
+        tab.signals = []
+        tab.values_changed.connect(lambda key, value: tab.signals.append(key))
+        tab.search_entries_changed.connect(lambda: tab.signals.append("search_entries_changed"))
+        return tab
+
+    def test_first_load_creates_every_group(self, qapp):
+        assert MovementGroupsTab().load(_groups()) == ["HOME_POS", "TOOL CHANGER"]
+
+    def test_unchanged_reload_keeps_the_widgets(self, tab):
+        before = {name: tab.get_widget(name) for name in _groups()}
+        assert tab.load(_groups()) == []
+        assert all(tab.get_widget(name) is w for name, w in before.items())
+        assert tab.signals == []
+
+    def test_only_changed_groups_are_reported(self, tab):
+        home, tool = tab.get_widget("HOME_POS"), tab.get_widget("TOOL CHANGER")
+        groups = _groups()
+        groups["TOOL CHANGER"] = MovementGroup(velocity=25, points=[P1, "[7, 8, 9, 10, 11, 12]"])
+        assert tab.load(groups) == ["TOOL CHANGER"]
+        assert tab.get_widget("HOME_POS") is home
+        assert tab.get_widget("TOOL CHANGER") is tool
+        assert tab.get_values() == groups
+        assert tab.signals == []            # patching is not an edit
+
+    def test_new_group_is_added(self, tab):
+        groups = {**_groups(), "EXTRA": MovementGroup(velocity=5)}
+        assert tab.load(groups) == ["EXTRA"]
+        assert isinstance(tab.get_widget("EXTRA"), MovementGroupWidget)
+        assert tab.signals == ["search_entries_changed"]
+
+    def test_missing_group_is_removed(self, tab):
+        groups = _groups()
+        del groups["HOME_POS"]
+        assert tab.load(groups) == ["HOME_POS"]
+        assert tab.get_widget("HOME_POS") is None
+        assert list(tab.get_values()) == ["TOOL CHANGER"]
+        assert tab.signals == ["search_entries_changed"]
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        assert len(tab.findChildren(MovementGroupWidget)) == 1
+
+    def test_widget_load_reports_whether_anything_changed(self, widget):
+        emitted = []
+        widget.points_changed.connect(lambda *a: emitted.append(a))
+        widget.velocity_changed.connect(lambda *a: emitted.append(a))
+        group = MovementGroup(velocity=20, points=[P1, "[7, 8, 9, 10, 11, 12]"])
+        assert widget.load(group) is True
+        assert widget.load(group) is False
+        assert widget.load(MovementGroup(velocity=20, points=[P1, "[0, 0, 0, 0, 0, 0]"])) is True
+        assert widget.get_values().points == [P1, "[0, 0, 0, 0, 0, 0]"]
+        assert emitted == []
+
+
+class TestSharedStylesheet:
+    @pytest.fixture
+    def view_and_tab(self, qapp):
+        view, tab = robot_tab_factory()
+        tab.load(_groups())
+        tab.expand("HOME_POS")
+        tab.expand("TOOL CHANGER")
+        return view, tab
+
+    def test_sheet_is_installed_once_on_the_view(self, view_and_tab):
+        view, tab = view_and_tab
+        assert view.styleSheet() == SETTINGS_VIEW_STYLE
+        assert [w for w in [tab, *tab.findChildren(QWidget)] if w.styleSheet()] == []
+
+    def test_widgets_carry_object_names_the_sheet_covers(self, view_and_tab):
+        _, tab = view_and_tab
+        styled = tab.findChildren((QLabel, QLineEdit, QListView, QPushButton))
+        assert styled
+        names = {w.objectName() for w in styled}
+        assert "" not in names
+        assert [n for n in names if f"#{n}" not in SHARED_WIDGET_STYLE] == []
+
+    def test_object_name_rules_reach_the_widgets(self, view_and_tab):
+        _, tab = view_and_tab
+        btn = next(b for b in tab.expand("TOOL CHANGER").findChildren(QPushButton)
+                   if b.objectName() == OBJ_ACTION_BUTTON)
+        btn.ensurePolished()
+        assert btn.palette().color(QPalette.ColorRole.ButtonText) == QColor("white")
+
+    def test_dialog_installs_the_sheet_only_without_an_owner(self, widget):
+        assert PositionEditorDialog("Edit", P1, parent=widget).styleSheet() == ""
+        assert PositionEditorDialog("Edit", P1).styleSheet() == SETTINGS_VIEW_STYLE
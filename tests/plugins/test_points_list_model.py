@@ -0,0 +1,124 @@
+"""Tests for src/plugins/robot_settings/view/points_list_model.py"""
+import numpy as np
+import pytest
+from PyQt6.QtCore import Qt
+
+from src.plugins.robot_settings.view.points_list_model import PointsListModel
+
+
+def _rows(*xs):
+    return [[x, 0, 0, 0, 0, 0] for x in xs]
+
+
+def _xs(model):
+    return model.points_array()[:, 0].tolist()
+
+
+@pytest.fixture
+def model(qapp):
+    m = PointsListModel()
+    m.set_points_array(_rows(0, 1, 2, 3))
+    return m
+
+
+@pytest.fixture
+def signals(model):
+    log = []
+    model.rowsInserted.connect(lambda _, a, b: log.append(("insert", a, b)))
+    model.rowsRemoved.connect(lambda _, a, b: log.append(("remove", a, b)))
+    model.dataChanged.connect(lambda a, b, *_: log.append(("change", a.row(), b.row())))
+    model.modelReset.connect(lambda: log.append(("reset",)))
+    return log
+
+
+class TestBasics:
+    def test_row_count_and_display(self, model):
+        assert model.rowCount() == 4
+        assert model.data(model.index(1)) == "[1, 0, 0, 0, 0, 0]"
+        assert model.data(model.index(9)) is None
+
+    def test_points_array_is_read_only(self, model):
+        with pytest.raises(ValueError):
+            model.points_array()[0, 0] = 5
+
+    def test_texts_are_shown_and_returned_verbatim(self, qapp):
+        m = PointsListModel()
+        m.set_points_array([[1, 2, 3, 4, 5, 6], [np.nan] * 6], ["[1.000, 2, 3, 4, 5, 6]", "bad"])
+        assert m.data(m.index(1), Qt.ItemDataRole.DisplayRole) == "bad"
+        assert m.point_strings() == ["[1.000, 2, 3, 4, 5, 6]", "bad"]
+
+    def test_texts_must_match_rows(self, model):
+        with pytest.raises(ValueError):
+            model.set_points_array(_rows(1, 2), ["only one"])
+
+
+class TestEdits:
+    def test_insert_in_the_middle(self, model, signals):
+        model.insert_points(2, _rows(10, 11), ["a", "b"])
+        assert _xs(model) == [0, 1, 10, 11, 2, 3]
+        assert model.point_strings()[2:4] == ["a", "b"]
+        assert signals == [("insert", 2, 3)]
+
+    def test_append(self, model):
+        model.append_points(_rows(9))
+        assert _xs(model) == [0, 1, 2, 3, 9]
+
+    def test_insert_nothing_emits_nothing(self, model, signals):
+        model.insert_points(0, np.empty((0, 6)))
+        assert signals == []
+
+    def test_remove_groups_contiguous_blocks(self, model, signals):
+        model.remove_points([3, 0, 1])
+        assert _xs(model) == [2]
+        assert signals == [("remove", 3, 3), ("remove", 0, 1)]
+
+    def test_remove_keeps_texts_aligned(self, qapp):
+        m = PointsListModel()
+        m.set_points_array(_rows(0, 1, 2), ["a", "b", "c"])
+        m.remove_points([1])
+        assert m.point_strings() == ["a", "c"]
+
+    def test_set_points_at(self, model, signals):
+        model.set_points_at(1, _rows(7, 8))
+        assert _xs(model) == [0, 7, 8, 3]
+        assert signals == [("change", 1, 2)]
+
+    def test_set_point_replaces_text(self, qapp):
+        m = PointsListModel()
+        m.set_points_array([[np.nan] * 6], ["bad"])
+        m.set_point(0, [1, 2, 3, 4, 5, 6], "[1, 2, 3, 4, 5, 6.0]")
+        assert m.point_strings() == ["[1, 2, 3, 4, 5, 6.0]"]
+        m.set_point(0, [0] * 6)
+        assert m.point_strings() == ["[0, 0, 0, 0, 0, 0]"]
+
+
+class TestPatch:
+    def test_equal_is_a_no_op(self, model, signals):
+        assert model.patch(_rows(0, 1, 2, 3)) is False
+        assert signals == []
+
+    def test_equal_with_nan_rows_is_a_no_op(self, qapp):
+        m = PointsListModel()
+        m.set_points_array([[np.nan] * 6], ["bad"])
+        assert m.patch([[np.nan] * 6], ["bad"]) is False
+
+    def test_single_change_touches_one_row(self, model, signals):
+        assert model.patch(_rows(0, 1, 9, 3)) is True
+        assert _xs(model) == [0, 1, 9, 3]
+        assert signals == [("change", 2, 2)]
+
+    def test_insert_and_remove(self, model, signals):
+        model.patch(_rows(0, 5, 1, 3))
+        assert _xs(model) == [0, 5, 1, 3]
+        assert ("reset",) not in signals
+        assert all(kind != "change" or a == b for kind, a, b in signals)
+
+    def test_text_only_change(self, qapp):
+        m = PointsListModel()
+        m.set_points_array(_rows(1), ["[1, 0, 0, 0, 0, 0]"])
+        assert m.patch(_rows(1), ["[1.0, 0, 0, 0, 0, 0]"]) is True
+        assert m.point_strings() == ["[1.0, 0, 0, 0, 0, 0]"]
+
+    def test_patch_to_empty(self, model):
+        model.patch(np.empty((0, 6)))
+        assert model.rowCount() == 0
@@ -0,0 +1,122 @@
+"""Tests for src/plugins/robot_settings/controller.py"""
+import copy
+
+import pytest
+
+from src.external_dependencies.robotConfig.MovementGroup import MovementGroup
+from src.external_dependencies.robotConfig.robotConfigModel import get_default_config
+from src.external_dependencies.robotConfig.robot_calibration_settings import RobotCalibrationSettings
+from src.plugins.robot_settings import RobotSettingsPlugin
+
+
+class FakeRobotSettingsService:
+    def __init__(self):
+        self.config = get_default_config()
+        self.calibration = RobotCalibrationSettings()
+        self.saved = []
+
+    def load_config(self):
+        return self.config
+
+    def save_config(self, config):
+        self.saved.append(config)
+        self.config = config
+
+    def load_calibration(self):
+        return self.calibration
+
+    def save_calibration(self, calibration):
+        self.calibration = calibration
+
+
+@pytest.fixture
+def plugin(qapp):
+    p = RobotSettingsPlugin(FakeRobotSettingsService())
+    p.load()
+    return p
+
+
+def _edit_groups(plugin, name, points):
+    tab = plugin._controller._movement_tab
+    groups = copy.deepcopy(tab.get_values())
+    groups[name] = MovementGroup(velocity=groups[name].velocity, points=points)
+    tab.load(groups)
+    plugin._controller._on_movement_changed(name, points)
+
+
+class TestSafetyLimits:
+    def test_refused_save_is_shown_in_the_view(self, plugin):
+        _edit_groups(plugin, "TOOL CHANGER", ["[0, 0, 300, 180, 0, 0]", "[0, 0, 900, 180, 0, 0]"])
+        plugin._controller._view._save_btn.click()
+        error = plugin._controller._view.error()
+        assert "TOOL CHANGER point 2: z=900" in error
+        assert plugin._service.saved == []
+
+    def test_malformed_point_is_refused(self, plugin):
+        _edit_groups(plugin, "TOOL CHANGER", ["[0, 0, 300, 180, 0, 0]", "[0, 0, 300, 180, 0]"])
+        plugin._controller._view._save_btn.click()
+        assert "TOOL CHANGER point 2: not six numbers" in plugin._controller._view.error()
+        assert plugin._service.saved == []
+
+    def test_valid_save_clears_the_error(self, plugin):
+        _edit_groups(plugin, "TOOL CHANGER", ["[0, 0, 900, 180, 0, 0]"])
+        plugin._controller._view._save_btn.click()
+        _edit_groups(plugin, "TOOL CHANGER", ["[0, 0, 300, 180, 0, 0]"])
+        plugin._controller._view._save_btn.click()
+        assert plugin._controller._view.error() == ""
+        assert len(plugin._service.saved) == 1
+
+
+class FailingRobotSettingsService(FakeRobotSettingsService):
+    def __init__(self):
+        super().__init__()
+        self.fail_load = False
+        self.fail_save = False
+
+    def load_config(self):
+        if self.fail_load:
+            raise IOError("config unreadable")
+        return super().load_config()
+
+    def save_config(self, config):
+        if self.fail_save:
+            raise IOError("disk full")
+        super().save_config(config)
+
+
+class TestServiceErrors:
+    @pytest.fixture(params=[False, True], ids=["inline", "async"])
+    def failing(self, qapp, request):
+        service = FailingRobotSettingsService()
+        p = RobotSettingsPlugin(service, async_io=request.param)
+        p.load()
+        if p.worker is not None:
+            p.worker.wait_for_done(2000)
+        return p, service
+
+    def _wait(self, plugin):
+        if plugin.worker is not None:
+            plugin.worker.wait_for_done(2000)
+
+    def test_failed_save_is_shown_and_cleared_by_the_next_save(self, failing):
+        plugin, service = failing
+        view = plugin._controller._view
+        service.fail_save = True
+        _edit_groups(plugin, "TOOL CHANGER", ["[0, 0, 300, 180, 0, 0]"])
+        view._save_btn.click()
+        self._wait(plugin)
+        assert view.error() == "Not saved: disk full"
+        assert view._save_btn.isEnabled()
+
+        service.fail_save = False
+        view._save_btn.click()
+        self._wait(plugin)
+        assert view.error() == ""
+        assert len(service.saved) == 1
+
+    def test_failed_load_is_shown(self, failing):
+        plugin, service = failing
+        service.fail_load = True
+        plugin.load()
+        self._wait(plugin)
+        assert plugin._controller._view.error() == "Not loaded: config unreadable"
@@ -0,0 +1,55 @@
+"""Tests for src/plugins/robot_settings/model.py"""
+import threading
+
+from src.external_dependencies.robotConfig.robotConfigModel import get_default_config
+from src.external_dependencies.robotConfig.robot_calibration_settings import RobotCalibrationSettings
+from src.plugins.base_settings_plugin.service_worker import ServiceWorker
+from src.plugins.robot_settings.model import RobotSettingsModel
+
+
+class BlockingRobotService:
+    """The first write waits for release so later saves overlap it."""
+
+    def __init__(self):
+        self.config = get_default_config()
+        self.calibration = RobotCalibrationSettings()
+        self.release = threading.Event()
+        self.writes = []
+
+    def _write(self, what):
+        if not self.writes:
+            self.release.wait(2)
+        self.writes.append(what)
+
+    def load_config(self):
+        return self.config
+
+    def save_config(self, config):
+        self._write("config")
+        self.config = config
+
+    def load_calibration(self):
+        return self.calibration
+
+    def save_calibration(self, calibration):
+        self._write("calibration")
+        self.calibration = calibration
+
+
+def test_replaced_parked_save_keeps_config_and_calibration(qapp):
+    worker = ServiceWorker()
+    service = BlockingRobotService()
+    model = RobotSettingsModel(service, worker=worker)
+    model.load()
+    worker.wait_for_done(2000)
+
+    model.save({"robot_tool": 1})                   # in flight
+    model.save({"tcp_x_offset": 5.0})               # parked
+    model.save({"calib_max_step_mm": 10.0})         # replaces the parked config save
+    service.release.set()
+    assert worker.wait_for_done(2000)
+
+    assert (service.config.robot_tool, service.config.tcp_x_offset) == (1, 5.0)
+    assert service.calibration.max_step_mm == 10.0
+    assert service.writes == ["config", "config", "calibration"]
+    assert model.to_flat_dict()["tcp_x_offset"] == 5.0
@@ -0,0 +1,85 @@
+"""Tests for src/plugins/robot_settings/safety_validator.py"""
+import warnings
+
+import pytest
+
+from src.external_dependencies.robotConfig.MovementGroup import MovementGroup
+from src.external_dependencies.robotConfig.SafetyLimits import SafetyLimits
+from src.external_dependencies.robotConfig.robotConfigModel import get_default_config
+from src.plugins.robot_settings.safety_validator import (
+    SafetyLimitError, find_violations, validate_movement_groups,
+)
+
+INSIDE = "[0, 0, 300, 180, 0, 0]"
+
+
+def _groups(**points):
+    return {name: MovementGroup(points=pts) for name, pts in points.items()}
+
+
+class TestFindViolations:
+    def test_points_inside_the_limits(self):
+        assert find_violations(_groups(A=[INSIDE, "[499, -499, 799, 171, -9, 179]"]), SafetyLimits()) == []
+
+    def test_empty_groups(self):
+        assert find_violations({}, SafetyLimits()) == []
+        assert find_violations(_groups(A=[], B=[]), SafetyLimits()) == []
+
+    def test_out_of_limits(self):
+        (v,) = find_violations(_groups(A=[INSIDE, "[600, 0, 300, 180, 0, 0]"]), SafetyLimits())
+        assert (v.group, v.point, v.axis, v.value) == ("A", 1, "x", 600)
+        assert (v.limit_min, v.limit_max) == (-500, 500)
+        assert str(v) == "A point 2: x=600 outside [-500, 500]"
+
+    @pytest.mark.parametrize("index, axis, value", [
+        (0, "x", -501), (1, "y", 501), (2, "z", 99), (3, "rx", 160), (4, "ry", 11), (5, "rz", 100),
+    ])
+    def test_each_axis(self, index, axis, value):
+        pose = [0, 0, 300, 180, 0, 0]
+        pose[index] = value
+        (v,) = find_violations(_groups(A=[str(pose)]), SafetyLimits(rz_min=-90, rz_max=90))
+        assert (v.axis, v.value) == (axis, value)
+
+    def test_rotations_wrap_modulo_360(self):
+        assert find_violations(_groups(A=["[0, 0, 300, -180, 0, 0]", "[0, 0, 300, 180, 360, -360]"]),
+                               SafetyLimits()) == []
+
+    def test_order_across_groups(self):
+        violations = find_violations(
+            _groups(A=["[0, 0, 50, 180, 0, 0]"], B=[INSIDE, "[0, 900, 300, 180, 0, 0]"]), SafetyLimits())
+        assert [(v.group, v.point, v.axis) for v in violations] == [("A", 0, "z"), ("B", 1, "y")]
+
+    def test_point_index_is_the_ui_row_after_malformed_points(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            violations = find_violations(_groups(A=["bad", "[1, 2, 3]", "[0, 0, 900, 180, 0, 0]"]),
+                                         SafetyLimits())
+        assert [(v.point, v.axis) for v in violations] == [(0, ""), (1, ""), (2, "z")]
+
+    def test_malformed_point_is_a_violation(self):
+        (v,) = find_violations(_groups(A=[INSIDE, "[0, 0, 300, 180, oops, 0]"]), SafetyLimits())
+        assert (v.group, v.point, v.axis) == ("A", 1, "")
+        assert str(v) == "A point 2: not six numbers"
+
+    @pytest.mark.parametrize("text", ["nan", "inf", "-inf"])
+    def test_non_finite_value_is_a_violation(self, text):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            (v,) = find_violations(_groups(A=[f"[0, 0, 300, {text}, 0, 0]"]), SafetyLimits())
+        assert (v.point, v.axis) == (0, "rx")
+        assert str(v) == f"A point 1: rx={float(text):g} is not a finite number"
+
+
+class TestValidate:
+    def test_raises_with_every_violation(self):
+        with pytest.raises(SafetyLimitError) as info:
+            validate_movement_groups(_groups(A=["[900, 900, 300, 180, 0, 0]"]), SafetyLimits())
+        assert [v.axis for v in info.value.violations] == ["x", "y"]
+
+    def test_malformed_point_blocks_the_save(self):
+        with pytest.raises(SafetyLimitError, match="point 1: not six numbers"):
+            validate_movement_groups(_groups(A=["[0, 0, 300]"]), SafetyLimits())
+
+    def test_default_config_is_valid(self):
+        config = get_default_config()
+        validate_movement_groups(config.movement_groups, config.safety_limits)
@@ -0,0 +1,139 @@
+"""Tests for src/plugins/base_settings_plugin/service_worker.py"""
+import threading
+
+import pytest
+from PyQt6.QtCore import QThread
+
+from src.plugins.base_settings_plugin.service_worker import ServiceWorker, call_service
+
+
+@pytest.fixture
+def worker(qapp):
+    w = ServiceWorker()
+    yield w
+    w.wait_for_done(2000)
+
+
+@pytest.fixture
+def gate():
+    """An Event the first job blocks on, so later submissions find it in flight."""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+class TestOrdering:
+    def test_jobs_run_and_report_in_submission_order(self, worker):
+        ran, done = [], []
+        for i in range(5):
+            worker.submit("save", lambda i=i: ran.append(i) or i, on_done=done.append)
+        assert worker.wait_for_done(2000)
+        assert ran == [0, 1, 2, 3, 4]
+        assert done == [0, 1, 2, 3, 4]
+
+    def test_finished_signal_carries_op_and_result(self, worker):
+        finished = []
+        worker.finished.connect(lambda op, result: finished.append((op, result)))
+        worker.submit("load", lambda: 42)
+        worker.wait_for_done(2000)
+        assert finished == [("load", 42)]
+
+
+class TestCoalescing:
+    def test_only_newest_parked_job_runs(self, worker, gate):
+        ran, done = [], []
+        worker.submit("save", lambda: gate.wait(2) and ran.append("first"), coalesce=True)
+        for name in ("a", "b", "c"):
+            worker.submit("save", lambda name=name: ran.append(name) or name,
+                          on_done=done.append, on_error=done.append, coalesce=True)
+        assert worker.is_busy("save")
+        gate.set()
+        assert worker.wait_for_done(2000)
+        assert ran == ["first", "c"]
+        assert done == ["c"]            # the replaced jobs' callbacks never fire
+
+    def test_other_ops_are_not_coalesced(self, worker, gate):
+        ran = []
+        worker.submit("save", lambda: gate.wait(2), coalesce=True)
+        worker.submit("load", lambda: ran.append("load"), coalesce=True)
+        worker.submit("save", lambda: ran.append("save"), coalesce=True)
+        gate.set()
+        worker.wait_for_done(2000)
+        assert sorted(ran) == ["load", "save"]
+
+    def test_without_coalesce_every_job_runs(self, worker, gate):
+        ran = []
+        worker.submit("save", lambda: gate.wait(2))
+        for i in range(3):
+            worker.submit("save", lambda i=i: ran.append(i))
+        gate.set()
+        worker.wait_for_done(2000)
+        assert ran == [0, 1, 2]
+
+
+class TestErrors:
+    def test_failure_reaches_signal_and_on_error_on_the_gui_thread(self, worker, qapp):
+        gui = qapp.thread()
+        seen = []
+
+        def fail():
+            raise IOError("disk full")
+
+        worker.failed.connect(lambda op, exc: seen.append(("failed", op, str(exc),
+                                                           QThread.currentThread() is gui)))
+        worker.submit("save", fail, on_done=lambda _: seen.append("done"),
+                      on_error=lambda exc: seen.append(("on_error", str(exc),
+                                                        QThread.currentThread() is gui)))
+        worker.wait_for_done(2000)
+        assert seen == [("failed", "save", "disk full", True), ("on_error", "disk full", True)]
+
+    def test_callbacks_run_on_the_gui_thread(self, worker, qapp):
+        threads = []
+        worker.submit("load", lambda: QThread.currentThread(),
+                      on_done=lambda job_thread: threads.extend([job_thread, QThread.currentThread()]))
+        worker.wait_for_done(2000)
+        job_thread, callback_thread = threads
+        assert job_thread is not qapp.thread()
+        assert callback_thread is qapp.thread()
+
+    def test_failed_job_does_not_block_the_next(self, worker):
+        done = []
+        worker.submit("save", lambda: 1 / 0, on_error=lambda _: done.append("error"))
+        worker.submit("save", lambda: "ok", on_done=done.append)
+        worker.wait_for_done(2000)
+        assert done == ["error", "ok"]
+
+
+class TestWaitForDone:
+    def test_times_out_while_a_job_runs(self, worker, gate):
+        worker.submit("save", lambda: gate.wait(2))
+        assert worker.wait_for_done(50) is False
+        assert worker.is_busy()
+        gate.set()
+        assert worker.wait_for_done(2000) is True
+        assert not worker.is_busy()
+
+    def test_returns_after_callbacks_ran(self, worker):
+        done = []
+        worker.submit("load", lambda: 1, on_done=done.append)
+        assert worker.wait_for_done(2000)
+        assert done == [1]
+
+    def test_idle_worker_returns_at_once(self, worker):
+        assert worker.wait_for_done(0) is True
+
+
+class TestCallService:
+    def test_inline_without_worker(self):
+        done = []
+        call_service(None, "load", lambda: 5, on_done=done.append)
+        assert done == [5]
+
+    def test_inline_error_goes_to_on_error(self):
+        errors = []
+        call_service(None, "load", lambda: 1 / 0, on_error=errors.append)
+        assert isinstance(errors[0], ZeroDivisionError)
+
+    def test_inline_error_propagates_without_on_error(self):
+        with pytest.raises(ZeroDivisionError):
+            call_service(None, "load", lambda: 1 / 0)
@@ -0,0 +1,75 @@
+"""Tests for src/plugins/camera_settings/view/shared_frame_source.py"""
+import uuid
+
+import numpy as np
+import pytest
+
+from src.plugins.camera_settings.shared_frames import SharedFrameWriter
+from src.plugins.camera_settings.view import shared_frame_source
+from src.plugins.camera_settings.view.shared_frame_source import SharedFrameSource
+
+
+@pytest.fixture
+def name():
+    return f"test_source_{uuid.uuid4().hex[:12]}"
+
+
+@pytest.fixture
+def source(qapp, name, monkeypatch):
+    monkeypatch.setattr(shared_frame_source, "_RECHECK_AFTER_S", 0.0)   # check on every idle poll
+    s = SharedFrameSource(name, interval_ms=1000)
+    s.attached_log = []
+    s.attached.connect(s.attached_log.append)
+    yield s
+    s.stop()
+
+
+def _frame(value):
+    return np.full((3, 4, 3), value, np.uint8)
+
+
+def test_waits_for_the_ring_to_appear(source, name):
+    source._poll()
+    assert not source.is_attached()
+    with SharedFrameWriter(name, width=4, height=3) as writer:
+        writer.write(_frame(1))
+        source._poll()
+        assert source.is_attached()
+        assert source.stats()[0] == 1
+
+
+def test_paused_producer_keeps_the_ring(source, name):
+    frames = []
+    source.frame_received.connect(frames.append)
+    with SharedFrameWriter(name, width=4, height=3) as writer:
+        writer.write(_frame(1))
+        for _ in range(5):
+            source._poll()
+        assert source.is_attached()
+        assert source.attached_log == [name]
+        assert [f.seq for f in frames] == [1]
+
+
+def test_restarted_producer_is_picked_up(source, name):
+    frames = []
+    source.frame_received.connect(frames.append)
+    writer = SharedFrameWriter(name, width=4, height=3)
+    writer.write(_frame(1))
+    source._poll()
+    writer.close()
+    with SharedFrameWriter(name, width=4, height=3) as restarted:
+        restarted.write(_frame(2))
+        source._poll()                      # sees the replaced ring and detaches
+        source._poll()
+        assert source.attached_log == [name, name]
+        assert [int(f.array[0, 0, 0]) for f in frames] == [1, 2]
+
+
+def test_dropped_frames_are_counted(source, name):
+    with SharedFrameWriter(name, width=4, height=3) as writer:
+        writer.write(_frame(1))
+        source._poll()
+        for value in (2, 3, 4):
+            writer.write(_frame(value))
+        source._poll()
+        assert source.stats()[:2] == (2, 2)
@@ -0,0 +1,126 @@
+"""Tests for src/plugins/camera_settings/shared_frames.py"""
+import uuid
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from src.plugins.camera_settings import shared_frames
+from src.plugins.camera_settings.shared_frames import SharedFrameReader, SharedFrameWriter
+
+
+@pytest.fixture
+def name():
+    return f"test_ring_{uuid.uuid4().hex[:12]}"
+
+
+@pytest.fixture
+def writer(name):
+    w = SharedFrameWriter(name, width=4, height=3, channels=3, slots=3)
+    yield w
+    if w._header is not None:
+        w.close()
+
+
+@pytest.fixture
+def reader(writer, name):
+    r = SharedFrameReader(name)
+    yield r
+    if r._header is not None:
+        r.close()
+
+
+def _frame(value):
+    return np.full((3, 4, 3), value, np.uint8)
+
+
+class TestAttach:
+    def test_missing_ring_raises_file_not_found(self, name):
+        with pytest.raises(FileNotFoundError):
+            SharedFrameReader(name)
+
+    def test_block_that_is_not_a_ring_raises_value_error(self, name):
+        shm = shared_memory.SharedMemory(name=name, create=True, size=4096)
+        try:
+            with pytest.raises(ValueError):
+                SharedFrameReader(name)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_reader_sees_ring_shape(self, reader):
+        assert reader.shape == (3, 4, 3)
+        assert reader.slots == 3
+
+
+class TestReadLatest:
+    def test_nothing_new_returns_none(self, writer, reader):
+        assert reader.read_latest() is None
+        seq = writer.write(_frame(1))
+        assert reader.read_latest(after_seq=seq) is None
+
+    def test_returns_newest_frame_and_counts_dropped(self, writer, reader):
+        writer.write(_frame(1))
+        first = reader.read_latest()
+        assert (first.seq, first.dropped) == (1, 0)
+        for value in (2, 3, 4):
+            writer.write(_frame(value))
+        frame = reader.read_latest(after_seq=first.seq)
+        assert (frame.seq, frame.dropped) == (4, 2)
+        assert (frame.array == 4).all()
+        assert frame.age_ms() >= 0
+
+    def test_copy_fills_out_buffer(self, writer, reader):
+        writer.write(_frame(7))
+        out = np.zeros(reader.shape, np.uint8)
+        frame = reader.read_latest(out=out)
+        assert frame.array is out
+        assert (out == 7).all()
+
+    def test_slot_being_written_is_not_returned(self, writer, reader):
+        seq = writer.write(_frame(1))
+        writer._meta[(seq - 1) % writer.slots, 0] = 0     # writer is mid-copy
+        assert reader.read_latest() is None
+
+    def test_frame_lapped_during_copy_is_retried(self, writer, reader, monkeypatch):
+        writer.write(_frame(1))
+        copyto = np.copyto
+        lapped = []
+
+        def copy_then_lap(dst, src):
+            copyto(dst, src)
+            if not lapped:                  # overwrite the slot being copied once
+                lapped.append(True)
+                for value in (2, 3, 4):
+                    writer.write(_frame(value))
+
+        monkeypatch.setattr(shared_frames.np, "copyto", copy_then_lap)
+        frame = reader.read_latest(out=np.empty(reader.shape, np.uint8))
+        assert lapped
+        assert frame.seq == 4
+        assert (frame.array == 4).all()
+
+    def test_view_survives_slots_minus_one_further_frames(self, writer, reader):
+        writer.write(_frame(1))
+        frame = reader.read_latest(copy=False)
+        writer.write(_frame(2))
+        writer.write(_frame(3))
+        assert (frame.array == 1).all()
+        writer.write(_frame(4))             # same slot as frame 1
+        assert (frame.array == 4).all()
+
+
+class TestIsCurrent:
+    def test_open_ring_is_current(self, reader):
+        assert reader.is_current()
+
+    def test_closed_ring_is_not_current(self, writer, reader):
+        writer.close()
+        assert not reader.is_current()
+
+    def test_replaced_ring_is_not_current(self, writer, reader, name):
+        writer.close()
+        with SharedFrameWriter(name, width=4, height=3):
+            assert not reader.is_current()
+            with SharedFrameReader(name) as fresh:
+                assert fresh.is_current()
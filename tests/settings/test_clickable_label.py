@@ -0,0 +1,261 @@
+"""Tests for src/utils_widgets/clickable_label.py"""
+import time
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import QEvent, QPointF, Qt
+from PyQt6.QtGui import QColor, QMouseEvent, QPixmap
+
+from src.utils_widgets.clickable_label import (
+    EMIT_EVERY_MOVE, EMIT_ON_RELEASE, EMIT_RATE_LIMITED, ClickableLabel,
+)
+
+
+def _frame(color="red", w=1280, h=720):
+    pixmap = QPixmap(w, h)
+    pixmap.fill(QColor(color))
+    return pixmap
+
+
+@pytest.fixture
+def label(qapp):
+    lbl = ClickableLabel()
+    lbl.resize(640, 360)
+    return lbl
+
+
+class TestScaledFrameCache:
+    def test_repaint_reuses_scaled_frame(self, label):
+        label.set_frame(_frame())
+        label.grab()
+        scaled = label._scaled
+        label.grab()
+        assert label._scaled is scaled
+
+    def test_new_frame_rescales(self, label):
+        label.set_frame(_frame("red"))
+        label.grab()
+        scaled = label._scaled
+        label.set_frame(_frame("blue"))
+        label.grab()
+        assert label._scaled is not scaled
+
+    def test_resize_rescales(self, label):
+        label.set_frame(_frame())
+        label.grab()
+        label.resize(320, 240)
+        label.grab()
+        assert label._scaled.width() == 320
+
+    def test_fast_transform_toggle_rescales(self, label):
+        label.set_frame(_frame())
+        label.grab()
+        scaled = label._scaled
+        label.set_fast_transform(True)
+        label.grab()
+        assert label._scaled is not scaled
+        assert label._scaled_key[-1] is True
+
+
+class TestFrameCoalescing:
+    def test_frames_within_refresh_interval_are_coalesced(self, qapp, label):
+        label.set_frame(_frame("red"))
+        label.grab()                       # just painted
+        newest = _frame("blue")
+        label.set_frame(_frame("green"))
+        label.set_frame(newest)
+        assert label._frame_timer.isActive()
+
+        deadline = time.perf_counter() + 0.5
+        while label._frame_timer.isActive() and time.perf_counter() < deadline:
+            qapp.processEvents()
+        label.grab()
+        assert label._painted_key == newest.cacheKey()
+        assert label.frame_stats() == (3, 2)
+
+
+class TestSetFrameArray:
+    def test_bgr_is_wrapped_without_copy(self, label):
+        array = np.zeros((720, 1280, 3), np.uint8)
+        array[..., 0] = 255                          # blue in BGR
+        label.set_frame_array(array, "bgr")
+        assert int(label._frame.constBits()) == array.ctypes.data
+        assert label._frame_array is array
+        assert label.grab().toImage().pixelColor(320, 180).getRgb() == (0, 0, 255, 255)
+
+    def test_rgb_and_gray(self, label):
+        rgb = np.zeros((72, 128, 3), np.uint8)
+        rgb[..., 0] = 255
+        label.set_frame_array(rgb, "rgb")
+        assert label.grab().toImage().pixelColor(320, 180).getRgb() == (255, 0, 0, 255)
+        label.set_frame_array(np.full((72, 128, 1), 128, np.uint8), "gray")
+        assert label.grab().toImage().pixelColor(320, 180).getRgb() == (128, 128, 128, 255)
+
+    def test_padded_rows_are_not_copied(self, label):
+        array = np.zeros((720, 1280, 3), np.uint8)
+        roi = array[100:500, 200:900]
+        label.set_frame_array(roi)
+        assert int(label._frame.constBits()) == roi.ctypes.data
+        assert (label._frame.width(), label._frame.height()) == (700, 400)
+
+    def test_non_contiguous_pixels_are_copied(self, label):
+        array = np.zeros((72, 128, 3), np.uint8)
+        label.set_frame_array(array[:, ::-1])
+        assert int(label._frame.constBits()) != array.ctypes.data
+
+    def test_downscale_on_ingest(self, label):
+        array = np.zeros((720, 1280, 3), np.uint8)
+        label.set_frame_array(array, downscale=True)
+        assert (label._frame.width(), label._frame.height()) == (640, 360)
+        assert label._frame_array is None
+        label._update_coord_text(0.5, 0.5)
+        assert label._coord_text == "x: 640  y: 360"   # source resolution
+
+    def test_replacing_frame_releases_array(self, label):
+        label.set_frame_array(np.zeros((72, 128, 3), np.uint8))
+        label.set_frame(_frame())
+        assert label._frame_array is None
+
+    @pytest.mark.parametrize("array, fmt", [
+        (np.zeros((72, 128, 3), np.float32), "bgr"),
+        (np.zeros((72, 128), np.uint8),      "bgr"),
+        (np.zeros((72, 128, 4), np.uint8),   "rgb"),
+        (np.zeros((72, 128, 3), np.uint8),   "hsv"),
+    ])
+    def test_rejects_bad_input(self, label, array, fmt):
+        with pytest.raises(ValueError):
+            label.set_frame_array(array, fmt)
+
+
+def _mouse(kind, x, y):
+    pos = QPointF(x, y)
+    button = Qt.MouseButton.NoButton if kind == QEvent.Type.MouseMove else Qt.MouseButton.LeftButton
+    buttons = Qt.MouseButton.LeftButton if kind != QEvent.Type.MouseButtonRelease else Qt.MouseButton.NoButton
+    return QMouseEvent(kind, pos, pos, button, buttons, Qt.KeyboardModifier.NoModifier)
+
+
+@pytest.fixture
+def areas(label):
+    label.set_frame(_frame())
+    label.set_area_corners("pickup_area", [(0.1, 0.1), (0.4, 0.1), (0.4, 0.4), (0.1, 0.4)])
+    label.set_area_corners("brightness_area", [(0.5, 0.5), (0.9, 0.5), (0.9, 0.9), (0.5, 0.9)])
+    label.set_active_area("brightness_area")
+    label.grab()
+    return label
+
+
+class TestOverlayCache:
+    def test_repaint_reuses_overlay(self, areas):
+        overlay = areas._overlay
+        assert overlay is not None
+        areas.grab()
+        assert areas._overlay is overlay
+
+    def test_dragging_active_corner_keeps_overlay(self, areas):
+        overlay = areas._overlay
+        x, y = areas._to_pixel(0.5, 0.5)
+        areas.mousePressEvent(_mouse(QEvent.Type.MouseButtonPress, x, y))
+        areas.mouseMoveEvent(_mouse(QEvent.Type.MouseMove, x + 20, y + 10))
+        areas.grab()
+        assert areas.get_area_corners("brightness_area")[0] != (0.5, 0.5)
+        assert areas._overlay is overlay
+
+    @pytest.mark.parametrize("change", [
+        lambda l: l.set_area_corners("pickup_area", [(0.2, 0.2), (0.3, 0.2), (0.3, 0.3)]),
+        lambda l: l.set_active_area("pickup_area"),
+        lambda l: l.add_area("pickup_area", "#ff00ff"),
+        lambda l: l.clear_area("pickup_area"),
+        lambda l: l.resize(320, 240),
+    ])
+    def test_overlay_rebuilt_on_change(self, areas, change):
+        key = areas._overlay_key
+        change(areas)
+        areas.grab()
+        assert areas._overlay_key != key
+
+    def test_no_overlay_without_inactive_areas(self, label):
+        label.set_area_corners("brightness_area", [(0.5, 0.5), (0.9, 0.5)])
+        label.set_active_area("brightness_area")
+        label.grab()
+        assert label._overlay is None
+
+
+def _drag(label, moves, release=True):
+    """Drag the first corner of the active area by (10 px, 5 px) steps."""
+    x, y = label._to_pixel(0.5, 0.5)
+    label.mousePressEvent(_mouse(QEvent.Type.MouseButtonPress, x, y))
+    for i in range(1, moves + 1):
+        label.mouseMoveEvent(_mouse(QEvent.Type.MouseMove, x + 10 * i, y + 5 * i))
+    if release:
+        label.mouseReleaseEvent(_mouse(QEvent.Type.MouseButtonRelease, x + 10 * moves, y + 5 * moves))
+
+
+@pytest.fixture
+def signals(areas):
+    updated, committed = [], []
+    areas.corner_updated.connect(lambda *a: updated.append(a))
+    areas.corner_committed.connect(lambda *a: committed.append(a))
+    return updated, committed
+
+
+class TestEmitPolicy:
+    def test_every_move_is_default(self, areas, signals):
+        updated, committed = signals
+        assert areas.emit_policy() == EMIT_EVERY_MOVE
+        _drag(areas, 5)
+        assert len(updated) == 5
+        assert committed == [updated[-1]]
+
+    def test_on_release_emits_once(self, areas, signals):
+        updated, committed = signals
+        areas.set_emit_policy(EMIT_ON_RELEASE)
+        _drag(areas, 5, release=False)
+        assert updated == []
+        areas.mouseReleaseEvent(_mouse(QEvent.Type.MouseButtonRelease, 0, 0))
+        assert len(updated) == 1
+        assert updated[0][:2] == ("brightness_area", 0)
+        assert updated[0][2:] == areas.get_area_corners("brightness_area")[0]
+        assert committed == updated
+
+    def test_rate_limited_delivers_last_position(self, qapp, areas, signals):
+        updated, committed = signals
+        areas.set_emit_policy(EMIT_RATE_LIMITED, rate_hz=20)
+        _drag(areas, 20, release=False)
+        assert len(updated) == 1                # leading edge only, the rest is pending
+        time.sleep(0.07)
+        qapp.processEvents()
+        assert len(updated) == 2                # trailing emission with the latest position
+        assert updated[-1][2:] == areas.get_area_corners("brightness_area")[0]
+        areas.mouseReleaseEvent(_mouse(QEvent.Type.MouseButtonRelease, 0, 0))
+        assert len(updated) == 2
+        assert committed == [updated[-1]]
+
+    def test_rate_limited_flushes_on_release(self, areas, signals):
+        updated, committed = signals
+        areas.set_emit_policy(EMIT_RATE_LIMITED, rate_hz=1)
+        _drag(areas, 10)
+        assert len(updated) == 2
+        assert updated[-1] == committed[0]
+
+    def test_click_to_place_commits(self, label):
+        committed = []
+        label.corner_committed.connect(lambda *a: committed.append(a))
+        label.set_frame(_frame())
+        label.add_area("pickup_area", "#ff00ff")
+        label.set_active_area("pickup_area")
+        label.set_emit_policy(EMIT_ON_RELEASE)
+        x, y = label._to_pixel(0.25, 0.25)
+        label.mousePressEvent(_mouse(QEvent.Type.MouseButtonPress, x, y))
+        label.mouseReleaseEvent(_mouse(QEvent.Type.MouseButtonRelease, x, y))
+        assert [c[:2] for c in committed] == [("pickup_area", 0)]
+
+    def test_click_without_drag_does_not_commit(self, areas, signals):
+        updated, committed = signals
+        _drag(areas, 0)
+        assert updated == committed == []
+
+    def test_rejects_unknown_policy(self, label):
+        with pytest.raises(ValueError):
+            label.set_emit_policy("sometimes")
+        with pytest.raises(ValueError):
+            label.set_emit_policy(EMIT_RATE_LIMITED, rate_hz=0)
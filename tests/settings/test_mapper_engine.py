@@ -0,0 +1,101 @@
+"""Tests for src/settings/settings_mapper/mapper_engine.py — no QApplication needed."""
+from dataclasses import dataclass, field
+
+import pytest
+
+from src.settings.settings_mapper import MappedField, compile_mapper
+
+
+@dataclass
+class _Limits:
+    low: int = 0
+    high: int = 10
+
+
+@dataclass
+class _Model:
+    name: str = "a"
+    speed: float = 1.0
+    enabled: bool = True
+    limits: _Limits = field(default_factory=_Limits)
+    points: list = field(default_factory=list)
+
+
+_FIELDS = (
+    MappedField("name",       json="Name"),
+    MappedField("speed",      type=float, json="Motion/Speed"),
+    MappedField("enabled",    type=bool,  json="Motion/Enabled", export=str),
+    MappedField("limit_low",  "limits.low",  int, json="Limits/Low"),
+    MappedField("limit_high", "limits.high", int),
+)
+
+
+@pytest.fixture
+def mapper():
+    return compile_mapper(_FIELDS, name="Test")
+
+
+class TestToFlatDict:
+    def test_all_keys_in_table_order(self, mapper):
+        assert list(mapper.to_flat_dict(_Model())) == mapper.keys
+
+    def test_nested_attr_and_export(self, mapper):
+        flat = mapper.to_flat_dict(_Model(enabled=False, limits=_Limits(3, 4)))
+        assert flat["enabled"] == "False"
+        assert flat["limit_low"] == 3
+        assert flat["limit_high"] == 4
+
+
+class TestFromFlatDict:
+    def test_casts_values(self, mapper):
+        m = mapper.from_flat_dict({"speed": "2.5", "limit_low": 7.0}, _Model())
+        assert m.speed == 2.5
+        assert m.limits.low == 7
+
+    def test_missing_keys_keep_base(self, mapper):
+        base = _Model(name="keep", speed=3.0)
+        assert mapper.from_flat_dict({}, base) == base
+
+    def test_base_not_mutated(self, mapper):
+        base = _Model()
+        mapper.from_flat_dict({"name": "b", "limit_high": 99}, base)
+        assert base == _Model()
+
+    def test_untouched_nested_object_shared(self, mapper):
+        base = _Model()
+        result = mapper.from_flat_dict({"name": "b"}, base)
+        assert result is not base
+        assert result.limits is base.limits
+        assert result.points is base.points
+
+    def test_touched_nested_object_copied(self, mapper):
+        base = _Model()
+        result = mapper.from_flat_dict({"limit_high": 20}, base)
+        assert result.limits is not base.limits
+        assert result.limits == _Limits(0, 20)
+
+
+class TestJson:
+    def test_to_json_nests_sections(self, mapper):
+        assert mapper.to_json(_Model()) == {
+            "Name": "a",
+            "Motion": {"Speed": 1.0, "Enabled": True},
+            "Limits": {"Low": 0},
+        }
+
+    def test_round_trip(self, mapper):
+        model = _Model(name="x", speed=4.0, enabled=False, limits=_Limits(5, 10))
+        assert mapper.from_json(mapper.to_json(model), _Model) == model
+
+    def test_from_json_missing_keys_use_factory_defaults(self, mapper):
+        assert mapper.from_json({"Motion": {"Speed": 9.0}}, _Model) == _Model(speed=9.0)
+
+
+class TestCompileErrors:
+    def test_duplicate_keys_rejected(self):
+        with pytest.raises(ValueError):
+            compile_mapper((MappedField("a"), MappedField("a")))
+
+    def test_deep_json_path_rejected(self):
+        with pytest.raises(ValueError):
+            compile_mapper((MappedField("a", json="X/Y/Z"),))
@@ -0,0 +1,91 @@
+"""Tests for src/settings/settings_search/search_index.py"""
+import pytest
+
+from src.settings.settings_search import (
+    KIND_CATEGORY, KIND_FIELD, KIND_MOVEMENT_GROUP, SearchEntry, SearchIndex,
+)
+from src.settings.settings_search.search_index import normalise
+
+
+def _field(key, label="", category="camera"):
+    return SearchEntry(category, KIND_FIELD, key, label)
+
+
+@pytest.fixture
+def index():
+    idx = SearchIndex()
+    idx.add_entries([
+        SearchEntry("robot", KIND_CATEGORY, "robot"),
+        SearchEntry("robot", KIND_MOVEMENT_GROUP, "SLOT 4 PICKUP"),
+        SearchEntry("robot", KIND_MOVEMENT_GROUP, "SLOT 4 DROPOFF"),
+        _field("erode_enabled", "Erode"),
+        _field("erode_iterations", "Erode Iterations"),
+        _field("robot_ip", "IP Address", category="robot"),
+    ])
+    return idx
+
+
+def _keys(hits):
+    return [h.entry.key for h in hits]
+
+
+class TestNormalise:
+    def test_folds_case_underscores_and_spaces(self):
+        assert normalise("  Erode_Iterations  x ") == "erode iterations x"
+
+
+class TestPrefixSearch:
+    def test_exact_match_ranks_first(self, index):
+        assert _keys(index.search("erode"))[0] == "erode_enabled"
+
+    def test_key_prefix(self, index):
+        assert _keys(index.search("erode it")) == ["erode_iterations"]
+
+    def test_word_prefix_inside_name(self, index):
+        assert _keys(index.search("drop")) == ["SLOT 4 DROPOFF"]
+        assert _keys(index.search("4 drop")) == ["SLOT 4 DROPOFF"]
+
+    def test_case_insensitive(self, index):
+        assert _keys(index.search("Slot 4 DropOff")) == ["SLOT 4 DROPOFF"]
+
+    def test_label_is_searched(self, index):
+        assert _keys(index.search("ip addr")) == ["robot_ip"]
+
+    def test_empty_query(self, index):
+        assert index.search("   ") == []
+
+    def test_limit(self, index):
+        assert len(index.search("slot", limit=1)) == 1
+
+
+class TestFuzzySearch:
+    def test_subsequence(self, index):
+        hits = index.search("erdit")
+        assert _keys(hits) == ["erode_iterations"]
+        assert hits[0].rank == 3
+
+    def test_prefix_hits_rank_before_fuzzy(self, index):
+        hits = index.search("slot 4 p")
+        assert _keys(hits)[0] == "SLOT 4 PICKUP"
+        assert all(a.rank <= b.rank for a, b in zip(hits, hits[1:]))
+
+    def test_fuzzy_can_be_disabled(self, index):
+        assert index.search("erdit", fuzzy=False) == []
+
+
+class TestIncrementalBuild:
+    def test_duplicate_add_ignored(self, index):
+        before = len(index)
+        index.add(_field("erode_enabled", "Erode"))
+        assert len(index) == before
+
+    def test_added_after_query_is_found(self, index):
+        index.search("erode")
+        index.add(_field("spray_width", "Spray Width", category="glue"))
+        assert _keys(index.search("spray")) == ["spray_width"]
+
+    def test_remove_category(self, index):
+        index.remove_category("camera")
+        assert index.entries("camera") == []
+        assert index.search("erode") == []
+        assert _keys(index.search("robot ip")) == ["robot_ip"]
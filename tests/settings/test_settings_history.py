@@ -0,0 +1,197 @@
+"""Tests for src/settings/settings_history/"""
+import json
+
+import pytest
+from PyQt6.QtCore import QCoreApplication, QEvent
+from PyQt6.QtWidgets import QMessageBox
+
+from src.settings.settings_history import (
+    HistoryChange, HistoryRecorder, SettingsHistory, SettingsHistoryView,
+)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "history.jsonl"
+
+
+def _save(history, before, **changes):
+    after = {**before, **changes}
+    history.record("Camera", before, after)
+    return after
+
+
+class TestRecord:
+    def test_records_only_changed_keys(self, path):
+        history = SettingsHistory(path)
+        version = history.record("Camera", {"a": 1, "b": 2}, {"a": 1, "b": 3})
+        assert version == 1
+        assert history.versions()[0].changes == (HistoryChange("b", 2, 3),)
+
+    def test_nothing_changed_records_nothing(self, path):
+        history = SettingsHistory(path)
+        assert history.record("Camera", {"a": 1}, {"a": 1}) is None
+        assert history.versions() == []
+        assert not path.exists()
+
+    def test_keys_limit_the_comparison(self, path):
+        history = SettingsHistory(path)
+        history.record("Camera", {"a": 1, "b": 2}, {"a": 5, "b": 6}, keys=["a"])
+        assert [c.key for c in history.versions()[0].changes] == ["a"]
+
+    def test_listener_called_with_version(self, path):
+        history = SettingsHistory(path)
+        seen = []
+        history.add_listener(seen.append)
+        history.record("Camera", {"a": 1}, {"a": 2})
+        assert [v.version for v in seen] == [1]
+
+    def test_removed_listener_is_not_called(self, path):
+        history = SettingsHistory(path)
+        seen = []
+        history.add_listener(seen.append)
+        history.remove_listener(seen.append)
+        history.remove_listener(seen.append)
+        history.record("Camera", {"a": 1}, {"a": 2})
+        assert seen == []
+
+    def test_failing_listener_does_not_lose_the_version(self, path):
+        history = SettingsHistory(path)
+        history.add_listener(lambda _: 1 / 0)
+        assert history.record("Camera", {"a": 1}, {"a": 2}) == 1
+        assert history.latest_version() == 1
+
+
+class TestStateAt:
+    def test_baseline_and_each_version(self, path):
+        history = SettingsHistory(path)
+        s0 = {"a": 1, "b": 2}
+        s1 = _save(history, s0, a=10)
+        s2 = _save(history, s1, b=20)
+        assert history.state_at(0) == s0
+        assert history.state_at(1) == s1
+        assert history.state_at(2) == s2
+
+    def test_unknown_version_raises(self, path):
+        history = SettingsHistory(path)
+        with pytest.raises(KeyError):
+            history.state_at(0)
+        _save(history, {"a": 1}, a=2)
+        with pytest.raises(KeyError):
+            history.state_at(2)
+
+    def test_snapshots_bound_the_replay(self, path):
+        history = SettingsHistory(path, snapshot_every=5)
+        state = {"a": 0}
+        for i in range(1, 13):
+            state = _save(history, state, a=i)
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [e["v"] for e in lines if "s" in e] == [0, 5, 10]
+        assert history.state_at(12) == {"a": 12}
+        assert history.state_at(7) == {"a": 7}
+
+    def test_invalid_snapshot_every(self, path):
+        with pytest.raises(ValueError):
+            SettingsHistory(path, snapshot_every=0)
+
+
+class TestReload:
+    def test_reload_from_file(self, path):
+        history = SettingsHistory(path, snapshot_every=3)
+        state = {"a": 0, "b": "x"}
+        for i in range(1, 6):
+            state = _save(history, state, a=i)
+        reloaded = SettingsHistory(path, snapshot_every=3)
+        assert reloaded.latest_version() == 5
+        assert reloaded.versions() == history.versions()
+        assert reloaded.state_at(4) == history.state_at(4)
+
+    def test_torn_last_line_is_skipped_and_not_glued_to(self, path):
+        history = SettingsHistory(path)
+        _save(history, {"a": 1}, a=2)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"v": 2, "t": 1.0, "c": "Cam')
+        reloaded = SettingsHistory(path)
+        assert reloaded.latest_version() == 1
+        reloaded.record("Camera", {"a": 2}, {"a": 3})
+        again = SettingsHistory(path)
+        assert again.latest_version() == 2
+        assert again.state_at(2) == {"a": 3}
+
+
+class TestHistoryRecorder:
+    def test_records_against_last_persisted_state(self, path):
+        recorder = HistoryRecorder(SettingsHistory(path), "Camera", dict)
+        recorder.loaded({"a": 1, "b": 2})
+        assert recorder.saved({"a": 5, "b": 2}, ["a"]) == 1
+        assert recorder.saved({"a": 5, "b": 7}, ["b"]) == 2
+        assert recorder.history.versions()[1].changes == (HistoryChange("b", 2, 7),)
+        assert recorder.history.state_at(0) == {"a": 1, "b": 2}
+
+    def test_unserialisable_value_is_reported_not_raised(self, path, capsys):
+        recorder = HistoryRecorder(SettingsHistory(path), "Camera", dict)
+        recorder.loaded({"a": 1})
+        assert recorder.saved({"a": object()}) is None
+        assert "not recorded" in capsys.readouterr().out
+
+
+class TestSettingsHistoryView:
+    def test_lists_versions_newest_first_then_baseline(self, qapp, path):
+        history = SettingsHistory(path)
+        view = SettingsHistoryView(history)
+        assert view._versions_table.rowCount() == 0
+        state = _save(history, {"a": 1}, a=2)
+        _save(history, state, a=3)
+        table = view._versions_table
+        assert table.rowCount() == 3
+        assert [table.item(r, 0).text() for r in range(3)] == ["2", "1", "Baseline"]
+
+    def test_baseline_shows_stored_values_and_restores_version_0(self, qapp, path, monkeypatch):
+        history = SettingsHistory(path)
+        _save(history, {"a": 1, "b": 2}, a=5)
+        view = SettingsHistoryView(history)
+        view.select_version(0)
+        assert view.selected_version() == 0
+        changes = view._changes_table
+        assert [changes.item(r, 0).text() for r in range(changes.rowCount())] == ["a", "b"]
+        assert changes.item(0, 2).text() == "1"
+
+        requested = []
+        view.restore_requested.connect(requested.append)
+        monkeypatch.setattr(QMessageBox, "question", lambda *a, **k: QMessageBox.StandardButton.Yes)
+        view._btn_restore.click()
+        assert requested == [0]
+
+    def test_destroyed_view_stops_listening(self, qapp, path, capsys):
+        history = SettingsHistory(path)
+        view = SettingsHistoryView(history)
+        assert len(history._listeners) == 1
+        view.deleteLater()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+        assert history._listeners == []
+        history.record("Camera", {"a": 1}, {"a": 2})
+        assert "listener" not in capsys.readouterr().out
+
+    def test_selection_shows_changes(self, qapp, path):
+        history = SettingsHistory(path)
+        _save(history, {"a": 1, "b": 2}, a=5, b=6)
+        view = SettingsHistoryView(history)
+        view.select_version(1)
+        assert view.selected_version() == 1
+        assert view._changes_table.rowCount() == 2
+
+    def test_restore_emits_after_confirmation(self, qapp, path, monkeypatch):
+        history = SettingsHistory(path)
+        _save(history, {"a": 1}, a=2)
+        view = SettingsHistoryView(history)
+        view.select_version(1)
+        requested = []
+        view.restore_requested.connect(requested.append)
+
+        monkeypatch.setattr(QMessageBox, "question", lambda *a, **k: QMessageBox.StandardButton.No)
+        view._btn_restore.click()
+        assert requested == []
+
+        monkeypatch.setattr(QMessageBox, "question", lambda *a, **k: QMessageBox.StandardButton.Yes)
+        view._btn_restore.click()
+        assert requested == [1]
@@ -0,0 +1,181 @@
+"""Tests for src/settings/settings_menu/settings_menu.py"""
+import pytest
+from PyQt6.QtWidgets import QLabel
+
+from src.settings.settings_menu.category_descriptor import CategoryDescriptor
+from src.settings.settings_menu.settings_menu import SettingsNavigationWidget
+from src.settings.settings_search import KIND_FIELD, KIND_MOVEMENT_GROUP, SearchEntry
+from src.settings.settings_view import SettingsView
+from src.external_dependencies.robotConfig.MovementGroup import MovementGroup
+from src.plugins.robot_settings.view.movement_groups_tab import MovementGroupsTab
+
+
+CATEGORIES = [
+    CategoryDescriptor(id="robot", icon="mdi.robot-industrial"),
+    CategoryDescriptor(id="camera", icon="mdi.camera"),
+]
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def factory_map(calls):
+    def make(name):
+        def factory():
+            calls.append(name)
+            return QLabel(name)
+        return factory
+    return {"robot": make("robot"), "camera": make("camera")}
+
+
+class TestEagerNavigation:
+    def test_views_built_in_constructor(self, qapp, factory_map, calls):
+        nav = SettingsNavigationWidget(CATEGORIES, factory_map)
+        assert calls == ["robot", "camera"]
+        assert set(nav.settings_views) == {"robot", "camera"}
+
+    def test_timings_recorded(self, qapp, factory_map):
+        nav = SettingsNavigationWidget(CATEGORIES, factory_map)
+        assert set(nav.build_timings) == {"robot", "camera"}
+        assert all(ms >= 0.0 for ms in nav.build_timings.values())
+
+
+class TestDeferredNavigation:
+    def test_nothing_built_in_constructor(self, qapp, factory_map, calls):
+        nav = SettingsNavigationWidget(CATEGORIES, factory_map, deferred=True)
+        assert calls == []
+        assert nav.settings_views == {}
+        assert nav.content_stack.currentIndex() == 0
+
+    def test_views_built_after_show(self, qapp, factory_map, calls):
+        nav = SettingsNavigationWidget(CATEGORIES, factory_map, deferred=True)
+        built = []
+        nav.view_built.connect(lambda cid, ms: built.append(cid))
+        nav.show()
+        for _ in range(5):
+            qapp.processEvents()
+        assert calls == ["robot", "camera"]
+        assert built == ["robot", "camera"]
+        nav.close()
+
+    def test_click_pending_shows_placeholder_then_view(self, qapp, factory_map, calls):
+        nav = SettingsNavigationWidget(CATEGORIES, factory_map, deferred=True)
+        nav._show_settings("camera")
+        assert nav.current_tab_id is None
+        assert nav.content_stack.currentIndex() == nav._loading_index
+        for _ in range(5):
+            qapp.processEvents()
+        # The clicked category is built first and shown once ready
+        assert calls[0] == "camera"
+        assert nav.current_tab_id == "camera"
+        assert nav.content_stack.currentWidget().text() == "camera"
+
+
+def _raising_factory():
+    raise RuntimeError("camera offline")
+
+
+class TestFailingFactory:
+    def test_eager_failure_shows_error_page_on_click(self, qapp):
+        nav = SettingsNavigationWidget(CATEGORIES, {"camera": _raising_factory, "robot": QLabel})
+        assert nav.build_errors == {"camera": "camera offline"}
+        nav._show_settings("camera")
+        assert nav.content_stack.currentIndex() == nav._error_index
+        assert "camera offline" in nav._error_label.text()
+        assert nav.current_tab_id is None
+
+    def test_deferred_click_leaves_loading_page(self, qapp, factory_map):
+        factory_map["camera"] = _raising_factory
+        nav = SettingsNavigationWidget(CATEGORIES, factory_map, deferred=True)
+        failed = []
+        nav.view_failed.connect(lambda cid, err: failed.append((cid, err)))
+        nav._show_settings("camera")
+        assert nav.content_stack.currentIndex() == nav._loading_index
+        for _ in range(5):
+            qapp.processEvents()
+        assert failed == [("camera", "camera offline")]
+        assert nav._requested_tab_id is None
+        assert nav.content_stack.currentIndex() == nav._error_index
+        # The other views are still built and reachable
+        nav._show_settings("robot")
+        assert nav.current_tab_id == "robot"
+
+    def test_search_reveal_of_failed_view(self, qapp):
+        nav = SettingsNavigationWidget(CATEGORIES, {"camera": _raising_factory}, deferred=True)
+        nav.reveal(SearchEntry("camera", KIND_FIELD, "erode_iterations"))
+        for _ in range(5):
+            qapp.processEvents()
+        assert nav.content_stack.currentIndex() == nav._error_index
+        assert nav._requested_key is None
+
+
+class _SearchableView(QLabel):
+    def __init__(self, keys):
+        super().__init__("searchable")
+        self.keys = keys
+        self.revealed = []
+
+    def search_entries(self, category):
+        return [SearchEntry(category, KIND_FIELD, key, key) for key in self.keys]
+
+    def reveal(self, key):
+        self.revealed.append(key)
+        return key in self.keys
+
+
+class TestNavigationSearch:
+    def test_categories_indexed_up_front(self, qapp, factory_map):
+        nav = SettingsNavigationWidget(CATEGORIES, factory_map, deferred=True)
+        assert [h.entry.key for h in nav.search("cam")] == ["camera"]
+
+    def test_views_indexed_as_they_are_built(self, qapp):
+        view = _SearchableView(["erode_iterations"])
+        nav = SettingsNavigationWidget(CATEGORIES, {"camera": lambda: view}, deferred=True)
+        assert nav.search("erode") == []
+        nav.show()
+        for _ in range(5):
+            qapp.processEvents()
+        assert [h.entry.category for h in nav.search("erode")] == ["camera"]
+        nav.close()
+
+    def test_reveal_switches_category_and_calls_view(self, qapp):
+        view = _SearchableView(["erode_iterations"])
+        nav = SettingsNavigationWidget(CATEGORIES, {"camera": view, "robot": QLabel("robot")})
+        nav.reveal(nav.search("erode")[0].entry)
+        assert nav.current_tab_id == "camera"
+        assert view.revealed == ["erode_iterations"]
+
+    def test_reveal_pending_view_after_build(self, qapp):
+        view = _SearchableView(["erode_iterations"])
+        nav = SettingsNavigationWidget(CATEGORIES, {"camera": lambda: view}, deferred=True)
+        nav.reveal(SearchEntry("camera", KIND_FIELD, "erode_iterations"))
+        for _ in range(5):
+            qapp.processEvents()
+        assert nav.current_tab_id == "camera"
+        assert view.revealed == ["erode_iterations"]
+
+    def test_reindex(self, qapp):
+        view = _SearchableView(["a_key"])
+        nav = SettingsNavigationWidget(CATEGORIES, {"camera": view})
+        view.keys = ["b_key"]
+        nav.reindex("camera")
+        assert [h.entry.key for h in nav.search("b key")] == ["b_key"]
+        assert nav.search("a key", limit=5) == []
+
+    def test_groups_loaded_after_registration_are_searchable(self, qapp):
+        view = SettingsView("Robot")
+        tab = MovementGroupsTab()
+        view.add_raw_tab("Movement Groups", tab)
+        nav = SettingsNavigationWidget(CATEGORIES, {"robot": view})
+        assert nav.search("glue path") == []
+
+        tab.load({"GLUE PATH": MovementGroup(points=["[0, 0, 300, 180, 0, 0]"])})
+        hits = nav.search("glue path")
+        assert [(h.entry.category, h.entry.kind, h.entry.key) for h in hits][:1] == [
+            ("robot", KIND_MOVEMENT_GROUP, "GLUE PATH")]
+
+        tab.load({})
+        assert nav.search("glue path") == []
@@ -130,6 +130,27 @@ class TestSettingsViewSaveRequested:
         view._save_btn.click()
         assert received[0]["speed"] == 55.0
 
+    def test_tab_deactivate_emits_signal(self, view):
+        received = []
+        view.tab_deactivated.connect(lambda: received.append(True))
+        view.on_tab_deactivate()
+        assert received == [True]
+
+    def test_set_saving_disables_button(self, view):
+        view.set_saving(True)
+        assert not view._save_btn.isEnabled()
+        view.set_saving(False)
+        assert view._save_btn.isEnabled()
+        assert view._save_btn.text() == "Save"
+
+    def test_set_error_shows_and_hides_message(self, view):
+        assert view.error() == "" and view._error_label.isHidden()
+        view.set_error("Not saved: out of limits")
+        assert view.error() == "Not saved: out of limits"
+        assert not view._error_label.isHidden()
+        view.set_error("")
+        assert view._error_label.isHidden()
+
 
 class TestSettingsViewValueChangedSignal:
     def test_spinbox_change_propagates_signal(self, view):
@@ -150,3 +171,209 @@ class TestSettingsViewValueChangedSignal:
         v.value_changed_signal.connect(lambda k, val, c: received.append(c))
         v._groups[0]._widgets["x"].plus_btn.click()
         assert received == ["MyComponent"]
+
+
+@pytest.fixture
+def lazy_view(qapp):
+    v = SettingsView(component_name="Lazy", lazy=True)
+    v.add_tab("Tab1", [_group("G1", _spinbox("speed", 10))])
+    v.add_tab("Tab2", [_group("G2", _spinbox("accel", 20), _text("name", "Robot"))])
+    return v
+
+
+class TestSettingsViewLazyTabs:
+    def test_only_current_tab_built(self, lazy_view):
+        assert lazy_view._tabs.count() == 2
+        assert len(lazy_view._groups) == 1
+
+    def test_tab_built_when_shown(self, lazy_view):
+        lazy_view._tabs.setCurrentIndex(1)
+        assert len(lazy_view._groups) == 2
+
+    def test_tab_built_once(self, lazy_view):
+        lazy_view._tabs.setCurrentIndex(1)
+        lazy_view._tabs.setCurrentIndex(0)
+        lazy_view._tabs.setCurrentIndex(1)
+        assert len(lazy_view._groups) == 2
+
+    def test_set_values_cached_for_unbuilt_tab(self, lazy_view):
+        lazy_view.set_values({"speed": 5, "accel": 99})
+        vals = lazy_view.get_values()
+        assert vals["speed"] == 5.0
+        assert vals["accel"] == 99
+
+    def test_cached_values_applied_on_build(self, lazy_view):
+        lazy_view.set_values({"accel": 99, "name": "HAL"})
+        lazy_view._tabs.setCurrentIndex(1)
+        assert lazy_view._groups[1]._widgets["accel"].value() == 99.0
+        assert lazy_view.get_values()["name"] == "HAL"
+
+    def test_unset_unbuilt_keys_omitted(self, lazy_view):
+        vals = lazy_view.get_values()
+        assert "speed" in vals
+        assert "accel" not in vals
+
+    def test_materialise_all(self, lazy_view):
+        lazy_view.materialise_all()
+        assert len(lazy_view._groups) == 2
+        assert lazy_view.get_values()["accel"] == 20.0
+
+    def test_signal_from_lazily_built_tab(self, lazy_view):
+        received = []
+        lazy_view.value_changed_signal.connect(lambda k, v, c: received.append((k, c)))
+        lazy_view._tabs.setCurrentIndex(1)
+        lazy_view._groups[1]._widgets["accel"].plus_btn.click()
+        assert received == [("accel", "Lazy")]
+
+
+class TestSettingsViewDiffSetValues:
+    def test_reports_updated_keys(self, view):
+        assert sorted(view.set_values({"speed": 1, "name": "X"})) == ["name", "speed"]
+
+    def test_unchanged_values_skipped(self, view):
+        view.set_values({"speed": 1, "accel": 2})
+        assert view.set_values({"speed": 1, "accel": 3}) == ["accel"]
+
+    def test_unknown_keys_not_reported(self, view):
+        assert view.set_values({"nonexistent": 1}) == []
+
+    def test_unchanged_value_does_not_touch_widget(self, view):
+        view.set_values({"speed": 5})
+        widget = view._groups[0]._widgets["speed"]
+        calls = []
+        original = widget.setValue
+        widget.setValue = lambda v: (calls.append(v), original(v))
+        view.set_values({"speed": 5})
+        assert calls == []
+
+    def test_user_edit_invalidates_cache(self, view):
+        view.set_values({"speed": 5})
+        view._groups[0]._widgets["speed"].plus_btn.click()
+        assert view.set_values({"speed": 5}) == ["speed"]
+        assert view.get_values()["speed"] == 5.0
+
+    def test_load_returns_updated_keys(self, qapp):
+        v = SettingsView(component_name="X", mapper=lambda m: {"x": m})
+        v.add_tab("T", [_group("G", _spinbox("x"))])
+        assert v.load(3) == ["x"]
+        assert v.load(3) == []
+
+    def test_lazy_pending_values_diffed(self, lazy_view):
+        assert lazy_view.set_values({"accel": 7}) == ["accel"]
+        assert lazy_view.set_values({"accel": 7}) == []
+
+
+class TestSettingsViewSingleField:
+    def test_get_value(self, view):
+        view.set_values({"speed": 42})
+        assert view.get_value("speed") == 42.0
+
+    def test_get_value_unknown_raises(self, view):
+        with pytest.raises(KeyError):
+            view.get_value("nonexistent")
+
+    def test_set_value(self, view):
+        assert view.set_value("speed", 9) is True
+        assert view.set_value("speed", 9) is False
+        assert view.get_values()["speed"] == 9.0
+
+    def test_set_value_unknown_raises(self, view):
+        with pytest.raises(KeyError):
+            view.set_value("nonexistent", 1)
+
+    def test_set_value_does_not_emit(self, view):
+        received = []
+        view.value_changed_signal.connect(lambda *a: received.append(a))
+        view.set_value("speed", 3)
+        assert received == []
+
+    def test_lazy_get_and_set_value(self, lazy_view):
+        lazy_view.set_value("accel", 4)
+        assert lazy_view.get_value("accel") == 4
+        lazy_view.materialise_all()
+        assert lazy_view.get_value("accel") == 4.0
+
+
+class TestSettingsViewDirtyKeys:
+    def test_initially_clean(self, view):
+        assert view.get_values(dirty_only=True) == {}
+
+    def test_user_edit_marks_dirty(self, view):
+        view.set_values({"speed": 5})
+        view._groups[0]._widgets["speed"].plus_btn.click()
+        assert view.dirty_keys() == {"speed"}
+        assert set(view.get_values(dirty_only=True)) == {"speed"}
+
+    def test_push_clears_dirty(self, view):
+        view._groups[0]._widgets["speed"].plus_btn.click()
+        view.set_values({"speed": 5})
+        assert view.dirty_keys() == set()
+
+    def test_clear_dirty(self, view):
+        view._groups[0]._widgets["speed"].plus_btn.click()
+        view.clear_dirty()
+        assert view.get_values(dirty_only=True) == {}
+
+    def test_clear_dirty_keeps_edits_made_after_save(self, view):
+        plus = view._groups[0]._widgets["speed"].plus_btn
+        plus.click()
+        saved = view.get_delta()
+        plus.click()                                  # edited while the save was in flight
+        view._groups[0]._widgets["accel"].plus_btn.click()
+        view.clear_dirty(saved)
+        assert view.dirty_keys() == {"speed", "accel"}
+
+    def test_clear_dirty_with_saved_delta(self, view):
+        view._groups[0]._widgets["speed"].plus_btn.click()
+        view._groups[0]._widgets["accel"].plus_btn.click()
+        view.clear_dirty({"speed": view.get_value("speed")})
+        assert view.dirty_keys() == {"accel"}
+
+    def test_mark_dirty_keeps_pushed_values_until_saved(self, view):
+        view.set_values({"speed": 5, "name": "Arm"})     # Tab2 not built yet
+        view.mark_dirty(["speed", "name", "unknown"])
+        assert view.get_delta() == {"speed": 5, "name": "Arm"}
+        view.clear_dirty({"speed": 5, "name": "Arm"})
+        assert view.dirty_keys() == set()
+
+
+class TestSettingsViewDelta:
+    def test_delta_contains_only_edited_fields(self, view):
+        view.set_values({"speed": 5, "accel": 2, "name": "A"})
+        view._groups[0]._widgets["speed"].plus_btn.click()
+        assert view.get_delta() == {"speed": view.get_value("speed")}
+
+    def test_delta_empty_after_clear(self, view):
+        view._groups[0]._widgets["speed"].plus_btn.click()
+        view.clear_dirty()
+        assert view.get_delta() == {}
+
+
+class TestSettingsViewSearch:
+    def test_search_entries_cover_all_tabs(self, view):
+        entries = view.search_entries("robot")
+        assert [e.key for e in entries] == ["speed", "accel", "name"]
+        assert entries[0].category == "robot"
+        assert entries[0].context == "Tab1 › G1"
+
+    def test_search_entries_without_building_lazy_tabs(self, qapp):
+        v = SettingsView(component_name="Lazy", lazy=True)
+        v.add_tab("Tab1", [_group("G1", _spinbox("speed"))])
+        v.add_tab("Tab2", [_group("G2", _text("name"))])
+        assert [e.key for e in v.search_entries("x")] == ["speed", "name"]
+        assert len(v._pending_tabs) == 1
+
+    def test_reveal_switches_tab(self, view):
+        assert view.reveal("name") is True
+        assert view._tabs.currentIndex() == 1
+
+    def test_reveal_builds_lazy_tab(self, qapp):
+        v = SettingsView(component_name="Lazy", lazy=True)
+        v.add_tab("Tab1", [_group("G1", _spinbox("speed"))])
+        v.add_tab("Tab2", [_group("G2", _text("name"))])
+        assert v.reveal("name") is True
+        assert v._pending_tabs == {}
+        assert "name" in v._key_index
+
+    def test_reveal_unknown_key(self, view):
+        assert view.reveal("nope") is False